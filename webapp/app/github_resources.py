@@ -0,0 +1,106 @@
+"""
+GitHub リソース作成ジョブのランナーと、ジョブごとのユースケースの組み立て。
+
+ワーカーの起動時 (wsgi/asgi) にビューを読み込まずにジョブの回復処理を開始できるよう、ビューから分離しています。
+githubkit・GitHub クライアント・ユースケースは、起動時ではなく最初のジョブの実行時に読み込みます。
+"""
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+from core_logic.infrastructure.config import get_settings
+from .jobs import GitHubResourceJobRunner
+
+if TYPE_CHECKING:
+    from core_logic.adapters.assignee_validator import AssignableUsersCache
+    from core_logic.adapters.github_client_registry import GitHubClientRegistry
+    from core_logic.adapters.run_ledger import RunLedger
+    from core_logic.use_cases.create_github_resources import CreateGitHubResourcesUseCase
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+_components_lock = threading.Lock()
+# GitHub クライアント (接続プール・レート制限の状態) はトークンごとにリクエストをまたいで共有する
+_github_client_registry: Optional["GitHubClientRegistry"] = None
+# 割り当て可能ユーザー一覧はリクエストをまたいでTTL付きで共有する
+_assignable_users_cache: Optional["AssignableUsersCache"] = None
+# 作成済みリソースをジョブIDごとに記録し、中断されたジョブの再実行時に完了済みの処理をスキップする
+_run_ledger: Optional["RunLedger"] = None
+_run_ledger_created = False
+
+
+def get_github_client_registry() -> "GitHubClientRegistry":
+    """共有の GitHubClientRegistry を返します (初回呼び出し時に作成します)。"""
+    global _github_client_registry
+    with _components_lock:
+        if _github_client_registry is None:
+            from core_logic.adapters.github_client_registry import GitHubClientRegistry
+            _github_client_registry = GitHubClientRegistry(
+                max_size=settings.github.client_registry_max_size,
+                idle_timeout=settings.github.client_idle_timeout)
+        return _github_client_registry
+
+
+def github_client_registry_stats() -> Dict[str, int]:
+    """監視用のレジストリの統計を返します (まだ作成されていない場合は空)。"""
+    registry = _github_client_registry
+    return registry.stats() if registry is not None else {}
+
+
+def _get_assignable_users_cache() -> "AssignableUsersCache":
+    global _assignable_users_cache
+    with _components_lock:
+        if _assignable_users_cache is None:
+            from core_logic.adapters.assignee_validator import AssignableUsersCache
+            _assignable_users_cache = AssignableUsersCache()
+        return _assignable_users_cache
+
+
+def _get_run_ledger() -> Optional["RunLedger"]:
+    global _run_ledger, _run_ledger_created
+    with _components_lock:
+        if not _run_ledger_created:
+            from core_logic.adapters.run_ledger import create_run_ledger
+            _run_ledger = create_run_ledger(settings.github)
+            _run_ledger_created = True
+        return _run_ledger
+
+
+def build_create_github_resources_use_case() -> "CreateGitHubResourcesUseCase":
+    """
+    リソース作成ジョブごとに CreateGitHubResourcesUseCase を組み立てます。
+    設定はキャッシュ済みのものを使い、githubkit インスタンス・接続プール・スケジューラはレジストリで再利用します。
+    """
+    from core_logic.adapters.assignee_validator import AssigneeValidator
+    from core_logic.use_cases.create_github_resources import CreateGitHubResourcesUseCase
+    from core_logic.use_cases.create_issues import CreateIssuesUseCase
+    from core_logic.use_cases.create_repository import CreateRepositoryUseCase
+
+    settings = get_settings()
+    clients = get_github_client_registry().get(
+        settings.github_pat.get_secret_value(), settings.github)
+    rest_client = clients.rest_client()
+    graphql_client = clients.graphql_client()
+    assignee_validator = AssigneeValidator(
+        rest_client=rest_client, cache=_get_assignable_users_cache(),
+        cache_ttl=settings.github.assignee_cache_ttl)
+    create_repo_uc = CreateRepositoryUseCase(github_client=rest_client)
+    create_issues_uc = CreateIssuesUseCase(
+        rest_client=rest_client, assignee_validator=assignee_validator,
+        max_workers=settings.github.max_workers)
+    return CreateGitHubResourcesUseCase(
+        rest_client=rest_client,
+        graphql_client=graphql_client,
+        create_repo_uc=create_repo_uc,
+        create_issues_uc=create_issues_uc,
+        max_workers=settings.github.max_workers,
+        ledger=_get_run_ledger()
+    )
+
+
+# リソース作成はリクエストスレッドの外でジョブとして実行する (状態はDBに保存)
+job_runner = GitHubResourceJobRunner(
+    use_case_factory=build_create_github_resources_use_case,
+    max_workers=settings.github.job_workers,
+    stale_after=settings.github.job_stale_after)
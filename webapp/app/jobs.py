@@ -0,0 +1,274 @@
+"""
+GitHub リソース作成ジョブの実行基盤。
+
+ジョブの入力・状態・途中結果は GitHubResourceJob としてDBに保存し、
+リクエストスレッドとは別のスレッドプールで CreateGitHubResourcesUseCase を実行します。
+ワーカーの起動時と、その後はハートビートの間隔ごとに、ハートビートが途絶えた実行中ジョブ
+(停止したワーカーのジョブ) と取り残された未着手のジョブを再実行します
+(ジョブIDを実行IDとして台帳に作成済みのリソースを記録するため、途中まで実行されたジョブを再実行しても
+完了済みの処理はスキップされ、Issueは重複作成されません。台帳が無効の場合も既存Issueはタイトルで検出されます)。
+"""
+import datetime
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional, Set
+
+from django.db import close_old_connections
+from django.db.models import F
+from django.utils import timezone
+
+from core_logic.domain.models import ParsedRequirementData, CreateGitHubResourcesResult
+from .models import GitHubResourceJob
+
+if TYPE_CHECKING:
+    # ユースケース (githubkit を含む) は、ワーカーの起動時ではなく最初のジョブの実行時に読み込む
+    from core_logic.use_cases.create_github_resources import CreateGitHubResourcesUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubResourceJobRunner:
+    """
+    GitHubResourceJob をスレッドプールで実行するランナー。
+    max_workers=0 の場合はスレッドを使わず submit の呼び出し元で実行します (テスト・デバッグ用)。
+    """
+
+    def __init__(self, use_case_factory: Callable[[], "CreateGitHubResourcesUseCase"],
+                 max_workers: int = 2, heartbeat_interval: float = 30.0,
+                 stale_after: float = 120.0):
+        """
+        Args:
+            use_case_factory: ジョブごとに CreateGitHubResourcesUseCase を生成する関数。
+            max_workers: 同時に実行するジョブ数の上限。
+            heartbeat_interval: 実行中ジョブのハートビートを更新する間隔 (秒)。
+            stale_after: ハートビートがこの秒数以上途絶えた実行中ジョブを、停止したワーカーのジョブとして再実行する。
+        """
+        if max_workers < 0:
+            raise ValueError("max_workers must not be negative.")
+        self.use_case_factory = use_case_factory
+        self.max_workers = max_workers
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._active_jobs: Set[uuid.UUID] = set()
+        # このランナーのキューに投入済みで、まだ実行を開始していないジョブ (回復処理で二重に投入しないため)
+        self._pending_jobs: Set[uuid.UUID] = set()
+        self._started = False
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    # --- Public API ---
+    def start(self) -> None:
+        """
+        ワーカーの起動時に呼び出し、中断されたジョブを再実行して、ハートビートと定期的な回復処理のスレッドを起動します。
+        2回目以降の呼び出しは何もしません。
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        try:
+            self.recover()
+        except Exception as e:
+            # マイグレーション前などでDBを利用できない場合も起動は妨げない (以降は定期的な回復処理で再試行する)
+            logger.warning(f"Failed to recover interrupted jobs at startup: {e}")
+        if self.max_workers > 0:
+            with self._lock:
+                self._ensure_heartbeat_thread()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        ジョブの受け付けを終了し、ハートビートと回復処理のスレッドを停止します。
+        wait=True の場合は実行中のジョブの完了を待ちます (その間もハートビートは更新します)。
+        未着手のジョブはDBに残り、他のワーカーの回復処理で再実行されます。
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending_jobs.clear()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        self._stop_event.set()
+        with self._lock:
+            heartbeat_thread = self._heartbeat_thread
+        if wait and heartbeat_thread is not None:
+            heartbeat_thread.join()
+        logger.info(f"GitHub resource job runner {self.worker_id} stopped.")
+
+    def enqueue(self, parsed_data: ParsedRequirementData, repo_name: str,
+                project_name: Optional[str] = None, dry_run: bool = False) -> GitHubResourceJob:
+        """ジョブをDBに登録して実行キューに追加します。"""
+        job = GitHubResourceJob.objects.create(
+            repo_name=repo_name, project_name=project_name, dry_run=dry_run,
+            parsed_data=parsed_data.model_dump(mode="json"))
+        logger.info(
+            f"Enqueued GitHub resource job {job.id} ({len(parsed_data.issues)} issue(s), repo: {repo_name}).")
+        self.start()
+        self.submit(job.id)
+        return job
+
+    def submit(self, job_id: uuid.UUID) -> None:
+        if self.max_workers == 0:
+            self._run(job_id)
+            return
+        with self._lock:
+            if self._stop_event.is_set():
+                logger.warning(
+                    f"Job runner is stopped. GitHub resource job {job_id} is left queued for another worker.")
+                return
+            if job_id in self._pending_jobs:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="github-resource-job")
+            self._pending_jobs.add(job_id)
+            self._executor.submit(self._run_in_thread, job_id)
+            self._ensure_heartbeat_thread()
+
+    def recover(self) -> int:
+        """
+        中断されたジョブ (ハートビートが stale_after 秒以上途絶えた実行中ジョブ・stale_after 秒以上前に登録された未着手のジョブ) を
+        再実行します。起動時と、その後はハートビートの間隔ごとに呼ばれます。再投入したジョブ数を返します。
+        """
+        stale_before = timezone.now() - datetime.timedelta(seconds=self.stale_after)
+        with self._lock:
+            active = list(self._active_jobs)
+        # このワーカーで実行中のジョブは、ハートビートの更新が遅れていても再実行しない
+        stale_running = GitHubResourceJob.objects.filter(
+            status=GitHubResourceJob.STATUS_RUNNING, heartbeat_at__lt=stale_before
+        ).exclude(id__in=active)
+        requeued = stale_running.update(
+            status=GitHubResourceJob.STATUS_QUEUED, worker_id='')
+        if requeued:
+            logger.warning(
+                f"Re-queued {requeued} GitHub resource job(s) interrupted by a stopped worker.")
+        queued_ids = list(GitHubResourceJob.objects.filter(
+            status=GitHubResourceJob.STATUS_QUEUED, created_at__lt=stale_before
+        ).values_list('id', flat=True))
+        with self._lock:
+            pending_ids = [job_id for job_id in queued_ids
+                           if job_id not in self._pending_jobs]
+        for job_id in pending_ids:
+            self.submit(job_id)
+        return len(pending_ids)
+
+    # --- Job execution ---
+    def _run_in_thread(self, job_id: uuid.UUID) -> None:
+        # スレッドごとにDB接続を管理する
+        close_old_connections()
+        try:
+            self._run(job_id)
+        finally:
+            close_old_connections()
+
+    def _claim(self, job_id: uuid.UUID) -> bool:
+        """未着手のジョブを他のワーカーと競合しないよう原子的に実行中にします。"""
+        now = timezone.now()
+        claimed = GitHubResourceJob.objects.filter(
+            id=job_id, status=GitHubResourceJob.STATUS_QUEUED
+        ).update(status=GitHubResourceJob.STATUS_RUNNING, worker_id=self.worker_id,
+                 started_at=now, heartbeat_at=now, error='', attempts=F('attempts') + 1)
+        return claimed == 1
+
+    def _run(self, job_id: uuid.UUID) -> None:
+        with self._lock:
+            self._pending_jobs.discard(job_id)
+        if not self._claim(job_id):
+            logger.debug(
+                f"GitHub resource job {job_id} was already claimed, skipping.")
+            return
+        job = GitHubResourceJob.objects.get(id=job_id)
+        with self._lock:
+            self._active_jobs.add(job_id)
+        logger.info(
+            f"Running GitHub resource job {job_id} (attempt {job.attempts}).")
+
+        completed_steps: list = []
+        # 失敗した場合も途中結果 (作成済みのリソース・再試行した操作) を保存するため、最後に通知された結果を保持する
+        latest_result: list = []
+
+        def on_progress(step: str, result: CreateGitHubResourcesResult) -> None:
+            latest_result[:] = [result]
+            # 新しいステップの開始 = それまでのステップの完了
+            GitHubResourceJob.objects.filter(id=job_id).update(
+                current_step=step, completed_steps=list(completed_steps),
+                result=result.model_dump(mode="json"), heartbeat_at=timezone.now())
+            completed_steps.append(step)
+
+        try:
+            use_case = self.use_case_factory()
+            result = use_case.execute(
+                parsed_data=ParsedRequirementData.model_validate(
+                    job.parsed_data),
+                repo_name_input=job.repo_name,
+                project_name=job.project_name,
+                dry_run=job.dry_run,
+                progress_callback=on_progress,
+                run_id=str(job_id))
+            GitHubResourceJob.objects.filter(id=job_id).update(
+                status=GitHubResourceJob.STATUS_SUCCEEDED,
+                result=result.model_dump(mode="json"), finished_at=timezone.now())
+            logger.info(f"GitHub resource job {job_id} succeeded.")
+        except Exception as e:
+            logger.exception(f"GitHub resource job {job_id} failed: {e}")
+            failed_fields = {}
+            if latest_result:
+                failed_fields["result"] = latest_result[0].model_dump(mode="json")
+            GitHubResourceJob.objects.filter(id=job_id).update(
+                status=GitHubResourceJob.STATUS_FAILED, error=str(e),
+                finished_at=timezone.now(), **failed_fields)
+        finally:
+            with self._lock:
+                self._active_jobs.discard(job_id)
+
+    # --- Heartbeat ---
+    def _ensure_heartbeat_thread(self) -> None:
+        """実行中ジョブのハートビートの更新と回復処理を定期的に行うスレッドを起動します (呼び出し側でロックを保持)。"""
+        if self._stop_event.is_set():
+            return
+        if self._heartbeat_thread is not None and self._heartbeat_thread.is_alive():
+            return
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name="github-resource-job-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop_event.wait(self.heartbeat_interval):
+            close_old_connections()
+            self._maintain()
+
+    def _maintain(self) -> None:
+        """このワーカーで実行中のジョブのハートビートを更新し、停止したワーカーのジョブを回復します。"""
+        with self._lock:
+            active = list(self._active_jobs)
+        if active:
+            try:
+                GitHubResourceJob.objects.filter(id__in=active, worker_id=self.worker_id).update(
+                    heartbeat_at=timezone.now())
+            except Exception as e:
+                logger.warning(f"Failed to update job heartbeat: {e}")
+        # 他のワーカーが停止して途絶えたジョブを、このワーカーが稼働している間に引き継ぐ
+        try:
+            self.recover()
+        except Exception as e:
+            logger.warning(f"Failed to recover interrupted jobs: {e}")
+
+
+def serialize_job(job: GitHubResourceJob) -> dict:
+    """ステータスAPIで返すジョブの情報"""
+    return {
+        "job_id": str(job.id),
+        "status": job.status,
+        "current_step": job.current_step or None,
+        "completed_steps": job.completed_steps or [],
+        "result": job.result,
+        "error": job.error or None,
+        "attempts": job.attempts,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
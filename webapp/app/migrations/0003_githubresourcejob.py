@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:31
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0002_useraisettings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitHubResourceJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], db_index=True, default='queued', max_length=16)),
+                ('repo_name', models.CharField(max_length=255)),
+                ('project_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('dry_run', models.BooleanField(default=False)),
+                ('parsed_data', models.JSONField(help_text='JSON serialized ParsedRequirementData (選択されたIssueのみ)')),
+                ('current_step', models.CharField(blank=True, default='', max_length=64)),
+                ('completed_steps', models.JSONField(blank=True, default=list)),
+                ('result', models.JSONField(blank=True, help_text='JSON serialized CreateGitHubResourcesResult (実行中は途中結果)', null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('worker_id', models.CharField(blank=True, default='', max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'GitHub Resource Job',
+                'verbose_name_plural': 'GitHub Resource Jobs',
+                'ordering': ['created_at'],
+            },
+        ),
+    ]
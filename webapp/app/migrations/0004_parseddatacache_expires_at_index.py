@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0003_githubresourcejob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='parseddatacache',
+            name='expires_at',
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
@@ -10,7 +10,8 @@ class ParsedDataCache(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     data = models.JSONField(help_text="JSON serialized ParsedRequirementData")
     created_at = models.DateTimeField(auto_now_add=True)
-    expires_at = models.DateTimeField()
+    # 期限切れセッションの定期削除で検索するためインデックスを張る
+    expires_at = models.DateTimeField(db_index=True)
 
     class Meta:
         verbose_name = "Parsed Data Cache"
@@ -37,3 +38,48 @@ class UserAiSettings(models.Model):
 
     def __str__(self):
         return f"AI設定({self.user.username})"
+
+
+class GitHubResourceJob(models.Model):
+    """
+    GitHub リソース作成ジョブの状態。
+    ワーカーが再起動しても、DBに保存した入力からジョブを再実行できるようにする。
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(
+        max_length=16, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True)
+    repo_name = models.CharField(max_length=255)
+    project_name = models.CharField(max_length=255, blank=True, null=True)
+    dry_run = models.BooleanField(default=False)
+    parsed_data = models.JSONField(
+        help_text="JSON serialized ParsedRequirementData (選択されたIssueのみ)")
+    current_step = models.CharField(max_length=64, blank=True, default='')
+    completed_steps = models.JSONField(default=list, blank=True)
+    result = models.JSONField(
+        null=True, blank=True, help_text="JSON serialized CreateGitHubResourcesResult (実行中は途中結果)")
+    error = models.TextField(blank=True, default='')
+    attempts = models.PositiveIntegerField(default=0)
+    worker_id = models.CharField(max_length=64, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "GitHub Resource Job"
+        verbose_name_plural = "GitHub Resource Jobs"
+        ordering = ['created_at']
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
@@ -43,6 +43,14 @@ class CreateIssuesResultSerializer(serializers.Serializer):
         child=serializers.ListField(child=serializers.CharField()), required=False)
 
 
+class StepTimingSerializer(serializers.Serializer):
+    step = serializers.CharField()
+    duration_seconds = serializers.FloatField()
+    api_calls = serializers.IntegerField(required=False)
+    items = serializers.IntegerField(required=False)
+    items_per_second = serializers.FloatField(allow_null=True, required=False)
+
+
 class CreateGitHubResourcesResultSerializer(serializers.Serializer):
     repository_url = serializers.CharField(allow_null=True, required=False)
     project_node_id = serializers.CharField(allow_null=True, required=False)
@@ -60,7 +68,11 @@ class CreateGitHubResourcesResultSerializer(serializers.Serializer):
     project_items_added_count = serializers.IntegerField(required=False)
     project_items_failed = serializers.ListField(
         child=serializers.ListField(child=serializers.CharField()), required=False)
+    retried_operations = serializers.DictField(
+        child=serializers.IntegerField(), required=False)
     fatal_error = serializers.CharField(allow_null=True, required=False)
     dry_run = serializers.BooleanField(required=False)
+    plan = serializers.DictField(allow_null=True, required=False)
+    step_timings = StepTimingSerializer(many=True, required=False)
 
 # 他のドメインモデル用シリアライザもここに追加
\ No newline at end of file
@@ -0,0 +1,356 @@
+"""
+解析結果 (ParsedRequirementData) を作成APIに引き継ぐためのセッションストア。
+
+バックエンド:
+- memory: プロセス内の LRU (単一プロセス構成向け。ディスクにアクセスしない)
+- cache: Django のキャッシュフレームワーク (Redis などを CACHES で設定)
+- database: ParsedDataCache テーブル (既定)
+
+セッションは作成後に変更されないため、database/cache の前段にプロセス内の LRU を置いて
+読み込みをメモリで完結させることができます (LOCAL_CACHE)。
+
+期限切れのセッションは、保存・読み込みの際と、ワーカーの起動時に開始する掃除スレッド (start_sweeper) で
+SWEEP_INTERVAL 秒ごとにまとめて削除します (アクセスが途絶えた場合もメモリ・テーブルに残り続けないようにするため)。
+"""
+import base64
+import datetime
+import json
+import logging
+import threading
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings as django_settings
+from django.core.cache import caches
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import close_old_connections
+from django.utils import timezone
+
+from core_logic.domain.models import ParsedRequirementData
+from .models import ParsedDataCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_TTL = 600.0
+# この長さ (バイト) 未満のペイロードは圧縮しても効果が小さいため圧縮しない
+COMPRESSION_THRESHOLD = 1024
+_PLAIN_PREFIX = b"j"
+_ZLIB_PREFIX = b"z"
+
+
+def encode_payload(parsed_data: ParsedRequirementData, compress: bool = True) -> bytes:
+    """解析結果をJSONにシリアライズし、必要に応じて zlib で圧縮します (先頭1バイトが形式)。"""
+    raw = json.dumps(parsed_data.model_dump(mode="json"),
+                     ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if compress and len(raw) >= COMPRESSION_THRESHOLD:
+        return _ZLIB_PREFIX + zlib.compress(raw)
+    return _PLAIN_PREFIX + raw
+
+
+def decode_payload(payload: bytes) -> ParsedRequirementData:
+    prefix, body = payload[:1], payload[1:]
+    if prefix == _ZLIB_PREFIX:
+        body = zlib.decompress(body)
+    elif prefix != _PLAIN_PREFIX:
+        raise ValueError(f"Unknown session payload format: {prefix!r}")
+    return ParsedRequirementData.model_validate_json(body)
+
+
+class ParsedSessionStore(ABC):
+    """
+    解析結果セッションストアの共通インターフェース。
+    sweep_interval 秒ごとに、保存・読み込みの際と掃除スレッド (start_sweeper) で期限切れのセッションをまとめて削除します。
+    """
+
+    def __init__(self, ttl: float = DEFAULT_SESSION_TTL, sweep_interval: Optional[float] = 300.0,
+                 clock: Callable[[], float] = time.time):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._last_sweep = clock()
+        self._sweep_lock = threading.Lock()
+        self._sweeper_stop = threading.Event()
+        self._sweeper_thread: Optional[threading.Thread] = None
+
+    def save(self, parsed_data: ParsedRequirementData) -> str:
+        """解析結果を保存し、セッションIDを返します。"""
+        session_id = str(uuid.uuid4())
+        self._save(session_id, parsed_data, self._clock() + self.ttl)
+        self._maybe_sweep()
+        return session_id
+
+    def load(self, session_id: str) -> Optional[ParsedRequirementData]:
+        """セッションIDに対応する解析結果を返します。存在しない・期限切れの場合は None を返します。"""
+        try:
+            uuid.UUID(str(session_id))
+        except ValueError:
+            return None
+        parsed_data = self._load(str(session_id))
+        self._maybe_sweep()
+        return parsed_data
+
+    @abstractmethod
+    def _save(self, session_id: str, parsed_data: ParsedRequirementData, expires_at: float) -> None:
+        ...
+
+    @abstractmethod
+    def _load(self, session_id: str) -> Optional[ParsedRequirementData]:
+        ...
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        ...
+
+    def sweep(self) -> int:
+        """期限切れのセッションを削除し、削除件数を返します (有効期限を自動管理するバックエンドでは何もしません)。"""
+        return 0
+
+    def start_sweeper(self) -> None:
+        """
+        sweep_interval 秒ごとに期限切れのセッションを削除するスレッドを起動します。
+        sweep_interval が None の場合と、既に起動している場合は何もしません。
+        """
+        if self.sweep_interval is None:
+            return
+        with self._sweep_lock:
+            if self._sweeper_thread is not None and self._sweeper_thread.is_alive():
+                return
+            self._sweeper_stop.clear()
+            self._sweeper_thread = threading.Thread(
+                target=self._sweeper_loop, name="parsed-session-sweeper", daemon=True)
+            self._sweeper_thread.start()
+
+    def stop_sweeper(self, wait: bool = True) -> None:
+        """掃除スレッドを停止します。"""
+        self._sweeper_stop.set()
+        thread = self._sweeper_thread
+        if wait and thread is not None:
+            thread.join()
+
+    def _sweeper_loop(self) -> None:
+        while not self._sweeper_stop.wait(self.sweep_interval):
+            # スレッドごとにDB接続を管理する
+            close_old_connections()
+            self._maybe_sweep()
+
+    def _maybe_sweep(self) -> None:
+        if self.sweep_interval is None:
+            return
+        now = self._clock()
+        # 他のスレッドが掃除中の場合は待たずに戻る
+        if now - self._last_sweep < self.sweep_interval or not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_sweep = now
+            removed = self.sweep()
+            if removed:
+                logger.info(
+                    f"Removed {removed} expired parsed data session(s).")
+        except Exception as e:
+            logger.warning(f"Failed to sweep expired parsed data sessions: {e}")
+        finally:
+            self._sweep_lock.release()
+
+
+class InMemorySessionStore(ParsedSessionStore):
+    """プロセス内の LRU で解析結果を保持するストア。max_entries を超えた場合は最も古く使われたものから削除します。"""
+
+    def __init__(self, max_entries: int = 1024, compress: bool = False, **kwargs: Any):
+        super().__init__(**kwargs)
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.compress = compress
+        self._lock = threading.Lock()
+        # session_id -> (有効期限, 解析結果 または 圧縮済みペイロード)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _save(self, session_id: str, parsed_data: ParsedRequirementData, expires_at: float) -> None:
+        self.put(session_id, parsed_data, expires_at)
+
+    def put(self, session_id: str, parsed_data: ParsedRequirementData, expires_at: float) -> None:
+        value = encode_payload(
+            parsed_data, compress=True) if self.compress else parsed_data
+        with self._lock:
+            self._entries[session_id] = (expires_at, value)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, session_id: str) -> Optional[ParsedRequirementData]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] < self._clock():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+        value = entry[1]
+        # 呼び出し側は解析結果を変更しない前提で、非圧縮時は保持しているモデルをそのまま返す
+        return decode_payload(value) if isinstance(value, bytes) else value
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def sweep(self) -> int:
+        now = self._clock()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items()
+                       if expires_at < now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+
+class DjangoCacheSessionStore(ParsedSessionStore):
+    """Django のキャッシュ (Redis・Memcached など) に解析結果を保存するストア。有効期限はキャッシュ側で管理します。"""
+
+    key_prefix = "parsed-session:"
+
+    def __init__(self, cache_alias: str = "default", compress: bool = True, **kwargs: Any):
+        kwargs.setdefault("sweep_interval", None)
+        super().__init__(**kwargs)
+        self.cache_alias = cache_alias
+        self.compress = compress
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _save(self, session_id: str, parsed_data: ParsedRequirementData, expires_at: float) -> None:
+        self.cache.set(self.key_prefix + session_id,
+                       encode_payload(parsed_data, compress=self.compress),
+                       timeout=max(1, int(expires_at - self._clock())))
+
+    def _load(self, session_id: str) -> Optional[ParsedRequirementData]:
+        payload = self.cache.get(self.key_prefix + session_id)
+        return decode_payload(payload) if payload is not None else None
+
+    def delete(self, session_id: str) -> None:
+        self.cache.delete(self.key_prefix + session_id)
+
+
+class DatabaseSessionStore(ParsedSessionStore):
+    """
+    ParsedDataCache テーブルに解析結果を保存するストア。
+    compress=True の場合、JSONField には {"encoding": "zlib+base64", "payload": ...} の形式で保存します。
+    """
+
+    def __init__(self, compress: bool = True, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.compress = compress
+
+    def _save(self, session_id: str, parsed_data: ParsedRequirementData, expires_at: float) -> None:
+        payload = encode_payload(parsed_data, compress=self.compress)
+        if payload[:1] == _ZLIB_PREFIX:
+            data: Dict[str, Any] = {"encoding": "zlib+base64",
+                                    "payload": base64.b64encode(payload[1:]).decode("ascii")}
+        else:
+            data = parsed_data.model_dump(mode="json")
+        ParsedDataCache.objects.create(
+            id=session_id, data=data,
+            expires_at=timezone.now() + datetime.timedelta(seconds=expires_at - self._clock()))
+
+    def _load(self, session_id: str) -> Optional[ParsedRequirementData]:
+        try:
+            entry = ParsedDataCache.objects.get(id=session_id)
+        except (ParsedDataCache.DoesNotExist, DjangoValidationError):
+            return None
+        if entry.expires_at < timezone.now():
+            entry.delete()
+            return None
+        data = entry.data
+        if isinstance(data, dict) and data.get("encoding") == "zlib+base64":
+            return decode_payload(_ZLIB_PREFIX + base64.b64decode(data["payload"]))
+        return ParsedRequirementData.model_validate(data)
+
+    def delete(self, session_id: str) -> None:
+        ParsedDataCache.objects.filter(id=session_id).delete()
+
+    def sweep(self) -> int:
+        removed, _ = ParsedDataCache.objects.filter(
+            expires_at__lt=timezone.now()).delete()
+        return removed
+
+
+class LocallyCachedSessionStore(ParsedSessionStore):
+    """
+    共有ストア (database/cache) の前段にプロセス内の LRU を置くストア。
+    保存時は両方に書き込み、読み込みはまずメモリを参照します (セッションは作成後に変更されないため整合性の問題はありません)。
+    掃除はこのストアが sweep_interval 秒ごとにメモリと共有ストアの両方に対して行います。
+    """
+
+    def __init__(self, backend: ParsedSessionStore, local: InMemorySessionStore,
+                 sweep_interval: Optional[float] = 300.0):
+        super().__init__(ttl=backend.ttl, sweep_interval=sweep_interval, clock=backend._clock)
+        self.backend = backend
+        self.local = local
+
+    def _save(self, session_id: str, parsed_data: ParsedRequirementData, expires_at: float) -> None:
+        self.backend._save(session_id, parsed_data, expires_at)
+        self.local.put(session_id, parsed_data, expires_at)
+
+    def _load(self, session_id: str) -> Optional[ParsedRequirementData]:
+        parsed_data = self.local._load(session_id)
+        if parsed_data is None:
+            parsed_data = self.backend._load(session_id)
+        return parsed_data
+
+    def delete(self, session_id: str) -> None:
+        self.local.delete(session_id)
+        self.backend.delete(session_id)
+
+    def sweep(self) -> int:
+        return self.local.sweep() + self.backend.sweep()
+
+
+def create_session_store(config: Optional[Dict[str, Any]] = None) -> ParsedSessionStore:
+    """
+    Django 設定の PARSED_SESSION_STORE (BACKEND, TTL, COMPRESS, MAX_ENTRIES, SWEEP_INTERVAL,
+    CACHE_ALIAS, LOCAL_CACHE) からセッションストアを作成します。
+    """
+    if config is None:
+        config = getattr(django_settings, "PARSED_SESSION_STORE", {})
+    backend = str(config.get("BACKEND", "database")).lower()
+    ttl = float(config.get("TTL", DEFAULT_SESSION_TTL))
+    compress = bool(config.get("COMPRESS", True))
+    max_entries = int(config.get("MAX_ENTRIES", 1024))
+    sweep_interval = config.get("SWEEP_INTERVAL", 300.0)
+
+    if backend == "memory":
+        return InMemorySessionStore(max_entries=max_entries, compress=compress,
+                                    ttl=ttl, sweep_interval=sweep_interval)
+    if backend == "cache":
+        store: ParsedSessionStore = DjangoCacheSessionStore(
+            cache_alias=config.get("CACHE_ALIAS", "default"), compress=compress, ttl=ttl)
+        # 有効期限はキャッシュ側で管理するが、前段のメモリの LRU は掃除する
+    elif backend == "database":
+        store = DatabaseSessionStore(
+            compress=compress, ttl=ttl, sweep_interval=sweep_interval)
+    else:
+        raise ValueError(f"Unknown parsed session store backend: {backend}")
+    if config.get("LOCAL_CACHE", True):
+        return LocallyCachedSessionStore(store, InMemorySessionStore(
+            max_entries=max_entries, ttl=ttl, sweep_interval=None), sweep_interval=sweep_interval)
+    return store
+
+
+_shared_store: Optional[ParsedSessionStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_parsed_session_store() -> ParsedSessionStore:
+    """プロセスで共有するセッションストアを返します (初回呼び出し時に Django 設定から作成します)。"""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = create_session_store()
+        return _shared_store
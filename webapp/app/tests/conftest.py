@@ -1,6 +1,10 @@
 import pytest
 from rest_framework.test import APIClient
 import os
+import tempfile
+
+# AI解析結果キャッシュ (既定はユーザーのキャッシュディレクトリ) をテストごとの一時ディレクトリに保存する
+os.environ['XDG_CACHE_HOME'] = tempfile.mkdtemp(prefix='github-auto-setup-test-')
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _modules_loaded_by(import_line: str, modules) -> list:
+    """新しいプロセスで Django を起動して import_line を実行し、読み込まれた modules を返す"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        str(PROJECT_ROOT / path) for path in ("", "webapp", "webapp/core_logic"))
+    env["DJANGO_SETTINGS_MODULE"] = "webapp.webapp_project.settings"
+    env.setdefault("GITHUB_PAT", "dummy-token")
+    code = ("import django, json, sys\n"
+            "django.setup()\n"
+            f"{import_line}\n"
+            f"print(json.dumps([m for m in {tuple(modules)!r} if m in sys.modules]))")
+
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env,
+                            capture_output=True, text=True, timeout=120, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_django_boot_does_not_import_llm_providers():
+    """ワーカーの起動 (views の import) では LangChain・プロバイダーの SDK を読み込まない"""
+    assert _modules_loaded_by("import app.views", (
+        "langchain_core", "langchain_openai", "langchain_google_genai", "openai")) == []
+
+
+def test_django_boot_does_not_import_github_clients():
+    """views・ジョブランナーの import では githubkit・GitHub クライアント・ユースケースを読み込まない"""
+    heavy_modules = ("githubkit", "httpx", "core_logic.adapters.github_rest_client",
+                     "core_logic.adapters.github_client_registry",
+                     "core_logic.use_cases.create_github_resources",
+                     "core_logic.services.parse_issue_file_service")
+    assert _modules_loaded_by("import app.views", heavy_modules) == []
+    assert _modules_loaded_by("import app.github_resources", heavy_modules) == []
@@ -0,0 +1,191 @@
+"""
+解析結果セッションストアのテスト
+"""
+import datetime
+import time
+import uuid
+
+import pytest
+from django.utils import timezone
+
+from app.models import ParsedDataCache
+from app.session_store import (
+    DatabaseSessionStore, DjangoCacheSessionStore, InMemorySessionStore,
+    LocallyCachedSessionStore, create_session_store, decode_payload, encode_payload,
+    get_parsed_session_store
+)
+from core_logic.domain.models import IssueData, ParsedRequirementData
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_parsed_data(count: int = 2) -> ParsedRequirementData:
+    return ParsedRequirementData(issues=[
+        IssueData(temp_id=f"temp-{i}", title=f"Issue {i}", description="説明 " * 100)
+        for i in range(count)])
+
+
+def test_payload_round_trip_and_compression():
+    data = make_parsed_data(5)
+    compressed = encode_payload(data, compress=True)
+    plain = encode_payload(data, compress=False)
+
+    assert compressed[:1] == b"z" and plain[:1] == b"j"
+    assert len(compressed) < len(plain)
+    assert decode_payload(compressed) == data == decode_payload(plain)
+    # 小さいペイロードは圧縮しない
+    assert encode_payload(make_parsed_data(0), compress=True)[:1] == b"j"
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_in_memory_store_expires_and_evicts(compress):
+    clock = FakeClock()
+    store = InMemorySessionStore(max_entries=2, compress=compress, ttl=60,
+                                 sweep_interval=None, clock=clock)
+    first = store.save(make_parsed_data())
+    second = store.save(make_parsed_data(1))
+
+    assert store.load(first) == make_parsed_data()
+    third = store.save(make_parsed_data(3))
+    # first は直前に参照されたため、最も古く使われた second が削除される
+    assert store.load(second) is None
+    assert store.load(first) is not None
+
+    clock.now += 61
+    assert store.load(third) is None
+    assert store.load("not-a-uuid") is None
+
+
+def test_in_memory_store_sweeps_periodically():
+    clock = FakeClock()
+    store = InMemorySessionStore(ttl=60, sweep_interval=100, clock=clock)
+    store.save(make_parsed_data())
+    clock.now += 61
+    store.save(make_parsed_data())
+    assert len(store._entries) == 2  # 掃除間隔前は削除されない
+
+    clock.now += 40
+    store.save(make_parsed_data())
+    assert len(store._entries) == 2
+
+
+def test_in_memory_store_sweeps_on_load():
+    clock = FakeClock()
+    store = InMemorySessionStore(ttl=60, sweep_interval=100, clock=clock)
+    store.save(make_parsed_data())
+    kept_id = store.save(make_parsed_data())
+    clock.now += 101
+    store._entries[kept_id] = (clock.now + 60, store._entries[kept_id][1])
+
+    # 保存が途絶えても読み込みの際に期限切れのセッションが削除される
+    assert store.load(kept_id) is not None
+    assert list(store._entries) == [kept_id]
+
+
+def test_session_store_sweeper_thread_removes_expired_sessions():
+    clock = FakeClock()
+    store = InMemorySessionStore(ttl=60, sweep_interval=0.01, clock=clock)
+    store.save(make_parsed_data())
+    clock.now += 61
+
+    store.start_sweeper()
+    try:
+        for _ in range(200):
+            if not store._entries:
+                break
+            time.sleep(0.01)
+        assert not store._entries
+    finally:
+        store.stop_sweeper()
+    assert not store._sweeper_thread.is_alive()
+
+
+def test_session_store_sweeper_is_disabled_without_interval():
+    store = InMemorySessionStore(ttl=60, sweep_interval=None)
+    store.start_sweeper()
+    assert store._sweeper_thread is None
+
+
+@pytest.mark.django_db
+def test_database_store_compresses_and_sweeps_expired_rows():
+    store = DatabaseSessionStore(compress=True, ttl=60, sweep_interval=None)
+    data = make_parsed_data(5)
+    session_id = store.save(data)
+
+    row = ParsedDataCache.objects.get(id=session_id)
+    assert row.data["encoding"] == "zlib+base64"
+    assert store.load(session_id) == data
+
+    ParsedDataCache.objects.create(
+        data=data.model_dump(), expires_at=timezone.now() - datetime.timedelta(seconds=1))
+    assert store.sweep() == 1
+    assert ParsedDataCache.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_database_store_reads_uncompressed_rows_and_rejects_expired():
+    store = DatabaseSessionStore(sweep_interval=None)
+    data = make_parsed_data(1)
+    fresh = ParsedDataCache.objects.create(
+        data=data.model_dump(), expires_at=timezone.now() + datetime.timedelta(minutes=10))
+    stale = ParsedDataCache.objects.create(
+        data=data.model_dump(), expires_at=timezone.now() - datetime.timedelta(seconds=1))
+
+    assert store.load(str(fresh.id)) == data
+    assert store.load(str(stale.id)) is None
+    assert not ParsedDataCache.objects.filter(id=stale.id).exists()
+
+
+def test_django_cache_store_round_trip():
+    store = DjangoCacheSessionStore(ttl=60)
+    data = make_parsed_data(3)
+    session_id = store.save(data)
+
+    assert store.load(session_id) == data
+    store.delete(session_id)
+    assert store.load(session_id) is None
+
+
+@pytest.mark.django_db
+def test_locally_cached_store_serves_reads_from_memory():
+    store = create_session_store({"BACKEND": "database", "TTL": 60})
+    assert isinstance(store, LocallyCachedSessionStore)
+    data = make_parsed_data()
+    session_id = store.save(data)
+
+    ParsedDataCache.objects.all().delete()
+    assert store.load(session_id) == data
+    # 他のプロセスで保存されたセッションは共有ストアから読み込む
+    other_id = store.backend.save(data)
+    assert store.load(other_id) == data
+
+
+def test_locally_cached_store_sweeps_local_entries():
+    clock = FakeClock()
+    backend = DjangoCacheSessionStore(ttl=60, clock=clock)
+    store = LocallyCachedSessionStore(backend, InMemorySessionStore(
+        ttl=60, sweep_interval=None, clock=clock), sweep_interval=100)
+    store.save(make_parsed_data())
+    clock.now += 101
+
+    store.load(str(uuid.uuid4()))
+    assert not store.local._entries
+
+
+def test_get_parsed_session_store_is_shared():
+    assert get_parsed_session_store() is get_parsed_session_store()
+
+
+def test_create_session_store_backends():
+    assert isinstance(create_session_store(
+        {"BACKEND": "memory"}), InMemorySessionStore)
+    assert isinstance(create_session_store(
+        {"BACKEND": "cache", "LOCAL_CACHE": False}), DjangoCacheSessionStore)
+    with pytest.raises(ValueError):
+        create_session_store({"BACKEND": "unknown"})
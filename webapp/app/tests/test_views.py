@@ -7,6 +7,13 @@ from django.utils import timezone
 import datetime
 
 
+def inline_job_runner():
+    """テスト用: ジョブをリクエスト内で同期的に実行するランナー"""
+    from app.jobs import GitHubResourceJobRunner
+    from app.github_resources import build_create_github_resources_use_case
+    return GitHubResourceJobRunner(build_create_github_resources_use_case, max_workers=0)
+
+
 @pytest.mark.django_db
 def test_create_github_resources_success(client):
     # モックデータとAPIキー
@@ -25,7 +32,8 @@ def test_create_github_resources_success(client):
     url = reverse("app:create_github_resources_api")
     dummy_result = CreateGitHubResourcesResult(
         repository_url="https://github.com/test/test-repo", project_name=project_name)
-    with patch("app.views.CreateGitHubResourcesUseCase.execute", return_value=dummy_result):
+    with patch("core_logic.use_cases.create_github_resources.CreateGitHubResourcesUseCase.execute", return_value=dummy_result), \
+            patch("app.views.job_runner", inline_job_runner()):
         response = client.post(url, {
             "repo_name": repo_name,
             "project_name": project_name,
@@ -33,8 +41,34 @@ def test_create_github_resources_success(client):
             "session_id": cache.id,
             "selected_issue_temp_ids": selected_issue_temp_ids
         }, format="json")
-    assert response.status_code == 200
-    assert "repository_url" in response.data
+        # POST はジョブを登録してジョブIDを返し、結果はステータスAPIで取得する
+        assert response.status_code == 202
+        assert "job_id" in response.data
+        status_response = client.get(response.data["status_url"])
+    assert status_response.status_code == 200
+    assert status_response.data["status"] == "succeeded"
+    assert "repository_url" in status_response.data["result"]
+
+
+@pytest.mark.django_db
+def test_create_github_resources_enqueue_failure_returns_json_error(client):
+    """ジョブの登録に失敗した場合は、既存のエラーレスポンス形式 (detail) の500を返すこと"""
+    from django.db import DatabaseError
+    from app.models import ParsedDataCache
+    parsed_data = ParsedRequirementData(
+        issues=[IssueData(temp_id="temp-1", title="t", description="d")])
+    cache = ParsedDataCache.objects.create(data=parsed_data.model_dump(
+    ), expires_at=timezone.now() + datetime.timedelta(minutes=10))
+    runner = MagicMock()
+    runner.enqueue.side_effect = DatabaseError("database is locked")
+
+    with patch("app.views.job_runner", runner):
+        response = client.post(reverse("app:create_github_resources_api"), {
+            "repo_name": "test-repo", "session_id": cache.id,
+            "selected_issue_temp_ids": ["temp-1"]}, format="json")
+
+    assert response.status_code == 500
+    assert "database is locked" in response.data["detail"]
 
 
 @pytest.mark.django_db
@@ -74,3 +108,230 @@ def test_save_locally_fs_error(client, monkeypatch):
         client.post(url, {"session_id": 1, "selected_issue_temp_ids": [
                     "temp-1"]}, format="json")
     assert "FS error" in str(excinfo.value)
+
+
+@pytest.mark.django_db
+def test_parse_file_stream_returns_ndjson_events(client):
+    """キーが Issue のフィールドと一致する YAML はAIを使わずに解析され、Issueごとのイベントと完了イベントが返る"""
+    import json
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from app.views import parsed_session_store
+    content = "- title: A\n  description: a\n- title: B\n  description: b\n"
+    upload = SimpleUploadedFile(
+        "backlog.yaml", content.encode("utf-8"), content_type="application/x-yaml")
+
+    response = client.post(reverse("app:parse_file_stream_api"),
+                           {"issue_file": upload}, format="multipart")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in b"".join(
+        response.streaming_content).decode("utf-8").splitlines()]
+    assert [e["type"] for e in events] == ["issue", "issue", "complete"]
+    assert [e["issue"]["title"] for e in events[:2]] == ["A", "B"]
+    assert events[2]["issue_count"] == 2
+    cached = parsed_session_store.load(events[2]["session_id"])
+    assert [i.title for i in cached.issues] == ["A", "B"]
+
+
+@pytest.mark.django_db
+def test_parse_file_stream_rejects_unsupported_file(client):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    upload = SimpleUploadedFile("notes.txt", b"x", content_type="text/plain")
+
+    response = client.post(reverse("app:parse_file_stream_api"),
+                           {"issue_file": upload}, format="multipart")
+
+    assert response.status_code == 400
+    assert "File parsing failed" in response.data["detail"]
+
+
+@pytest.mark.django_db
+def test_parse_service_is_built_on_first_use_and_retried_after_failure(client):
+    """AIParser は最初の解析リクエストで組み立て、初期化に失敗した場合は次のリクエストで再試行する"""
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from core_logic.domain.exceptions import AiParserError
+    import app.views as views
+
+    def upload():
+        return SimpleUploadedFile("backlog.md", b"# A\nbody", content_type="text/markdown")
+
+    with patch.object(views, "_parse_issue_file_service", None), \
+            patch("app.views.AIParser", side_effect=AiParserError("API key is missing")) as parser_cls:
+        response = client.post(reverse("app:parse_file_stream_api"),
+                               {"issue_file": upload()}, format="multipart")
+        assert response.status_code == 400
+        assert "API key is missing" in response.data["detail"]
+
+        parser_cls.side_effect = None
+        assert views.get_parse_issue_file_service() is views.get_parse_issue_file_service()
+        assert parser_cls.call_count == 2
+
+
+@pytest.mark.django_db
+def test_github_resource_job_reports_progress_and_failure(client):
+    """ジョブのステップごとの進捗・途中結果・失敗が保存されること"""
+    from app.jobs import GitHubResourceJobRunner
+    from app.models import GitHubResourceJob
+    from core_logic.domain.exceptions import GitHubClientError
+
+    def execute(parsed_data, repo_name_input, project_name=None, dry_run=False, progress_callback=None, run_id=None):
+        partial = CreateGitHubResourcesResult(
+            repository_url="https://github.com/o/r")
+        progress_callback("resolve_repository", partial)
+        progress_callback("ensure_repository", partial)
+        # 中断時に集計された再試行回数 (通知後に更新された途中結果) も保存される
+        partial.retried_operations = {"rest.get_repository": 2}
+        raise GitHubClientError("boom")
+    use_case = MagicMock()
+    use_case.execute.side_effect = execute
+    runner = GitHubResourceJobRunner(lambda: use_case, max_workers=0)
+
+    job = runner.enqueue(ParsedRequirementData(
+        issues=[IssueData(title="t", description="d")]), repo_name="o/r")
+
+    job.refresh_from_db()
+    assert job.status == GitHubResourceJob.STATUS_FAILED
+    assert job.current_step == "ensure_repository"
+    assert job.completed_steps == ["resolve_repository"]
+    assert job.result["repository_url"] == "https://github.com/o/r"
+    assert job.result["retried_operations"] == {"rest.get_repository": 2}
+    assert "boom" in job.error
+    assert job.attempts == 1
+
+
+@pytest.mark.django_db
+def test_github_resource_job_recovers_interrupted_jobs():
+    """ハートビートが途絶えた実行中ジョブは、再起動後のランナーで再実行されること"""
+    from app.jobs import GitHubResourceJobRunner
+    from app.models import GitHubResourceJob
+    stale = timezone.now() - datetime.timedelta(minutes=10)
+    interrupted = GitHubResourceJob.objects.create(
+        repo_name="o/r", parsed_data={"issues": []},
+        status=GitHubResourceJob.STATUS_RUNNING, heartbeat_at=stale, attempts=1)
+    GitHubResourceJob.objects.filter(id=interrupted.id).update(created_at=stale)
+    alive = GitHubResourceJob.objects.create(
+        repo_name="o/r2", parsed_data={"issues": []},
+        status=GitHubResourceJob.STATUS_RUNNING, heartbeat_at=timezone.now())
+    use_case = MagicMock()
+    use_case.execute.return_value = CreateGitHubResourcesResult()
+    runner = GitHubResourceJobRunner(lambda: use_case, max_workers=0)
+
+    assert runner.recover() == 1
+    assert runner.recover() == 0  # 再実行済みのジョブは再投入しない
+
+    interrupted.refresh_from_db()
+    alive.refresh_from_db()
+    assert interrupted.status == GitHubResourceJob.STATUS_SUCCEEDED
+    assert interrupted.attempts == 2
+    assert alive.status == GitHubResourceJob.STATUS_RUNNING
+
+
+@pytest.mark.django_db
+def test_github_resource_job_recovery_runs_periodically():
+    """起動時にはまだ新しかったジョブも、定期的な回復処理でハートビートが途絶えた時点で再実行されること"""
+    from app.jobs import GitHubResourceJobRunner
+    from app.models import GitHubResourceJob
+    running = GitHubResourceJob.objects.create(
+        repo_name="o/r", parsed_data={"issues": []}, worker_id="dead-worker",
+        status=GitHubResourceJob.STATUS_RUNNING, heartbeat_at=timezone.now(), attempts=1)
+    queued = GitHubResourceJob.objects.create(
+        repo_name="o/r2", parsed_data={"issues": []})
+    use_case = MagicMock()
+    use_case.execute.return_value = CreateGitHubResourcesResult()
+    runner = GitHubResourceJobRunner(lambda: use_case, max_workers=0)
+
+    runner.start()
+    running.refresh_from_db()
+    queued.refresh_from_db()
+    assert running.status == GitHubResourceJob.STATUS_RUNNING
+    assert queued.status == GitHubResourceJob.STATUS_QUEUED
+
+    # 停止したワーカーのハートビートが途絶え、未着手のジョブも取り残されたまま stale_after を経過する
+    stale = timezone.now() - datetime.timedelta(minutes=10)
+    GitHubResourceJob.objects.filter(id=running.id).update(heartbeat_at=stale, created_at=stale)
+    GitHubResourceJob.objects.filter(id=queued.id).update(created_at=stale)
+    runner._maintain()
+
+    running.refresh_from_db()
+    queued.refresh_from_db()
+    assert running.status == GitHubResourceJob.STATUS_SUCCEEDED
+    assert running.attempts == 2
+    assert queued.status == GitHubResourceJob.STATUS_SUCCEEDED
+
+
+@pytest.mark.django_db
+def test_github_resource_job_recovery_skips_own_active_jobs():
+    """このワーカーで実行中のジョブは、ハートビートが古くても再実行しないこと"""
+    from app.jobs import GitHubResourceJobRunner
+    from app.models import GitHubResourceJob
+    stale = timezone.now() - datetime.timedelta(minutes=10)
+    use_case = MagicMock()
+    runner = GitHubResourceJobRunner(lambda: use_case, max_workers=0)
+    job = GitHubResourceJob.objects.create(
+        repo_name="o/r", parsed_data={"issues": []}, worker_id=runner.worker_id,
+        status=GitHubResourceJob.STATUS_RUNNING, heartbeat_at=stale)
+    GitHubResourceJob.objects.filter(id=job.id).update(created_at=stale)
+    runner._active_jobs.add(job.id)
+
+    assert runner.recover() == 0
+
+    job.refresh_from_db()
+    assert job.status == GitHubResourceJob.STATUS_RUNNING
+    use_case.execute.assert_not_called()
+
+
+def test_github_resource_job_runner_stop_ends_heartbeat_thread():
+    """stop() でハートビート・回復処理のスレッドが終了し、以降のジョブは受け付けないこと"""
+    import threading
+    import uuid
+    from app.jobs import GitHubResourceJobRunner
+    runner = GitHubResourceJobRunner(MagicMock(), max_workers=1, heartbeat_interval=0.01)
+    maintained = threading.Event()
+    runner._maintain = MagicMock(side_effect=maintained.set)
+    with runner._lock:
+        runner._ensure_heartbeat_thread()
+    assert maintained.wait(5)
+
+    runner.stop()
+
+    assert not runner._heartbeat_thread.is_alive()
+    with patch.object(runner, "_run_in_thread") as run_in_thread:
+        runner.submit(uuid.uuid4())
+    run_in_thread.assert_not_called()
+    assert runner._executor is None
+
+
+@pytest.mark.django_db
+def test_github_resource_job_status_not_found(client):
+    import uuid
+    response = client.get(reverse("app:github_resource_job_status_api",
+                                  kwargs={"job_id": uuid.uuid4()}))
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_github_api_metrics_prometheus_format(client):
+    from core_logic.adapters.github_metrics import GitHubApiMetrics
+    metrics = GitHubApiMetrics()
+    metrics.record_call("rest", "create_issue", 0.2, "201")
+    with patch("app.views.github_api_metrics", metrics):
+        response = client.get(reverse("app:github_api_metrics_api"))
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = response.content.decode()
+    assert 'github_api_calls_total{api="rest",operation="create_issue",status="201"} 1' in body
+    assert "# TYPE github_client_registry_stats gauge" in body
+
+
+def test_create_github_resources_result_serializer_includes_step_timings():
+    from app.serializers import CreateGitHubResourcesResultSerializer
+    from core_logic.domain.models import StepTiming
+    result = CreateGitHubResourcesResult(step_timings=[StepTiming(
+        step="issues", duration_seconds=2.0, api_calls=4, items=4, items_per_second=2.0)])
+    data = CreateGitHubResourcesResultSerializer(result).data
+    assert data["step_timings"][0] == {"step": "issues", "duration_seconds": 2.0,
+                                       "api_calls": 4, "items": 4, "items_per_second": 2.0}
+    # ジョブに保存された辞書形式の結果も同様にシリアライズできる
+    data = CreateGitHubResourcesResultSerializer(result.model_dump()).data
+    assert data["step_timings"][0]["step"] == "issues"
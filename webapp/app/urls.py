@@ -2,9 +2,12 @@ from django.urls import path
 from .views import (
     health_check_api_view,
     FileUploadAPIView,
+    FileStreamParseAPIView,
     GitHubCreateIssuesAPIView,
     AiSettingsAPIView,
     CreateGitHubResourcesAPIView,
+    GitHubResourceJobStatusAPIView,
+    GitHubApiMetricsAPIView,
     SaveLocallyAPIView,
     UploadAndParseView
 )
@@ -19,10 +22,18 @@ urlpatterns = [
     # --- File Processing API (mainブランチの新しいエンドポイントを採用) ---
     path('api/upload-and-parse/', UploadAndParseView.as_view(),
          name='upload_and_parse_api'),
+    # 解析済みのIssueから順に NDJSON で返すストリーミング版
+    path('api/v1/parse-file/stream/', FileStreamParseAPIView.as_view(),
+         name='parse_file_stream_api'),
 
     # --- GitHub Resource Creation and Local Save API (issue#209_01の機能とmainのURL構造を統合) ---
     path('api/v1/create-github-resources/',
          CreateGitHubResourcesAPIView.as_view(), name='create_github_resources_api'),
+    path('api/v1/jobs/<uuid:job_id>/', GitHubResourceJobStatusAPIView.as_view(),
+         name='github_resource_job_status_api'),
+    # GitHub API 呼び出しのメトリクス (Prometheus 形式)
+    path('api/v1/metrics/', GitHubApiMetricsAPIView.as_view(),
+         name='github_api_metrics_api'),
     path('api/v1/save-locally/', SaveLocallyAPIView.as_view(),
          name='save_locally_api'),
 
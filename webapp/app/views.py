@@ -1,7 +1,7 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from .forms import FileUploadForm
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import ensure_csrf_cookie
 
@@ -12,40 +12,91 @@ from rest_framework.response import Response
 from rest_framework import status, serializers
 from rest_framework.permissions import AllowAny, IsAuthenticated
 
-from .models import ParsedDataCache, UserAiSettings
-from django.utils import timezone
-from core_logic.domain.models import ParsedRequirementData, IssueData
-from core_logic.infrastructure.config import load_settings
+from .models import UserAiSettings, GitHubResourceJob
+from .session_store import get_parsed_session_store
+from .jobs import serialize_job
+from .github_resources import job_runner, github_client_registry_stats
+from django.conf import settings as django_settings
+from django.urls import reverse
+from core_logic.domain.models import ParsedRequirementData, IssueData, ParseReport
+from core_logic.infrastructure.config import get_settings
 from core_logic.adapters.ai_parser import AIParser
-from core_logic.adapters.markdown_issue_parser import MarkdownIssueParser
-from core_logic.adapters.yaml_issue_parser import YamlIssueParser
-from core_logic.adapters.json_issue_parser import JsonIssueParser
+from core_logic.adapters.parse_result_cache import create_parse_result_cache, create_inferred_rules_cache
 from core_logic.domain.exceptions import AiParserError, ParsingError
-from core_logic.use_cases.create_github_resources import CreateGitHubResourcesUseCase
-from githubkit import GitHub
-from core_logic.adapters.github_rest_client import GitHubRestClient
-from core_logic.adapters.github_graphql_client import GitHubGraphQLClient
-from core_logic.adapters.assignee_validator import AssigneeValidator
-from core_logic.use_cases.create_repository import CreateRepositoryUseCase
-from core_logic.use_cases.create_issues import CreateIssuesUseCase
-from core_logic.domain.exceptions import GitHubClientError, GitHubAuthenticationError, GitHubValidationError
-from core_logic.services import parse_issue_file_service
+from core_logic.adapters.github_metrics import github_api_metrics, render_stats_family
 from .authentication import CustomAPIKeyAuthentication
 from webapp.app.permissions import HasValidAPIKey
 from .serializers import ParsedRequirementDataSerializer, CreateGitHubResourcesResultSerializer
-from core_logic.use_cases.local_save_use_case import LocalSaveUseCase
 
 
+import json
 import logging
 import os
+import threading
 import uuid
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from core_logic.services.parse_issue_file_service import ParseIssueFileService
 
 logger = logging.getLogger(__name__)
 
-settings = load_settings()
-ai_parser = AIParser(settings=settings)
-parse_issue_file_service = parse_issue_file_service.ParseIssueFileService(
-    ai_parser)
+settings = get_settings()
+parse_result_cache = create_parse_result_cache(settings.ai)
+inferred_rules_cache = create_inferred_rules_cache(settings.ai)
+# AIParser (LangChain・プロバイダーの SDK の読み込みを含む) はワーカーの起動を遅くするため、最初の解析リクエストで組み立てる
+_parse_service_lock = threading.Lock()
+_parse_issue_file_service: Optional["ParseIssueFileService"] = None
+
+
+def get_parse_issue_file_service() -> "ParseIssueFileService":
+    """
+    共有の ParseIssueFileService を返します (初回呼び出し時に AIParser とともに組み立てます)。
+    LLM クライアントの初期化に失敗した場合は AiParserError を送出し、次回の呼び出しで再試行します。
+    """
+    global _parse_issue_file_service
+    with _parse_service_lock:
+        if _parse_issue_file_service is None:
+            from core_logic.services.parse_issue_file_service import ParseIssueFileService
+            ai_parser = AIParser(
+                settings=settings, cache=parse_result_cache, rules_cache=inferred_rules_cache)
+            _parse_issue_file_service = ParseIssueFileService(
+                ai_parser, chunk_token_budget=settings.ai.parse_chunk_token_budget,
+                max_parallel_chunks=settings.ai.parse_max_parallel_chunks,
+                rule_based_fast_path=settings.ai.structured_fast_path,
+                key_mapping=settings.ai.structured_key_mapping)
+        return _parse_issue_file_service
+
+
+# 解析結果はセッションストアに保存し、作成・ローカル保存APIに session_id で引き継ぐ
+parsed_session_store = get_parsed_session_store()
+
+
+def _file_too_large_response() -> Response:
+    limit_mb = django_settings.ISSUE_FILE_MAX_UPLOAD_SIZE // (1024 * 1024)
+    return Response({"detail": f"File size exceeds {limit_mb}MB limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _load_selected_issues(session_id, selected_issue_temp_ids):
+    """
+    セッションストアから解析結果を読み込み、選択されたIssueのみを返します。
+    戻り値は (ParsedRequirementData, None) または (None, エラーレスポンス)。
+    """
+    try:
+        full_parsed_data = parsed_session_store.load(str(session_id))
+    except Exception as e:
+        logger.error(
+            f"Failed to load or process cached data: {e}", exc_info=True)
+        return None, Response({"detail": "Failed to retrieve parsed issue data."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    if full_parsed_data is None:
+        return None, Response({"detail": "Parsed data session not found or expired."}, status=status.HTTP_400_BAD_REQUEST)
+    selected_issues = [
+        issue for issue in full_parsed_data.issues
+        if issue.temp_id in selected_issue_temp_ids
+    ]
+    if not selected_issues:
+        return None, Response({"detail": "No selected issues found matching the provided IDs within the cached data."}, status=status.HTTP_400_BAD_REQUEST)
+    return ParsedRequirementData(issues=selected_issues), None
 
 
 @api_view(['GET'])
@@ -66,6 +117,29 @@ def api_root(request):
     })
 
 
+def _issue_to_minimal_dict(issue: IssueData) -> dict:
+    """UI に返すIssueの必要最小限の情報"""
+    return {
+        "temp_id": issue.temp_id,
+        "title": issue.title,
+        "description": issue.description,
+        "assignees": issue.assignees,
+        "labels": issue.labels,
+        "tasks": issue.tasks,
+        "acceptance": issue.acceptance,
+        "milestone": issue.milestone,
+        "relational_definition": issue.relational_definition,
+        "relational_issues": issue.relational_issues,
+    }
+
+
+def _format_parse_warnings(parse_report: ParseReport) -> list:
+    return [
+        f"Blocks {failure.first_block + 1}-{failure.last_block + 1} could not be parsed: {failure.error}"
+        for failure in parse_report.failed_chunks
+    ]
+
+
 class FileUploadAPIView(APIView):
     parser_classes = [MultiPartParser]
     authentication_classes = [CustomAPIKeyAuthentication]
@@ -75,39 +149,26 @@ class FileUploadAPIView(APIView):
         uploaded_file = request.FILES.get('issue_file')
         if not uploaded_file:
             return Response({"detail": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
-        # 10MB超過チェック
-        max_size = 10 * 1024 * 1024  # 10MB
-        if uploaded_file.size > max_size:
-            return Response({"detail": "File size exceeds 10MB limit."}, status=status.HTTP_400_BAD_REQUEST)
+        if uploaded_file.size > django_settings.ISSUE_FILE_MAX_UPLOAD_SIZE:
+            return _file_too_large_response()
         try:
-            parsed_data = parse_issue_file_service.parse(
-                uploaded_file.name, uploaded_file.read())
+            parse_report = get_parse_issue_file_service().parse_with_report(
+                uploaded_file.name, uploaded_file.chunks())
+            parsed_data = parse_report.data
             if not parsed_data.issues:
                 return Response({"detail": "No issues extracted from file."}, status=status.HTTP_400_BAD_REQUEST)
             # パース結果を一時保存
-            cached_entry = ParsedDataCache.objects.create(
-                data=parsed_data.model_dump())
-            unique_session_id = str(cached_entry.id)
-            # UI に返すのは必要最小限の情報
-            minimal_issues_data = [
-                {
-                    "temp_id": issue.temp_id,
-                    "title": issue.title,
-                    "description": issue.description,
-                    "assignees": issue.assignees,
-                    "labels": issue.labels,
-                    "tasks": issue.tasks,
-                    "acceptance": issue.acceptance,
-                    "milestone": issue.milestone,
-                    "relational_definition": issue.relational_definition,
-                    "relational_issues": issue.relational_issues,
-                }
-                for issue in parsed_data.issues
-            ]
-            return Response({
+            unique_session_id = parsed_session_store.save(parsed_data)
+            response_data = {
                 "session_id": unique_session_id,
-                "issues": minimal_issues_data
-            }, status=status.HTTP_200_OK)
+                # UI に返すのは必要最小限の情報
+                "issues": [_issue_to_minimal_dict(issue) for issue in parsed_data.issues]
+            }
+            # 分割解析で一部のチャンクが失敗した場合は、その旨を返す
+            if parse_report.failed_chunks:
+                response_data["parse_warnings"] = _format_parse_warnings(
+                    parse_report)
+            return Response(response_data, status=status.HTTP_200_OK)
         except (ParsingError, AiParserError) as e:
             logger.error(f"File parsing error: {e}", exc_info=True)
             return Response({"detail": f"File parsing failed: {e}"}, status=status.HTTP_400_BAD_REQUEST)
@@ -117,6 +178,67 @@ class FileUploadAPIView(APIView):
             return Response({"detail": f"An unexpected error occurred: {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class FileStreamParseAPIView(APIView):
+    """
+    アップロードされたファイルを解析し、完成したIssueから順に NDJSON (1行1イベントのJSON) で返すAPI。
+    イベント: {"type": "issue", "issue": {...}} → 最後に {"type": "complete", "session_id": ..., ...}
+    解析途中でエラーが発生した場合は {"type": "error", "detail": ...} を返して終了します。
+    """
+    parser_classes = [MultiPartParser]
+    authentication_classes = [CustomAPIKeyAuthentication]
+    permission_classes = []
+
+    def post(self, request, *args, **kwargs):
+        uploaded_file = request.FILES.get('issue_file')
+        if not uploaded_file:
+            return Response({"detail": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
+        if uploaded_file.size > django_settings.ISSUE_FILE_MAX_UPLOAD_SIZE:
+            return _file_too_large_response()
+        parse_report = ParseReport(data=ParsedRequirementData(issues=[]))
+        # 最初のIssueまでは通常のレスポンスとしてエラーを返せるよう、ストリーミング開始前に取得する
+        try:
+            issues = get_parse_issue_file_service().parse_stream(
+                uploaded_file.name, uploaded_file.chunks(), report=parse_report)
+            first_issue = next(issues, None)
+        except (ParsingError, AiParserError) as e:
+            logger.error(f"File parsing error: {e}", exc_info=True)
+            return Response({"detail": f"File parsing failed: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.exception(
+                f"Unexpected error during streaming file parsing: {e}")
+            return Response({"detail": f"An unexpected error occurred: {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if first_issue is None:
+            return Response({"detail": "No issues extracted from file."}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(
+            self._stream_events(first_issue, issues, parse_report),
+            content_type="application/x-ndjson")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # リバースプロキシでのバッファリングを無効化
+        return response
+
+    @staticmethod
+    def _stream_events(first_issue: IssueData, issues, parse_report: ParseReport):
+        def event(payload: dict) -> str:
+            return json.dumps(payload, ensure_ascii=False) + "\n"
+
+        try:
+            yield event({"type": "issue", "issue": _issue_to_minimal_dict(first_issue)})
+            for issue in issues:
+                yield event({"type": "issue", "issue": _issue_to_minimal_dict(issue)})
+            # すべて受信したら、作成APIで使えるよう解析結果を一時保存する
+            session_id = parsed_session_store.save(parse_report.data)
+            complete = {"type": "complete", "session_id": session_id,
+                        "issue_count": len(parse_report.data.issues)}
+            if parse_report.failed_chunks:
+                complete["parse_warnings"] = _format_parse_warnings(
+                    parse_report)
+            yield event(complete)
+        except Exception as e:
+            logger.exception(f"Error while streaming parsed issues: {e}")
+            yield event({"type": "error", "detail": f"File parsing failed: {e}"})
+
+
 class CreateGitHubResourcesAPIView(APIView):
     authentication_classes = [CustomAPIKeyAuthentication]
     permission_classes = []
@@ -131,58 +253,61 @@ class CreateGitHubResourcesAPIView(APIView):
 
         if not session_id or not selected_issue_temp_ids:
             return Response({"detail": "Missing session ID or selected issues."}, status=status.HTTP_400_BAD_REQUEST)
+        parsed_data_for_use_case, error_response = _load_selected_issues(
+            session_id, selected_issue_temp_ids)
+        if error_response is not None:
+            return error_response
         try:
-            cached_entry = ParsedDataCache.objects.get(id=session_id)
-            if cached_entry.expires_at < timezone.now():
-                cached_entry.delete()
-                return Response({"detail": "Parsed data session expired."}, status=status.HTTP_400_BAD_REQUEST)
-            full_parsed_data = ParsedRequirementData(**cached_entry.data)
-            selected_issues = [
-                issue for issue in full_parsed_data.issues
-                if issue.temp_id in selected_issue_temp_ids
-            ]
-            if not selected_issues:
-                return Response({"detail": "No selected issues found matching the provided IDs within the cached data."}, status=status.HTTP_400_BAD_REQUEST)
-            parsed_data_for_use_case = ParsedRequirementData(
-                issues=selected_issues)
-        except ParsedDataCache.DoesNotExist:
-            return Response({"detail": "Parsed data session not found or expired."}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            logger.error(
-                f"Failed to load or process cached data: {e}", exc_info=True)
-            return Response({"detail": "Failed to retrieve parsed issue data."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        try:
-            settings = load_settings()
-            github_instance = GitHub(settings.github_pat.get_secret_value())
-            rest_client = GitHubRestClient(github_instance=github_instance)
-            graphql_client = GitHubGraphQLClient(
-                github_instance=github_instance)
-            assignee_validator = AssigneeValidator(rest_client=rest_client)
-            create_repo_uc = CreateRepositoryUseCase(github_client=rest_client)
-            create_issues_uc = CreateIssuesUseCase(
-                rest_client=rest_client, assignee_validator=assignee_validator)
-            main_use_case = CreateGitHubResourcesUseCase(
-                rest_client=rest_client,
-                graphql_client=graphql_client,
-                create_repo_uc=create_repo_uc,
-                create_issues_uc=create_issues_uc
-            )
-            result = main_use_case.execute(
-                parsed_data=parsed_data_for_use_case,
-                repo_name_input=repo_name,
-                project_name=project_name,
-                dry_run=dry_run
-            )
-            serializer = CreateGitHubResourcesResultSerializer(
-                result.model_dump())
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except (GitHubAuthenticationError, GitHubClientError, GitHubValidationError) as e:
-            logger.error(f"GitHub operation failed: {e}", exc_info=True)
-            return Response({"detail": f"GitHub operation failed: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+            job = job_runner.enqueue(
+                parsed_data=parsed_data_for_use_case, repo_name=repo_name,
+                project_name=project_name, dry_run=dry_run)
+            job.refresh_from_db()
         except Exception as e:
             logger.exception(
-                f"Unexpected error during GitHub resource creation: {e}")
+                f"Unexpected error while enqueuing GitHub resource creation: {e}")
             return Response({"detail": f"An unexpected error occurred: {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        response_data = serialize_job(job)
+        response_data["status_url"] = reverse(
+            "app:github_resource_job_status_api", kwargs={"job_id": job.id})
+        return Response(response_data, status=status.HTTP_202_ACCEPTED)
+
+
+class GitHubResourceJobStatusAPIView(APIView):
+    """リソース作成ジョブの状態・進捗・途中結果を返すAPI"""
+    authentication_classes = [CustomAPIKeyAuthentication]
+    permission_classes = []
+
+    def get(self, request, job_id, *args, **kwargs):
+        job_runner.start()
+        try:
+            job = GitHubResourceJob.objects.get(id=job_id)
+        except GitHubResourceJob.DoesNotExist:
+            return Response({"detail": "Job not found."}, status=status.HTTP_404_NOT_FOUND)
+        response_data = serialize_job(job)
+        if job.result is not None:
+            response_data["result"] = CreateGitHubResourcesResultSerializer(
+                job.result).data
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class GitHubApiMetricsAPIView(APIView):
+    """
+    GitHub API 呼び出しのメトリクス (レイテンシのヒストグラム・ステータスコード・リトライ・
+    レート制限の残量・GraphQLコスト) とキャッシュの統計を Prometheus のテキスト形式で返すAPI
+    """
+    authentication_classes = [CustomAPIKeyAuthentication]
+    permission_classes = []
+
+    def get(self, request, *args, **kwargs):
+        lines = [github_api_metrics.render_prometheus().rstrip("\n")]
+        lines += render_stats_family(
+            "parse_cache_stats", "Parse result and inferred rules cache statistics.",
+            [({"cache": "parse_result"}, parse_result_cache.stats() if parse_result_cache is not None else {}),
+             ({"cache": "inferred_rules"}, inferred_rules_cache.stats() if inferred_rules_cache is not None else {})])
+        lines += render_stats_family(
+            "github_client_registry_stats", "Shared GitHub client registry statistics.",
+            [({}, github_client_registry_stats())])
+        return HttpResponse("\n".join(lines) + "\n", content_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 class GitHubCreateIssuesAPIView(APIView):
@@ -213,26 +338,11 @@ class SaveLocallyAPIView(APIView):
         dry_run = request.data.get('dry_run', False)
         if not session_id or not selected_issue_temp_ids:
             return Response({"detail": "Missing session ID or selected issues."}, status=status.HTTP_400_BAD_REQUEST)
-        try:
-            cached_entry = ParsedDataCache.objects.get(id=session_id)
-            if cached_entry.expires_at < timezone.now():
-                cached_entry.delete()
-                return Response({"detail": "Parsed data session expired."}, status=status.HTTP_400_BAD_REQUEST)
-            full_parsed_data = ParsedRequirementData(**cached_entry.data)
-            selected_issues = [
-                issue for issue in full_parsed_data.issues
-                if issue.temp_id in selected_issue_temp_ids
-            ]
-            if not selected_issues:
-                return Response({"detail": "No selected issues found matching the provided IDs within the cached data."}, status=status.HTTP_400_BAD_REQUEST)
-            parsed_data_for_use_case = ParsedRequirementData(
-                issues=selected_issues)
-        except ParsedDataCache.DoesNotExist:
-            return Response({"detail": "Parsed data session not found or expired."}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            logger.error(
-                f"Failed to load or process cached data: {e}", exc_info=True)
-            return Response({"detail": "Failed to retrieve parsed issue data."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        parsed_data_for_use_case, error_response = _load_selected_issues(
+            session_id, selected_issue_temp_ids)
+        if error_response is not None:
+            return error_response
+        from core_logic.use_cases.local_save_use_case import LocalSaveUseCase
         try:
             result = LocalSaveUseCase().execute(
                 parsed_data=parsed_data_for_use_case, dry_run=dry_run)
@@ -251,9 +361,8 @@ class UploadAndParseView(APIView):
         uploaded_file = request.FILES.get('file')
         if not uploaded_file:
             return Response({"detail": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
-        max_size = 10 * 1024 * 1024
-        if uploaded_file.size > max_size:
-            return Response({"detail": "File size exceeds 10MB limit."}, status=status.HTTP_400_BAD_REQUEST)
+        if uploaded_file.size > django_settings.ISSUE_FILE_MAX_UPLOAD_SIZE:
+            return _file_too_large_response()
         allowed_exts = ['md', 'yml', 'yaml', 'json']
         ext = uploaded_file.name.split('.')[-1].lower()
         if ext not in allowed_exts:
@@ -263,8 +372,8 @@ class UploadAndParseView(APIView):
         if not github_pat or not ai_api_key:
             return Response({"detail": "API key missing."}, status=status.HTTP_401_UNAUTHORIZED)
         try:
-            parsed_data = parse_issue_file_service.parse(
-                uploaded_file.name, uploaded_file.read())
+            parsed_data = get_parse_issue_file_service().parse(
+                uploaded_file.name, uploaded_file.chunks())
             serializer = ParsedRequirementDataSerializer(parsed_data)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except (ParsingError, AiParserError) as e:
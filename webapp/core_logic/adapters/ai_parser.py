@@ -1,84 +1,119 @@
 from .rule_based_splitter import RuleBasedSplitterSvc  # 相対importで再度試行
 import logging
-from typing import Type, Union, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Type, Union, List, Dict, Any, Optional, Iterator
 # pydantic.ValidationError をインポート
 from pydantic import ValidationError
-from langchain_core.messages import AIMessage
+import yaml
 
 # 設定、データモデル、カスタム例外をインポート
 from core_logic.infrastructure.config import Settings
 from core_logic.domain.models import ParsedRequirementData, IssueData, AISuggestedRules
 from core_logic.domain.exceptions import AiParserError
+from core_logic.adapters.parse_result_cache import ParseResultCache, document_shape_fingerprint
 
-# --- LangChain のコアコンポーネント ---
-from langchain_core.prompts import PromptTemplate
-# PydanticOutputParser は不要になる
-# from langchain_core.output_parsers import PydanticOutputParser
-# OutputParserExceptionもwith_structured_outputでは使用しないため削除
-# from langchain_core.exceptions import OutputParserException
-from langchain_core.runnables import RunnableSerializable
-from langchain_core.language_models.chat_models import BaseChatModel
-
-
-# --- LLM 実装 (try-except でインポート) ---
-try:
-    from langchain_openai import ChatOpenAI
-except ImportError:
-    ChatOpenAI = None
-    logging.debug("langchain-openai not installed.")
-try:
-    from langchain_google_genai import ChatGoogleGenerativeAI
-except ImportError:
-    ChatGoogleGenerativeAI = None
-    logging.debug("langchain-google-genai not installed.")
-
-# --- API エラークラス (変更なし) ---
-_OPENAI_ERRORS = tuple()
-_GOOGLE_ERRORS = tuple()
-try:
-    from openai import AuthenticationError as OpenAIAuthenticationError
-    from openai import RateLimitError as OpenAIRateLimitError
-    from openai import APIError as OpenAIAPIError
-    from openai import APITimeoutError as OpenAITimeoutError
-    from openai import NotFoundError as OpenAINotFoundError  # 追加
-    _OPENAI_ERRORS = (OpenAIAuthenticationError, OpenAIRateLimitError,
-                      OpenAIAPIError, OpenAITimeoutError, OpenAINotFoundError)
-except ImportError:
-    logging.debug(
-        "openai library not fully available for specific error handling.")
-try:
-    from google.api_core.exceptions import PermissionDenied as GooglePermissionDenied
-    from google.api_core.exceptions import ResourceExhausted as GoogleResourceExhausted
-    from google.api_core.exceptions import GoogleAPICallError, DeadlineExceeded as GoogleTimeoutError
-    from google.api_core.exceptions import NotFound as GoogleNotFound  # 追加
-    _GOOGLE_ERRORS = (GooglePermissionDenied, GoogleResourceExhausted,
-                      GoogleAPICallError, GoogleTimeoutError, GoogleNotFound)
-except ImportError:
-    logging.debug(
-        "google-api-core library not fully available for specific error handling.")
+logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableSerializable
+    from langchain_core.language_models.chat_models import BaseChatModel
 
-logger = logging.getLogger(__name__)
+# --- LangChain・LLM 実装・API エラークラス ---
+# LangChain と各プロバイダーの SDK は読み込みに数秒かかるため、モジュールの import 時ではなく
+# AIParser の初期化時に、設定で選択したプロバイダーの分だけ読み込む (_load_langchain / _load_provider)。
+# 読み込み前は _NOT_LOADED、パッケージがインストールされていない場合は None になる。
+_NOT_LOADED: Any = object()
+PromptTemplate: Any = _NOT_LOADED
+AIMessage: Any = _NOT_LOADED
+ChatOpenAI: Any = _NOT_LOADED
+ChatGoogleGenerativeAI: Any = _NOT_LOADED
+_OPENAI_ERRORS: tuple = tuple()
+_GOOGLE_ERRORS: tuple = tuple()
+
+
+def _load_langchain() -> None:
+    """LangChain のコアコンポーネント (PromptTemplate・AIMessage) を読み込みます。"""
+    global PromptTemplate, AIMessage
+    if PromptTemplate is _NOT_LOADED:
+        from langchain_core.prompts import PromptTemplate as _PromptTemplate
+        PromptTemplate = _PromptTemplate
+    if AIMessage is _NOT_LOADED:
+        from langchain_core.messages import AIMessage as _AIMessage
+        AIMessage = _AIMessage
+
+
+def _load_provider(model_type: str) -> None:
+    """
+    選択したプロバイダーの LLM 実装と API エラークラスを読み込みます。
+    読み込み済みかどうかはモジュール変数自体で判定するため、テストでの差し替え (patch) が戻された後も再度読み込みます。
+    """
+    global ChatOpenAI, ChatGoogleGenerativeAI, _OPENAI_ERRORS, _GOOGLE_ERRORS
+    if model_type == "openai":
+        if ChatOpenAI is _NOT_LOADED:
+            try:
+                from langchain_openai import ChatOpenAI as _ChatOpenAI
+            except ImportError:
+                _ChatOpenAI = None
+                logger.debug("langchain-openai not installed.")
+            ChatOpenAI = _ChatOpenAI
+        if not _OPENAI_ERRORS:
+            try:
+                from openai import AuthenticationError as OpenAIAuthenticationError
+                from openai import RateLimitError as OpenAIRateLimitError
+                from openai import APIError as OpenAIAPIError
+                from openai import APITimeoutError as OpenAITimeoutError
+                from openai import NotFoundError as OpenAINotFoundError
+                _OPENAI_ERRORS = (OpenAIAuthenticationError, OpenAIRateLimitError,
+                                  OpenAIAPIError, OpenAITimeoutError, OpenAINotFoundError)
+            except ImportError:
+                logger.debug(
+                    "openai library not fully available for specific error handling.")
+    elif model_type == "gemini":
+        if ChatGoogleGenerativeAI is _NOT_LOADED:
+            try:
+                from langchain_google_genai import ChatGoogleGenerativeAI as _ChatGoogleGenerativeAI
+            except ImportError:
+                _ChatGoogleGenerativeAI = None
+                logger.debug("langchain-google-genai not installed.")
+            ChatGoogleGenerativeAI = _ChatGoogleGenerativeAI
+        if not _GOOGLE_ERRORS:
+            try:
+                from google.api_core.exceptions import PermissionDenied as GooglePermissionDenied
+                from google.api_core.exceptions import ResourceExhausted as GoogleResourceExhausted
+                from google.api_core.exceptions import GoogleAPICallError, DeadlineExceeded as GoogleTimeoutError
+                from google.api_core.exceptions import NotFound as GoogleNotFound
+                _GOOGLE_ERRORS = (GooglePermissionDenied, GoogleResourceExhausted,
+                                  GoogleAPICallError, GoogleTimeoutError, GoogleNotFound)
+            except ImportError:
+                logger.debug(
+                    "google-api-core library not fully available for specific error handling.")
 
 
 class AIParser:
     """
     LangChain と Generative AI を使用して Markdown テキストから Issue 情報を解析するクラス。
     with_structured_output を利用して信頼性を向上。
+    cache を指定した場合、同じ入力・モデル・プロンプトの解析結果はLLMを呼ばずにキャッシュから返します。
+    rules_cache を指定した場合、同じ形 (見出し構造・キー名) の文書の推論ルールを再利用します。
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, cache: Optional[ParseResultCache] = None,
+                 rules_cache: Optional[ParseResultCache] = None):
         self.settings = settings
-        self.llm: BaseChatModel = self._initialize_llm()
-        self.chain: RunnableSerializable = self._build_chain()
+        self.cache = cache
+        self.rules_cache = rules_cache
+        _load_langchain()
+        self.llm: "BaseChatModel" = self._initialize_llm()
+        self.chain: "RunnableSerializable" = self._build_chain()
         self.splitter = RuleBasedSplitterSvc()
         logger.info(
             f"AIParser initialized with model type: {self.settings.ai_model}")
 
-    def _initialize_llm(self) -> BaseChatModel:
+    def _initialize_llm(self) -> "BaseChatModel":
         """設定に基づいて適切な LangChain LLM クライアントを初期化します。"""
         model_type = self.settings.ai_model.lower()
         logger.debug(f"Initializing LLM for model type: {model_type}")
+        _load_provider(model_type)
 
         openai_model_name = self.settings.final_openai_model_name
         gemini_model_name = self.settings.final_gemini_model_name
@@ -132,14 +167,28 @@ class AIParser:
                 logger.info(
                     f"ChatGoogleGenerativeAI client initialized with model: {gemini_model_name}")
                 return llm
+
+            elif model_type == "replay":
+                # ネットワークに接続せずに記録済み・合成した結果を返す (負荷試験・プロファイリング用)
+                from core_logic.adapters.replay_llm import ReplayChatModel, load_replay_responses
+                replay = self.settings.ai.replay
+                responses = load_replay_responses(
+                    replay.responses_path) if replay.responses_path else []
+                llm = ReplayChatModel(
+                    responses=responses, synthetic_issues=replay.synthetic_issues,
+                    latency=replay.latency, seconds_per_output_token=replay.seconds_per_output_token,
+                    prompt_tokens=replay.prompt_tokens, completion_tokens=replay.completion_tokens)
+                logger.info(
+                    f"Replay model initialized with {len(responses)} recorded response(s) (latency: {replay.latency}s).")
+                return llm
             else:
                 raise ValueError(
-                    f"Unsupported AI model type in settings: '{model_type}'. Supported: 'openai', 'gemini'")
+                    f"Unsupported AI model type in settings: '{model_type}'. Supported: 'openai', 'gemini', 'replay'")
 
         except ImportError as e:
             raise AiParserError(
                 f"Import error for '{model_type}': {e}", e) from e
-        except ValueError as e:
+        except (ValueError, OSError, yaml.YAMLError) as e:
             raise AiParserError(
                 f"Configuration error for '{model_type}': {e}", e) from e
         except (*_OPENAI_ERRORS, *_GOOGLE_ERRORS) as e:
@@ -155,7 +204,7 @@ class AIParser:
             raise AiParserError(
                 f"Could not initialize LLM client ({model_type}): {e}", e) from e
 
-    def _build_chain(self) -> RunnableSerializable:
+    def _build_chain(self) -> "RunnableSerializable":
         """
         プロンプトと構造化出力LLMを繋いだ LangChain Chain を構築します。
         PydanticOutputParser は使用しません。
@@ -170,11 +219,14 @@ class AIParser:
             prompt_template_text = self.settings.prompt_template
 
             # プロンプトテンプレートを調整
-            # テンプレートにformat_instructionsプレースホルダーが含まれない前提で空の辞書を提供
+            # with_structured_output では出力形式の指示は不要なため、
+            # 旧形式のテンプレートに残っている {format_instructions} は空文字列で埋める
+            partial_variables = {"format_instructions": ""} \
+                if "{format_instructions}" in prompt_template_text else {}
             prompt = PromptTemplate(
                 template=prompt_template_text,
                 input_variables=["markdown_text"],
-                partial_variables={}
+                partial_variables=partial_variables
             )
             logger.debug(
                 f"Using prompt template loaded from settings (length: {len(prompt_template_text)}).")
@@ -201,6 +253,23 @@ class AIParser:
             raise AiParserError(
                 f"Failed to build LangChain chain: {e}", original_exception=e) from e
 
+    def _model_identifier(self) -> str:
+        """キャッシュキーに含めるモデル識別子 (例: 'openai:gpt-4o')"""
+        model_type = self.settings.ai_model.lower()
+        if model_type == "replay":
+            return f"replay:{self.settings.ai.replay.responses_path or 'synthetic'}"
+        model_name = self.settings.final_openai_model_name if model_type == "openai" \
+            else self.settings.final_gemini_model_name
+        return f"{model_type}:{model_name}"
+
+    def cache_stats(self) -> Dict[str, int]:
+        """解析結果キャッシュのヒット・ミス件数を返します (キャッシュ未設定の場合は空)。"""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def rules_cache_stats(self) -> Dict[str, int]:
+        """推論ルールキャッシュのヒット・ミス件数を返します (キャッシュ未設定の場合は空)。"""
+        return self.rules_cache.stats() if self.rules_cache is not None else {}
+
     def parse(self, content_input: Union[str, List[Dict[str, Any]]]) -> ParsedRequirementData:
         """
         Markdown/YAML/JSONテキストまたはlist[dict]を解析し、構造化されたIssueデータを抽出します。
@@ -217,6 +286,15 @@ class AIParser:
             logger.warning(
                 "Input content is empty or whitespace only, returning empty data.")
             return ParsedRequirementData(issues=[])
+        cache_key: Optional[str] = None
+        if self.cache is not None:
+            cache_key = ParseResultCache.make_key(
+                str(content_to_parse), self._model_identifier(), self.settings.prompt_template)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"Returning cached AI parse result ({len(cached.issues)} issue(s)) without invoking the LLM.")
+                return cached
         if not hasattr(self, 'chain') or self.chain is None:
             logger.error("AI processing chain is not initialized.")
             raise AiParserError("AI processing chain is not initialized.")
@@ -235,6 +313,8 @@ class AIParser:
             else:
                 logger.info(
                     f"Successfully parsed {len(result.issues)} issue(s).")
+            if cache_key is not None:
+                self.cache.put(cache_key, result)
             return result
         except ValidationError as e:
             logger.error(f"AI output validation failed: {e}", exc_info=False)
@@ -263,43 +343,122 @@ class AIParser:
             raise AiParserError(
                 "An unexpected error occurred during AI parsing.", original_exception=e) from e
 
+    def parse_stream(self, content_input: Union[str, List[Dict[str, Any]]]) -> Iterator[IssueData]:
+        """
+        parse のストリーミング版。LLMの部分的な構造化出力を受け取りながら、完成したIssueから順に返します。
+        部分出力では末尾のIssueがまだ生成途中の可能性があるため、次のIssueが現れた時点で1つ前のIssueを確定とします。
+        すべて受信した結果はキャッシュに保存し、キャッシュにある場合はLLMを呼ばずに返します。
+        """
+        if isinstance(content_input, list):
+            import json
+            content_to_parse = json.dumps(
+                content_input, indent=2, ensure_ascii=False)
+        else:
+            content_to_parse = content_input
+        if not content_to_parse or not str(content_to_parse).strip():
+            logger.warning(
+                "Input content is empty or whitespace only, nothing to stream.")
+            return
+        cache_key: Optional[str] = None
+        if self.cache is not None:
+            cache_key = ParseResultCache.make_key(
+                str(content_to_parse), self._model_identifier(), self.settings.prompt_template)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"Streaming cached AI parse result ({len(cached.issues)} issue(s)) without invoking the LLM.")
+                yield from cached.issues
+                return
+        if not hasattr(self, 'chain') or self.chain is None:
+            logger.error("AI processing chain is not initialized.")
+            raise AiParserError("AI processing chain is not initialized.")
+
+        emitted: List[IssueData] = []
+        latest_issues: List[Any] = []
+        try:
+            for partial in self.chain.stream({"markdown_text": content_to_parse}):
+                latest_issues = self._partial_issues(partial)
+                # 末尾以外のIssueは生成が完了している
+                while len(emitted) < len(latest_issues) - 1:
+                    issue = self._to_issue_data(latest_issues[len(emitted)])
+                    emitted.append(issue)
+                    yield issue
+            while len(emitted) < len(latest_issues):
+                issue = self._to_issue_data(latest_issues[len(emitted)])
+                emitted.append(issue)
+                yield issue
+        except ValidationError as e:
+            logger.error(f"AI streamed output validation failed: {e}", exc_info=False)
+            raise AiParserError(
+                f"AI output validation failed: {e}", original_exception=e) from e
+        except AiParserError:
+            raise
+        except (*_OPENAI_ERRORS, *_GOOGLE_ERRORS) as e:
+            error_type = type(e).__name__
+            logger.error(
+                f"AI API call failed during streaming parse: {error_type} - {e}")
+            raise AiParserError(
+                f"AI API call failed during parse ({error_type}): {e}", original_exception=e) from e
+        except Exception as e:
+            logger.exception(
+                f"An unexpected error occurred during streaming AI parsing: {e}")
+            raise AiParserError(
+                "An unexpected error occurred during AI parsing.", original_exception=e) from e
+
+        logger.info(f"Streamed {len(emitted)} issue(s).")
+        if cache_key is not None:
+            self.cache.put(cache_key, ParsedRequirementData(issues=emitted))
+
+    @staticmethod
+    def _partial_issues(partial: Any) -> List[Any]:
+        """ストリーミングの部分出力 (ParsedRequirementData または dict) からIssueのリストを取り出します。"""
+        if isinstance(partial, ParsedRequirementData):
+            return list(partial.issues)
+        if isinstance(partial, dict):
+            return list(partial.get("issues") or [])
+        raise AiParserError(
+            f"AI streaming resulted in unexpected data type: {type(partial)}")
+
+    @staticmethod
+    def _to_issue_data(issue: Any) -> IssueData:
+        return issue if isinstance(issue, IssueData) else IssueData.model_validate(issue)
+
     def infer_rules(self, markdown_text: str) -> AISuggestedRules:
         """
         入力テキストからAIを用いて区切りルール・キーマッピングルールを推論し、信頼度評価・警告/エラー情報を含めて返す。
+        2つの推論は並行に実行します。rules_cache が設定されている場合、同じ形の文書では推論を省略します。
         """
+        sep_prompt = self.settings.ai.separator_rule_prompt_template
+        map_prompt = self.settings.ai.key_mapping_rule_prompt_template
+        cache_key: Optional[str] = None
+        if self.rules_cache is not None:
+            cache_key = ParseResultCache.make_key(
+                document_shape_fingerprint(markdown_text), self._model_identifier(),
+                f"{sep_prompt}\n{map_prompt}", model_type=AISuggestedRules)
+            cached = self.rules_cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "Reusing inferred rules for a document with the same shape without invoking the LLM.")
+                return cached
+
         warnings = []
         errors = []
         confidence = 1.0
-        separator_rule = {}
-        key_mapping_rule = {}
-        # 区切りルール推論
-        try:
-            sep_prompt = self.settings.ai.separator_rule_prompt_template
-            if not sep_prompt:
-                raise ValueError("区切りルール用プロンプトテンプレートが未設定です")
-            sep_chain = PromptTemplate(
-                template=sep_prompt, input_variables=["markdown_text"])
-            sep_result = self.llm.invoke(
-                sep_chain.format(markdown_text=markdown_text))
-            separator_rule = self._parse_json_result(
-                sep_result, key="separator_pattern")
-        except Exception as e:
-            errors.append(f"区切りルール推論失敗: {e}")
+        # 区切りルール推論とキーマッピングルール推論を並行に実行
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ai-infer-rules") as executor:
+            sep_future = executor.submit(
+                self._infer_single_rule, sep_prompt, "separator_pattern", markdown_text,
+                "区切りルール用プロンプトテンプレートが未設定です")
+            map_future = executor.submit(
+                self._infer_single_rule, map_prompt, "key_mapping", markdown_text,
+                "キーマッピングルール用プロンプトテンプレートが未設定です")
+        separator_rule, sep_error = sep_future.result()
+        key_mapping_rule, map_error = map_future.result()
+        if sep_error is not None:
+            errors.append(f"区切りルール推論失敗: {sep_error}")
             confidence -= 0.4
-
-        # キーマッピングルール推論
-        try:
-            map_prompt = self.settings.ai.key_mapping_rule_prompt_template
-            if not map_prompt:
-                raise ValueError("キーマッピングルール用プロンプトテンプレートが未設定です")
-            map_chain = PromptTemplate(
-                template=map_prompt, input_variables=["markdown_text"])
-            map_result = self.llm.invoke(
-                map_chain.format(markdown_text=markdown_text))
-            key_mapping_rule = self._parse_json_result(
-                map_result, key="key_mapping")
-        except Exception as e:
-            errors.append(f"キーマッピングルール推論失敗: {e}")
+        if map_error is not None:
+            errors.append(f"キーマッピングルール推論失敗: {map_error}")
             confidence -= 0.4
 
         # 信頼度評価（例: 先頭キーの一貫性、必須フィールド充足率）
@@ -309,13 +468,30 @@ class AIParser:
         if confidence < 0.7:
             warnings.append("AI推論ルールの信頼度が低いです")
 
-        return AISuggestedRules(
+        rules = AISuggestedRules(
             separator_rule=separator_rule or {},
             key_mapping_rule=key_mapping_rule or {},
             confidence=confidence,
             warnings=warnings,
             errors=errors
         )
+        # 一時的な失敗を再利用しないよう、両方の推論に成功した場合のみキャッシュする
+        if cache_key is not None and not errors and separator_rule and key_mapping_rule:
+            self.rules_cache.put(cache_key, rules)
+        return rules
+
+    def _infer_single_rule(self, prompt_template: str, key: str, markdown_text: str,
+                           missing_template_message: str):
+        """1つのルール推論を実行し、(ルール, 例外) を返します。失敗時はルールが空で例外が設定されます。"""
+        try:
+            if not prompt_template:
+                raise ValueError(missing_template_message)
+            chain = PromptTemplate(
+                template=prompt_template, input_variables=["markdown_text"])
+            result = self.llm.invoke(chain.format(markdown_text=markdown_text))
+            return self._parse_json_result(result, key=key), None
+        except Exception as e:
+            return {}, e
 
     def _parse_json_result(self, result, key=None):
         import json
@@ -2,31 +2,127 @@
 # 新規作成
 
 import logging
-from typing import List, Tuple
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
 
 # 依存する GitHubRestClient とドメイン例外をインポート
 from core_logic.adapters.github_rest_client import GitHubRestClient
 from core_logic.domain.exceptions import GitHubClientError
+from core_logic.domain.models import RepositorySnapshot
 
 logger = logging.getLogger(__name__)
 
+# 割り当て可能ユーザー一覧のキャッシュ有効期間の既定値 (秒)
+DEFAULT_ASSIGNEE_CACHE_TTL = 600.0
+
+
+class AssignableUsersCache:
+    """
+    (owner, repo) ごとの割り当て可能ユーザー (正規化済みログイン名) を保持するスレッドセーフなキャッシュ。
+    複数の AssigneeValidator (Webアプリのリクエストごとに生成される) で共有できます。
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], Tuple[float, FrozenSet[str]]] = {}
+
+    @staticmethod
+    def _key(owner: str, repo: str) -> Tuple[str, str]:
+        return owner.casefold(), repo.casefold()
+
+    def get(self, owner: str, repo: str, max_age: float) -> Optional[FrozenSet[str]]:
+        """登録から max_age 秒以内のエントリを返します (存在しない・期限切れの場合は None)。"""
+        with self._lock:
+            entry = self._entries.get(self._key(owner, repo))
+        if entry is None:
+            return None
+        loaded_at, logins = entry
+        if self._clock() - loaded_at > max_age:
+            return None
+        return logins
+
+    def put(self, owner: str, repo: str, logins: List[str]) -> FrozenSet[str]:
+        """ログイン名一覧を大文字小文字を区別しない形で登録し、登録したセットを返します。"""
+        normalized = frozenset(login.casefold() for login in logins)
+        with self._lock:
+            self._entries[self._key(owner, repo)] = (self._clock(), normalized)
+        return normalized
+
+    def invalidate(self, owner: str, repo: str) -> None:
+        with self._lock:
+            self._entries.pop(self._key(owner, repo), None)
+
 
 class AssigneeValidator:
     """
     GitHub担当者の有効性（リポジトリのコラボレーターであるか）を検証するクラス。
+    リポジトリの割り当て可能ユーザーを1回のページングAPI呼び出しで取得し、TTL付きでキャッシュします。
+    リポジトリスナップショットが読み込まれている場合は、API呼び出しなしでローカルに判定します。
+    一覧を取得できない場合は、ログイン名ごとのコラボレーター確認APIにフォールバックします。
     """
 
-    def __init__(self, rest_client: GitHubRestClient):
+    def __init__(self, rest_client: GitHubRestClient,
+                 cache: Optional[AssignableUsersCache] = None,
+                 cache_ttl: float = DEFAULT_ASSIGNEE_CACHE_TTL):
         """
         Args:
-            rest_client: コラボレーター確認API(`check_collaborator`)を呼び出すための GitHubRestClient インスタンス。
+            rest_client: 割り当て可能ユーザー一覧API(`list_assignees`)・コラボレーター確認API(`check_collaborator`)を
+                呼び出すための GitHubRestClient インスタンス。
+            cache: 割り当て可能ユーザーのキャッシュ。実行をまたいで共有する場合に指定します (省略時はインスタンス専用)。
+            cache_ttl: キャッシュの有効期間 (秒)。
         """
         if not isinstance(rest_client, GitHubRestClient):
             raise TypeError(
                 "rest_client must be an instance of GitHubRestClient.")
+        if cache_ttl < 0:
+            raise ValueError("cache_ttl must not be negative.")
         self.rest_client = rest_client
+        self.cache = cache if cache is not None else AssignableUsersCache()
+        self.cache_ttl = cache_ttl
+        # 同じリポジトリの一覧を並行して重複取得しないためのロック
+        self._load_lock = threading.Lock()
         logger.info("AssigneeValidator initialized.")
 
+    def load_snapshot(self, snapshot: RepositorySnapshot) -> None:
+        """
+        リポジトリスナップショットの割り当て可能ユーザーを読み込みます。
+        以降、同じリポジトリの検証はAPIを呼ばずに行います。
+        全件取得できていないスナップショットは判定に使用しません。
+        """
+        if not snapshot.is_complete:
+            logger.debug(
+                f"Snapshot for {snapshot.owner}/{snapshot.name} is incomplete. Assignees will be verified via API.")
+            return
+        self.cache.put(snapshot.owner, snapshot.name,
+                       snapshot.assignable_users)
+        logger.debug(
+            f"Loaded {len(snapshot.assignable_users)} assignable user(s) for {snapshot.owner}/{snapshot.name} from snapshot.")
+
+    def _get_assignable_users(self, owner: str, repo: str) -> Optional[FrozenSet[str]]:
+        """
+        リポジトリの割り当て可能ユーザーをキャッシュから返します。
+        キャッシュがない・期限切れの場合は一覧APIで1回だけ取得します。取得できない場合は None を返します。
+        """
+        cached = self.cache.get(owner, repo, self.cache_ttl)
+        if cached is not None:
+            return cached
+        with self._load_lock:
+            # ロック待ちの間に他スレッドが取得済みの場合はそれを使う
+            cached = self.cache.get(owner, repo, self.cache_ttl)
+            if cached is not None:
+                return cached
+            try:
+                logins = self.rest_client.list_assignees(owner, repo)
+            except GitHubClientError as e:
+                logger.warning(
+                    f"Could not list assignable users for {owner}/{repo}: {type(e).__name__} - {e}. Falling back to per-user collaborator checks.")
+                return None
+            logger.debug(
+                f"Loaded {len(logins)} assignable user(s) for {owner}/{repo} via API.")
+            return self.cache.put(owner, repo, logins)
+
     def validate_assignees(self, owner: str, repo: str, assignee_logins: List[str]) -> Tuple[List[str], List[str]]:
         """
         担当者のリストを検証し、有効なログイン名リストと無効（または検証不可）なログイン名リストを返します。
@@ -59,7 +155,20 @@ class AssigneeValidator:
         logger.info(
             f"Validating {len(unique_logins_to_check)} unique assignee(s) for {owner}/{repo}...")
 
-        for login in unique_logins_to_check:
+        logins_to_verify_via_api = unique_logins_to_check
+        known_assignees = self._get_assignable_users(owner, repo)
+        if known_assignees is not None:
+            # 割り当て可能ユーザー一覧から判定 (GitHubのログイン名は大文字小文字を区別しない)
+            for login in unique_logins_to_check:
+                if login.casefold() in known_assignees:
+                    valid_assignees.append(login)
+                else:
+                    logger.warning(
+                        f"Assignee '{login}' is not an assignable user for {owner}/{repo}.")
+                    invalid_assignees.append(login)
+            logins_to_verify_via_api = set()
+
+        for login in logins_to_verify_via_api:
             is_valid = False  # Assume invalid initially
             try:
                 # GitHubRestClient の check_collaborator を使用
@@ -1,9 +1,10 @@
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # domain/models.py から結果用データクラスをインポートすることを想定
 # (CreateIssuesResult は前回定義済み)
-from core_logic.domain.models import CreateIssuesResult, CreateGitHubResourcesResult
+from core_logic.domain.models import CreateIssuesResult, CreateGitHubResourcesResult, ResourcePlan
+from core_logic.adapters.github_metrics import OperationSummary
 from core_logic.domain.exceptions import GitHubValidationError, GitHubClientError
 
 # このモジュール用のロガーを取得
@@ -137,6 +138,11 @@ class CliReporter:
         else:
             logger.warning("[Repository] No repository URL available")
 
+        if is_dry_run and result.plan:
+            self.display_resource_plan(result.plan)
+            logger.info("=" * 60)
+            return
+
         # --- ラベル情報 ---
         if result.created_labels or result.failed_labels:
             # --- Dry Run モードの表示 --- # 修正
@@ -244,8 +250,94 @@ class CliReporter:
         else:
             logger.info("[Issues] No issue results available")
 
+        # --- リトライ発生状況 ---
+        if result.retried_operations:
+            total_retries = sum(result.retried_operations.values())
+            logger.info(
+                f"[Retries] {total_retries} transient error(s) were retried:")
+            for operation, count in sorted(result.retried_operations.items()):
+                logger.info(f"  - {operation}: {count}")
+
+        # --- ステップごとの所要時間 ---
+        if result.step_timings:
+            total_seconds = sum(
+                timing.duration_seconds for timing in result.step_timings)
+            logger.info(f"[Timings] Total: {total_seconds:.2f}s")
+            for timing in result.step_timings:
+                rate = f", {timing.items_per_second:.1f} items/s" if timing.items_per_second is not None else ""
+                logger.info(
+                    f"  - {timing.step}: {timing.duration_seconds:.2f}s, {timing.api_calls} API call(s), {timing.items} item(s){rate}")
+
         logger.info("=" * 60)
 
+    def display_resource_plan(self, plan: ResourcePlan):
+        """Dry Run で作成した実行計画 (作成/スキップされるリソースと見積もりAPI呼び出し数) を表示します。"""
+        logger.info("-" * 60)
+        logger.info(f"--- Plan for {plan.owner}/{plan.repo} ---")
+        if plan.repository_exists:
+            logger.info(f"[Repository] Exists: {plan.repository_url}")
+        else:
+            logger.info("[Repository] Would create a new repository")
+
+        logger.info(
+            f"[Labels] Would create: {len(plan.labels_to_create)}, Existing: {len(plan.existing_labels)}")
+        if plan.labels_to_create:
+            logger.info(f"  To create: {', '.join(plan.labels_to_create)}")
+
+        logger.info(
+            f"[Milestones] Would create: {len(plan.milestones_to_create)}, Existing: {len(plan.existing_milestones)}")
+        if plan.milestones_to_create:
+            logger.info(
+                f"  To create: {', '.join(plan.milestones_to_create)}")
+
+        issues_to_create = plan.issues_to_create
+        issues_to_skip = plan.issues_to_skip
+        logger.info(
+            f"[Issues] Would create: {len(issues_to_create)}, Would skip: {len(issues_to_skip)}")
+        for issue in issues_to_create:
+            logger.info(f"  + {issue.title}")
+            if issue.invalid_assignees:
+                logger.warning(
+                    f"    Assignees not assignable (would be dropped): {', '.join(issue.invalid_assignees)}")
+        for issue in issues_to_skip:
+            logger.info(f"  - {issue.title} ({issue.reason})")
+
+        if plan.project_name:
+            if plan.project_node_id:
+                logger.info(
+                    f"[Project] Would add {len(issues_to_create)} items to project '{plan.project_name}'")
+            else:
+                logger.warning(
+                    f"[Project] Project '{plan.project_name}' not found. Items would not be added.")
+
+        cost = plan.estimated_cost
+        logger.info(
+            f"[API Cost] ~{cost.rest_requests} REST request(s) ({cost.content_creations} content creation(s)), "
+            f"~{cost.graphql_requests} GraphQL request(s)")
+        if cost.rest_remaining is not None or cost.graphql_remaining is not None:
+            logger.info(
+                f"  Rate limit remaining: REST {cost.rest_remaining if cost.rest_remaining is not None else 'unknown'}, "
+                f"GraphQL {cost.graphql_remaining if cost.graphql_remaining is not None else 'unknown'}")
+        if cost.fits_rate_limit is False:
+            logger.warning(
+                "  The plan exceeds the remaining rate limit. Applying it will wait for the limit to reset.")
+
+    def display_api_metrics_summary(self, rows: List[OperationSummary], rate_limit_remaining: Optional[Dict[str, int]] = None):
+        """実行中の GitHub API 呼び出しを操作ごとに集計した表 (所要時間・リトライ・GraphQLコスト) を表示します。"""
+        if not rows:
+            return
+        logger.info("-" * 60)
+        logger.info("--- GitHub API Calls ---")
+        logger.info(
+            f"{'api':<8} {'operation':<32} {'calls':>5} {'errors':>6} {'total(s)':>8} {'p50(s)':>7} {'p95(s)':>7} {'retries':>7} {'cost':>5}")
+        for row in rows:
+            logger.info(
+                f"{row.api:<8} {row.operation:<32} {row.calls:>5} {row.errors:>6} {row.total_seconds:>8.2f} "
+                f"{row.p50_seconds:>7.2f} {row.p95_seconds:>7.2f} {row.retries:>7} {row.graphql_cost:>5}")
+        if rate_limit_remaining:
+            logger.info("Rate limit remaining: " + ", ".join(
+                f"{resource} {remaining}" for resource, remaining in sorted(rate_limit_remaining.items())))
+
     # --- 今後実装する他のリソースに関する表示メソッド ---
     # def display_label_creation_result(...)
     # def display_milestone_creation_result(...)
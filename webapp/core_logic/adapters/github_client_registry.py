@@ -0,0 +1,213 @@
+# webapp/core_logic/adapters/github_client_registry.py
+# GitHub クライアント (githubkit インスタンス・接続プール・スケジューラ) をプロセス内で再利用するレジストリ
+
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+import httpx
+from githubkit import GitHub
+
+from core_logic.adapters.github_request_scheduler import GitHubRequestScheduler, create_github_instance
+from core_logic.adapters.github_rest_client import GitHubRestClient
+from core_logic.adapters.github_graphql_client import GitHubGraphQLClient
+from core_logic.adapters.github_utils import RetryPolicy
+from core_logic.infrastructure.config import GitHubSettings
+
+logger = logging.getLogger(__name__)
+
+
+class KeepAliveTransport(httpx.HTTPTransport):
+    """
+    複数の httpx.Client で共有する接続プール。
+    githubkit はコンテキスト外ではリクエストごとに httpx.Client を作成・終了するため、
+    クライアントの終了時にはプールを閉じず、レジストリから削除されたクライアントセットが使われなくなった時点で shutdown で閉じます。
+    """
+
+    def close(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        super().close()
+
+
+def create_retry_policy(github_settings: GitHubSettings) -> RetryPolicy:
+    """GitHub設定からリトライ方針を作成します。"""
+    return RetryPolicy(
+        max_attempts=github_settings.retry_max_attempts,
+        base_delay=github_settings.retry_base_delay,
+        max_delay=github_settings.retry_max_delay,
+        jitter=github_settings.retry_jitter,
+        max_retry_after=github_settings.retry_max_retry_after)
+
+
+class GitHubClientSet:
+    """
+    1つのトークンに対応する共有コンポーネント (githubkit インスタンス・接続プール・レート制限スケジューラ)。
+    REST/GraphQL クライアントは呼び出しごとのリトライ統計を分けるため、rest_client() / graphql_client() で都度作成します。
+    作成したクライアントが破棄されるまでは使用中とみなし、その間に close() された場合は最後のクライアントの破棄時に接続プールを閉じます。
+    """
+
+    def __init__(self, github: GitHub, scheduler: GitHubRequestScheduler,
+                 transport: KeepAliveTransport, retry_policy: RetryPolicy, last_used: float):
+        self.github = github
+        self.scheduler = scheduler
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.last_used = last_used
+        # クライアントの破棄 (weakref.finalize) はGCの実行中に任意のスレッドで呼ばれるため、再入可能なロックを使う
+        self._lock = threading.RLock()
+        self._users = 0
+        self._retired = False
+        self._closed = False
+
+    def rest_client(self) -> GitHubRestClient:
+        return self._track(GitHubRestClient(github_instance=self.github, retry_policy=self.retry_policy))
+
+    def graphql_client(self) -> GitHubGraphQLClient:
+        return self._track(GitHubGraphQLClient(github_instance=self.github, scheduler=self.scheduler,
+                                               retry_policy=self.retry_policy))
+
+    @property
+    def in_use(self) -> bool:
+        """このセットから作成したクライアントがまだ使われている (破棄されていない) かを返します。"""
+        with self._lock:
+            return self._users > 0
+
+    @property
+    def closed(self) -> bool:
+        with self._lock:
+            return self._closed
+
+    def close(self) -> None:
+        """接続プールを閉じます。使用中のクライアントがある場合は、最後のクライアントが破棄されるまで遅らせます。"""
+        with self._lock:
+            self._retired = True
+            if self._users > 0:
+                logger.debug(
+                    f"Deferring shutdown of a GitHub client set still used by {self._users} client(s).")
+                return
+        self._shutdown()
+
+    def _track(self, client):
+        with self._lock:
+            self._users += 1
+        weakref.finalize(client, self._release)
+        return client
+
+    def _release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if not self._retired or self._users > 0:
+                return
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.transport.shutdown()
+
+
+class GitHubClientRegistry:
+    """
+    トークン (のハッシュ) とGitHub設定ごとに GitHubClientSet を保持し、リクエストをまたいで再利用するレジストリ。
+    接続プールを共有するため、2回目以降のリクエストではTLSハンドシェイクを省略できます。
+    max_size を超えた場合は最も長く使われていないものから、idle_timeout 秒使われなかったものは次回の取得時に削除します。
+    実行中のジョブがクライアントを使用しているものは idle_timeout を過ぎても削除せず、max_size を超えて削除する場合も
+    使用中でないものを優先します。使用中のものを削除した場合、接続プールはジョブの終了後に閉じます。
+    """
+
+    def __init__(self, max_size: int = 8, idle_timeout: float = 900.0,
+                 max_keepalive_connections: int = 10,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_size: 保持するトークンの最大数。
+            idle_timeout: この秒数使われなかったクライアントを削除する。
+            max_keepalive_connections: トークンごとに保持するアイドル接続の最大数。
+            clock: 単調増加する現在時刻 (秒) を返す関数。テスト用に差し替え可能。
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_keepalive_connections = max_keepalive_connections
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, GitHubClientSet]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(token: str, github_settings: GitHubSettings) -> str:
+        """トークンは保持せず、ハッシュとクライアントに影響する設定からキーを算出します。"""
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        options = (github_settings.rate_limit_reserve, github_settings.retry_max_attempts,
+                   github_settings.retry_base_delay, github_settings.retry_max_delay,
+                   github_settings.retry_jitter, github_settings.retry_max_retry_after)
+        return f"{token_hash}:{options}"
+
+    def get(self, token: str, github_settings: GitHubSettings) -> GitHubClientSet:
+        """トークンに対応するクライアントセットを返します (存在しない場合は作成します)。"""
+        key = self.make_key(token, github_settings)
+        now = self._clock()
+        with self._lock:
+            self._evict_idle(now)
+            client_set = self._entries.get(key)
+            if client_set is not None:
+                self._entries.move_to_end(key)
+                client_set.last_used = now
+                self.hits += 1
+                return client_set
+            self.misses += 1
+            client_set = self._create(token, github_settings, now)
+            self._entries[key] = client_set
+            while len(self._entries) > self.max_size:
+                self._evict_least_recently_used(keep=key)
+        logger.info("Created GitHub client set for a new token/settings combination.")
+        return client_set
+
+    def clear(self) -> None:
+        with self._lock:
+            for client_set in self._entries.values():
+                client_set.close()
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """監視用のヒット・ミス・削除件数と現在のエントリ数を返します。"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions, "entries": len(self._entries)}
+
+    # --- Internal helpers (呼び出し側でロックを保持していること) ---
+    def _evict_idle(self, now: float) -> None:
+        for key in [key for key, client_set in self._entries.items()
+                    if now - client_set.last_used > self.idle_timeout and not client_set.in_use]:
+            self._entries.pop(key).close()
+            self.evictions += 1
+
+    def _evict_least_recently_used(self, keep: str) -> None:
+        """最も長く使われていないものを削除します (使用中でないものを優先し、すべて使用中の場合は接続プールの終了を遅らせる)。"""
+        candidates = [key for key in self._entries if key != keep]
+        key = next((key for key in candidates if not self._entries[key].in_use), candidates[0])
+        self._entries.pop(key).close()
+        self.evictions += 1
+
+    def _create(self, token: str, github_settings: GitHubSettings, now: float) -> GitHubClientSet:
+        transport = KeepAliveTransport(limits=httpx.Limits(
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=min(self.idle_timeout, 300.0)))
+        scheduler = GitHubRequestScheduler(
+            reserve=github_settings.rate_limit_reserve)
+        # リトライはクライアント側の RetryPolicy で行うため、githubkit 組み込みのリトライは無効化する
+        github = create_github_instance(
+            token, scheduler, auto_retry=False, transport=transport)
+        return GitHubClientSet(github=github, scheduler=scheduler, transport=transport,
+                               retry_policy=create_retry_policy(github_settings), last_used=now)
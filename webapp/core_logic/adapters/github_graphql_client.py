@@ -1,9 +1,10 @@
 # src/github_automation_tool/adapters/github_graphql_client.py
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from githubkit import GitHub
+from githubkit.exception import GraphQLFailed
 
 # GraphQLResponse のインポート元を修正 (githubkit v1.0.0 以降を想定)
 try:
@@ -17,13 +18,31 @@ except ImportError:
         GraphQLResponseData = dict  # Fallback
 
 # エラーハンドリングデコレータとドメイン例外をインポート
-from core_logic.adapters.github_utils import github_api_error_handler
+from core_logic.adapters.github_utils import (
+    github_api_error_handler, github_api_retry, _process_graphql_errors, RetryPolicy, RetryStats, ApiCallCounter
+)
 from core_logic.domain.exceptions import (
     GitHubClientError, GitHubResourceNotFoundError
 )
+from core_logic.domain.models import RepositorySnapshot
+from core_logic.adapters.github_request_scheduler import GitHubRequestScheduler
+from core_logic.adapters.github_metrics import GitHubApiMetrics, observe_graphql_rate_limit
 
 logger = logging.getLogger(__name__)
 
+# リポジトリスナップショットで取得する各コネクションと、その取得フィールド
+# (結果のキー, GraphQLフィールド定義, ノードのフィールド)
+_SNAPSHOT_CONNECTIONS = (
+    ("labels", "labels(first: 100, after: $labelsCursor)", "name"),
+    ("milestones",
+     "milestones(first: 100, after: $milestonesCursor, states: [OPEN, CLOSED])", "title number"),
+    ("assignableUsers", "assignableUsers(first: 100, after: $assignableUsersCursor)", "login"),
+    ("issues", "issues(first: 100, after: $issuesCursor, states: [OPEN])", "title"),
+)
+
+# 1回のGraphQLリクエストにまとめる addProjectV2ItemById ミューテーションの既定件数
+PROJECT_ITEMS_BATCH_SIZE = 25
+
 
 class GitHubGraphQLClient:
     """
@@ -31,15 +50,28 @@ class GitHubGraphQLClient:
     エラーハンドリングはデコレータ @github_api_error_handler に委譲します。
     """
 
-    def __init__(self, github_instance: GitHub):
+    # メトリクスに記録するAPI種別
+    api_name = "graphql"
+
+    def __init__(self, github_instance: GitHub, scheduler: Optional[GitHubRequestScheduler] = None,
+                 retry_policy: Optional[RetryPolicy] = None, metrics: Optional[GitHubApiMetrics] = None):
         """
         Args:
             github_instance: 認証済みの githubkit.GitHub インスタンス。
+            scheduler: レート制限対応スケジューラ (オプション)。
+                指定した場合、クエリで取得した rateLimit フィールドを通知します。
+            retry_policy: 一時的なエラー時のリトライ方針。None の場合はリトライしません。
+            metrics: API呼び出しのメトリクスの記録先。None の場合はプロセス共通のレジストリに記録します。
         """
         if not isinstance(github_instance, GitHub):
             raise TypeError(
                 "github_instance must be a valid githubkit.GitHub instance.")
         self.gh = github_instance
+        self.scheduler = scheduler
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.call_counter = ApiCallCounter()
+        self.metrics = metrics
         logger.info("GitHubGraphQLClient initialized.")
 
     # --- Context Generators for Decorator ---
@@ -49,7 +81,14 @@ class GitHubGraphQLClient:
     def _add_item_context(self, project_node_id: str, content_node_id: str) -> str:
         return f"adding item '{content_node_id}' to project '{project_node_id}'"
 
+    def _repository_snapshot_context(self, owner: str, repo: str, **_) -> str:
+        return f"loading repository snapshot for {owner}/{repo}"
+
+    def _add_items_batch_context(self, project_node_id: str, content_node_ids: List[str]) -> str:
+        return f"adding {len(content_node_ids)} items to project '{project_node_id}'"
+
     # --- ProjectsV2 ---
+    @github_api_retry()
     @github_api_error_handler(_find_project_context, ignore_not_found=True)
     def find_project_v2_node_id(self, owner: str, project_name: str) -> Optional[str]:
         """
@@ -109,7 +148,9 @@ class GitHubGraphQLClient:
 
             # --- ★ Issueで提案された修正箇所を反映 ★ ---
             # --- walrus operatorで簡潔化 ---
-            if not (data := response.get("data") if isinstance(response, dict) else getattr(response, 'data', None)):
+            # githubkit の graphql() は data 部分のみを返すため、{"data": ...} 形式と両方に対応する
+            if not (data := response.get("data") if isinstance(response, dict) and "data" in response
+                    else (response if isinstance(response, dict) else getattr(response, 'data', None))):
                 logger.warning(
                     f"GraphQL response missing 'data' field on page {page_count}. Treating as not found.")
                 return None
@@ -214,8 +255,9 @@ class GitHubGraphQLClient:
             raise GitHubClientError(f"Failed to add item to project {p_id}.")
 
         # --- Data Extraction (Simplified) ---
-        data = response.get("data") if isinstance(
-            response, dict) else getattr(response, 'data', None)
+        # githubkit の graphql() は data 部分のみを返すため、{"data": ...} 形式と両方に対応する
+        data = response.get("data") if isinstance(response, dict) and "data" in response \
+            else (response if isinstance(response, dict) else getattr(response, 'data', None))
         if data is None:
             # dataがNoneの場合のみ例外を送出
             raise GitHubClientError(
@@ -248,3 +290,241 @@ class GitHubGraphQLClient:
         # ---
         raise GitHubClientError(
             f"Failed to add item to project {p_id} or retrieve item ID from response. Response data: {data}")
+
+    @staticmethod
+    def _build_add_items_mutation(count: int) -> str:
+        """エイリアス (item0, item1, ...) 付きの addProjectV2ItemById を count 件含むミューテーションを生成します。"""
+        variable_defs = ", ".join(
+            f"$contentId{i}: ID!" for i in range(count))
+        fields = "\n".join(
+            f"  item{i}: addProjectV2ItemById(input: {{projectId: $projectId, contentId: $contentId{i}}}) {{ item {{ id }} }}"
+            for i in range(count))
+        return f"mutation AddItemsToProject($projectId: ID!, {variable_defs}) {{\n{fields}\n}}"
+
+    # addProjectV2ItemById は追加済みのアイテムに対して既存アイテムを返すため、リトライしても重複しない
+    @github_api_retry()
+    @github_api_error_handler(_add_items_batch_context)
+    def _send_add_items_batch(self, project_node_id: str, content_node_ids: List[str]) -> Tuple[Dict[str, Any], List[Any]]:
+        """
+        1バッチ分のミューテーションを送信し、(data, errors) のタプルを返します。
+        一部のエイリアスだけが失敗した場合も例外にはせず、成功分のデータとエラーリストを返します。
+        """
+        mutation = self._build_add_items_mutation(len(content_node_ids))
+        variables: Dict[str, Any] = {"projectId": project_node_id}
+        for i, c_id in enumerate(content_node_ids):
+            variables[f"contentId{i}"] = c_id
+
+        try:
+            response = self.gh.graphql(mutation, variables)  # type: ignore
+        except GraphQLFailed as e:
+            # 部分的な失敗: githubkit はエラーを含むレスポンスを例外として返す
+            return (e.response.data or {}), list(e.response.errors or [])
+
+        if response is None:
+            raise GitHubClientError(
+                f"GraphQL mutation returned no response while adding items to project {project_node_id}.")
+        # {"data": ..., "errors": ...} 形式と data のみの形式の両方に対応
+        if isinstance(response, dict) and ("data" in response or "errors" in response):
+            return (response.get("data") or {}), list(response.get("errors") or [])
+        data = response if isinstance(
+            response, dict) else getattr(response, "data", None)
+        return (data or {}), list(getattr(response, "errors", None) or [])
+
+    def add_items_to_project_v2(self, project_node_id: str, content_node_ids: List[str],
+                                batch_size: int = PROJECT_ITEMS_BATCH_SIZE) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        複数の Issue を ProjectV2 にアイテムとして追加します。
+        batch_size 件ごとにエイリアス付きミューテーションを1リクエストにまとめて送信し、
+        部分的なエラーは各 Content Node ID に対応付けて返します。
+
+        Args:
+            project_node_id: 追加先のプロジェクトの Node ID。
+            content_node_ids: 追加する Issue または Pull Request の Node ID のリスト。
+            batch_size: 1リクエストに含めるミューテーション数。
+
+        Returns:
+            ({Content Node ID: 追加されたアイテムID}, {Content Node ID: エラーメッセージ}) のタプル。
+            バッチ全体が失敗した場合、そのバッチの全アイテムが失敗側に含まれます。
+
+        Raises:
+            ValueError: プロジェクトIDが空、または batch_size が1未満の場合。
+        """
+        p_id = project_node_id.strip()
+        if not p_id:
+            raise ValueError("Project Node ID cannot be empty.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        added: Dict[str, str] = {}
+        failed: Dict[str, str] = {}
+        c_ids = [c.strip() for c in content_node_ids]
+        for c_id in c_ids:
+            if not c_id:
+                failed[c_id] = "Content Node ID cannot be empty."
+        c_ids = [c for c in c_ids if c]
+
+        total_batches = (len(c_ids) + batch_size - 1) // batch_size
+        for batch_index, start in enumerate(range(0, len(c_ids), batch_size)):
+            batch = c_ids[start:start + batch_size]
+            logger.info(
+                f"Adding batch {batch_index + 1}/{total_batches} ({len(batch)} items) to project '{p_id}'...")
+            try:
+                data, errors = self._send_add_items_batch(p_id, batch)
+            except GitHubClientError as e:
+                logger.error(
+                    f"Failed to add batch {batch_index + 1}/{total_batches} to project '{p_id}': {e}")
+                for c_id in batch:
+                    failed[c_id] = str(e)
+                continue
+
+            # エラーを path の先頭 (エイリアス) ごとに振り分ける
+            errors_by_alias: Dict[str, List[str]] = {}
+            unassigned_errors: List[str] = []
+            for err in errors:
+                path = err.get("path") if isinstance(
+                    err, dict) else getattr(err, "path", None)
+                message = err.get("message") if isinstance(
+                    err, dict) else getattr(err, "message", None)
+                message = message or str(err)
+                if path:
+                    errors_by_alias.setdefault(
+                        str(path[0]), []).append(message)
+                else:
+                    unassigned_errors.append(message)
+
+            for i, c_id in enumerate(batch):
+                alias = f"item{i}"
+                item = (data.get(alias) or {}).get("item") or {}
+                item_id = item.get("id") if isinstance(item, dict) else None
+                if item_id:
+                    added[c_id] = item_id
+                elif alias in errors_by_alias:
+                    failed[c_id] = "; ".join(errors_by_alias[alias])
+                elif unassigned_errors:
+                    failed[c_id] = "; ".join(unassigned_errors)
+                else:
+                    failed[c_id] = "Did not receive valid item ID."
+
+        logger.info(
+            f"Added {len(added)}/{len(content_node_ids)} items to project '{p_id}' in {total_batches} request(s).")
+        if failed:
+            logger.warning(
+                f"Failed to add {len(failed)} item(s) to project '{p_id}': {failed}")
+        return added, failed
+
+    # --- Repository Snapshot ---
+    @staticmethod
+    def _snapshot_include_flag(key: str) -> str:
+        """コネクションの取得有無を切り替える変数名 (例: labels -> withLabels) を返します。"""
+        return f"with{key[0].upper()}{key[1:]}"
+
+    @staticmethod
+    def _build_repository_snapshot_query() -> str:
+        """
+        各コネクションを @include で個別に有効/無効化できるスナップショット取得クエリを生成します。
+        取得済みのコネクションは次ページ以降のリクエストから除外されます。
+        """
+        variable_defs = ["$owner: String!", "$name: String!"]
+        fields = []
+        for key, field, node_fields in _SNAPSHOT_CONNECTIONS:
+            flag = GitHubGraphQLClient._snapshot_include_flag(key)
+            variable_defs += [f"${key}Cursor: String", f"${flag}: Boolean!"]
+            fields.append(
+                f"    {key}: {field} @include(if: ${flag}) {{ nodes {{ {node_fields} }} pageInfo {{ hasNextPage endCursor }} }}")
+        field_block = "\n".join(fields)
+        return (f"query RepositorySnapshot({', '.join(variable_defs)}) {{\n"
+                f"  rateLimit {{ cost remaining resetAt }}\n"
+                f"  repository(owner: $owner, name: $name) {{\n    id\n    url\n{field_block}\n  }}\n}}")
+
+    @github_api_retry()
+    @github_api_error_handler(_repository_snapshot_context, ignore_not_found=True)
+    def get_repository_snapshot(self, owner: str, repo: str, max_pages: int = 20) -> Optional[RepositorySnapshot]:
+        """
+        リポジトリのNode ID・ラベル・マイルストーン・割り当て可能ユーザー・Open Issueタイトルを
+        1つのGraphQLクエリでまとめて取得し、RepositorySnapshot として返します。
+        コネクションごとにカーソルを進め、全コネクションを取得し終えるまでページングします。
+
+        Args:
+            owner: リポジトリのオーナー名。
+            repo: リポジトリ名。
+            max_pages: ページングの安全上限。超過した場合は is_complete=False のスナップショットを返します。
+
+        Returns:
+            RepositorySnapshot。リポジトリが見つからない場合は None。
+        """
+        logger.info(f"Loading repository snapshot for {owner}/{repo}...")
+        query = self._build_repository_snapshot_query()
+        context = self._repository_snapshot_context(owner, repo)
+        nodes_by_key: Dict[str, List[Dict[str, Any]]] = {
+            key: [] for key, _, _ in _SNAPSHOT_CONNECTIONS}
+        cursors: Dict[str, Optional[str]] = {
+            key: None for key in nodes_by_key}
+        pending = set(nodes_by_key)
+        repository_id: Optional[str] = None
+        repository_url: Optional[str] = None
+        page_count = 0
+
+        while pending and page_count < max_pages:
+            page_count += 1
+            variables: Dict[str, Any] = {"owner": owner, "name": repo}
+            for key in nodes_by_key:
+                variables[f"{key}Cursor"] = cursors[key]
+                variables[self._snapshot_include_flag(key)] = key in pending
+
+            try:
+                response = self.gh.graphql(query, variables)  # type: ignore
+            except GraphQLFailed as e:
+                errors = [err.model_dump() if hasattr(err, "model_dump") else err
+                          for err in (e.response.errors or [])]
+                _process_graphql_errors(errors, context, True)
+                raise
+
+            if isinstance(response, dict) and response.get("errors"):
+                _process_graphql_errors(response["errors"], context, True)
+            data = response.get("data") if isinstance(response, dict) and "data" in response \
+                else (response if isinstance(response, dict) else getattr(response, "data", None))
+            if data:
+                observe_graphql_rate_limit(data.get("rateLimit"))
+            if data and self.scheduler is not None:
+                self.scheduler.update_from_graphql(data.get("rateLimit"))
+            if not data or not (repository := data.get("repository")):
+                logger.warning(
+                    f"Repository '{owner}/{repo}' not found in snapshot response.")
+                return None
+            repository_id = repository.get("id") or repository_id
+            repository_url = repository.get("url") or repository_url
+
+            for key in list(pending):
+                connection = repository.get(key) or {}
+                nodes_by_key[key].extend(
+                    node for node in connection.get("nodes") or [] if isinstance(node, dict))
+                page_info = connection.get("pageInfo") or {}
+                if page_info.get("hasNextPage") and page_info.get("endCursor"):
+                    cursors[key] = page_info["endCursor"]
+                else:
+                    pending.discard(key)
+
+        if pending:
+            logger.warning(
+                f"Reached maximum page limit ({max_pages}) while loading snapshot for {owner}/{repo}. Incomplete: {sorted(pending)}")
+
+        snapshot = RepositorySnapshot(
+            owner=owner,
+            name=repo,
+            repository_id=repository_id,
+            repository_url=repository_url,
+            label_names=[n["name"]
+                         for n in nodes_by_key["labels"] if n.get("name")],
+            milestones={n["title"]: n["number"] for n in reversed(nodes_by_key["milestones"])
+                        if n.get("title") and n.get("number") is not None},
+            assignable_users=[n["login"]
+                              for n in nodes_by_key["assignableUsers"] if n.get("login")],
+            open_issue_titles=[n["title"]
+                               for n in nodes_by_key["issues"] if n.get("title")],
+            is_complete=not pending,
+        )
+        logger.info(
+            f"Loaded repository snapshot for {owner}/{repo} in {page_count} request(s): "
+            f"{len(snapshot.label_names)} labels, {len(snapshot.milestones)} milestones, "
+            f"{len(snapshot.assignable_users)} assignable users, {len(snapshot.open_issue_titles)} open issues.")
+        return snapshot
@@ -0,0 +1,286 @@
+# webapp/core_logic/adapters/github_metrics.py
+# GitHub API 呼び出しごとのレイテンシ・ステータス・リトライ・レート制限・GraphQLコストを集計するメトリクスレジストリ
+
+import bisect
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+# レイテンシのヒストグラムの上限値 (秒)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Prometheus 形式の累積バケットを持つヒストグラム (呼び出し側でロックを保持すること)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 末尾は +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, 累積件数) のリストを返します。"""
+        result, total = [], 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """バケットの上限値から分位点を推定します (+Inf に入った場合は最大値)。"""
+        if self.count == 0:
+            return 0.0
+        rank, total = q * self.count, 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class OperationSummary(BaseModel):
+    """1つの操作 (クライアントのメソッド) の集計結果"""
+    api: str = Field(description="rest / graphql")
+    operation: str = Field(description="操作名 (メソッド名)")
+    calls: int = Field(default=0, description="呼び出し回数")
+    errors: int = Field(default=0, description="例外で終了した呼び出し回数")
+    http_requests: int = Field(default=0, description="送信したHTTPリクエスト数 (ページングを含む)")
+    total_seconds: float = Field(default=0.0, description="合計所要時間 (秒)")
+    p50_seconds: float = Field(default=0.0, description="所要時間の中央値の推定 (秒)")
+    p95_seconds: float = Field(default=0.0, description="所要時間の95パーセンタイルの推定 (秒)")
+    max_seconds: float = Field(default=0.0, description="最大所要時間 (秒)")
+    retries: int = Field(default=0, description="リトライで追加された試行回数")
+    graphql_cost: int = Field(default=0, description="GraphQL の rateLimit.cost の合計")
+    status_counts: Dict[str, int] = Field(
+        default_factory=dict, description="ステータスコード (取得できない場合は ok / error) ごとの呼び出し回数")
+
+
+class _OperationMetrics:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.latency = Histogram(buckets)
+        self.status_counts: Dict[str, int] = {}
+        self.errors = 0
+        self.http_requests = 0
+        self.retries = 0
+        self.graphql_cost = 0
+
+
+class ApiCallObservation:
+    """実行中のAPI呼び出し1回の間に受信したレスポンスの情報 (スレッドごとに保持)"""
+
+    def __init__(self) -> None:
+        self.status_code: Optional[int] = None
+        self.http_requests = 0
+        self.rate_limit_remaining: Dict[str, int] = {}
+        self.graphql_cost = 0
+
+
+_local = threading.local()
+
+
+def begin_call() -> ApiCallObservation:
+    """現在のスレッドでAPI呼び出しの観測を開始します (入れ子の呼び出しは内側に記録されます)。"""
+    observation = ApiCallObservation()
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(observation)
+    return observation
+
+
+def end_call(observation: ApiCallObservation) -> None:
+    stack = getattr(_local, "stack", None)
+    if stack and stack[-1] is observation:
+        stack.pop()
+
+
+def _current_observation() -> Optional[ApiCallObservation]:
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+def observe_response(status_code: int, headers: Mapping[str, str], resource: str) -> None:
+    """httpx のレスポンスフックから呼ばれ、実行中の呼び出しにステータスとレート制限の残量を記録します。"""
+    observation = _current_observation()
+    if observation is None:
+        return
+    observation.status_code = status_code
+    observation.http_requests += 1
+    lowered = {k.lower(): v for k, v in headers.items()}
+    remaining = lowered.get("x-ratelimit-remaining")
+    if remaining is not None:
+        try:
+            observation.rate_limit_remaining[lowered.get(
+                "x-ratelimit-resource") or resource] = int(remaining)
+        except ValueError:
+            pass
+
+
+def observe_graphql_rate_limit(rate_limit: Optional[Dict[str, Any]]) -> None:
+    """GraphQL レスポンスの rateLimit { cost remaining } を実行中の呼び出しに記録します。"""
+    observation = _current_observation()
+    if observation is None or not rate_limit:
+        return
+    try:
+        observation.graphql_cost += int(rate_limit.get("cost") or 0)
+        if rate_limit.get("remaining") is not None:
+            observation.rate_limit_remaining["graphql"] = int(
+                rate_limit["remaining"])
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring malformed GraphQL rateLimit: {rate_limit}")
+
+
+class GitHubApiMetrics:
+    """
+    GitHub API 呼び出しのメトリクスレジストリ (スレッドセーフ)。
+    (api, 操作名) ごとにレイテンシのヒストグラム・ステータスコード別の回数・リトライ回数・GraphQLコストを集計し、
+    レート制限の残量はリソースごとに最後に観測した値を保持します。
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._operations: Dict[Tuple[str, str], _OperationMetrics] = {}
+        self._rate_limit_remaining: Dict[str, int] = {}
+
+    def _get(self, api: str, operation: str) -> _OperationMetrics:
+        key = (api, operation)
+        metrics = self._operations.get(key)
+        if metrics is None:
+            metrics = self._operations[key] = _OperationMetrics(self.buckets)
+        return metrics
+
+    def record_call(self, api: str, operation: str, duration: float, status: str,
+                    error: bool = False, observation: Optional[ApiCallObservation] = None) -> None:
+        """API呼び出し1回の結果を記録します。"""
+        with self._lock:
+            metrics = self._get(api, operation)
+            metrics.latency.observe(duration)
+            metrics.status_counts[status] = metrics.status_counts.get(
+                status, 0) + 1
+            if error:
+                metrics.errors += 1
+            if observation is not None:
+                metrics.http_requests += observation.http_requests
+                metrics.graphql_cost += observation.graphql_cost
+                self._rate_limit_remaining.update(
+                    observation.rate_limit_remaining)
+
+    def record_retries(self, api: str, operation: str, retries: int) -> None:
+        if retries <= 0:
+            return
+        with self._lock:
+            self._get(api, operation).retries += retries
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+            self._rate_limit_remaining.clear()
+
+    def rate_limit_remaining(self) -> Dict[str, int]:
+        """リソースごとに最後に観測したレート制限の残量を返します。"""
+        with self._lock:
+            return dict(self._rate_limit_remaining)
+
+    def summary(self) -> List[OperationSummary]:
+        """操作ごとの集計結果を、合計所要時間の長い順に返します。"""
+        with self._lock:
+            rows = [OperationSummary(
+                api=api, operation=operation, calls=metrics.latency.count,
+                errors=metrics.errors, http_requests=metrics.http_requests,
+                total_seconds=metrics.latency.sum,
+                p50_seconds=metrics.latency.quantile(0.5),
+                p95_seconds=metrics.latency.quantile(0.95),
+                max_seconds=metrics.latency.max, retries=metrics.retries,
+                graphql_cost=metrics.graphql_cost,
+                status_counts=dict(metrics.status_counts))
+                for (api, operation), metrics in self._operations.items()]
+        return sorted(rows, key=lambda row: row.total_seconds, reverse=True)
+
+    def render_prometheus(self) -> str:
+        """Prometheus のテキスト形式 (text/plain; version=0.0.4) でメトリクスを出力します。"""
+        with self._lock:
+            operations = sorted(self._operations.items())
+            lines = ["# HELP github_api_request_duration_seconds Latency of GitHub API client calls.",
+                     "# TYPE github_api_request_duration_seconds histogram"]
+            for (api, operation), metrics in operations:
+                labels = {"api": api, "operation": operation}
+                for le, count in metrics.latency.cumulative():
+                    lines.append(
+                        f"github_api_request_duration_seconds_bucket{format_labels({**labels, 'le': le})} {count}")
+                lines.append(
+                    f"github_api_request_duration_seconds_sum{format_labels(labels)} {metrics.latency.sum!r}")
+                lines.append(
+                    f"github_api_request_duration_seconds_count{format_labels(labels)} {metrics.latency.count}")
+            lines += ["# HELP github_api_calls_total GitHub API client calls by status code.",
+                      "# TYPE github_api_calls_total counter"]
+            for (api, operation), metrics in operations:
+                for status, count in sorted(metrics.status_counts.items()):
+                    lines.append(
+                        f"github_api_calls_total{format_labels({'api': api, 'operation': operation, 'status': status})} {count}")
+            lines += render_metric_family(
+                "github_api_http_requests_total", "counter", "HTTP requests sent by GitHub API client calls.",
+                {(("api", api), ("operation", operation)): metrics.http_requests
+                 for (api, operation), metrics in operations})
+            lines += render_metric_family(
+                "github_api_retries_total", "counter", "Additional attempts made by retried GitHub API calls.",
+                {(("api", api), ("operation", operation)): metrics.retries
+                 for (api, operation), metrics in operations})
+            lines += render_metric_family(
+                "github_api_graphql_cost_total", "counter", "GraphQL rate limit cost reported by GitHub.",
+                {(("api", api), ("operation", operation)): metrics.graphql_cost
+                 for (api, operation), metrics in operations if api == "graphql"})
+            lines += render_metric_family(
+                "github_api_rate_limit_remaining", "gauge", "Last observed remaining rate limit per resource.",
+                {(("resource", resource),): remaining
+                 for resource, remaining in sorted(self._rate_limit_remaining.items())})
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: Mapping[str, Any]) -> str:
+    """ラベルの辞書を Prometheus のラベル表記 ({key="value",...}) にします。"""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_metric_family(name: str, metric_type: str, help_text: str,
+                         samples: Mapping[Tuple[Tuple[str, Any], ...], float]) -> List[str]:
+    """1つのメトリクス (HELP/TYPE 行と、ラベルの組 → 値 のサンプル) を Prometheus のテキスト形式の行にします。"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples.items():
+        lines.append(f"{name}{format_labels(dict(labels))} {value}")
+    return lines
+
+
+def render_stats_family(name: str, help_text: str, stats: Iterable[Tuple[Mapping[str, Any], Mapping[str, float]]]) -> List[str]:
+    """
+    stats() が返す {"hits": 1, ...} 形式の辞書を、stat ラベル付きのゲージとして出力します。
+    stats には (ラベル, stats() の戻り値) の組を渡します。
+    """
+    samples: Dict[Tuple[Tuple[str, Any], ...], float] = {}
+    for labels, values in stats:
+        for stat, value in values.items():
+            samples[tuple(labels.items()) + (("stat", stat),)] = value
+    return render_metric_family(name, "gauge", help_text, samples)
+
+
+# プロセス全体で共有する既定のレジストリ (クライアントに metrics 属性がない場合に使用)
+github_api_metrics = GitHubApiMetrics()
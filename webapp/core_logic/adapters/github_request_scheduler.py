@@ -0,0 +1,188 @@
+# webapp/core_logic/adapters/github_request_scheduler.py
+# GitHub API のレート制限を考慮してリクエスト間隔を調整するスケジューラ
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import httpx
+from githubkit import GitHub
+from pydantic import BaseModel, Field
+
+from core_logic.adapters.github_metrics import observe_response
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitState(BaseModel):
+    """リソース (core, graphql, search など) ごとのレート制限の状態"""
+    remaining: int = Field(description="リセットまでに残っているリクエスト数 (GraphQLはポイント)")
+    reset_at: float = Field(description="残量がリセットされるUNIX時刻 (秒)")
+    limit: int | None = Field(default=None, description="1時間あたりの上限")
+
+
+class GitHubRequestScheduler:
+    """
+    GitHubRestClient と GitHubGraphQLClient が共有する、レート制限対応のリクエストスケジューラ。
+    githubkit.GitHub インスタンスの httpx イベントフックとして組み込み、全リクエストの前後で動作します。
+
+    - レスポンスの X-RateLimit-* ヘッダー、および GraphQL の rateLimit フィールドから残量を追跡します。
+    - 残量が reserve 以下になると、リセット時刻までの残り時間に均等に分散するようリクエストを遅延させます。
+    - Retry-After (セカンダリレート制限) を受け取った場合は、指定秒数の間すべてのリクエストを待機させます。
+    """
+
+    def __init__(self, reserve: int = 50, max_wait: float = 900.0,
+                 clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            reserve: この残量を下回ったらペース配分を開始するリクエスト数。
+            max_wait: 1回の待機の上限秒数。
+            clock: 現在時刻 (UNIX秒) を返す関数。テスト用に差し替え可能。
+            sleep: 待機関数。テスト用に差し替え可能。
+        """
+        if reserve < 0:
+            raise ValueError("reserve must not be negative")
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._states: Dict[str, RateLimitState] = {}
+        self._paused_until = 0.0
+        self.total_wait_seconds = 0.0
+        logger.debug(
+            f"GitHubRequestScheduler initialized (reserve={reserve}).")
+
+    # --- Resource helpers ---
+    @staticmethod
+    def resource_for_path(path: str) -> str:
+        """リクエストパスから対象のレート制限リソース名を推定します。"""
+        if path.rstrip("/").endswith("/graphql"):
+            return "graphql"
+        if path.startswith("/search"):
+            return "search"
+        return "core"
+
+    def get_state(self, resource: str) -> Optional[RateLimitState]:
+        """指定リソースの最新のレート制限状態を返します (未取得の場合は None)。"""
+        with self._lock:
+            return self._states.get(resource)
+
+    # --- State updates ---
+    def update_from_headers(self, headers: Mapping[str, str], resource: Optional[str] = None) -> None:
+        """
+        レスポンスヘッダー (X-RateLimit-*, Retry-After) からレート制限状態を更新します。
+        """
+        lowered = {k.lower(): v for k, v in headers.items()}
+        now = self._clock()
+        with self._lock:
+            if (retry_after := lowered.get("retry-after")) is not None:
+                try:
+                    pause_until = now + float(retry_after)
+                except ValueError:
+                    pause_until = now
+                if pause_until > self._paused_until:
+                    self._paused_until = pause_until
+                    logger.warning(
+                        f"GitHub requested Retry-After {retry_after}s. Pausing all requests.")
+
+            remaining = lowered.get("x-ratelimit-remaining")
+            reset = lowered.get("x-ratelimit-reset")
+            if remaining is None or reset is None:
+                return
+            resource = lowered.get("x-ratelimit-resource") or resource or "core"
+            try:
+                limit = lowered.get("x-ratelimit-limit")
+                self._states[resource] = RateLimitState(
+                    remaining=int(remaining), reset_at=float(reset),
+                    limit=int(limit) if limit is not None else None)
+            except ValueError:
+                logger.debug(
+                    f"Ignoring malformed rate limit headers: remaining={remaining}, reset={reset}")
+
+    def update_from_graphql(self, rate_limit: Optional[Dict[str, Any]]) -> None:
+        """
+        GraphQL レスポンスの rateLimit { cost remaining resetAt } フィールドから状態を更新します。
+        """
+        if not rate_limit or rate_limit.get("remaining") is None or not rate_limit.get("resetAt"):
+            return
+        try:
+            reset_at = datetime.fromisoformat(
+                str(rate_limit["resetAt"]).replace("Z", "+00:00")).timestamp()
+            remaining = int(rate_limit["remaining"])
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring malformed GraphQL rateLimit: {rate_limit}")
+            return
+        with self._lock:
+            current = self._states.get("graphql")
+            self._states["graphql"] = RateLimitState(
+                remaining=remaining, reset_at=reset_at,
+                limit=current.limit if current else None)
+        logger.debug(
+            f"GraphQL rate limit: cost={rate_limit.get('cost')}, remaining={remaining}")
+
+    # --- Scheduling ---
+    def compute_delay(self, resource: str) -> float:
+        """次のリクエストを送信するまでに待つべき秒数を計算します。"""
+        now = self._clock()
+        with self._lock:
+            delay = max(0.0, self._paused_until - now)
+            state = self._states.get(resource)
+            if state is not None and state.remaining <= self.reserve:
+                until_reset = max(0.0, state.reset_at - now)
+                if state.remaining <= 0:
+                    # 残量がない場合はリセットまで待つ
+                    delay = max(delay, until_reset)
+                else:
+                    # 残り時間に均等に分散させる
+                    delay = max(delay, until_reset / state.remaining)
+        return min(delay, self.max_wait)
+
+    def wait_for_slot(self, resource: str) -> float:
+        """必要に応じて待機し、実際に待機した秒数を返します。"""
+        delay = self.compute_delay(resource)
+        if delay > 0:
+            logger.info(
+                f"Rate limit pacing: waiting {delay:.1f}s before next '{resource}' request.")
+            self._sleep(delay)
+            with self._lock:
+                self.total_wait_seconds += delay
+        return delay
+
+    # --- httpx event hooks ---
+    def _on_request(self, request: httpx.Request) -> None:
+        self.wait_for_slot(self.resource_for_path(request.url.path))
+
+    def _on_response(self, response: httpx.Response) -> None:
+        resource = self.resource_for_path(response.request.url.path)
+        self.update_from_headers(response.headers, resource)
+        observe_response(response.status_code, response.headers, resource)
+
+    def event_hooks(self) -> Dict[str, List[Callable[..., Any]]]:
+        """githubkit.GitHub(event_hooks=...) に渡す httpx イベントフックを返します。"""
+        return {"request": [self._on_request], "response": [self._on_response]}
+
+
+def create_github_instance(token: str, scheduler: Optional[GitHubRequestScheduler] = None,
+                           auto_retry: bool = True,
+                           transport: Optional[httpx.BaseTransport] = None,
+                           base_url: Optional[str] = None) -> GitHub:
+    """
+    認証済みの githubkit.GitHub インスタンスを作成します。
+    scheduler を渡した場合、全リクエストがスケジューラを経由するようイベントフックを設定します。
+    auto_retry=False の場合、githubkit 組み込みのリトライを無効化します
+    (クライアント側の RetryPolicy でリトライする場合に二重リトライを避けるため)。
+    transport を渡した場合、その接続プールを全リクエストで共有します (keep-alive 用)。
+    base_url を渡した場合、api.github.com の代わりにそのURLへ送信します (ベンチマーク用のフェイクサーバー等)。
+    """
+    options: Dict[str, Any] = {"auto_retry": auto_retry}
+    if scheduler is not None:
+        options["event_hooks"] = scheduler.event_hooks()
+    if transport is not None:
+        options["transport"] = transport
+    if base_url is not None:
+        options["base_url"] = base_url
+    return GitHub(token, **options)
@@ -2,7 +2,7 @@
 # GitHubのREST APIを扱うためのクライアントクラス
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple, cast
+from typing import List, Optional, Dict, Any, Tuple, Callable, cast
 from githubkit import GitHub, Response
 # 必要なモデルを githubkit からインポート
 from githubkit.versions.latest.models import (
@@ -11,7 +11,10 @@ from githubkit.versions.latest.models import (
 from githubkit.exception import RequestFailed  # 404ハンドリング用
 
 # 作成したエラーハンドリングデコレータとドメイン例外をインポート
-from core_logic.adapters.github_utils import github_api_error_handler
+from core_logic.adapters.github_utils import (
+    github_api_error_handler, github_api_retry, RetryPolicy, RetryStats, ApiCallCounter
+)
+from core_logic.adapters.github_metrics import GitHubApiMetrics
 from core_logic.domain.exceptions import GitHubClientError, GitHubResourceNotFoundError
 
 logger = logging.getLogger(__name__)
@@ -25,16 +28,26 @@ class GitHubRestClient:
     各メソッドは原則としてGitHub APIの操作を直接実行します。
     """
 
-    def __init__(self, github_instance: GitHub):
+    # メトリクスに記録するAPI種別
+    api_name = "rest"
+
+    def __init__(self, github_instance: GitHub, retry_policy: Optional[RetryPolicy] = None,
+                 metrics: Optional[GitHubApiMetrics] = None):
         """
         Args:
             github_instance: 認証済みの githubkit.GitHub インスタンス。
+            retry_policy: 一時的なエラー時のリトライ方針。None の場合はリトライしません。
+            metrics: API呼び出しのメトリクスの記録先。None の場合はプロセス共通のレジストリに記録します。
         """
         if not isinstance(github_instance, GitHub):
             # 初期化時の型チェックを追加
             raise TypeError(
                 "github_instance must be a valid githubkit.GitHub instance.")
         self.gh = github_instance
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.call_counter = ApiCallCounter()
+        self.metrics = metrics
         logger.info("GitHubRestClient initialized.")
 
     # --- Context Generators for Decorator ---
@@ -55,6 +68,9 @@ class GitHubRestClient:
     def _create_label_context(self, owner: str, repo: str, label_name: str, **_) -> str:
         return f"creating label '{label_name}' in {owner}/{repo}"
 
+    def _list_labels_context(self, owner: str, repo: str) -> str:
+        return f"listing labels for {owner}/{repo}"
+
     # state, per_pageを受け取っても無視
     def _list_milestones_context(self, owner: str, repo: str, **_) -> str:
         return f"listing milestones for {owner}/{repo}"
@@ -67,13 +83,56 @@ class GitHubRestClient:
     def _create_issue_context(self, owner: str, repo: str, title: str, **_) -> str:
         return f"creating issue '{title}' in {owner}/{repo}"
 
+    # state を受け取っても無視
+    def _list_issues_context(self, owner: str, repo: str, **_) -> str:
+        return f"listing issues for {owner}/{repo}"
+
     def _search_issues_context(self, q: str, **_) -> str:  # per_pageを受け取っても無視
         return f"searching issues with query '{q}'"
 
     def _check_collaborator_context(self, owner: str, repo: str, username: str) -> str:
         return f"checking collaborator status for '{username}' in {owner}/{repo}"
 
+    def _list_assignees_context(self, owner: str, repo: str) -> str:
+        return f"listing assignable users for {owner}/{repo}"
+
+    # --- Duplicate Checks for Retry ---
+    # 作成系メソッドのリトライ前に、前回の試行で作成済みかを確認する (private)
+    def _find_created_label(self, owner: str, repo: str, label_name: str, **_) -> Optional[Label]:
+        return self.get_label(owner, repo, label_name.strip())
+
+    def _find_created_milestone(self, owner: str, repo: str, title: str, **_) -> Optional[Milestone]:
+        trimmed_title = title.strip()
+        return next((m for m in self.list_milestones(owner, repo, state="all")
+                     if m.title == trimmed_title), None)
+
+    # --- Pagination Helper ---
+    def _paginate(self, request_func: Callable[..., Response], per_page: int = 100,
+                  max_pages: int = 100, **kwargs: Any) -> List[Any]:
+        """
+        page パラメータを進めながら一覧系APIを呼び出し、全ページの結果を結合して返します。
+        取得件数が per_page 未満のページを最終ページとみなします。
+        エラーハンドリングは呼び出し元メソッドのデコレータに委譲します。
+        """
+        items: List[Any] = []
+        page = 1
+        while page <= max_pages:
+            response = request_func(per_page=per_page, page=page, **kwargs)
+            page_items = response.parsed_data if response and response.parsed_data else []
+            items.extend(page_items)
+            logger.debug(
+                f"Fetched page {page} ({len(page_items)} item(s), total {len(items)})")
+            if len(page_items) < per_page:
+                break
+            page += 1
+        else:
+            logger.warning(
+                f"Reached maximum page limit ({max_pages}) while paginating. Results may be incomplete.")
+        return items
+
     # --- Repository ---
+    # 冪等ではないため、GitHub が処理せずに拒否したレート制限のみリトライする
+    @github_api_retry(rate_limit_only=True)
     @github_api_error_handler(_create_repo_context)
     def create_repository(self, repo_name: str) -> Repository:
         """
@@ -97,6 +156,7 @@ class GitHubRestClient:
             f"Successfully created repository: {response.parsed_data.html_url}")
         return response.parsed_data
 
+    @github_api_retry()
     @github_api_error_handler(lambda self, owner, repo: f"getting repository '{owner}/{repo}'")
     def get_repository(self, owner: str, repo: str):
         """
@@ -129,6 +189,7 @@ class GitHubRestClient:
         return response.parsed_data
 
     # --- Authenticated User ---
+    @github_api_retry()
     @github_api_error_handler(_get_auth_user_context)
     def get_authenticated_user(self) -> User:
         """認証されたユーザーの情報を取得します。"""
@@ -143,6 +204,7 @@ class GitHubRestClient:
 
     # --- Labels ---
     # ignore_not_found=True をデコレータに指定し、404の場合はNoneを返すようにする
+    @github_api_retry()
     @github_api_error_handler(_get_label_context, ignore_not_found=True)
     def get_label(self, owner: str, repo: str, label_name: str) -> Optional[Label]:
         """
@@ -162,6 +224,19 @@ class GitHubRestClient:
         # parsed_dataがあればそれを返す (Noneの場合もそのまま返す) - castを追加
         return cast(Optional[Label], response.parsed_data) if response else None
 
+    @github_api_retry()
+    @github_api_error_handler(_list_labels_context)
+    def list_labels(self, owner: str, repo: str) -> List[Label]:
+        """
+        リポジトリに定義されている全ラベルを全ページ取得して返します (per_page=100)。
+        """
+        logger.debug(f"Listing labels for {owner}/{repo}")
+        labels = self._paginate(
+            self.gh.rest.issues.list_labels_for_repo, owner=owner, repo=repo)
+        logger.debug(f"Listed {len(labels)} label(s) for {owner}/{repo}.")
+        return labels
+
+    @github_api_retry(duplicate_check=_find_created_label)
     @github_api_error_handler(_create_label_context)
     def create_label(self, owner: str, repo: str, label_name: str,
                      color: Optional[str] = None, description: Optional[str] = "") -> Label:
@@ -193,17 +268,20 @@ class GitHubRestClient:
         return response.parsed_data
 
     # --- Milestones ---
+    @github_api_retry()
     @github_api_error_handler(_list_milestones_context)
     def list_milestones(self, owner: str, repo: str, state: str = "open", per_page: int = 100) -> List[Milestone]:
-        """指定された状態のマイルストーンをリストします。"""
+        """指定された状態のマイルストーンを全ページ取得してリストします。"""
         logger.debug(
             f"Listing {state} milestones for {owner}/{repo} (per_page={per_page})")
-        response: Response[List[Milestone]] = self.gh.rest.issues.list_milestones(
-            owner=owner, repo=repo, state=state, per_page=per_page
-        )
-        # parsed_dataがNoneや空リストの場合もそのまま返す
-        return response.parsed_data if response and response.parsed_data else []
+        milestones = self._paginate(
+            self.gh.rest.issues.list_milestones, per_page=per_page,
+            owner=owner, repo=repo, state=state)
+        logger.debug(
+            f"Listed {len(milestones)} {state} milestone(s) for {owner}/{repo}.")
+        return milestones
 
+    @github_api_retry(duplicate_check=_find_created_milestone)
     @github_api_error_handler(_create_milestone_context)
     def create_milestone(self, owner: str, repo: str, title: str,
                          state: str = "open", description: Optional[str] = "") -> Milestone:
@@ -239,6 +317,8 @@ class GitHubRestClient:
         return response.parsed_data
 
     # --- Issues ---
+    # 冪等ではないため、GitHub が処理せずに拒否したレート制限のみリトライする
+    @github_api_retry(rate_limit_only=True)
     @github_api_error_handler(_create_issue_context)
     def create_issue(self, owner: str, repo: str, title: str,
                      body: Optional[str] = None,
@@ -275,7 +355,24 @@ class GitHubRestClient:
             f"Successfully created issue '{trimmed_title}': {response.parsed_data.html_url}")
         return response.parsed_data
 
+    @github_api_retry()
+    @github_api_error_handler(_list_issues_context)
+    def list_issues(self, owner: str, repo: str, state: str = "open") -> List[Issue]:
+        """
+        リポジトリの Issue を全ページ取得して返します (per_page=100)。
+        REST API の一覧には Pull Request も含まれるため、それらは除外します。
+        """
+        logger.debug(f"Listing {state} issues for {owner}/{repo}")
+        items = self._paginate(
+            self.gh.rest.issues.list_for_repo, owner=owner, repo=repo, state=state)
+        issues = [item for item in items if not getattr(
+            item, "pull_request", None)]
+        logger.debug(
+            f"Listed {len(issues)} {state} issue(s) for {owner}/{repo} (excluded {len(items) - len(issues)} pull request(s)).")
+        return issues
+
     # --- Search ---
+    @github_api_retry()
     @github_api_error_handler(_search_issues_context)
     def search_issues_and_pull_requests(self, q: str, per_page: int = 1) -> Any:
         """
@@ -299,6 +396,7 @@ class GitHubRestClient:
 
     # --- Collaborators ---
     # ignore_not_found=True を指定し、404の場合は False を返すようにする
+    @github_api_retry()
     @github_api_error_handler(_check_collaborator_context, ignore_not_found=True)
     def check_collaborator(self, owner: str, repo: str, username: str) -> bool:
         """
@@ -324,3 +422,17 @@ class GitHubRestClient:
         logger.debug(
             f"User '{username}' is{'' if is_collaborator else ' not'} a collaborator on {owner}/{repo}")
         return is_collaborator
+
+    @github_api_retry()
+    @github_api_error_handler(_list_assignees_context)
+    def list_assignees(self, owner: str, repo: str) -> List[str]:
+        """
+        リポジトリの Issue に割り当て可能なユーザーのログイン名を全ページ取得して返します (per_page=100)。
+        """
+        logger.debug(f"Listing assignable users for {owner}/{repo}")
+        users = self._paginate(
+            self.gh.rest.issues.list_assignees, owner=owner, repo=repo)
+        logins = [user.login for user in users if user and user.login]
+        logger.debug(
+            f"Listed {len(logins)} assignable user(s) for {owner}/{repo}.")
+        return logins
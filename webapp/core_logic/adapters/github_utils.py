@@ -3,9 +3,13 @@
 
 import functools
 import logging
+import random
+import threading
+import time
 from typing import Optional, Callable, TypeVar, Any, cast, List, Dict
 from githubkit import GitHub
-from githubkit.exception import RequestFailed, RequestError, RequestTimeout
+from githubkit.exception import RequestFailed, RequestError, RequestTimeout, RateLimitExceeded
+from pydantic import BaseModel, Field
 
 # GraphQLResponseのインポート
 # githubkitのバージョンによって適切な方法でGraphQLエラー関連の型をインポート
@@ -27,6 +31,7 @@ except ImportError:
 from core_logic.domain.exceptions import (
     GitHubClientError, GitHubResourceNotFoundError, GitHubAuthenticationError, GitHubRateLimitError, GitHubValidationError
 )
+from core_logic.adapters.github_metrics import GitHubApiMetrics, github_api_metrics, begin_call, end_call
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +104,8 @@ def github_api_error_handler(
     """
     GitHub API呼び出しのエラーを処理し、適切なカスタム例外にラップするデコレータ。
     GraphQL APIの場合、戻り値のレスポンスにエラーが含まれているかもチェックします。
+    各呼び出しの所要時間・ステータスコード・レート制限の残量・GraphQLコストをインスタンスの metrics 属性
+    (未設定の場合はプロセス共有の github_api_metrics) に記録します。操作名はメソッド名、API種別は api_name 属性です。
 
     Args:
         context_func: メソッド呼び出し時のコンテキスト文字列を生成する関数 (self, *args を受け取る)。
@@ -132,6 +139,34 @@ def github_api_error_handler(
     def decorator(func: Callable[..., R]) -> Callable[..., Optional[R]]:
         @functools.wraps(func)
         def wrapper(self: Any, *args: Any, **kwargs: Any) -> Optional[R]:
+            observation = begin_call()
+            start = time.perf_counter()
+            error: Optional[Exception] = None
+            try:
+                return invoke(self, *args, **kwargs)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                end_call(observation)
+                if error is not None:
+                    status_code = getattr(error, "status_code", None)
+                    status = str(status_code) if status_code else "error"
+                else:
+                    status = str(
+                        observation.status_code) if observation.status_code else "ok"
+                call_counter = getattr(self, "call_counter", None)
+                if isinstance(call_counter, ApiCallCounter):
+                    call_counter.increment()
+                try:
+                    _metrics_for(self).record_call(
+                        _api_name(self), func.__name__, time.perf_counter() - start, status,
+                        error=error is not None, observation=observation)
+                except Exception as metrics_error:
+                    logger.debug(
+                        f"Failed to record metrics for {func.__name__}: {metrics_error}")
+
+        def invoke(self: Any, *args: Any, **kwargs: Any) -> Optional[R]:
             # メソッド呼び出し前にコンテキスト文字列を生成
             context = context_func(
                 self, *args, **kwargs) if context_func else f"{func.__name__} operation"
@@ -191,17 +226,17 @@ def github_api_error_handler(
                 logger.warning(msg)  # 失敗時はWarningレベル
 
                 # ステータスコードに基づいて適切なドメイン例外に変換
-                if status_code == 401:
+                if _is_rate_limited(e, status_code, headers):
+                    # プライマリ (残量0)・セカンダリ (Retry-After 付きの 403/429) レート制限
+                    raise GitHubRateLimitError(f"Rate limit exceeded during {context}",
+                                               status_code=status_code, original_exception=e,
+                                               retry_after=_retry_after_seconds(e, headers)) from e
+                elif status_code == 401:
                     raise GitHubAuthenticationError(f"Authentication failed (401) during {context}. Check PAT.",
                                                     status_code=status_code, original_exception=e) from e
                 elif status_code == 403:
-                    remaining = headers.get("X-RateLimit-Remaining")
-                    if remaining == "0":
-                        raise GitHubRateLimitError(f"Rate limit exceeded during {context}",
-                                                   status_code=status_code, original_exception=e) from e
-                    else:
-                        raise GitHubAuthenticationError(f"Permission denied (403) during {context}. Check PAT scope.",
-                                                        status_code=status_code, original_exception=e) from e
+                    raise GitHubAuthenticationError(f"Permission denied (403) during {context}. Check PAT scope.",
+                                                    status_code=status_code, original_exception=e) from e
                 elif status_code == 404:
                     # ignore_not_foundフラグが指定されている場合は、404を無視してNoneを返す
                     if ignore_not_found:
@@ -281,3 +316,194 @@ def github_api_error_handler(
 
         return wrapper
     return decorator
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """レスポンスヘッダーを大文字・小文字を区別せずに取得します。"""
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        value = next((v for k, v in headers.items() if k.lower() == lowered), None)
+    return value
+
+
+def _is_rate_limited(error: RequestFailed, status_code: Optional[int], headers: Any) -> bool:
+    """失敗したリクエストがレート制限によるものかを判定します。"""
+    if isinstance(error, RateLimitExceeded) or status_code == 429:
+        return True
+    if status_code != 403:
+        return False
+    return _header(headers, "X-RateLimit-Remaining") == "0" or _header(headers, "Retry-After") is not None
+
+
+def _retry_after_seconds(error: RequestFailed, headers: Any) -> Optional[float]:
+    """
+    レート制限の解除までの待機秒数を返します。
+    githubkit が算出した値、Retry-After、X-RateLimit-Reset の順に参照し、いずれも無い場合は None を返します。
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return max(0.0, retry_after.total_seconds())
+    try:
+        if (value := _header(headers, "Retry-After")) is not None:
+            return max(0.0, float(value))
+        if _header(headers, "X-RateLimit-Remaining") == "0" and \
+                (reset := _header(headers, "X-RateLimit-Reset")) is not None:
+            return max(0.0, float(reset) - time.time())
+    except ValueError:
+        logger.debug(f"Ignoring malformed rate limit headers: {headers}")
+    return None
+
+
+def _metrics_for(client: Any) -> GitHubApiMetrics:
+    metrics = getattr(client, "metrics", None)
+    return metrics if isinstance(metrics, GitHubApiMetrics) else github_api_metrics
+
+
+def _api_name(client: Any) -> str:
+    return getattr(client, "api_name", None) or type(client).__name__
+
+
+# --- リトライ関連 ---
+
+
+class RetryPolicy(BaseModel):
+    """
+    一時的なエラーに対するリトライ方針。指数バックオフ + ジッターで待機時間を決定する。
+    """
+    max_attempts: int = Field(
+        3, ge=1, description="最大試行回数 (1 の場合はリトライしない)")
+    base_delay: float = Field(1.0, ge=0, description="初回リトライまでの基準待機秒数")
+    max_delay: float = Field(30.0, ge=0, description="1回の待機の上限秒数")
+    jitter: float = Field(
+        0.5, ge=0, le=1, description="待機時間に加える揺らぎの割合 (0.5 なら ±50%)")
+    retryable_status_codes: frozenset[int] = Field(
+        default=frozenset({429, 500, 502, 503, 504}), description="リトライ対象のHTTPステータスコード")
+    max_retry_after: float = Field(
+        60.0, ge=0, description="レート制限の解除までこの秒数より長く待つ必要がある場合はリトライしない")
+
+    def compute_delay(self, attempt: int, rand: Callable[[], float] = random.random,
+                      retry_after: Optional[float] = None) -> float:
+        """
+        attempt 回目の失敗後に待機する秒数を返します。
+        retry_after (レート制限の解除までの秒数) を指定した場合は、少なくともその秒数待機します。
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = max(0.0, delay * (1 + self.jitter * (2 * rand() - 1)))
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    def is_retryable(self, error: GitHubClientError) -> bool:
+        """ドメイン例外がリトライ対象かどうかを判定します。"""
+        if isinstance(error, GitHubRateLimitError):
+            return error.retry_after is None or error.retry_after <= self.max_retry_after
+        if error.status_code is not None:
+            return error.status_code in self.retryable_status_codes
+        # ステータスコードのないネットワークエラー・タイムアウト
+        return isinstance(error.original_exception, (RequestError, RequestTimeout))
+
+
+# リトライしない方針 (クライアントの既定値)
+NO_RETRY_POLICY = RetryPolicy(max_attempts=1)
+
+
+class RetryStats:
+    """
+    クライアントごとのリトライ発生状況を記録するスレッドセーフなカウンタ。
+    操作名 (メソッド名) ごとに、リトライで追加された試行回数を集計します。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries: Dict[str, int] = {}
+
+    def record(self, operation: str, attempts: int) -> None:
+        if attempts <= 1:
+            return
+        with self._lock:
+            self._retries[operation] = self._retries.get(
+                operation, 0) + attempts - 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """現在までの操作ごとのリトライ回数のコピーを返します。"""
+        with self._lock:
+            return dict(self._retries)
+
+
+class ApiCallCounter:
+    """
+    クライアントごとのAPI呼び出し回数 (リトライを含む試行回数) を数えるスレッドセーフなカウンタ。
+    ワークフローのステップごとの呼び出し回数は、ステップ前後の値の差から求めます。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def increment(self) -> None:
+        with self._lock:
+            self._count += 1
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return self._count
+
+
+def _record_attempts(client: Any, stats: Optional[RetryStats], operation: str, attempts: int) -> None:
+    """試行回数をリトライ統計とメトリクスレジストリに記録します。"""
+    if stats is not None:
+        stats.record(operation, attempts)
+    _metrics_for(client).record_retries(
+        _api_name(client), operation, attempts - 1)
+
+
+def github_api_retry(duplicate_check: Optional[Callable[..., Any]] = None,
+                     rate_limit_only: bool = False) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """
+    github_api_error_handler の外側に付与し、一時的なエラーを指数バックオフでリトライするデコレータ。
+    リトライ方針はインスタンスの retry_policy 属性、記録先は retry_stats 属性から取得します。
+
+    冪等な操作にのみそのまま付与してください。作成系の操作に付与する場合は duplicate_check を指定します。
+    duplicate_check は元のメソッドと同じ引数で呼ばれ、前回の試行で既に作成されていたリソースを返します
+    (存在しなければ None)。リトライ前に呼び出し、見つかった場合は再作成せずにそれを返します。
+    rate_limit_only=True の場合はレート制限 (GitHub がリクエストを処理せずに拒否したもの) のみリトライします。
+    冪等でない作成系の操作でも、拒否されたリクエストを Retry-After の経過後に再送できます。
+    レート制限の場合は、GitHub が指示した解除までの秒数以上待機してからリトライします。
+    """
+    def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> R:
+            policy: RetryPolicy = getattr(
+                self, "retry_policy", None) or NO_RETRY_POLICY
+            stats: Optional[RetryStats] = getattr(self, "retry_stats", None)
+            attempt = 1
+            while True:
+                try:
+                    result = func(self, *args, **kwargs)
+                except GitHubClientError as e:
+                    retryable = isinstance(e, GitHubRateLimitError) if rate_limit_only else True
+                    if attempt >= policy.max_attempts or not retryable or not policy.is_retryable(e):
+                        _record_attempts(self, stats, func.__name__, attempt)
+                        raise
+                    delay = policy.compute_delay(
+                        attempt, retry_after=getattr(e, "retry_after", None))
+                    logger.warning(
+                        f"Transient error in {func.__name__} (attempt {attempt}/{policy.max_attempts}): {e}. Retrying in {delay:.1f}s...")
+                    time.sleep(delay)
+                    attempt += 1
+                    if duplicate_check is not None:
+                        # 失敗したリクエストが実際にはサーバー側で処理されていた場合に備える
+                        existing = duplicate_check(self, *args, **kwargs)
+                        if existing is not None:
+                            logger.info(
+                                f"{func.__name__}: resource was already created by a previous attempt. Skipping retry.")
+                            _record_attempts(
+                                self, stats, func.__name__, attempt)
+                            return cast(R, existing)
+                    continue
+                _record_attempts(self, stats, func.__name__, attempt)
+                return result
+        return wrapper
+    return decorator
@@ -1,13 +1,81 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Iterable, Iterator
+import codecs
 import yaml
 import json
 
+from core_logic.domain.exceptions import ParsingError
+
 # RawIssueBlock: 各Issueを表す未加工データ（Markdownならstr、YAML/JSONならdict）
 RawIssueBlock = Union[str, Dict[str, Any]]
 # IntermediateParsingResult: ファイル全体をパースした結果（Issueブロックのリスト）
 IntermediateParsingResult = List[RawIssueBlock]
 
+# バイト列をストリームとして扱う際の1チャンクの大きさ
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_byte_chunks(content: Union[bytes, Iterable[bytes]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """bytes は chunk_size ごとに分割し、それ以外 (UploadedFile.chunks() など) はそのまま返します。"""
+    if isinstance(content, (bytes, bytearray)):
+        view = memoryview(content)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+        return
+    yield from content
+
+
+def decode_utf8_chunks(byte_chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    バイト列のチャンクを逐次UTF-8デコードします。
+    チャンクの境界で分断されたマルチバイト文字は次のチャンクと結合してデコードします。
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for chunk in byte_chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        text = decoder.decode(b'', final=True)
+    except UnicodeDecodeError as e:
+        raise ParsingError(f"File is not valid UTF-8: {e}") from e
+    if text:
+        yield text
+
+
+def iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """テキストのチャンクを行 ('\\n' を含む) 単位に組み直して返します。"""
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        lines = pending.split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
+
+
+class TextChunkStream:
+    """テキストのチャンクを read(size) で読み出せるファイルライクオブジェクト (PyYAML の逐次読み込み用)"""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
 class AbstractIssueFileParser(ABC):
     @abstractmethod
     def parse(self, file_content: str) -> IntermediateParsingResult:
@@ -20,6 +88,13 @@ class AbstractIssueFileParser(ABC):
         """
         pass
 
+    def iter_blocks(self, chunks: Iterable[str]) -> Iterator[RawIssueBlock]:
+        """
+        テキストのチャンクを順に読み込み、Issueブロックを1件ずつ返す。
+        既定ではすべてのチャンクを結合して parse を呼ぶため、逐次処理できるパーサーは上書きすること。
+        """
+        yield from self.parse("".join(chunks))
+
 class YamlIssueParser(AbstractIssueFileParser):
     def __init__(self, issues_key="issues"):
         self.issues_key = issues_key
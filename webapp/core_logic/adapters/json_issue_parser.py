@@ -1,10 +1,86 @@
-from .issue_file_parser_base import AbstractIssueFileParser, IntermediateParsingResult
+from .issue_file_parser_base import AbstractIssueFileParser, IntermediateParsingResult, RawIssueBlock
 from core_logic.domain.exceptions import ParsingError
+from typing import Any, Iterable, Iterator
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+_JSON_WHITESPACE = " \t\n\r"
+
+
+class _JsonStreamReader:
+    """
+    テキストのチャンクからJSONの値を逐次読み込むリーダー。
+    配列の要素は json.JSONDecoder.raw_decode で1件ずつデコードし、読み終えた部分はバッファから捨てます。
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """次のチャンクを読み込みます (読み込み済みの部分は破棄)。これ以上ない場合は False を返します。"""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """空白を読み飛ばし、次の文字を返します (終端では空文字)。"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ParsingError(
+                f"Invalid JSON format: expected '{char}' but found {self.peek()!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # 値が次のチャンクに続いている可能性があるため、読み込んでから再試行する
+                if self._fill():
+                    continue
+                raise ParsingError(f"Invalid JSON format: {e}") from e
+            # 数値・リテラルがチャンク末尾で終わっている場合は続きがあり得るため読み込んで再デコードする
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ParsingError(
+                    f"Invalid JSON format: expected ',' or ']' in array but found {char!r}")
+
 
 class JsonIssueParser(AbstractIssueFileParser):
     """
@@ -37,3 +113,44 @@ class JsonIssueParser(AbstractIssueFileParser):
                     )
                     return []
         return []
+
+    def iter_blocks(self, chunks: Iterable[str]) -> Iterator[RawIssueBlock]:
+        """
+        配列の要素を1件ずつデコードして返します (ファイル全体をオブジェクトとして保持しません)。
+        結果は parse と同じですが、文書の途中で構文エラーがあった場合はそれまでのブロックを返した後に ParsingError を送出します。
+        """
+        reader = _JsonStreamReader(chunks)
+        first = reader.peek()
+        if first == "[":
+            yield from reader.iter_array()
+        elif first == "{":
+            reader.expect("{")
+            if reader.peek() == "}":
+                reader.expect("}")
+            else:
+                yield from self._iter_object_issues(reader)
+        elif first:
+            reader.value()
+        if reader.peek():
+            raise ParsingError("Invalid JSON format: extra data after the document")
+
+    def _iter_object_issues(self, reader: _JsonStreamReader) -> Iterator[RawIssueBlock]:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ParsingError(
+                    "Invalid JSON format: object keys must be strings")
+            reader.expect(":")
+            if key == self.issues_key and reader.peek() == "[":
+                yield from reader.iter_array()
+            else:
+                # issues_key 以外の値は構文の検証のためだけに読み飛ばす
+                value = reader.value()
+                if key == self.issues_key:
+                    logger.warning(
+                        f"Key '{self.issues_key}' found in JSON but its value is not a list (type: {type(value).__name__}). Returning empty list."
+                    )
+            char = reader.peek()
+            reader.expect("," if char == "," else "}")
+            if char != ",":
+                return
@@ -1,5 +1,6 @@
-from .issue_file_parser_base import AbstractIssueFileParser, IntermediateParsingResult
+from .issue_file_parser_base import AbstractIssueFileParser, IntermediateParsingResult, RawIssueBlock, iter_lines
 from core_logic.domain.exceptions import ParsingError
+from typing import Iterable, Iterator, List
 import re
 
 
@@ -22,3 +23,25 @@ class MarkdownIssueParser(AbstractIssueFileParser):
         blocks = [block.strip() for block in re.split(
             self.delimiter_pattern, file_content, flags=re.MULTILINE)]
         return [block for block in blocks if block]
+
+    def iter_blocks(self, chunks: Iterable[str]) -> Iterator[RawIssueBlock]:
+        """
+        行単位で区切り文字を探し、ブロックが完成するたびに返します (保持するのは読み込み中のブロックのみ)。
+        区切り文字のパターンは1行の中で照合します (複数行にまたがるパターンには parse を使用してください)。
+        """
+        pattern = re.compile(self.delimiter_pattern, flags=re.MULTILINE)
+        current: List[str] = []
+        for line in iter_lines(chunks):
+            body = line[:-1] if line.endswith("\n") else line
+            match = pattern.search(body)
+            if match is None:
+                current.append(line)
+                continue
+            current.append(body[:match.start()])
+            block = "".join(current).strip()
+            if block:
+                yield block
+            current = [line[match.end():]]
+        block = "".join(current).strip()
+        if block:
+            yield block
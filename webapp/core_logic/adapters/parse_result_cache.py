@@ -0,0 +1,284 @@
+# webapp/core_logic/adapters/parse_result_cache.py
+# AIParser.parse / infer_rules の結果を入力内容のハッシュで保存するキャッシュ
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from core_logic.domain.models import ParsedRequirementData, AISuggestedRules
+from core_logic.infrastructure.config import AiSettings
+
+logger = logging.getLogger(__name__)
+
+# キャッシュエントリの形式を変更した場合にインクリメントする
+PARSE_CACHE_FORMAT_VERSION = 1
+# parse_cache_dir を指定しない場合の保存先 (ユーザーのキャッシュディレクトリ配下)
+_DEFAULT_CACHE_SUBDIR = Path("github-auto-setup") / "parse_results"
+
+
+@lru_cache(maxsize=None)
+def _schema_fingerprint(model_type: Type[BaseModel] = ParsedRequirementData) -> str:
+    """結果モデルのスキーマから算出したフィンガープリント (モデル変更時にキャッシュを無効化する)"""
+    schema = json.dumps(model_type.model_json_schema(),
+                        sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_parse_input(content: str) -> str:
+    """
+    キャッシュキー算出用に入力テキストを正規化します。
+    改行コードを LF に統一し、各行末の空白と前後の空行を除去します。
+    """
+    lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+# 見出し (# Title)、区切り線 (---)、キー行 (**Title:** / Title: / "title":) を文書の構造として扱う
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s")
+_SEPARATOR_PATTERN = re.compile(r"^(-{3,}|\*{3,}|_{3,})$")
+_KEY_PATTERN = re.compile(
+    r"^(?:[-*]\s+)?(?:\*\*|__)?[\"']?([^\s:\"'*_][^:\"'*]{0,39}?)[\"']?(?:\*\*|__)?\s*:")
+_JSON_KEY_PATTERN = re.compile(r'"([^"\n]{1,40})"\s*:')
+
+
+def document_shape_fingerprint(content: str) -> str:
+    """
+    文書の「形」(見出しレベル・区切り線・キー名の集合) からフィンガープリントを算出します。
+    同じテンプレートで書かれたファイルは、Issueの内容や件数が異なっても同じ値になります。
+    """
+    headings, keys = set(), set()
+    has_separator = False
+    for line in normalize_parse_input(content).split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if _SEPARATOR_PATTERN.match(stripped):
+            has_separator = True
+            continue
+        heading = _HEADING_PATTERN.match(stripped)
+        if heading:
+            headings.add(len(heading.group(1)))
+            continue
+        json_keys = _JSON_KEY_PATTERN.findall(stripped)
+        if json_keys:
+            keys.update(k.strip().lower() for k in json_keys)
+            continue
+        key = _KEY_PATTERN.match(stripped)
+        if key:
+            keys.add(key.group(1).strip().lower())
+    shape = json.dumps({"headings": sorted(headings), "separator": has_separator,
+                        "keys": sorted(keys)}, ensure_ascii=False)
+    return hashlib.sha256(shape.encode("utf-8")).hexdigest()
+
+
+class ParseResultCache:
+    """
+    AIParser の結果 (既定は ParsedRequirementData、model_type で変更可) を保持するキャッシュ。
+
+    キーは正規化した入力・モデル名・プロンプトテンプレート・スキーマのハッシュです。
+    directory を指定した場合はエントリを JSON ファイルとして保存し、プロセスをまたいで再利用します。
+    max_entries を超えた場合は最も長く使われていないエントリから削除し、ttl 秒を過ぎたエントリは無効とします。
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_entries: int = 256,
+                 ttl: float = 7 * 24 * 3600, clock: Callable[[], float] = time.time,
+                 model_type: Type[BaseModel] = ParsedRequirementData):
+        """
+        Args:
+            directory: エントリを保存するディレクトリ。None の場合はメモリ内のみで保持します。
+            max_entries: 保持する最大エントリ数。
+            ttl: エントリの有効期間 (秒)。
+            clock: 現在時刻 (UNIX秒) を返す関数。テスト用に差し替え可能。
+            model_type: 保存する結果の pydantic モデル。
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        if ttl < 0:
+            raise ValueError("ttl must not be negative.")
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self.model_type = model_type
+        self._lock = threading.Lock()
+        # key -> (作成時刻, 結果)。並び順が最終利用順 (末尾が最新)
+        self._entries: "OrderedDict[str, Tuple[float, BaseModel]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load_from_directory()
+        logger.debug(
+            f"ParseResultCache initialized (directory={self.directory}, max_entries={max_entries}, ttl={ttl}).")
+
+    # --- Key ---
+    @staticmethod
+    def make_key(content: str, model_name: str, prompt_template: str,
+                 model_type: Type[BaseModel] = ParsedRequirementData) -> str:
+        """入力・モデル名・プロンプトテンプレート・スキーマからキャッシュキーを算出します。"""
+        payload = json.dumps({
+            "format": PARSE_CACHE_FORMAT_VERSION,
+            "schema": _schema_fingerprint(model_type),
+            "model": model_name,
+            "prompt": prompt_template,
+            "input": normalize_parse_input(content),
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # --- Public API ---
+    def get(self, key: str) -> Optional[BaseModel]:
+        """キーに対応する有効な結果を返します (存在しない・期限切れの場合は None)。"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry[0]):
+                self._remove(key)
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._touch(key)
+        # 呼び出し側での変更がキャッシュに影響しないようコピーを返す
+        return entry[1].model_copy(deep=True)
+
+    def put(self, key: str, result: BaseModel) -> None:
+        """結果を保存し、必要に応じて古いエントリを削除します。"""
+        created_at = self._clock()
+        stored = result.model_copy(deep=True)
+        with self._lock:
+            self._entries[key] = (created_at, stored)
+            self._entries.move_to_end(key)
+            self._write(key, created_at, stored)
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, int]:
+        """監視用のヒット・ミス・削除件数と現在のエントリ数を返します。"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions, "entries": len(self._entries)}
+
+    # --- Internal helpers (呼び出し側でロックを保持していること) ---
+    def _is_expired(self, created_at: float) -> bool:
+        return self._clock() - created_at > self.ttl
+
+    def _path_for(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.json"
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self.directory is not None:
+            try:
+                self._path_for(key).unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to remove parse cache file for {key}: {e}")
+
+    def _touch(self, key: str) -> None:
+        """ファイルの更新時刻を最終利用時刻として更新します (再起動後の LRU 順序の復元に使用)。"""
+        if self.directory is not None:
+            try:
+                os.utime(self._path_for(key))
+            except OSError:
+                pass
+
+    def _write(self, key: str, created_at: float, result: BaseModel) -> None:
+        if self.directory is None:
+            return
+        payload = {"created_at": created_at, "result": result.model_dump(mode="json")}
+        try:
+            # 書き込み途中のファイルを読まないよう、一時ファイルに書いてから置き換える
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path_for(key))
+        except OSError as e:
+            logger.warning(f"Failed to write parse cache file for {key}: {e}")
+
+    def _load_from_directory(self) -> None:
+        """保存済みのエントリを最終利用時刻の古い順に読み込みます。壊れた・期限切れのファイルは削除します。"""
+        assert self.directory is not None
+        paths = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in paths:
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+                created_at = float(payload["created_at"])
+                result = self.model_type.model_validate(payload["result"])
+            except (OSError, ValueError, KeyError, TypeError, ValidationError) as e:
+                logger.warning(f"Discarding unreadable parse cache file {path.name}: {e}")
+                path.unlink(missing_ok=True)
+                continue
+            if self._is_expired(created_at):
+                path.unlink(missing_ok=True)
+                continue
+            self._entries[path.stem] = (created_at, result)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+        logger.debug(f"Loaded {len(self._entries)} parse cache entr(ies) from {self.directory}.")
+
+
+def default_parse_cache_dir() -> Path:
+    """parse_cache_dir を指定しない場合の保存先 ($XDG_CACHE_HOME または ~/.cache の下) を返します。"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / _DEFAULT_CACHE_SUBDIR
+
+
+def _cache_directory(ai_settings: AiSettings) -> Optional[Path]:
+    if not ai_settings.parse_cache_persist:
+        return None
+    return Path(ai_settings.parse_cache_dir) if ai_settings.parse_cache_dir else default_parse_cache_dir()
+
+
+def _create_cache(directory: Optional[Path], ai_settings: AiSettings,
+                  model_type: Type[BaseModel]) -> ParseResultCache:
+    try:
+        return ParseResultCache(directory=directory,
+                                max_entries=ai_settings.parse_cache_max_entries,
+                                ttl=ai_settings.parse_cache_ttl,
+                                model_type=model_type)
+    except OSError as e:
+        # キャッシュディレクトリを作成できない環境 (読み取り専用のホームなど) でも解析は続ける
+        logger.warning(
+            f"Cannot use parse cache directory {directory}, falling back to in-memory cache: {e}")
+        return ParseResultCache(max_entries=ai_settings.parse_cache_max_entries,
+                                ttl=ai_settings.parse_cache_ttl,
+                                model_type=model_type)
+
+
+def create_parse_result_cache(ai_settings: AiSettings) -> Optional[ParseResultCache]:
+    """AI設定からキャッシュを作成します。無効化されている場合は None を返します。"""
+    if not ai_settings.parse_cache_enabled:
+        logger.info("AI parse result cache is disabled.")
+        return None
+    return _create_cache(_cache_directory(ai_settings), ai_settings, ParsedRequirementData)
+
+
+def create_inferred_rules_cache(ai_settings: AiSettings) -> Optional[ParseResultCache]:
+    """AI設定から推論ルール (AISuggestedRules) のキャッシュを作成します。無効化されている場合は None を返します。"""
+    if not ai_settings.rules_cache_enabled:
+        logger.info("Inferred rules cache is disabled.")
+        return None
+    directory = _cache_directory(ai_settings)
+    return _create_cache(directory / "rules" if directory is not None else None,
+                         ai_settings, AISuggestedRules)
@@ -0,0 +1,175 @@
+# webapp/core_logic/adapters/replay_llm.py
+# ネットワークに接続せずに記録済み・合成した解析結果を返すフェイクの LLM (AI_MODEL=replay)
+# 解析パイプライン (ParseIssueFileService・infer_rules・アップロードAPI) の負荷試験・プロファイリングに使用する
+
+import json
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import yaml
+from pydantic import Field, PrivateAttr
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from core_logic.domain.models import IssueData, ParsedRequirementData
+
+logger = logging.getLogger(__name__)
+
+# 合成時に Issue のタイトルとみなす行 (Markdown の見出し・**Title:**・YAML/JSON の title キー。プロンプトのコードブロック開始の ``` に続く場合を含む)
+_TITLE_LINE_PATTERN = re.compile(
+    r'^[\s`]*(?:#{1,3}\s+|\*\*Title:\*\*\s*|-?\s*title:\s*|"title"\s*:\s*)"?(?P<title>[^"\n]+?)"?,?\s*$',
+    re.IGNORECASE | re.MULTILINE)
+
+
+def estimate_text_tokens(text: str) -> int:
+    """トークン数を文字数/4 で概算します (最低1)。"""
+    return max(1, (len(text) + 3) // 4)
+
+
+def load_replay_responses(path: Union[str, Path]) -> List[ParsedRequirementData]:
+    """
+    記録済みの解析結果を JSON/YAML ファイルから読み込みます。
+    {"issues": [...]} (1件)、そのリスト (複数件。呼び出しごとに順番に返す)、
+    または Issue のリスト (要件ファイルと同じ形式。1件) を受け付けます。
+    """
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    data = json.loads(text) if path.suffix.lower() == ".json" else yaml.safe_load(text)
+    if isinstance(data, dict):
+        return [ParsedRequirementData.model_validate(data)]
+    if isinstance(data, list):
+        if data and all(isinstance(item, dict) and "issues" in item for item in data):
+            return [ParsedRequirementData.model_validate(item) for item in data]
+        return [ParsedRequirementData.model_validate({"issues": data})]
+    raise ValueError(
+        f"Replay responses file '{path}' must contain an object or a list, got {type(data).__name__}.")
+
+
+class ReplayChatModel(BaseChatModel):
+    """
+    記録済みまたは合成した ParsedRequirementData を返すフェイクの LLM。
+    responses を指定した場合は呼び出しごとに順番に (末尾の次は先頭に戻って) 返し、
+    指定しない場合は入力の見出し・タイトル行から Issue を合成します。
+    応答遅延とトークン数は設定でき、usage_metadata と stats() で確認できます。
+    """
+    responses: List[ParsedRequirementData] = Field(
+        default_factory=list, description="返す解析結果 (空の場合は入力から合成)")
+    synthetic_issues: Optional[int] = Field(
+        default=None, ge=0, description="合成する Issue 数 (未指定の場合は入力のタイトル行の数)")
+    latency: float = Field(default=0.0, ge=0, description="1回の呼び出しの応答遅延 (秒)")
+    seconds_per_output_token: float = Field(
+        default=0.0, ge=0, description="出力トークン1つあたりの生成時間 (秒)")
+    prompt_tokens: Optional[int] = Field(
+        default=None, ge=0, description="報告する入力トークン数 (未指定の場合は文字数から概算)")
+    completion_tokens: Optional[int] = Field(
+        default=None, ge=0, description="報告する出力トークン数 (未指定の場合は出力の文字数から概算)")
+    separator_pattern: str = Field(default="---", description="infer_rules に返す区切りルール")
+    key_mapping: Dict[str, str] = Field(
+        default_factory=lambda: {"title": "title", "description": "description"},
+        description="infer_rules に返すキーマッピングルール")
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _next_response: int = PrivateAttr(default=0)
+    _calls: int = PrivateAttr(default=0)
+    _prompt_tokens_total: int = PrivateAttr(default=0)
+    _completion_tokens_total: int = PrivateAttr(default=0)
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def stats(self) -> Dict[str, int]:
+        """呼び出し回数と、報告した入力・出力トークン数の合計を返します。"""
+        with self._lock:
+            return {"calls": self._calls, "prompt_tokens": self._prompt_tokens_total,
+                    "completion_tokens": self._completion_tokens_total}
+
+    def _record_usage(self, prompt_text: str, output_text: str) -> Dict[str, int]:
+        prompt_tokens = self.prompt_tokens if self.prompt_tokens is not None \
+            else estimate_text_tokens(prompt_text)
+        completion_tokens = self.completion_tokens if self.completion_tokens is not None \
+            else estimate_text_tokens(output_text)
+        with self._lock:
+            self._calls += 1
+            self._prompt_tokens_total += prompt_tokens
+            self._completion_tokens_total += completion_tokens
+        return {"input_tokens": prompt_tokens, "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens}
+
+    def _generation_seconds(self, completion_tokens: int) -> float:
+        return self.latency + self.seconds_per_output_token * completion_tokens
+
+    def _next_result(self, prompt_text: str) -> ParsedRequirementData:
+        """次に返す解析結果を、temp_id を振り直したコピーとして返します。"""
+        if self.responses:
+            with self._lock:
+                recorded = self.responses[self._next_response % len(self.responses)]
+                self._next_response += 1
+            return ParsedRequirementData(issues=[
+                IssueData(**issue.model_dump(exclude={"temp_id"})) for issue in recorded.issues])
+        titles = [match.group("title").strip() for match in _TITLE_LINE_PATTERN.finditer(prompt_text)]
+        count = self.synthetic_issues if self.synthetic_issues is not None else max(1, len(titles))
+        return ParsedRequirementData(issues=[
+            IssueData(title=titles[i] if i < len(titles) else f"Replay issue {i + 1}",
+                      description=f"Synthetic issue {i + 1} returned by the replay model.")
+            for i in range(count)])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        """infer_rules 用: 区切りルールとキーマッピングルールを含む JSON を返します。"""
+        prompt_text = "\n".join(str(message.content) for message in messages)
+        content = json.dumps({"separator_pattern": self.separator_pattern,
+                              "key_mapping": self.key_mapping}, ensure_ascii=False)
+        usage = self._record_usage(prompt_text, content)
+        time.sleep(self._generation_seconds(usage["output_tokens"]))
+        return ChatResult(generations=[ChatGeneration(
+            message=AIMessage(content=content, usage_metadata=usage))])
+
+    def with_structured_output(self, schema: Any, *, include_raw: bool = False, **kwargs: Any) -> Runnable:
+        if schema is not ParsedRequirementData or include_raw:
+            raise NotImplementedError(
+                "ReplayChatModel only supports structured output of ParsedRequirementData.")
+        return _ReplayStructuredOutput(self)
+
+
+class _ReplayStructuredOutput(Runnable[Any, ParsedRequirementData]):
+    """ReplayChatModel.with_structured_output が返す Runnable。stream では Issue を1件ずつ増やした部分出力を返す。"""
+
+    def __init__(self, model: ReplayChatModel):
+        self.model = model
+
+    @staticmethod
+    def _prompt_text(input: Any) -> str:
+        if isinstance(input, PromptValue):
+            return input.to_string()
+        if isinstance(input, list):
+            return "\n".join(str(getattr(message, "content", message)) for message in input)
+        return str(input)
+
+    def _respond(self, input: Any):
+        prompt_text = self._prompt_text(input)
+        result = self.model._next_result(prompt_text)
+        usage = self.model._record_usage(prompt_text, result.model_dump_json())
+        return result, usage["output_tokens"]
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> ParsedRequirementData:
+        result, completion_tokens = self._respond(input)
+        time.sleep(self.model._generation_seconds(completion_tokens))
+        return result
+
+    def stream(self, input: Any, config: Optional[RunnableConfig] = None,
+               **kwargs: Any) -> Iterator[ParsedRequirementData]:
+        result, completion_tokens = self._respond(input)
+        time.sleep(self.model.latency)
+        # 出力トークンの生成時間を Issue ごとに均等に割り振る
+        per_issue = self.model.seconds_per_output_token * completion_tokens / max(1, len(result.issues))
+        for i in range(1, len(result.issues) + 1):
+            time.sleep(per_issue)
+            yield ParsedRequirementData(issues=result.issues[:i])
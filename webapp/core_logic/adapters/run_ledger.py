@@ -0,0 +1,143 @@
+# webapp/core_logic/adapters/run_ledger.py
+# リソース作成の実行 (run) ごとに、作成済みのリソースを SQLite に記録する冪等性台帳
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from core_logic.domain.models import IssueData
+from core_logic.infrastructure.config import GitHubSettings
+
+logger = logging.getLogger(__name__)
+
+# 台帳に記録するリソースの種類
+KIND_REPOSITORY = "repository"
+KIND_LABEL = "label"
+KIND_MILESTONE = "milestone"
+KIND_PROJECT = "project"
+KIND_ISSUE = "issue"
+KIND_PROJECT_ITEM = "project_item"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger_entries (
+    run_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (run_id, kind, key)
+)
+"""
+
+
+def issue_fingerprint(issue: IssueData) -> str:
+    """
+    Issueの内容から安定したハッシュを算出します。
+    解析ごとに採番される temp_id は含めないため、同じファイルを再解析しても同じ値になります。
+    """
+    content = issue.model_dump(mode="json", exclude={"temp_id"})
+    serialized = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class RunLedger:
+    """
+    実行ID (run_id) ごとに、作成・確認済みのリソース (リポジトリ・ラベル・マイルストーン・プロジェクト・
+    Issue・プロジェクトアイテム) を記録する台帳。同じ run_id で再実行すると、記録済みの処理はAPIを呼ばずにスキップされます。
+    書き込みは記録ごとにコミットするため、処理の途中でプロセスが終了しても記録済みの分は失われません。
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:", clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path: SQLite データベースのパス。":memory:" の場合はプロセス内のみで保持します。
+            clock: 現在時刻 (UNIX秒) を返す関数。テスト用に差し替え可能。
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Issue作成はスレッドプールから記録されるため、1つの接続をロックで保護して共有する
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    def run(self, run_id: str) -> "LedgerRun":
+        """指定した実行IDの記録を読み書きするビューを返します。"""
+        if not run_id:
+            raise ValueError("run_id must not be empty.")
+        return LedgerRun(self, run_id)
+
+    def get(self, run_id: str, kind: str, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM ledger_entries WHERE run_id = ? AND kind = ? AND key = ?",
+                (run_id, kind, key)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def entries(self, run_id: str, kind: str) -> Dict[str, Any]:
+        """指定した種類の記録を key → 値 の辞書で返します。"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM ledger_entries WHERE run_id = ? AND kind = ?",
+                (run_id, kind)).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def record(self, run_id: str, kind: str, key: str, value: Any = True) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ledger_entries (run_id, kind, key, value, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                (run_id, kind, key, json.dumps(value, ensure_ascii=False), self._clock()))
+
+    def delete_run(self, run_id: str) -> int:
+        """実行IDの記録を全て削除し、削除件数を返します。"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM ledger_entries WHERE run_id = ?", (run_id,))
+        return cursor.rowcount
+
+    def prune(self, older_than: float) -> int:
+        """最後の記録から older_than 秒以上経過した実行の記録を削除し、削除件数を返します。"""
+        threshold = self._clock() - older_than
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM ledger_entries WHERE run_id IN ("
+                "SELECT run_id FROM ledger_entries GROUP BY run_id HAVING MAX(recorded_at) < ?)",
+                (threshold,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LedgerRun:
+    """RunLedger のうち1つの実行IDに対応する記録"""
+
+    def __init__(self, ledger: RunLedger, run_id: str):
+        self.ledger = ledger
+        self.run_id = run_id
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        return self.ledger.get(self.run_id, kind, key)
+
+    def entries(self, kind: str) -> Dict[str, Any]:
+        return self.ledger.entries(self.run_id, kind)
+
+    def record(self, kind: str, key: str, value: Any = True) -> None:
+        self.ledger.record(self.run_id, kind, key, value)
+
+
+def create_run_ledger(github_settings: GitHubSettings) -> Optional[RunLedger]:
+    """GitHub設定から台帳を作成します。保存先が指定されていない場合は None を返します。"""
+    if not github_settings.run_ledger_path:
+        return None
+    return RunLedger(github_settings.run_ledger_path)
@@ -1,5 +1,6 @@
-from .issue_file_parser_base import AbstractIssueFileParser, IntermediateParsingResult
+from .issue_file_parser_base import AbstractIssueFileParser, IntermediateParsingResult, RawIssueBlock, TextChunkStream
 from core_logic.domain.exceptions import ParsingError
+from typing import Iterable, Iterator
 import yaml
 import logging
 
@@ -37,3 +38,51 @@ class YamlIssueParser(AbstractIssueFileParser):
                     )
                     return []
         return []
+
+    def iter_blocks(self, chunks: Iterable[str]) -> Iterator[RawIssueBlock]:
+        """
+        PyYAML のイベントAPIでリストの要素を1件ずつ構築して返します (ファイル全体をオブジェクトとして保持しません)。
+        結果は parse と同じですが、文書の途中で構文エラーがあった場合はそれまでのブロックを返した後に ParsingError を送出します。
+        """
+        loader = yaml.SafeLoader(TextChunkStream(chunks))
+        try:
+            yield from self._iter_document_blocks(loader)
+        except yaml.YAMLError as e:
+            raise ParsingError(f"Invalid YAML format: {e}") from e
+        finally:
+            loader.dispose()
+
+    def _iter_document_blocks(self, loader: yaml.SafeLoader) -> Iterator[RawIssueBlock]:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStartEvent
+        if loader.check_event(yaml.SequenceStartEvent):
+            yield from self._iter_sequence(loader)
+        elif loader.check_event(yaml.MappingStartEvent):
+            loader.get_event()
+            while not loader.check_event(yaml.MappingEndEvent):
+                key = loader.construct_document(loader.compose_node(None, None))
+                if key == self.issues_key and loader.check_event(yaml.SequenceStartEvent):
+                    yield from self._iter_sequence(loader)
+                    continue
+                # issues_key 以外の値は構文の検証のためだけに読み飛ばす
+                value = loader.construct_document(loader.compose_node(None, None))
+                if key == self.issues_key:
+                    logger.warning(
+                        f"Key '{self.issues_key}' found in YAML but its value is not a list (type: {type(value).__name__}). Returning empty list."
+                    )
+            loader.get_event()
+        else:
+            loader.compose_node(None, None)
+        loader.get_event()  # DocumentEndEvent
+        if not loader.check_event(yaml.StreamEndEvent):
+            raise ParsingError(
+                "Invalid YAML format: expected a single document in the stream")
+
+    @staticmethod
+    def _iter_sequence(loader: yaml.SafeLoader) -> Iterator[RawIssueBlock]:
+        loader.get_event()  # SequenceStartEvent
+        while not loader.check_event(yaml.SequenceEndEvent):
+            yield loader.construct_document(loader.compose_node(None, None))
+        loader.get_event()
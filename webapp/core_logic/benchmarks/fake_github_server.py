@@ -0,0 +1,539 @@
+# webapp/core_logic/benchmarks/fake_github_server.py
+# ベンチマーク用に GitHub REST/GraphQL API の代わりをするローカル HTTP サーバー
+# (遅延・レート制限・障害をテストから設定可能)
+
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+_TIMESTAMP = "2024-01-01T00:00:00Z"
+
+
+class FakeGitHubConfig(BaseModel):
+    """フェイクサーバーの挙動 (遅延・レート制限・障害の注入) の設定"""
+    login: str = Field(default="bench-user", description="認証ユーザーのログイン名 (リポジトリのオーナー)")
+    latency: float = Field(default=0.0, ge=0.0, description="全リクエストに加える遅延 (秒)")
+    latency_jitter: float = Field(default=0.0, ge=0.0, description="遅延に加える 0〜指定秒のランダムな揺らぎ")
+    rate_limit: int = Field(default=5000, ge=1, description="リソース (core / graphql / search) ごとのウィンドウ内のリクエスト上限")
+    rate_limit_window: float = Field(default=3600.0, gt=0.0, description="レート制限のウィンドウ (秒)")
+    graphql_cost: int = Field(default=1, ge=0, description="GraphQLリクエスト1回あたりの rateLimit.cost")
+    failure_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="一時的なエラーを返すリクエストの割合")
+    failure_status: int = Field(default=502, description="注入する一時的なエラーのステータスコード")
+    projects: List[str] = Field(default_factory=lambda: ["Benchmark Board"], description="オーナーが持つ Project V2 のタイトル")
+    assignable_users: List[str] = Field(default_factory=list, description="認証ユーザー以外に割り当て可能なユーザー")
+    seed: int = Field(default=0, description="遅延の揺らぎと障害注入の乱数シード")
+
+
+class _RateLimitWindow:
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.used = 0
+
+
+class _FakeRepository:
+    def __init__(self, repo_id: int, owner: str, name: str):
+        self.id = repo_id
+        self.owner = owner
+        self.name = name
+        self.labels: Dict[str, Dict[str, Any]] = {}  # casefold したラベル名 → ラベル
+        self.milestones: List[Dict[str, Any]] = []
+        self.issues: List[Dict[str, Any]] = []
+
+
+class FakeGitHubState:
+    """フェイクサーバーが保持するリポジトリ・プロジェクト・リクエスト統計 (スレッドセーフ)"""
+
+    def __init__(self, config: FakeGitHubConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.random = random.Random(config.seed)
+        self._next_id = 1
+        self.repositories: Dict[Tuple[str, str], _FakeRepository] = {}
+        self.projects: Dict[str, str] = {
+            title: f"PVT_{i + 1}" for i, title in enumerate(config.projects)}
+        self.project_items: Dict[Tuple[str, str], str] = {}
+        self.windows: Dict[str, _RateLimitWindow] = {}
+        self.request_counts: Dict[str, int] = {}
+        self.rate_limited = 0
+        self.injected_failures = 0
+
+    def next_id(self) -> int:
+        value = self._next_id
+        self._next_id += 1
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {"requests": sum(self.request_counts.values()),
+                    "requests_by_route": dict(self.request_counts),
+                    "rate_limited": self.rate_limited,
+                    "injected_failures": self.injected_failures}
+
+    def reset_stats(self) -> None:
+        with self.lock:
+            self.request_counts.clear()
+            self.rate_limited = 0
+            self.injected_failures = 0
+
+
+class FakeGitHubServer:
+    """
+    CreateGitHubResourcesUseCase が githubkit 経由で呼び出す REST/GraphQL API をメモリ上で再現する HTTP サーバー。
+    レスポンスは githubkit のモデル検証を通る形式で返し、レート制限ヘッダー・GraphQL の rateLimit も返します。
+
+    Examples:
+        ```python
+        with FakeGitHubServer(FakeGitHubConfig(latency=0.01)) as server:
+            github = create_github_instance("token", base_url=server.url)
+        ```
+    """
+
+    def __init__(self, config: Optional[FakeGitHubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or FakeGitHubConfig()
+        self.state = FakeGitHubState(self.config)
+        self._httpd = ThreadingHTTPServer((host, port), _FakeGitHubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = self.state  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGitHubServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-github-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Fake GitHub server listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """受信したリクエスト数 (ルート別)・レート制限・注入した障害の件数を返します。"""
+        return self.state.stats()
+
+    def __enter__(self) -> "FakeGitHubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+# --- レスポンスの組み立て (githubkit のモデルの必須フィールドを満たす最小構成) ---
+
+def _user_payload(base: str, login: str, user_id: int) -> Dict[str, Any]:
+    url = f"{base}/users/{login}"
+    return {
+        "login": login, "id": user_id, "node_id": f"U_{user_id}",
+        "avatar_url": f"{base}/avatars/{login}", "gravatar_id": "", "url": url,
+        "html_url": f"{base}/{login}", "followers_url": f"{url}/followers",
+        "following_url": f"{url}/following{{/other_user}}", "gists_url": f"{url}/gists{{/gist_id}}",
+        "starred_url": f"{url}/starred{{/owner}}{{/repo}}", "subscriptions_url": f"{url}/subscriptions",
+        "organizations_url": f"{url}/orgs", "repos_url": f"{url}/repos", "events_url": f"{url}/events{{/privacy}}",
+        "received_events_url": f"{url}/received_events", "type": "User", "site_admin": False,
+    }
+
+
+def _private_user_payload(base: str, login: str) -> Dict[str, Any]:
+    return {
+        **_user_payload(base, login, 1), "name": login, "company": None, "blog": "", "location": None,
+        "email": None, "hireable": None, "bio": None, "public_repos": 0, "public_gists": 0,
+        "followers": 0, "following": 0, "created_at": _TIMESTAMP, "updated_at": _TIMESTAMP,
+        "private_gists": 0, "total_private_repos": 0, "owned_private_repos": 0, "disk_usage": 0,
+        "collaborators": 0, "two_factor_authentication": False,
+    }
+
+
+_REPOSITORY_URL_FIELDS = (
+    "archive", "assignees", "blobs", "branches", "collaborators", "comments", "commits", "compare",
+    "contents", "contributors", "deployments", "downloads", "events", "forks", "git_commits", "git_refs",
+    "git_tags", "issue_comment", "issue_events", "issues", "keys", "labels", "languages", "merges",
+    "milestones", "notifications", "pulls", "releases", "stargazers", "statuses", "subscribers",
+    "subscription", "tags", "teams", "trees", "hooks")
+
+
+def _repository_payload(base: str, repo: _FakeRepository) -> Dict[str, Any]:
+    url = f"{base}/repos/{repo.owner}/{repo.name}"
+    html_url = f"https://github.com/{repo.owner}/{repo.name}"
+    payload: Dict[str, Any] = {f"{field}_url": f"{url}/{field}" for field in _REPOSITORY_URL_FIELDS}
+    payload.update({
+        "id": repo.id, "node_id": f"R_{repo.id}", "name": repo.name, "full_name": f"{repo.owner}/{repo.name}",
+        "owner": _user_payload(base, repo.owner, 1), "private": True, "html_url": html_url,
+        "description": None, "fork": False, "url": url, "git_url": f"{html_url}.git",
+        "ssh_url": f"git@github.com:{repo.owner}/{repo.name}.git", "clone_url": f"{html_url}.git",
+        "mirror_url": None, "svn_url": html_url, "homepage": None, "language": None,
+        "forks_count": 0, "stargazers_count": 0, "watchers_count": 0, "size": 0, "default_branch": "main",
+        "open_issues_count": len(repo.issues), "has_issues": True, "has_projects": True, "has_wiki": False,
+        "has_pages": False, "has_discussions": False, "archived": False, "disabled": False,
+        "pushed_at": _TIMESTAMP, "created_at": _TIMESTAMP, "updated_at": _TIMESTAMP,
+        "subscribers_count": 0, "network_count": 0, "license": None, "forks": 0,
+        "open_issues": len(repo.issues), "watchers": 0,
+    })
+    return payload
+
+
+def _label_payload(base: str, repo: _FakeRepository, label_id: int, name: str, color: str,
+                   description: Optional[str]) -> Dict[str, Any]:
+    return {"id": label_id, "node_id": f"LA_{label_id}",
+            "url": f"{base}/repos/{repo.owner}/{repo.name}/labels/{name}", "name": name,
+            "description": description, "color": color, "default": False,
+            "archived_at": None, "archived_by": None}
+
+
+def _milestone_payload(base: str, repo: _FakeRepository, milestone_id: int, number: int, title: str) -> Dict[str, Any]:
+    url = f"{base}/repos/{repo.owner}/{repo.name}/milestones/{number}"
+    return {"url": url, "html_url": f"https://github.com/{repo.owner}/{repo.name}/milestone/{number}",
+            "labels_url": f"{url}/labels", "id": milestone_id, "node_id": f"MI_{milestone_id}",
+            "number": number, "title": title, "description": None, "state": "open",
+            "creator": _user_payload(base, repo.owner, 1), "open_issues": 0, "closed_issues": 0,
+            "created_at": _TIMESTAMP, "updated_at": _TIMESTAMP, "closed_at": None, "due_on": None}
+
+
+def _issue_payload(base: str, repo: _FakeRepository, issue_id: int, number: int, body: Dict[str, Any],
+                   labels: List[Dict[str, Any]], milestone: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    url = f"{base}/repos/{repo.owner}/{repo.name}/issues/{number}"
+    return {"id": issue_id, "node_id": f"I_{issue_id}", "url": url,
+            "repository_url": f"{base}/repos/{repo.owner}/{repo.name}", "labels_url": f"{url}/labels{{/name}}",
+            "comments_url": f"{url}/comments", "events_url": f"{url}/events",
+            "html_url": f"https://github.com/{repo.owner}/{repo.name}/issues/{number}", "number": number,
+            "state": "open", "title": body.get("title", ""), "body": body.get("body"),
+            "user": _user_payload(base, repo.owner, 1), "labels": labels,
+            "assignees": [_user_payload(base, login, 1) for login in body.get("assignees") or []],
+            "milestone": milestone, "locked": False, "comments": 0, "closed_at": None,
+            "created_at": _TIMESTAMP, "updated_at": _TIMESTAMP}
+
+
+class _FakeGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeGitHub/1.0"
+    # ヘッダーと本文を別々に書き込むため、Nagle アルゴリズムによる遅延 (約40ms) が計測に混ざらないようにする
+    disable_nagle_algorithm = True
+
+    _ROUTES = (
+        ("GET", re.compile(r"^/user$"), "_get_user"),
+        ("POST", re.compile(r"^/user/repos$"), "_create_repository"),
+        ("GET", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)$"), "_get_repository"),
+        ("GET", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/labels$"), "_list_labels"),
+        ("POST", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/labels$"), "_create_label"),
+        ("GET", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/labels/(?P<name>.+)$"), "_get_label"),
+        ("GET", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/milestones$"), "_list_milestones"),
+        ("POST", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/milestones$"), "_create_milestone"),
+        ("GET", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues$"), "_list_issues"),
+        ("POST", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues$"), "_create_issue"),
+        ("GET", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/assignees$"), "_list_assignees"),
+        ("GET", re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/collaborators/(?P<user>[^/]+)$"),
+         "_check_collaborator"),
+        ("GET", re.compile(r"^/search/issues$"), "_search_issues"),
+        ("POST", re.compile(r"^/graphql$"), "_graphql"),
+    )
+
+    @property
+    def state(self) -> FakeGitHubState:
+        return self.server.state  # type: ignore[attr-defined]
+
+    @property
+    def base(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    # --- Dispatch ---
+    def _dispatch(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/") or "/"
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        try:
+            self.body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            self._send(400, {"message": "Problems parsing JSON"})
+            return
+
+        handler_name, params = None, {}
+        for route_method, pattern, name in self._ROUTES:
+            match = pattern.match(path)
+            if route_method == method and match:
+                handler_name, params = name, {k: unquote(v) for k, v in match.groupdict().items()}
+                break
+        resource = "graphql" if path == "/graphql" else "search" if path.startswith("/search") else "core"
+
+        config = self.state.config
+        with self.state.lock:
+            route = f"{method} {handler_name.lstrip('_') if handler_name else path}"
+            self.state.request_counts[route] = self.state.request_counts.get(route, 0) + 1
+            delay = config.latency + (self.state.random.uniform(0, config.latency_jitter)
+                                      if config.latency_jitter else 0.0)
+            inject_failure = config.failure_rate > 0 and self.state.random.random() < config.failure_rate
+            rate_headers, limited = self._consume_rate_limit(resource)
+            if limited:
+                self.state.rate_limited += 1
+            elif inject_failure:
+                self.state.injected_failures += 1
+        if delay:
+            time.sleep(delay)
+
+        self.rate_headers = rate_headers
+        if limited:
+            self._send(403, {"message": "API rate limit exceeded for user.",
+                             "documentation_url": "https://docs.github.com/rest/rate-limit"})
+        elif inject_failure:
+            self._send(config.failure_status, {"message": "Injected failure"})
+        elif handler_name is None:
+            self._send(404, {"message": "Not Found"})
+        else:
+            getattr(self, handler_name)(**params)
+
+    def _consume_rate_limit(self, resource: str) -> Tuple[Dict[str, str], bool]:
+        """レート制限のウィンドウを消費し、(レスポンスヘッダー, 上限超過か) を返します (ロック保持中に呼ぶこと)。"""
+        config = self.state.config
+        now = time.time()
+        window = self.state.windows.get(resource)
+        if window is None or now >= window.started_at + config.rate_limit_window:
+            window = self.state.windows[resource] = _RateLimitWindow(now)
+        limited = window.used >= config.rate_limit
+        if not limited:
+            window.used += config.graphql_cost if resource == "graphql" else 1
+        self.reset_at = window.started_at + config.rate_limit_window
+        self.remaining = max(0, config.rate_limit - window.used)
+        return {"X-RateLimit-Limit": str(config.rate_limit),
+                "X-RateLimit-Remaining": str(self.remaining),
+                "X-RateLimit-Used": str(window.used),
+                "X-RateLimit-Reset": str(math.ceil(self.reset_at)),
+                "X-RateLimit-Resource": resource}, limited
+
+    def _send(self, status: int, payload: Any = None, headers: Optional[Dict[str, str]] = None) -> None:
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for key, value in {**getattr(self, "rate_headers", {}), **(headers or {})}.items():
+            self.send_header(key, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _repository(self, owner: str, repo: str) -> Optional[_FakeRepository]:
+        return self.state.repositories.get((owner, repo))
+
+    def _page(self, items: List[Any]) -> List[Any]:
+        per_page = int(self.query.get("per_page", 30))
+        page = int(self.query.get("page", 1))
+        return items[(page - 1) * per_page:page * per_page]
+
+    # --- REST ---
+    def _get_user(self) -> None:
+        self._send(200, _private_user_payload(self.base, self.state.config.login))
+
+    def _create_repository(self) -> None:
+        name = str(self.body.get("name") or "")
+        owner = self.state.config.login
+        with self.state.lock:
+            if not name or (owner, name) in self.state.repositories:
+                created = None
+            else:
+                created = self.state.repositories[(owner, name)] = _FakeRepository(
+                    self.state.next_id(), owner, name)
+        if created is None:
+            self._send(422, {"message": "Repository creation failed.",
+                             "errors": [{"resource": "Repository", "code": "custom", "field": "name",
+                                         "message": "name already exists on this account"}]})
+            return
+        self._send(201, _repository_payload(self.base, created))
+
+    def _get_repository(self, owner: str, repo: str) -> None:
+        repository = self._repository(owner, repo)
+        if repository is None:
+            self._send(404, {"message": "Not Found"})
+            return
+        self._send(200, _repository_payload(self.base, repository))
+
+    def _list_labels(self, owner: str, repo: str) -> None:
+        repository = self._repository(owner, repo)
+        if repository is None:
+            self._send(404, {"message": "Not Found"})
+            return
+        with self.state.lock:
+            labels = list(repository.labels.values())
+        self._send(200, self._page(labels))
+
+    def _get_label(self, owner: str, repo: str, name: str) -> None:
+        repository = self._repository(owner, repo)
+        label = repository.labels.get(name.casefold()) if repository else None
+        if label is None:
+            self._send(404, {"message": "Not Found"})
+            return
+        self._send(200, label)
+
+    def _create_label(self, owner: str, repo: str) -> None:
+        repository = self._repository(owner, repo)
+        if repository is None:
+            self._send(404, {"message": "Not Found"})
+            return
+        name = str(self.body.get("name") or "")
+        with self.state.lock:
+            if not name or name.casefold() in repository.labels:
+                label = None
+            else:
+                label = repository.labels[name.casefold()] = _label_payload(
+                    self.base, repository, self.state.next_id(), name,
+                    str(self.body.get("color") or "ededed"), self.body.get("description"))
+        if label is None:
+            self._send(422, {"message": "Validation Failed",
+                             "errors": [{"resource": "Label", "code": "already_exists", "field": "name"}]})
+            return
+        self._send(201, label)
+
+    def _list_milestones(self, owner: str, repo: str) -> None:
+        repository = self._repository(owner, repo)
+        if repository is None:
+            self._send(404, {"message": "Not Found"})
+            return
+        with self.state.lock:
+            milestones = list(repository.milestones)
+        self._send(200, self._page(milestones))
+
+    def _create_milestone(self, owner: str, repo: str) -> None:
+        repository = self._repository(owner, repo)
+        if repository is None:
+            self._send(404, {"message": "Not Found"})
+            return
+        title = str(self.body.get("title") or "")
+        with self.state.lock:
+            if not title or any(m["title"] == title for m in repository.milestones):
+                milestone = None
+            else:
+                milestone = _milestone_payload(self.base, repository, self.state.next_id(),
+                                               len(repository.milestones) + 1, title)
+                repository.milestones.append(milestone)
+        if milestone is None:
+            self._send(422, {"message": "Validation Failed",
+                             "errors": [{"resource": "Milestone", "code": "already_exists", "field": "title"}]})
+            return
+        self._send(201, milestone)
+
+    def _list_issues(self, owner: str, repo: str) -> None:
+        repository = self._repository(owner, repo)
+        if repository is None:
+            self._send(404, {"message": "Not Found"})
+            return
+        with self.state.lock:
+            issues = list(repository.issues)
+        self._send(200, self._page(issues))
+
+    def _create_issue(self, owner: str, repo: str) -> None:
+        repository = self._repository(owner, repo)
+        if repository is None or not self.body.get("title"):
+            self._send(404 if repository is None else 422, {"message": "Validation Failed"})
+            return
+        with self.state.lock:
+            labels = [repository.labels.get(str(name).casefold()) or _label_payload(
+                self.base, repository, self.state.next_id(), str(name), "ededed", None)
+                for name in self.body.get("labels") or []]
+            milestone = next((m for m in repository.milestones
+                              if m["number"] == self.body.get("milestone")), None)
+            issue = _issue_payload(self.base, repository, self.state.next_id(), len(repository.issues) + 1,
+                                   self.body, labels, milestone)
+            repository.issues.append(issue)
+        self._send(201, issue)
+
+    def _list_assignees(self, owner: str, repo: str) -> None:
+        logins = [self.state.config.login] + self.state.config.assignable_users
+        self._send(200, self._page([_user_payload(self.base, login, i + 1) for i, login in enumerate(logins)]))
+
+    def _check_collaborator(self, owner: str, repo: str, user: str) -> None:
+        if user in [self.state.config.login] + self.state.config.assignable_users:
+            self._send(204)
+        else:
+            self._send(404, {"message": "Not Found"})
+
+    def _search_issues(self) -> None:
+        self._send(200, {"total_count": 0, "incomplete_results": False, "items": [], "search_type": "lexical"})
+
+    # --- GraphQL ---
+    def _graphql(self) -> None:
+        query = str(self.body.get("query") or "")
+        variables = self.body.get("variables") or {}
+        if "RepositorySnapshot" in query:
+            data = self._graphql_repository_snapshot(variables)
+        elif "GetProjectsList" in query:
+            data = self._graphql_projects(variables)
+        elif "addProjectV2ItemById" in query:
+            data = self._graphql_add_items(query, variables)
+        else:
+            self._send(200, {"data": None, "errors": [{"type": "NOT_SUPPORTED",
+                                                      "message": "Operation not supported by the fake server."}]})
+            return
+        data["rateLimit"] = {"cost": self.state.config.graphql_cost, "remaining": self.remaining,
+                             "resetAt": datetime.fromtimestamp(self.reset_at, tz=timezone.utc).isoformat()}
+        self._send(200, {"data": data})
+
+    @staticmethod
+    def _connection(nodes: List[Dict[str, Any]], cursor: Optional[str], first: int = 100) -> Dict[str, Any]:
+        start = int(cursor or 0)
+        end = start + first
+        return {"nodes": nodes[start:end],
+                "pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end)}}
+
+    def _graphql_repository_snapshot(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        repository = self._repository(str(variables.get("owner")), str(variables.get("name")))
+        if repository is None:
+            return {"repository": None}
+        config = self.state.config
+        with self.state.lock:
+            connections = {
+                "labels": [{"name": label["name"]} for label in repository.labels.values()],
+                "milestones": [{"title": m["title"], "number": m["number"]} for m in repository.milestones],
+                "assignableUsers": [{"login": login} for login in [config.login] + config.assignable_users],
+                "issues": [{"title": issue["title"]} for issue in repository.issues],
+            }
+        result: Dict[str, Any] = {"id": f"R_{repository.id}",
+                                  "url": f"https://github.com/{repository.owner}/{repository.name}"}
+        for key, nodes in connections.items():
+            if variables.get(f"with{key[0].upper()}{key[1:]}", True):
+                result[key] = self._connection(nodes, variables.get(f"{key}Cursor"))
+        return {"repository": result}
+
+    def _graphql_projects(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        nodes = [{"id": node_id, "title": title} for title, node_id in self.state.projects.items()]
+        return {"repositoryOwner": {"projectsV2": self._connection(
+            nodes, variables.get("after"), int(variables.get("first") or 100))}}
+
+    def _graphql_add_items(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        project_id = str(variables.get("projectId"))
+        aliases = re.findall(r"(\w+):\s*addProjectV2ItemById\(input:\s*\{projectId: \$projectId, contentId: \$(\w+)\}",
+                             query) or [("addProjectV2ItemById", "contentId")]
+        data: Dict[str, Any] = {}
+        with self.state.lock:
+            for alias, variable in aliases:
+                key = (project_id, str(variables.get(variable)))
+                if key not in self.state.project_items:
+                    self.state.project_items[key] = f"PVTI_{self.state.next_id()}"
+                data[alias] = {"item": {"id": self.state.project_items[key]}}
+        return data
@@ -0,0 +1,255 @@
+# webapp/core_logic/benchmarks/run_benchmark.py
+# フェイク GitHub サーバーに対して CreateGitHubResourcesUseCase を繰り返し実行し、スループットを計測するベンチマーク
+#
+# 使い方 (webapp ディレクトリで実行):
+#   python -m core_logic.benchmarks.run_benchmark run --runs 5 --issues 100 --labels 10 --milestones 3 --output result.json
+#   python -m core_logic.benchmarks.run_benchmark run --latency 0.05 --failure-rate 0.02 --baseline result.json
+#   python -m core_logic.benchmarks.run_benchmark generate requirements.yml --issues 500
+
+import logging
+import math
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+from typing_extensions import Annotated
+from pydantic import BaseModel, Field
+
+from core_logic.adapters.assignee_validator import AssigneeValidator
+from core_logic.adapters.github_client_registry import KeepAliveTransport
+from core_logic.adapters.github_graphql_client import GitHubGraphQLClient
+from core_logic.adapters.github_metrics import GitHubApiMetrics, OperationSummary
+from core_logic.adapters.github_request_scheduler import GitHubRequestScheduler, create_github_instance
+from core_logic.adapters.github_rest_client import GitHubRestClient
+from core_logic.adapters.github_utils import RetryPolicy
+from core_logic.benchmarks.fake_github_server import FakeGitHubConfig, FakeGitHubServer
+from core_logic.benchmarks.synthetic_requirements import generate_requirements, write_requirements_file
+from core_logic.domain.exceptions import GitHubClientError
+from core_logic.use_cases.create_github_resources import CreateGitHubResourcesUseCase
+from core_logic.use_cases.create_issues import CreateIssuesUseCase
+from core_logic.use_cases.create_repository import CreateRepositoryUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class BenchmarkConfig(BaseModel):
+    """ベンチマークの条件"""
+    runs: int = Field(default=5, ge=1, description="ワークフローの実行回数 (実行ごとに新しいリポジトリを作成)")
+    issues: int = Field(default=50, ge=0, description="1回の実行で作成する Issue 数 (N)")
+    labels: int = Field(default=10, ge=0, description="ラベルの種類数 (L)")
+    milestones: int = Field(default=3, ge=0, description="マイルストーンの種類数 (M)")
+    assignees: int = Field(default=1, ge=0, description="Issue に割り当てる担当者の候補数")
+    with_project: bool = Field(default=True, description="作成した Issue をプロジェクトに追加するか")
+    max_workers: int = Field(default=1, ge=1, description="ラベル・Issue 作成の並行数")
+    retry_max_attempts: int = Field(default=3, ge=1, description="一時的なエラーに対する最大試行回数")
+    retry_base_delay: float = Field(default=0.01, ge=0, description="リトライの基準待機秒数")
+    rate_limit_reserve: int = Field(default=0, ge=0, description="スケジューラがペース配分を始める残量")
+    seed: int = Field(default=0, description="要件データ生成の乱数シード")
+    server: FakeGitHubConfig = Field(default_factory=FakeGitHubConfig, description="フェイクサーバーの設定")
+
+
+class BenchmarkResult(BaseModel):
+    """ベンチマークの結果。JSON で保存し、別のコミットでの結果と比較できます。"""
+    config: BenchmarkConfig
+    runs: int = Field(description="完了した実行回数")
+    failed_runs: int = Field(default=0, description="致命的なエラーで中断した実行回数")
+    failed_issues: int = Field(default=0, description="作成に失敗した Issue の合計数")
+    total_seconds: float = Field(description="全実行の合計所要時間 (秒)")
+    runs_per_second: float = Field(description="1秒あたりの実行回数")
+    issues_per_second: float = Field(description="1秒あたりの Issue 作成数")
+    p50_run_seconds: float = Field(description="1回の実行の所要時間の中央値 (秒)")
+    p95_run_seconds: float = Field(description="1回の実行の所要時間の95パーセンタイル (秒)")
+    max_run_seconds: float = Field(description="1回の実行の最大所要時間 (秒)")
+    api_calls_per_run: float = Field(description="1回の実行あたりのクライアントのAPI呼び出し回数 (リトライを含む)")
+    http_requests_per_run: float = Field(description="1回の実行あたりにサーバーが受信したリクエスト数")
+    retries: int = Field(default=0, description="リトライで追加された試行回数の合計")
+    rate_limited_responses: int = Field(default=0, description="サーバーがレート制限で拒否したリクエスト数")
+    injected_failures: int = Field(default=0, description="サーバーが注入した一時的なエラーの数")
+    scheduler_wait_seconds: float = Field(default=0.0, description="レート制限のペース配分で待機した合計秒数")
+    step_seconds: Dict[str, float] = Field(default_factory=dict, description="ステップごとの平均所要時間 (秒)")
+    requests_by_route: Dict[str, int] = Field(default_factory=dict, description="サーバーが受信したルートごとのリクエスト数")
+    operations: List[OperationSummary] = Field(default_factory=list, description="API操作ごとのレイテンシ")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """最近傍順位法による分位点 (values が空の場合は 0.0)。"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_benchmark(config: BenchmarkConfig) -> BenchmarkResult:
+    """フェイクサーバーを起動し、合成した要件データで CreateGitHubResourcesUseCase を config.runs 回実行します。"""
+    assignee_logins = [f"bench-member-{i + 1}" for i in range(config.assignees)]
+    server_config = config.server.model_copy(update={
+        "assignable_users": sorted(set(config.server.assignable_users) | set(assignee_logins))})
+    parsed_data = generate_requirements(
+        config.issues, config.labels, config.milestones, assignee_logins, seed=config.seed)
+    project_name = server_config.projects[0] if config.with_project and server_config.projects else None
+
+    with FakeGitHubServer(server_config) as server:
+        scheduler = GitHubRequestScheduler(reserve=config.rate_limit_reserve)
+        transport = KeepAliveTransport()
+        github = create_github_instance(
+            "benchmark-token", scheduler, auto_retry=False, transport=transport, base_url=server.url)
+        metrics = GitHubApiMetrics()
+        retry_policy = RetryPolicy(max_attempts=config.retry_max_attempts,
+                                   base_delay=config.retry_base_delay, max_delay=1.0, jitter=0.0)
+        rest_client = GitHubRestClient(github, retry_policy=retry_policy, metrics=metrics)
+        graphql_client = GitHubGraphQLClient(
+            github, scheduler=scheduler, retry_policy=retry_policy, metrics=metrics)
+        use_case = CreateGitHubResourcesUseCase(
+            rest_client=rest_client,
+            graphql_client=graphql_client,
+            create_repo_uc=CreateRepositoryUseCase(github_client=rest_client),
+            create_issues_uc=CreateIssuesUseCase(
+                rest_client=rest_client, assignee_validator=AssigneeValidator(rest_client=rest_client),
+                max_workers=config.max_workers),
+            max_workers=config.max_workers)
+
+        durations: List[float] = []
+        step_totals: Dict[str, float] = {}
+        failed_runs = 0
+        failed_issues = 0
+        started = time.perf_counter()
+        try:
+            for i in range(config.runs):
+                run_started = time.perf_counter()
+                try:
+                    result = use_case.execute(
+                        parsed_data, f"{server_config.login}/bench-{i + 1:04d}", project_name=project_name)
+                except GitHubClientError as e:
+                    logger.error(f"Benchmark run {i + 1} failed: {e}")
+                    failed_runs += 1
+                    continue
+                durations.append(time.perf_counter() - run_started)
+                if result.issue_result:
+                    failed_issues += len(result.issue_result.failed_issue_titles)
+                for timing in result.step_timings:
+                    step_totals[timing.step] = step_totals.get(
+                        timing.step, 0.0) + timing.duration_seconds
+        finally:
+            total_seconds = time.perf_counter() - started
+            transport.shutdown()
+        server_stats = server.stats()
+
+    completed = len(durations)
+    runs_total = completed + failed_runs
+    operations = metrics.summary()
+    return BenchmarkResult(
+        config=config,
+        runs=completed,
+        failed_runs=failed_runs,
+        failed_issues=failed_issues,
+        total_seconds=total_seconds,
+        runs_per_second=completed / total_seconds if total_seconds > 0 else 0.0,
+        issues_per_second=completed * config.issues / total_seconds if total_seconds > 0 else 0.0,
+        p50_run_seconds=percentile(durations, 0.5),
+        p95_run_seconds=percentile(durations, 0.95),
+        max_run_seconds=max(durations, default=0.0),
+        api_calls_per_run=(rest_client.call_counter.value + graphql_client.call_counter.value) / runs_total,
+        http_requests_per_run=server_stats["requests"] / runs_total,
+        retries=sum(row.retries for row in operations),
+        rate_limited_responses=server_stats["rate_limited"],
+        injected_failures=server_stats["injected_failures"],
+        scheduler_wait_seconds=scheduler.total_wait_seconds,
+        step_seconds={step: total / completed for step, total in step_totals.items()} if completed else {},
+        requests_by_route=server_stats["requests_by_route"],
+        operations=operations)
+
+
+def format_result(result: BenchmarkResult, baseline: Optional[BenchmarkResult] = None) -> List[str]:
+    """結果を表示用の行に整形します。baseline を渡した場合は主要な指標の変化率を併記します。"""
+    def delta(name: str, higher_is_better: bool) -> str:
+        if baseline is None:
+            return ""
+        before, after = getattr(baseline, name), getattr(result, name)
+        if not before:
+            return "  (baseline: n/a)"
+        change = (after - before) / before * 100
+        better = change >= 0 if higher_is_better else change <= 0
+        return f"  ({change:+.1f}% vs baseline, {'better' if better else 'worse'})"
+
+    config = result.config
+    lines = [
+        f"Benchmark: {config.runs} run(s) x {config.issues} issue(s), {config.labels} label(s), "
+        f"{config.milestones} milestone(s), workers={config.max_workers}, latency={config.server.latency}s, "
+        f"failure_rate={config.server.failure_rate}",
+        f"  runs/sec        : {result.runs_per_second:.3f}{delta('runs_per_second', True)}",
+        f"  issues/sec      : {result.issues_per_second:.1f}{delta('issues_per_second', True)}",
+        f"  run p50 / p95   : {result.p50_run_seconds:.3f}s / {result.p95_run_seconds:.3f}s"
+        f"{delta('p95_run_seconds', False)}",
+        f"  API calls/run   : {result.api_calls_per_run:.1f}{delta('api_calls_per_run', False)}",
+        f"  HTTP reqs/run   : {result.http_requests_per_run:.1f}",
+        f"  failed runs     : {result.failed_runs}, failed issues: {result.failed_issues}, retries: {result.retries}, "
+        f"rate limited: {result.rate_limited_responses}, injected failures: {result.injected_failures}, "
+        f"scheduler wait: {result.scheduler_wait_seconds:.2f}s",
+    ]
+    if result.step_seconds:
+        lines.append("  steps (mean)    : " + ", ".join(
+            f"{step} {seconds:.3f}s" for step, seconds in result.step_seconds.items()))
+    lines.append(f"  {'operation':<36} {'calls':>6} {'p50(s)':>8} {'p95(s)':>8} {'retries':>7}")
+    for row in result.operations:
+        lines.append(f"  {row.api + '.' + row.operation:<36} {row.calls:>6} {row.p50_seconds:>8.3f} "
+                     f"{row.p95_seconds:>8.3f} {row.retries:>7}")
+    return lines
+
+
+app = typer.Typer(help="Offline benchmark of the GitHub resource creation workflow against a fake GitHub server.")
+
+
+@app.command("run")
+def run_command(
+    runs: Annotated[int, typer.Option(help="Number of workflow runs.")] = 5,
+    issues: Annotated[int, typer.Option(help="Issues per run (N).")] = 50,
+    labels: Annotated[int, typer.Option(help="Distinct labels (L).")] = 10,
+    milestones: Annotated[int, typer.Option(help="Distinct milestones (M).")] = 3,
+    max_workers: Annotated[int, typer.Option(help="Concurrent label/issue creation workers.")] = 1,
+    with_project: Annotated[bool, typer.Option(help="Add created issues to a project.")] = True,
+    latency: Annotated[float, typer.Option(help="Server latency per request (seconds).")] = 0.0,
+    latency_jitter: Annotated[float, typer.Option(help="Random extra latency up to this many seconds.")] = 0.0,
+    rate_limit: Annotated[int, typer.Option(help="Requests per rate limit window and resource.")] = 5000,
+    rate_limit_window: Annotated[float, typer.Option(help="Rate limit window (seconds).")] = 3600.0,
+    failure_rate: Annotated[float, typer.Option(help="Fraction of requests answered with a transient error.")] = 0.0,
+    seed: Annotated[int, typer.Option(help="Random seed for data generation and failure injection.")] = 0,
+    output: Annotated[Optional[Path], typer.Option(help="Save the result as JSON.")] = None,
+    baseline: Annotated[Optional[Path], typer.Option(help="Compare with a previously saved JSON result.")] = None,
+    log_level: Annotated[str, typer.Option(help="Log level during the benchmark.")] = "WARNING",
+):
+    """Run the benchmark and print runs/sec, latency percentiles and API call counts."""
+    logging.basicConfig(level=log_level.upper(),
+                        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    config = BenchmarkConfig(
+        runs=runs, issues=issues, labels=labels, milestones=milestones, max_workers=max_workers,
+        with_project=with_project, seed=seed,
+        server=FakeGitHubConfig(latency=latency, latency_jitter=latency_jitter, rate_limit=rate_limit,
+                                rate_limit_window=rate_limit_window, failure_rate=failure_rate, seed=seed))
+    result = run_benchmark(config)
+    baseline_result = BenchmarkResult.model_validate_json(
+        baseline.read_text(encoding="utf-8")) if baseline else None
+    for line in format_result(result, baseline_result):
+        typer.echo(line)
+    if output:
+        output.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+        typer.echo(f"Result saved to: {output}")
+
+
+@app.command("generate")
+def generate_command(
+    path: Annotated[Path, typer.Argument(help="Output file (.yml, .yaml or .json).")],
+    issues: Annotated[int, typer.Option(help="Number of issues (N).")] = 50,
+    labels: Annotated[int, typer.Option(help="Distinct labels (L).")] = 10,
+    milestones: Annotated[int, typer.Option(help="Distinct milestones (M).")] = 3,
+    seed: Annotated[int, typer.Option(help="Random seed.")] = 0,
+):
+    """Write a synthetic requirements file."""
+    written = write_requirements_file(
+        generate_requirements(issues, labels, milestones, seed=seed), path)
+    typer.echo(f"Wrote {issues} issue(s) to {written}")
+
+
+if __name__ == "__main__":
+    app()
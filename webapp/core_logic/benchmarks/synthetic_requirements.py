@@ -0,0 +1,62 @@
+# webapp/core_logic/benchmarks/synthetic_requirements.py
+# ベンチマーク用に、指定した件数の Issue・ラベル・マイルストーンを含む要件データを生成する
+
+import json
+import random
+from pathlib import Path
+from typing import Sequence, Union
+
+import yaml
+
+from core_logic.domain.models import IssueData, ParsedRequirementData
+
+
+def generate_requirements(issues: int, labels: int = 0, milestones: int = 0,
+                          assignees: Sequence[str] = (), max_labels_per_issue: int = 3,
+                          seed: int = 0) -> ParsedRequirementData:
+    """
+    N件のIssueを生成します。ラベルは L 種類から1〜max_labels_per_issue 個をランダムに、
+    マイルストーンは M 種類を順番に割り当てるため、L 件・M 件全てが使われます (Issue 数が足りる場合)。
+    同じ引数とシードからは同じデータが生成されます。
+    """
+    if issues < 0 or labels < 0 or milestones < 0:
+        raise ValueError("issues, labels and milestones must not be negative.")
+    rng = random.Random(seed)
+    label_names = [f"label-{i + 1:03d}" for i in range(labels)]
+    milestone_names = [f"Milestone {i + 1:03d}" for i in range(milestones)]
+    generated = []
+    for i in range(issues):
+        issue_labels = None
+        if label_names:
+            # 先頭のラベルは順番に割り当て、全ラベルが少なくとも1回使われるようにする
+            count = rng.randint(1, max(1, min(max_labels_per_issue, len(label_names))))
+            issue_labels = sorted({label_names[i % len(label_names)],
+                                   *rng.sample(label_names, count - 1)})
+        generated.append(IssueData(
+            title=f"Synthetic issue {i + 1:05d}",
+            description=f"Benchmark issue {i + 1} generated with seed {seed}.",
+            tasks=[f"Task {j + 1}" for j in range(rng.randint(0, 3))],
+            acceptance=["Works as described"],
+            labels=issue_labels,
+            milestone=milestone_names[i % len(milestone_names)] if milestone_names else None,
+            assignees=[f"@{rng.choice(list(assignees))}"] if assignees else None,
+        ))
+    return ParsedRequirementData(issues=generated)
+
+
+def write_requirements_file(data: ParsedRequirementData, path: Union[str, Path]) -> Path:
+    """要件データを拡張子に応じて YAML (.yml/.yaml) または JSON (.json) で保存します。"""
+    path = Path(path)
+    issues = [issue.model_dump(exclude={"temp_id"}, exclude_none=True, by_alias=False)
+              for issue in data.issues]
+    suffix = path.suffix.lower()
+    if suffix in (".yml", ".yaml"):
+        content = yaml.safe_dump(issues, allow_unicode=True, sort_keys=False)
+    elif suffix == ".json":
+        content = json.dumps(issues, ensure_ascii=False, indent=2)
+    else:
+        raise ValueError(
+            f"Unsupported file extension '{path.suffix}'. Use .yml, .yaml or .json.")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
@@ -22,8 +22,13 @@ class GitHubAuthenticationError(GitHubClientError):
 
 
 class GitHubRateLimitError(GitHubClientError):
-    """APIレート制限超過エラー"""
-    pass
+    """APIレート制限超過エラー (プライマリ・セカンダリ)"""
+
+    def __init__(self, message: str, status_code: int | None = None, original_exception: Exception | None = None, retry_after: float | None = None):
+        super().__init__(message, status_code=status_code,
+                         original_exception=original_exception)
+        # GitHubが指示した再試行までの待機秒数 (Retry-After・X-RateLimit-Reset。不明な場合は None)
+        self.retry_after = retry_after
 
 
 class GitHubResourceNotFoundError(GitHubClientError):
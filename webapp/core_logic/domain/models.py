@@ -57,6 +57,47 @@ class ParsedRequirementData(BaseModel):
     # milestone_to_create: Optional[str] = Field(default=None, description="ファイル全体で定義された共通マイルストーン等")
 
 
+class ChunkParseFailure(BaseModel):
+    """分割解析で失敗したチャンクの情報"""
+    chunk_index: int = Field(description="失敗したチャンクの番号 (0始まり)")
+    first_block: int = Field(description="チャンクに含まれる最初のブロック番号 (0始まり)")
+    last_block: int = Field(description="チャンクに含まれる最後のブロック番号 (0始まり)")
+    error: str = Field(description="エラーメッセージ")
+
+
+class ParseReport(BaseModel):
+    """ファイル解析の結果と、分割解析時のチャンクごとの失敗情報"""
+    data: ParsedRequirementData = Field(description="正常に解析できたIssueデータ (チャンク順に結合)")
+    chunk_count: int = Field(default=1, description="AI解析を呼び出したチャンク数")
+    rule_based_count: int = Field(
+        default=0, description="AIを使わずにルールベースでマッピングしたブロック数")
+    failed_chunks: list[ChunkParseFailure] = Field(
+        default_factory=list, description="解析に失敗したチャンクのリスト")
+
+
+class RepositorySnapshot(BaseModel):
+    """
+    GraphQL API で一括取得したリポジトリの現在状態のスナップショット。
+    ラベル・マイルストーン・担当者・既存Issueの確認を、項目ごとのAPI呼び出しなしで行うために使用する。
+    """
+    owner: str = Field(description="リポジトリのオーナー名")
+    name: str = Field(description="リポジトリ名")
+    repository_id: str | None = Field(
+        default=None, description="リポジトリのNode ID")
+    repository_url: str | None = Field(
+        default=None, description="リポジトリのURL")
+    label_names: list[str] = Field(
+        default_factory=list, description="既存ラベル名のリスト")
+    milestones: dict[str, int] = Field(
+        default_factory=dict, description="既存マイルストーン (open/closed) のタイトル→番号のマップ")
+    assignable_users: list[str] = Field(
+        default_factory=list, description="Issueに割り当て可能なユーザーのログイン名リスト")
+    open_issue_titles: list[str] = Field(
+        default_factory=list, description="Open状態の既存Issueタイトルのリスト")
+    is_complete: bool = Field(
+        default=True, description="全ページを取得できたかどうか (False の場合は一部が欠けている可能性がある)")
+
+
 class CreateIssuesResult(BaseModel):
     """
     CreateIssuesUseCase の実行結果を格納するデータクラス。
@@ -84,6 +125,81 @@ class CreateIssuesResult(BaseModel):
     )
 
 
+class PlannedIssue(BaseModel):
+    """実行計画における Issue 1件の扱い"""
+    title: str = Field(description="Issueのタイトル")
+    temp_id: str | None = Field(default=None, description="解析結果のIssueの一時ID")
+    action: str = Field(
+        description="create (作成する) / skip (既存または同一ファイル内で重複するため作成しない) / invalid (タイトルがないため作成できない)")
+    reason: str | None = Field(
+        default=None, description="skip / invalid の理由 (exists, duplicate_in_file, empty_title)")
+    invalid_assignees: list[str] = Field(
+        default_factory=list, description="割り当て可能ユーザーに含まれないため除外される担当者")
+
+
+class ApiCostEstimate(BaseModel):
+    """実行計画の適用に必要なAPI呼び出し数とレート制限の見積もり"""
+    rest_requests: int = Field(default=0, description="REST API の呼び出し数")
+    graphql_requests: int = Field(default=0, description="GraphQL API の呼び出し数")
+    content_creations: int = Field(
+        default=0, description="リソースを作成するリクエスト数 (GitHubのコンテンツ作成の二次レート制限の対象)")
+    rest_remaining: int | None = Field(
+        default=None, description="計画作成時点の REST API の残り回数 (不明な場合は None)")
+    graphql_remaining: int | None = Field(
+        default=None, description="計画作成時点の GraphQL API の残りポイント (不明な場合は None)")
+    fits_rate_limit: bool | None = Field(
+        default=None, description="現在の残量の範囲で適用できるか (残量が不明な場合は None)")
+
+
+class ResourcePlan(BaseModel):
+    """
+    読み取り専用のAPIで取得したリポジトリの現在状態と解析結果の差分から作成した、GitHubリソース作成の実行計画。
+    CreateGitHubResourcesUseCase.execute(plan=...) に渡すと、状態を再取得せずにこの計画どおりに適用する。
+    """
+    owner: str = Field(description="リポジトリのオーナー名")
+    repo: str = Field(description="リポジトリ名")
+    repository_exists: bool = Field(description="計画作成時点でリポジトリが存在したか")
+    repository_url: str | None = Field(
+        default=None, description="既存リポジトリのURL")
+    labels_to_create: list[str] = Field(
+        default_factory=list, description="作成するラベル名のリスト")
+    existing_labels: list[str] = Field(
+        default_factory=list, description="既に存在するため作成しないラベル名のリスト")
+    milestones_to_create: list[str] = Field(
+        default_factory=list, description="作成するマイルストーン名のリスト")
+    existing_milestones: dict[str, int] = Field(
+        default_factory=dict, description="既に存在するマイルストーンの名前→番号のマップ (ファイルで使用されているもののみ)")
+    issues: list[PlannedIssue] = Field(
+        default_factory=list, description="解析結果のIssueごとの扱い (ファイル内の順序)")
+    project_name: str | None = Field(default=None, description="対象プロジェクト名")
+    project_node_id: str | None = Field(
+        default=None, description="対象プロジェクトのNode ID (見つからない場合は None)")
+    estimated_cost: ApiCostEstimate = Field(
+        default_factory=ApiCostEstimate, description="適用に必要なAPI呼び出し数の見積もり")
+    snapshot: RepositorySnapshot | None = Field(
+        default=None, description="計画の作成に使用したリポジトリの状態 (適用時に再取得せずに使用する)")
+
+    @property
+    def issues_to_create(self) -> list[PlannedIssue]:
+        return [issue for issue in self.issues if issue.action == "create"]
+
+    @property
+    def issues_to_skip(self) -> list[PlannedIssue]:
+        return [issue for issue in self.issues if issue.action != "create"]
+
+
+class StepTiming(BaseModel):
+    """CreateGitHubResourcesUseCase の1ステップの所要時間・API呼び出し回数・処理件数"""
+    step: str = Field(
+        description="ステップ名 (repository / labels / milestones / project / issues / project_items)")
+    duration_seconds: float = Field(description="所要時間 (秒)")
+    api_calls: int = Field(
+        default=0, description="ステップ中に実行したGitHub API呼び出し回数 (リトライを含む)")
+    items: int = Field(default=0, description="ステップで処理した項目数")
+    items_per_second: float | None = Field(
+        default=None, description="1秒あたりの処理件数 (項目がない、または所要時間が0の場合は None)")
+
+
 class CreateGitHubResourcesResult(BaseModel):
     """
     CreateGitHubResourcesUseCase の全体的な実行結果を格納するデータクラス。
@@ -120,6 +236,10 @@ class CreateGitHubResourcesResult(BaseModel):
     project_items_failed: list[tuple[str, str]] = Field(
         default_factory=list, description="プロジェクトへの追加に失敗したIssue Node IDとそのエラーメッセージのタプルのリスト")
 
+    # 一時的なエラーによるリトライの発生状況
+    retried_operations: dict[str, int] = Field(
+        default_factory=dict, description="リトライが発生した操作名 (例: 'rest.create_label') と追加試行回数の辞書")
+
     # 全体的な致命的エラー
     fatal_error: str | None = Field(
         default=None, description="処理を中断させた致命的なエラーメッセージ")
@@ -127,6 +247,14 @@ class CreateGitHubResourcesResult(BaseModel):
     # dry_runフラグを追加
     dry_run: bool = Field(default=False, description="ドライランかどうか")
 
+    # ドライランで作成した (または適用した) 実行計画
+    plan: ResourcePlan | None = Field(
+        default=None, description="ドライランで作成した、または適用した実行計画")
+
+    # ステップごとの所要時間 (実行順)
+    step_timings: list[StepTiming] = Field(
+        default_factory=list, description="ステップごとの所要時間・API呼び出し回数・処理件数")
+
 
 class AISuggestedRules(BaseModel):
     """
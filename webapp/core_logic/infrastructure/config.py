@@ -1,7 +1,8 @@
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from pydantic import Field, SecretStr, BaseModel, ValidationError
@@ -12,6 +13,21 @@ logger = logging.getLogger(__name__)
 # --- 新しいネストされたモデル ---
 
 
+class ReplayModelSettings(BaseModel):
+    """AI_MODEL=replay (ネットワークに接続しないフェイクの LLM) の設定"""
+    responses_path: Optional[str] = Field(
+        None, description="記録済みの解析結果 (ParsedRequirementData の JSON/YAML、またはそのリスト) のファイル。未指定の場合は入力のタイトル行から Issue を合成")
+    synthetic_issues: Optional[int] = Field(
+        None, ge=0, description="合成する Issue 数 (未指定の場合は入力のタイトル行の数)")
+    latency: float = Field(0.0, ge=0, description="1回の呼び出しの応答遅延 (秒)")
+    seconds_per_output_token: float = Field(
+        0.0, ge=0, description="出力トークン1つあたりの生成時間 (秒)")
+    prompt_tokens: Optional[int] = Field(
+        None, ge=0, description="報告する入力トークン数 (未指定の場合は文字数から概算)")
+    completion_tokens: Optional[int] = Field(
+        None, ge=0, description="報告する出力トークン数 (未指定の場合は出力の文字数から概算)")
+
+
 class AiSettings(BaseModel):
     """AI関連の設定"""
     # ai_model は環境変数優先のためここでは定義しない
@@ -31,6 +47,58 @@ class AiSettings(BaseModel):
         default="",
         description="キーマッピングルール推論用プロンプトテンプレート"
     )
+    parse_cache_enabled: bool = Field(
+        True, description="同じ入力に対するAI解析結果をキャッシュして再利用するか")
+    parse_cache_dir: Optional[str] = Field(
+        None, description="AI解析結果キャッシュの保存先ディレクトリ (未指定の場合はユーザーのキャッシュディレクトリ)")
+    parse_cache_persist: bool = Field(
+        True, description="AI解析結果キャッシュをディレクトリに保存し、CLIの実行・再起動をまたいで再利用するか (false の場合はプロセス内のメモリのみ)")
+    parse_cache_max_entries: int = Field(
+        256, ge=1, description="AI解析結果キャッシュの最大エントリ数 (超えた場合は最も古く使われたものから削除)")
+    parse_cache_ttl: float = Field(
+        7 * 24 * 3600, ge=0, description="AI解析結果キャッシュの有効期間 (秒)")
+    rules_cache_enabled: bool = Field(
+        True, description="同じ形 (見出し構造・キー名) の文書に対する区切り・キーマッピングルールの推論結果を再利用するか")
+    parse_chunk_token_budget: Optional[int] = Field(
+        None, ge=1, description="1回のAI解析に渡す入力の推定トークン数の上限 (未指定の場合はファイル全体を1回で解析)")
+    parse_max_parallel_chunks: int = Field(
+        4, ge=1, description="分割解析時に同時に解析するチャンク数の上限")
+    structured_fast_path: bool = Field(
+        True, description="YAML/JSON のキーが Issue のフィールドと一致するブロックをAIを使わずにマッピングするか")
+    structured_key_mapping: Dict[str, str] = Field(
+        default_factory=dict, description="YAML/JSON のルールベースマッピングで使うキーの対応表 (Issueのフィールド名 → ファイルのキー名)")
+    replay: ReplayModelSettings = Field(
+        default_factory=ReplayModelSettings, description="AI_MODEL=replay の場合のフェイクの LLM の設定")
+
+
+class GitHubSettings(BaseModel):
+    """GitHub API関連の設定"""
+    max_workers: int = Field(
+        1, ge=1, description="Issue・ラベル作成の最大並行数 (1 の場合は逐次処理)")
+    rate_limit_reserve: int = Field(
+        50, ge=0, description="レート制限の残量がこの値以下になったらリクエスト間隔を調整する")
+    retry_max_attempts: int = Field(
+        3, ge=1, description="一時的なエラー (タイムアウト・5xx・429) 時の最大試行回数 (1 の場合はリトライしない)")
+    retry_base_delay: float = Field(
+        1.0, ge=0, description="リトライ間隔の基準秒数 (試行ごとに2倍)")
+    retry_max_delay: float = Field(
+        30.0, ge=0, description="リトライ間隔の上限秒数")
+    retry_jitter: float = Field(
+        0.5, ge=0, le=1, description="リトライ間隔に加える揺らぎの割合")
+    retry_max_retry_after: float = Field(
+        60.0, ge=0, description="レート制限の解除 (Retry-After) までこの秒数より長く待つ必要がある場合はリトライしない")
+    assignee_cache_ttl: float = Field(
+        600.0, ge=0, description="担当者検証に使う割り当て可能ユーザー一覧のキャッシュ有効期間 (秒)")
+    client_registry_max_size: int = Field(
+        8, ge=1, description="Webアプリでリクエストをまたいで再利用するGitHubクライアント (トークン) の最大数")
+    client_idle_timeout: float = Field(
+        900.0, gt=0, description="この秒数使われなかったGitHubクライアントと接続プールを破棄する")
+    job_workers: int = Field(
+        2, ge=0, description="Webアプリでリソース作成ジョブを同時に実行する数 (0 の場合はリクエスト内で実行)")
+    job_stale_after: float = Field(
+        120.0, gt=0, description="ハートビートがこの秒数以上途絶えた実行中ジョブを中断されたものとみなして再実行する")
+    run_ledger_path: Optional[str] = Field(
+        None, description="作成済みリソースを実行IDごとに記録するSQLiteファイルのパス (未指定の場合は記録しない)")
 
 
 class LoggingSettings(BaseModel):
@@ -74,6 +142,7 @@ class Settings(BaseSettings):
     # --- YAMLファイルから読み込む項目 (ネストモデル) ---
     # デフォルト値を提供して、必須エラーを回避
     ai: AiSettings = Field(default_factory=AiSettings)
+    github: GitHubSettings = Field(default_factory=GitHubSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
 
     # --- 最終的な設定値を取得するプロパティ ---
@@ -205,6 +274,10 @@ def load_settings(config_file: Path = Path("config.yaml")) -> Settings:
         if 'ai' in yaml_config_data:
             init_data['ai'] = yaml_config_data['ai']
 
+        # YAML から GitHub 設定を読み込む
+        if 'github' in yaml_config_data:
+            init_data['github'] = yaml_config_data['github']
+
         # YAML からロギング設定を読み込む
         if 'logging' in yaml_config_data:
             init_data['logging'] = yaml_config_data['logging']
@@ -250,3 +323,42 @@ def load_settings(config_file: Path = Path("config.yaml")) -> Settings:
         # YAML読み込みエラーは内部でWarning/Errorログを出しているので、ここでは予期せぬエラーのみ捕捉
         logger.error(f"Unexpected error loading settings: {e}", exc_info=True)
         raise
+
+
+# --- 設定のキャッシュ ---
+# config_file の絶対パス → (設定ファイルと環境変数のフィンガープリント, Settings)
+_settings_cache: Dict[Path, Tuple[Tuple[Any, ...], Settings]] = {}
+_settings_cache_lock = threading.Lock()
+
+
+def _settings_fingerprint(config_file: Path) -> Tuple[Any, ...]:
+    """設定ファイルの更新時刻・サイズと環境変数から、設定の再読み込みが必要かを判定する値を算出します。"""
+    try:
+        stat = config_file.stat()
+        file_state: Tuple[Any, ...] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_state = (None, None)
+    return file_state + (hash(frozenset(os.environ.items())),)
+
+
+def get_settings(config_file: Path = Path("config.yaml")) -> Settings:
+    """
+    load_settings の結果をプロセス内でキャッシュして返します。
+    設定ファイルが更新された場合や環境変数が変わった場合は再読み込みします。
+    リクエストごとに設定を参照するWebアプリ向けで、YAMLの読み込みと検証を毎回行わずに済みます。
+    """
+    key = config_file.resolve()
+    fingerprint = _settings_fingerprint(config_file)
+    with _settings_cache_lock:
+        cached = _settings_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+    settings = load_settings(config_file)
+    with _settings_cache_lock:
+        _settings_cache[key] = (fingerprint, settings)
+    return settings
+
+
+def clear_settings_cache() -> None:
+    with _settings_cache_lock:
+        _settings_cache.clear()
@@ -11,22 +11,25 @@ except importlib.metadata.PackageNotFoundError:
 import sys
 import logging
 
-# githubkit から GitHub クラスをインポート
-from githubkit import GitHub
 
 # --- Project Imports ---
 # Infrastructure / Adapters
 from core_logic.infrastructure.config import load_settings, Settings
 from core_logic.infrastructure.file_reader import read_markdown_file
 from core_logic.adapters.ai_parser import AIParser
+from core_logic.adapters.parse_result_cache import create_parse_result_cache, create_inferred_rules_cache
 from core_logic.adapters.github_rest_client import GitHubRestClient
 from core_logic.adapters.cli_reporter import CliReporter
 from core_logic.adapters.github_graphql_client import GitHubGraphQLClient
+from core_logic.adapters.github_request_scheduler import GitHubRequestScheduler, create_github_instance
+from core_logic.adapters.github_client_registry import KeepAliveTransport, create_retry_policy
 from core_logic.adapters.assignee_validator import AssigneeValidator
+from core_logic.adapters.run_ledger import create_run_ledger
+from core_logic.adapters.github_metrics import github_api_metrics
 from core_logic.use_cases.create_github_resources import CreateGitHubResourcesUseCase
 from core_logic.use_cases.create_repository import CreateRepositoryUseCase
 from core_logic.use_cases.create_issues import CreateIssuesUseCase
-from core_logic.domain.models import CreateGitHubResourcesResult, ParsedRequirementData
+from core_logic.domain.models import CreateGitHubResourcesResult, ParsedRequirementData, ResourcePlan
 from core_logic.domain.exceptions import (
     AiParserError, GitHubClientError, GitHubAuthenticationError, GitHubValidationError
 )
@@ -85,6 +88,12 @@ def run(
         "--project", help="Name of the GitHub project (V2) to add issues to.")] = None,
     dry_run: Annotated[bool, typer.Option(
         "--dry-run", help="Simulate the process without making actual changes on GitHub.")] = False,
+    save_plan: Annotated[Optional[Path], typer.Option(
+        "--save-plan", help="With --dry-run, save the computed plan as JSON to this path.", dir_okay=False, resolve_path=True)] = None,
+    apply_plan: Annotated[Optional[Path], typer.Option(
+        "--apply-plan", help="Apply a plan saved with --save-plan without re-querying the repository state.", exists=True, file_okay=True, dir_okay=False, readable=True, resolve_path=True)] = None,
+    run_id: Annotated[Optional[str], typer.Option(
+        "--run-id", help="Record created resources under this ID (requires github.run_ledger_path). Re-running with the same ID resumes an interrupted run.")] = None,
     version: Annotated[Optional[bool], typer.Option(
         "--version", help="Show the application version and exit.", callback=version_callback, is_eager=True)] = None,
 ):
@@ -122,7 +131,15 @@ def run(
         logger.debug("Initializing core components...")
         # 2.1 githubkitのベースインスタンス作成
         try:
-            github_instance = GitHub(settings.github_pat.get_secret_value())
+            # REST/GraphQL の全リクエストをレート制限対応スケジューラ経由で送信する
+            request_scheduler = GitHubRequestScheduler(
+                reserve=settings.github.rate_limit_reserve)
+            retry_policy = create_retry_policy(settings.github)
+            # リトライはクライアント側の RetryPolicy で行うため、githubkit 組み込みのリトライは無効化する
+            # 実行中の全リクエストで接続プールを共有し、リクエストごとのTLSハンドシェイクを避ける
+            github_instance = create_github_instance(
+                settings.github_pat.get_secret_value(), request_scheduler, auto_retry=False,
+                transport=KeepAliveTransport())
         except Exception as e:
             logger.error(
                 f"Failed to initialize GitHub instance: {e}", exc_info=True)
@@ -130,10 +147,16 @@ def run(
                 f"Failed to initialize GitHub client: {e}", original_exception=e) from e
 
         # 個別のクライアントをインスタンス化
-        rest_client = GitHubRestClient(github_instance=github_instance)
-        graphql_client = GitHubGraphQLClient(github_instance=github_instance)
-        assignee_validator = AssigneeValidator(rest_client=rest_client)
-        ai_parser = AIParser(settings=settings)
+        rest_client = GitHubRestClient(
+            github_instance=github_instance, retry_policy=retry_policy)
+        graphql_client = GitHubGraphQLClient(
+            github_instance=github_instance, scheduler=request_scheduler,
+            retry_policy=retry_policy)
+        assignee_validator = AssigneeValidator(
+            rest_client=rest_client, cache_ttl=settings.github.assignee_cache_ttl)
+        ai_parser = AIParser(
+            settings=settings, cache=create_parse_result_cache(settings.ai),
+            rules_cache=create_inferred_rules_cache(settings.ai))
 
         # --- PAT認証チェックを追加 ---
         try:
@@ -148,13 +171,20 @@ def run(
             github_client=rest_client)  # 修正: rest_client を渡す
         create_issues_uc = CreateIssuesUseCase(
             rest_client=rest_client,  # 修正: rest_client を渡す
-            assignee_validator=assignee_validator  # AssigneeValidator を渡す
+            assignee_validator=assignee_validator,  # AssigneeValidator を渡す
+            max_workers=settings.github.max_workers
         )
+        run_ledger = create_run_ledger(settings.github) if run_id else None
+        if run_id and run_ledger is None:
+            logger.warning(
+                "--run-id was given but github.run_ledger_path is not configured. Progress will not be recorded.")
         main_use_case = CreateGitHubResourcesUseCase(
             rest_client=rest_client,       # 修正
             graphql_client=graphql_client,  # 追加
             create_repo_uc=create_repo_uc,
-            create_issues_uc=create_issues_uc
+            create_issues_uc=create_issues_uc,
+            max_workers=settings.github.max_workers,
+            ledger=run_ledger
         )
         logger.debug("Core components initialized.")
 
@@ -204,14 +234,31 @@ def run(
             f"Project Name    : {project_name if project_name else 'None'}")
         logger.info(f"Dry Run Mode    : {dry_run}")
         logger.info("------------------------------------")
+        plan: Optional[ResourcePlan] = None
+        if apply_plan:
+            logger.info(f"Applying plan   : {apply_plan}")
+            plan = ResourcePlan.model_validate_json(
+                apply_plan.read_text(encoding="utf-8"))
         result: CreateGitHubResourcesResult = main_use_case.execute(
             parsed_data=parsed_data,
             repo_name_input=repo_name_input,
             project_name=project_name,
-            dry_run=dry_run
+            dry_run=dry_run,
+            plan=plan,
+            run_id=run_id
         )
 
         reporter.display_create_github_resources_result(result)
+        reporter.display_api_metrics_summary(
+            github_api_metrics.summary(), github_api_metrics.rate_limit_remaining())
+        if save_plan:
+            if result.plan is None:
+                logger.warning(
+                    "No plan was computed (use --dry-run). Nothing was saved.")
+            else:
+                save_plan.write_text(
+                    result.plan.model_dump_json(indent=2), encoding="utf-8")
+                logger.info(f"Plan saved to: {save_plan}")
         logger.info("Workflow execution completed.")
 
     except ValidationError as e:
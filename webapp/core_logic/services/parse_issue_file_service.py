@@ -1,26 +1,95 @@
 """
 ParseIssueFileService: ファイル名・内容からAIパースを行う共通サービス
 """
+import logging
 import os
-from core_logic.domain.models import ParsedRequirementData
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from core_logic.domain.models import ParsedRequirementData, IssueData, ChunkParseFailure, ParseReport
 from core_logic.domain.exceptions import ParsingError, AiParserError
+from core_logic.adapters.issue_file_parser_base import decode_utf8_chunks, iter_byte_chunks
 from core_logic.adapters.markdown_issue_parser import MarkdownIssueParser
 from core_logic.adapters.yaml_issue_parser import YamlIssueParser
 from core_logic.adapters.json_issue_parser import JsonIssueParser
 from core_logic.adapters.ai_parser import AIParser
+from core_logic.services.rule_based_mapper import RuleBasedMapperService
 import json
 import yaml
 
+logger = logging.getLogger(__name__)
+
+MARKDOWN_BLOCK_SEPARATOR = '\n---\n'
+STRUCTURED_EXTENSIONS = ('.yml', '.yaml', '.json')
+
+# ファイル内容: bytes またはバイト列のチャンクのイテラブル
+FileContent = Union[bytes, Iterable[bytes]]
+
+# IssueData のリスト型フィールドに文字列が指定された場合の分割方法
+LIST_FIELD_CONVERTERS = {
+    "tasks": "to_list_by_newline",
+    "relational_definition": "to_list_by_newline",
+    "relational_issues": "to_list_by_newline",
+    "acceptance": "to_list_by_newline",
+    "labels": "to_list_by_comma",
+    "assignees": "to_list_by_comma",
+}
+# ルールベースでマッピングする IssueData のフィールド (temp_id は自動生成)
+MAPPABLE_FIELDS = [
+    field for field in IssueData.model_fields if field != "temp_id"]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    テキストのトークン数を概算します。
+    ASCII文字は約4文字で1トークン、それ以外 (日本語など) は1文字1トークンとして多めに見積もります。
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
 
 class ParseIssueFileService:
-    def __init__(self, ai_parser: AIParser):
+    def __init__(self, ai_parser: AIParser, chunk_token_budget: Optional[int] = None,
+                 max_parallel_chunks: int = 1, rule_based_fast_path: bool = True,
+                 key_mapping: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            ai_parser: Issue情報の抽出に使用する AIParser。
+            chunk_token_budget: 1回のAI解析に渡す入力の推定トークン数の上限。
+                指定した場合、ブロックをこの上限に収まるチャンクにまとめて個別に解析します。
+                None の場合はファイル全体を1回で解析します。
+            max_parallel_chunks: 同時に解析するチャンク数の上限。
+            rule_based_fast_path: YAML/JSON のブロックのキーが IssueData のフィールド (または key_mapping) と
+                一致する場合に、AIを使わずにルールベースでマッピングするか。
+            key_mapping: IssueData のフィールド名 → 入力ファイルのキー名 の対応表 (例: {"title": "件名"})。
+        """
+        if chunk_token_budget is not None and chunk_token_budget < 1:
+            raise ValueError("chunk_token_budget must be at least 1.")
+        if max_parallel_chunks < 1:
+            raise ValueError("max_parallel_chunks must be at least 1.")
         self.ai_parser = ai_parser
+        self.chunk_token_budget = chunk_token_budget
+        self.max_parallel_chunks = max_parallel_chunks
+        self.rule_based_fast_path = rule_based_fast_path
+        self.key_mapping = dict(key_mapping or {})
+        default_mapping: Dict[str, Any] = {
+            field: field for field in MAPPABLE_FIELDS}
+        default_mapping.update(
+            {f"{field}__convert": rule for field, rule in LIST_FIELD_CONVERTERS.items()})
+        self.mapper = RuleBasedMapperService(default_mapping)
+        # ルールベースで解釈できるキー (これ以外のキーを含むブロックはAIで解析する)
+        self._known_keys = {field for field in MAPPABLE_FIELDS} | {
+            "body"} | set(self.key_mapping.values())
         self.markdown_parser = MarkdownIssueParser()
         self.yaml_parser = YamlIssueParser()
         self.json_parser = JsonIssueParser()
 
-    def parse(self, file_name: str, file_content_bytes: bytes) -> ParsedRequirementData:
-        file_content = file_content_bytes.decode('utf-8')
+    def _open_blocks(self, file_name: str, file_content: FileContent) -> Tuple[str, Iterator[Any]]:
+        """
+        拡張子に応じたパーサーを選び、(拡張子, Issueブロックのイテレータ) を返します。
+        ファイル内容はチャンクごとにUTF-8デコードし、ブロックは読み込みながら分割するため、
+        ファイル全体の文字列・オブジェクトを保持しません。
+        """
         ext = os.path.splitext(file_name)[1].lower()
         if ext in ['.md', '.markdown']:
             initial_parser = self.markdown_parser
@@ -30,23 +99,227 @@ class ParseIssueFileService:
             initial_parser = self.json_parser
         else:
             raise ParsingError(f"Unsupported file extension: {ext}")
-        raw_issue_blocks = initial_parser.parse(file_content)
-        if not raw_issue_blocks:
-            return ParsedRequirementData(issues=[])
+        return ext, initial_parser.iter_blocks(decode_utf8_chunks(iter_byte_chunks(file_content)))
+
+    @staticmethod
+    def _blocks_to_text(ext: str, blocks: List[Any]) -> str:
+        """ブロックのリストをAI解析に渡すテキストに変換します。"""
         if ext in ['.md', '.markdown']:
-            combined_content = '\n---\n'.join(raw_issue_blocks)
-            parsed_data: ParsedRequirementData = self.ai_parser.parse(
-                combined_content)
-        else:
-            # YAML/JSONはlist[dict]→文字列化してAIパース
-            if ext in ['.yml', '.yaml']:
-                content_to_parse = yaml.dump(
-                    raw_issue_blocks, default_flow_style=False, sort_keys=False)
-            elif ext == '.json':
-                content_to_parse = json.dumps(
-                    raw_issue_blocks, indent=2, ensure_ascii=False)
+            return MARKDOWN_BLOCK_SEPARATOR.join(blocks)
+        # YAML/JSONはlist[dict]→文字列化してAIパース
+        if ext in ['.yml', '.yaml']:
+            return yaml.dump(blocks, default_flow_style=False, sort_keys=False)
+        if ext == '.json':
+            return json.dumps(blocks, indent=2, ensure_ascii=False)
+        return str(blocks)
+
+    def _iter_chunk_texts(self, ext: str, blocks: Iterable[Any],
+                          block_offset: int) -> Iterator[Tuple[int, int, str]]:
+        """
+        ブロックを順序を保ったまま推定トークン数が chunk_token_budget 以下になるようにまとめ、
+        チャンクが確定するたびに (先頭ブロック番号, 末尾ブロック番号, AIに渡すテキスト) を返します。
+        1ブロックだけで上限を超える場合は、そのブロック単独のチャンクとします。
+        """
+        assert self.chunk_token_budget is not None
+        chunk: List[Any] = []
+        current_tokens = 0
+        for index, block in enumerate(blocks, start=block_offset):
+            block_tokens = estimate_tokens(self._blocks_to_text(ext, [block]))
+            if chunk and current_tokens + block_tokens > self.chunk_token_budget:
+                yield index - len(chunk), index - 1, self._blocks_to_text(ext, chunk)
+                chunk, current_tokens = [], 0
+            chunk.append(block)
+            current_tokens += block_tokens
+        if chunk:
+            yield index - len(chunk) + 1, index, self._blocks_to_text(ext, chunk)
+
+    def _iter_chunks(self, ext: str, blocks: Iterable[Any], block_offset: int,
+                     report: ParseReport) -> Iterator[IssueData]:
+        """
+        ブロックをチャンクに分けて並行に解析し、結果をチャンク順に返します。
+        ブロックは必要な分だけ読み込み、同時に保持するチャンクは max_parallel_chunks 件までです。
+        失敗したチャンクは report.failed_chunks に記録します (block_offset はファイル内でのブロック番号の補正値)。
+        """
+        logger.info(
+            f"Parsing blocks in chunks (token budget: {self.chunk_token_budget}, parallel: {self.max_parallel_chunks}).")
+
+        def parse_chunk(text: str) -> Tuple[Optional[ParsedRequirementData], Optional[Exception]]:
+            try:
+                return self.ai_parser.parse(text), None
+            except Exception as e:  # チャンク単位の失敗として記録する
+                return None, e
+
+        def handle(first: int, last: int, outcome: Tuple[Optional[ParsedRequirementData], Optional[Exception]]) -> Iterator[IssueData]:
+            result, error = outcome
+            chunk_index = report.chunk_count
+            report.chunk_count += 1
+            if error is not None:
+                self._record_failure(report, chunk_index, first, last, error)
+                return
+            yield from result.issues
+
+        chunks = self._iter_chunk_texts(ext, blocks, block_offset)
+        if self.max_parallel_chunks == 1:
+            for first, last, text in chunks:
+                yield from handle(first, last, parse_chunk(text))
+            return
+        with ThreadPoolExecutor(max_workers=self.max_parallel_chunks, thread_name_prefix="ai-parse-chunk") as executor:
+            pending: Deque[Tuple[int, int, Future]] = deque()
+            for first, last, text in chunks:
+                pending.append((first, last, executor.submit(parse_chunk, text)))
+                # 同時実行数に達したら、最も古いチャンクの完了を待って (チャンク順を保って) 返す
+                if len(pending) >= self.max_parallel_chunks:
+                    first, last, future = pending.popleft()
+                    yield from handle(first, last, future.result())
+            while pending:
+                first, last, future = pending.popleft()
+                yield from handle(first, last, future.result())
+
+    @staticmethod
+    def _record_failure(report: ParseReport, chunk_index: int, first_block: int,
+                        last_block: int, error: Exception) -> None:
+        logger.warning(
+            f"Chunk {chunk_index + 1} (blocks {first_block + 1}-{last_block + 1}) failed to parse: {type(error).__name__} - {error}")
+        report.failed_chunks.append(ChunkParseFailure(
+            chunk_index=chunk_index, first_block=first_block, last_block=last_block, error=str(error)))
+
+    def _iter_ai_run(self, ext: str, blocks: Iterable[Any], block_offset: int, report: ParseReport,
+                     stream: bool, raise_errors: bool = False) -> Iterator[IssueData]:
+        """
+        連続するブロックをAIで解析します。chunk_token_budget が指定されている場合はチャンクに分けて解析します。
+        stream=True の場合は AIParser.parse_stream で完成したIssueから順に返します。
+        raise_errors=False の場合、失敗は report.failed_chunks に記録して処理を続けます。
+        """
+        if self.chunk_token_budget is not None:
+            yield from self._iter_chunks(ext, blocks, block_offset, report)
+            return
+        # ファイル全体 (またはルールベースで扱えないブロックの並び) を1回で解析するため、ここでは全ブロックを保持する
+        blocks = list(blocks)
+        if not blocks:
+            return
+        chunk_index = report.chunk_count
+        report.chunk_count += 1
+        text = self._blocks_to_text(ext, blocks)
+        try:
+            if stream:
+                yield from self.ai_parser.parse_stream(text)
             else:
-                content_to_parse = str(raw_issue_blocks)
-            parsed_data: ParsedRequirementData = self.ai_parser.parse(
-                content_to_parse)
-        return parsed_data
+                yield from self.ai_parser.parse(text).issues
+        except Exception as e:
+            if raise_errors:
+                raise
+            self._record_failure(report, chunk_index, block_offset,
+                                 block_offset + len(blocks) - 1, e)
+
+    def _try_map_block(self, block: Any) -> Optional[IssueData]:
+        """
+        ブロックのキーがすべて既知 (IssueData のフィールドまたは key_mapping) の場合に、
+        ルールベースで IssueData に変換します。変換できない場合は None を返します。
+        """
+        if not isinstance(block, dict) or not block or not set(block) <= self._known_keys:
+            return None
+        key_mapping_rule = dict(self.key_mapping)
+        if "description" not in key_mapping_rule and "description" not in block and "body" in block:
+            key_mapping_rule["description"] = "body"
+        try:
+            return self.mapper.map_block_to_issue_data(
+                block, key_mapping_rule, warn_missing_fields=False)
+        except ValueError as e:  # pydantic.ValidationError を含む
+            logger.debug(
+                f"Block could not be mapped without AI, falling back: {e}")
+            return None
+
+    def _iter_segments(self, ext: str, blocks: Iterable[Any], report: ParseReport) -> Iterator[Union[IssueData, Tuple[int, List[Any]]]]:
+        """
+        YAML/JSON のブロックを読み込みながらルールベースでマッピングし、
+        マッピング済みの IssueData と、AIで解析する連続ブロック (開始ブロック番号, ブロックのリスト) を順に返します。
+        チャンク解析時は、連続ブロックが並行解析できる分 (chunk_token_budget × max_parallel_chunks) に達した時点で区切ります。
+        """
+        run_limit = None if self.chunk_token_budget is None else \
+            self.chunk_token_budget * self.max_parallel_chunks
+        run: List[Any] = []
+        run_start, run_tokens = 0, 0
+        for index, block in enumerate(blocks):
+            issue = self._try_map_block(block)
+            if issue is None:
+                if not run:
+                    run_start, run_tokens = index, 0
+                run.append(block)
+                if run_limit is not None:
+                    run_tokens += estimate_tokens(
+                        self._blocks_to_text(ext, [block]))
+                    if run_tokens >= run_limit:
+                        yield run_start, run
+                        run = []
+                continue
+            if run:
+                yield run_start, run
+                run = []
+            report.rule_based_count += 1
+            yield issue
+        if run:
+            yield run_start, run
+
+    def _iter_parse(self, file_name: str, file_content: FileContent, report: ParseReport,
+                    stream: bool) -> Iterator[IssueData]:
+        """
+        ファイルを解析し、Issueをファイル内の順序で返します。チャンク数・失敗情報は report に記録します。
+        すべてのAI解析が失敗し結果が1件もない場合は AiParserError を送出します。
+        """
+        ext, raw_issue_blocks = self._open_blocks(file_name, file_content)
+        if self.rule_based_fast_path and ext in STRUCTURED_EXTENSIONS:
+            block_count = 0
+            for segment in self._iter_segments(ext, raw_issue_blocks, report):
+                if isinstance(segment, IssueData):
+                    block_count += 1
+                    yield segment
+                    continue
+                start, run_blocks = segment
+                block_count += len(run_blocks)
+                yield from self._iter_ai_run(ext, run_blocks, start, report, stream)
+            logger.info(
+                f"Mapped {report.rule_based_count}/{block_count} block(s) without AI.")
+        elif self.chunk_token_budget is not None:
+            yield from self._iter_ai_run(ext, raw_issue_blocks, 0, report, stream)
+        else:
+            # ファイル全体を1回で解析する場合、エラーはそのまま送出する
+            yield from self._iter_ai_run(ext, raw_issue_blocks, 0, report, stream, raise_errors=True)
+            return
+        self._raise_if_nothing_parsed(report)
+
+    @staticmethod
+    def _raise_if_nothing_parsed(report: ParseReport) -> None:
+        """すべてのAI解析が失敗し、結果が1件も得られなかった場合は AiParserError を送出します。"""
+        if report.failed_chunks and report.rule_based_count == 0 \
+                and len(report.failed_chunks) == report.chunk_count:
+            raise AiParserError(
+                f"All {report.chunk_count} chunk(s) failed to parse: {report.failed_chunks[0].error}")
+
+    def parse_with_report(self, file_name: str, file_content_bytes: FileContent) -> ParseReport:
+        """
+        ファイルを解析し、解析結果とチャンクごとの失敗情報を返します。
+        ファイル内容は bytes のほか、バイト列のチャンクのイテラブル (UploadedFile.chunks() など) も受け付けます。
+        YAML/JSON はキーが既知のブロックをAIを使わずにマッピングし、残りのブロックのみAIで解析します。
+        分割解析では一部のチャンクが失敗しても、成功したチャンクの結果を返します (全チャンク失敗時は AiParserError)。
+        """
+        report = ParseReport(
+            data=ParsedRequirementData(issues=[]), chunk_count=0)
+        report.data.issues.extend(self._iter_parse(
+            file_name, file_content_bytes, report, stream=False))
+        return report
+
+    def parse_stream(self, file_name: str, file_content_bytes: FileContent,
+                     report: Optional[ParseReport] = None) -> Iterator[IssueData]:
+        """
+        parse_with_report のストリーミング版。解析が完了したIssueからファイル内の順序で返します。
+        report を渡した場合、返したIssue・チャンク数・失敗情報を記録します (イテレーション完了後に参照してください)。
+        """
+        if report is None:
+            report = ParseReport(data=ParsedRequirementData(issues=[]))
+        report.chunk_count = 0
+        for issue in self._iter_parse(file_name, file_content_bytes, report, stream=True):
+            report.data.issues.append(issue)
+            yield issue
+
+    def parse(self, file_name: str, file_content_bytes: FileContent) -> ParsedRequirementData:
+        return self.parse_with_report(file_name, file_content_bytes).data
@@ -2,7 +2,7 @@
 RuleBasedMapperService: 推論ルールに基づくIssueDataマッピングサービス
 """
 from typing import Any, Dict, List, Optional
-from domain.models import IssueData
+from core_logic.domain.models import IssueData
 import logging
 
 logger = logging.getLogger(__name__)
@@ -33,7 +33,8 @@ class RuleBasedMapperService:
     def __init__(self, default_mapping: Optional[Dict[str, Any]] = None):
         self.default_mapping = default_mapping or {}
 
-    def map_block_to_issue_data(self, block: Dict[str, Any], key_mapping_rule: Dict[str, Any]) -> IssueData:
+    def map_block_to_issue_data(self, block: Dict[str, Any], key_mapping_rule: Dict[str, Any],
+                                warn_missing_fields: bool = True) -> IssueData:
         field_map = key_mapping_rule.copy()
         # デフォルトルールの適用（AI推論が不十分な場合のフォールバック）
         for k, v in self.default_mapping.items():
@@ -49,8 +50,9 @@ class RuleBasedMapperService:
             raw_value = block.get(input_key)
             if raw_value is None:
                 continue
-            # 変換ルール適用
-            convert_rule = field_map.get(f"{field}__convert")
+            # 変換ルール適用 (変換関数は文字列用のため、既にリスト等の場合はそのまま使う)
+            convert_rule = field_map.get(f"{field}__convert") if isinstance(
+                raw_value, str) else None
             try:
                 if convert_rule == "to_list_by_comma":
                     data[field] = to_list_by_comma(raw_value)
@@ -66,9 +68,10 @@ class RuleBasedMapperService:
         if not data.get("title") or not str(data["title"]).strip():
             raise ValueError("titleフィールドが空、またはマッピングできません")
         # 警告ログ
-        for f in IssueData.model_fields.keys():
-            if f not in data:
-                warnings.append(f"マッピング失敗: {f}")
+        if warn_missing_fields:
+            for f in IssueData.model_fields.keys():
+                if f not in data:
+                    warnings.append(f"マッピング失敗: {f}")
         if warnings:
             logger.warning("RuleBasedMapperService: %s", "; ".join(warnings))
         return IssueData(**data)
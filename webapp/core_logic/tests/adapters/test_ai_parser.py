@@ -1,11 +1,13 @@
 import pytest
 from unittest import mock
 import logging
+import threading
 from pydantic import ValidationError, SecretStr  # ValidationError をインポート
 import json
 
 # テスト対象と依存モジュール
 from core_logic.adapters.ai_parser import AIParser
+from core_logic.adapters.parse_result_cache import ParseResultCache
 from core_logic.domain.exceptions import AiParserError
 from core_logic.domain.models import ParsedRequirementData, IssueData, AISuggestedRules
 from core_logic.infrastructure.config import Settings
@@ -361,16 +363,28 @@ def test_build_chain_with_prompt_template(mock_settings, mock_api_clients):
     )
 
 
+def respond_by_prompt(separator_response, key_mapping_response):
+    """
+    infer_rules の2つの推論は並行に実行されるため、呼び出し順ではなくプロンプトで応答を返す llm.invoke のモック。
+    応答に例外を指定した場合は送出する。
+    """
+    def invoke(prompt):
+        response = separator_response if "区切りルール" in prompt else key_mapping_response
+        if isinstance(response, Exception):
+            raise response
+        return response
+    return invoke
+
+
 def test_infer_rules_success(monkeypatch, mock_settings):
     """AI区切り・キーマッピングルール推論が正常に動作し、信頼度・警告が正しく返る"""
     from core_logic.adapters.ai_parser import AIParser
     parser = AIParser(settings=mock_settings)
     # モック: llm.invokeの返り値を制御
     parser.llm = mock.MagicMock()
-    parser.llm.invoke.side_effect = [
+    parser.llm.invoke.side_effect = respond_by_prompt(
         '{"separator_pattern": "---"}',
-        '{"key_mapping": {"Title": "title", "Description": "description"}}'
-    ]
+        '{"key_mapping": {"Title": "title", "Description": "description"}}')
     mock_settings.ai.separator_rule_prompt_template = "区切りルールプロンプト"
     mock_settings.ai.key_mapping_rule_prompt_template = "キーマッピングルールプロンプト"
     result = parser.infer_rules("dummy text")
@@ -388,8 +402,8 @@ def test_infer_rules_partial_failure(monkeypatch, mock_settings):
     from core_logic.adapters.ai_parser import AIParser
     parser = AIParser(settings=mock_settings)
     parser.llm = mock.MagicMock()
-    parser.llm.invoke.side_effect = [
-        Exception("AI error"), '{"key_mapping": {"Title": "title"}}']
+    parser.llm.invoke.side_effect = respond_by_prompt(
+        Exception("AI error"), '{"key_mapping": {"Title": "title"}}')
     mock_settings.ai.separator_rule_prompt_template = "区切りルールプロンプト"
     mock_settings.ai.key_mapping_rule_prompt_template = "キーマッピングルールプロンプト"
     result = parser.infer_rules("dummy text")
@@ -407,8 +421,8 @@ def test_infer_rules_total_failure(monkeypatch, mock_settings):
     from core_logic.adapters.ai_parser import AIParser
     parser = AIParser(settings=mock_settings)
     parser.llm = mock.MagicMock()
-    parser.llm.invoke.side_effect = [
-        Exception("AI error1"), Exception("AI error2")]
+    parser.llm.invoke.side_effect = respond_by_prompt(
+        Exception("AI error1"), Exception("AI error2"))
     mock_settings.ai.separator_rule_prompt_template = "区切りルールプロンプト"
     mock_settings.ai.key_mapping_rule_prompt_template = "キーマッピングルールプロンプト"
     result = parser.infer_rules("dummy text")
@@ -418,3 +432,163 @@ def test_infer_rules_total_failure(monkeypatch, mock_settings):
     assert result.confidence <= 0.3
     assert len(result.errors) == 2
     assert any("信頼度" in w or "一部" in w for w in result.warnings)
+
+
+def test_infer_rules_runs_inferences_concurrently(mock_settings):
+    """区切りルールとキーマッピングルールの推論が並行に実行されること"""
+    from core_logic.adapters.ai_parser import AIParser
+    parser = AIParser(settings=mock_settings)
+    mock_settings.ai.separator_rule_prompt_template = "区切りルールプロンプト"
+    mock_settings.ai.key_mapping_rule_prompt_template = "キーマッピングルールプロンプト"
+    barrier = threading.Barrier(2, timeout=5)
+    respond = respond_by_prompt(
+        '{"separator_pattern": "---"}', '{"key_mapping": {"Title": "title"}}')
+
+    def invoke(prompt):
+        barrier.wait()  # 両方の呼び出しが同時に実行中でなければタイムアウトする
+        return respond(prompt)
+    parser.llm = mock.MagicMock()
+    parser.llm.invoke.side_effect = invoke
+
+    result = parser.infer_rules("dummy text")
+
+    assert result.confidence == 1.0
+    assert parser.llm.invoke.call_count == 2
+
+
+def test_infer_rules_reuses_cached_rules_for_same_shape(mock_settings):
+    """同じテンプレート (見出し・キー構成) の文書では推論を省略し、形が異なる場合は再推論すること"""
+    from core_logic.adapters.ai_parser import AIParser
+    parser = AIParser(settings=mock_settings,
+                      rules_cache=ParseResultCache(model_type=AISuggestedRules))
+    mock_settings.ai.separator_rule_prompt_template = "区切りルールプロンプト"
+    mock_settings.ai.key_mapping_rule_prompt_template = "キーマッピングルールプロンプト"
+    parser.llm = mock.MagicMock()
+    parser.llm.invoke.side_effect = respond_by_prompt(
+        '{"separator_pattern": "---"}', '{"key_mapping": {"Title": "title"}}')
+
+    first = parser.infer_rules("---\n**Title:** A\n**Description:** x")
+    second = parser.infer_rules(
+        "---\n**Title:** B\n**Description:** y\n---\n**Title:** C\n**Description:** z")
+    assert second == first
+    assert parser.llm.invoke.call_count == 2
+
+    parser.infer_rules("---\n**件名:** A\n**Labels:** bug")
+    assert parser.llm.invoke.call_count == 4
+    assert parser.rules_cache_stats()["hits"] == 1
+
+
+def test_infer_rules_does_not_cache_failures(mock_settings):
+    from core_logic.adapters.ai_parser import AIParser
+    parser = AIParser(settings=mock_settings,
+                      rules_cache=ParseResultCache(model_type=AISuggestedRules))
+    mock_settings.ai.separator_rule_prompt_template = "区切りルールプロンプト"
+    mock_settings.ai.key_mapping_rule_prompt_template = "キーマッピングルールプロンプト"
+    parser.llm = mock.MagicMock()
+    parser.llm.invoke.side_effect = respond_by_prompt(
+        Exception("AI error"), '{"key_mapping": {"Title": "title"}}')
+
+    parser.infer_rules("**Title:** A")
+    parser.infer_rules("**Title:** A")
+
+    assert parser.llm.invoke.call_count == 4
+
+
+def test_parse_stream_yields_completed_issues_incrementally(ai_parser_openai):
+    """部分出力を受け取りながら、次のIssueが現れた時点で前のIssueを確定して返すこと"""
+    parser, mock_chain = ai_parser_openai
+    received = []
+
+    def stream(_inputs):
+        yield {"issues": [{"title": "A"}]}
+        yield {"issues": [{"title": "A", "description": "a"}, {"title": "B"}]}
+        # この時点で A は確定済みとして返されている
+        received.append([i.title for i in emitted])
+        yield {"issues": [{"title": "A", "description": "a"}, {"title": "B", "description": "b"}]}
+    mock_chain.stream.side_effect = stream
+    parser.cache = ParseResultCache()
+
+    emitted = []
+    for issue in parser.parse_stream("Title: A\n---\nTitle: B"):
+        emitted.append(issue)
+
+    assert [(i.title, i.description) for i in emitted] == [("A", "a"), ("B", "b")]
+    assert received == [["A"]]
+    # 全体を受信した結果はキャッシュされ、parse からも利用できる
+    assert [i.title for i in parser.parse("Title: A\n---\nTitle: B").issues] == ["A", "B"]
+    mock_chain.invoke.assert_not_called()
+
+
+def test_parse_stream_wraps_errors(ai_parser_openai):
+    parser, mock_chain = ai_parser_openai
+    mock_chain.stream.side_effect = RuntimeError("boom")
+
+    with pytest.raises(AiParserError):
+        list(parser.parse_stream("some text"))
+    assert list(parser.parse_stream("  ")) == []
+
+
+def test_parse_uses_cache_for_same_input(ai_parser_openai):
+    """キャッシュ設定時、同じ入力 (改行コード・行末空白の違いは無視) ではLLMを呼ばずに結果を返すこと"""
+    parser, mock_chain = ai_parser_openai
+    parser.cache = ParseResultCache()
+
+    first = parser.parse("Title: A\nBody")
+    second = parser.parse("Title: A  \r\nBody\n")
+
+    assert second == first
+    mock_chain.invoke.assert_called_once()
+    assert parser.cache_stats() == {
+        "hits": 1, "misses": 1, "evictions": 0, "entries": 1}
+
+
+def test_parse_cache_key_includes_model_and_prompt(ai_parser_openai, mock_settings):
+    """モデル名やプロンプトが変わった場合はキャッシュを使わないこと"""
+    parser, mock_chain = ai_parser_openai
+    parser.cache = ParseResultCache()
+
+    parser.parse("same input")
+    mock_settings.final_openai_model_name = "gpt-4o-mini"
+    parser.parse("same input")
+    mock_settings.prompt_template = "Another prompt {markdown_text}"
+    parser.parse("same input")
+
+    assert mock_chain.invoke.call_count == 3
+
+
+def test_parse_errors_are_not_cached(ai_parser_openai):
+    """解析に失敗した結果はキャッシュされないこと"""
+    parser, mock_chain = ai_parser_openai
+    parser.cache = ParseResultCache()
+    valid_result = mock_chain.invoke.return_value
+    mock_chain.invoke.side_effect = [RuntimeError("boom"), valid_result]
+
+    with pytest.raises(AiParserError):
+        parser.parse("input")
+    assert parser.parse("input") == valid_result
+    assert mock_chain.invoke.call_count == 2
+
+
+def test_build_chain_fills_legacy_format_instructions(mock_settings, mock_api_clients):
+    """旧形式のテンプレートに残っている {format_instructions} は空文字列で埋めること"""
+    mock_settings.prompt_template = "Extract issues.\n{format_instructions}\n{markdown_text}"
+
+    AIParser(settings=mock_settings)
+
+    mock_api_clients['prompt'].assert_called_once_with(
+        template=mock_settings.prompt_template,
+        input_variables=["markdown_text"],
+        partial_variables={"format_instructions": ""}
+    )
+
+
+def test_provider_is_loaded_again_after_patch_is_undone(mock_settings):
+    """テストで ChatOpenAI を差し替えて戻した後も、プロバイダーを読み込み直して初期化できること"""
+    from core_logic.adapters import ai_parser as ai_parser_module
+    with mock.patch.object(ai_parser_module, "ChatOpenAI", ai_parser_module._NOT_LOADED), \
+            mock.patch("core_logic.adapters.ai_parser.PromptTemplate"):
+        with mock.patch("core_logic.adapters.ai_parser.ChatOpenAI"):
+            AIParser(settings=mock_settings)
+        parser = AIParser(settings=mock_settings)
+
+    assert type(parser.llm).__name__ == "ChatOpenAI"
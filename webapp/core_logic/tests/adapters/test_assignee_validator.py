@@ -4,15 +4,18 @@ import pytest
 from unittest.mock import MagicMock, patch
 import logging
 
-from core_logic.adapters.assignee_validator import AssigneeValidator
+from core_logic.adapters.assignee_validator import AssigneeValidator, AssignableUsersCache
 from core_logic.adapters.github_rest_client import GitHubRestClient
 from core_logic.domain.exceptions import GitHubClientError
+from core_logic.domain.models import RepositorySnapshot
 
 
 @pytest.fixture
 def mock_rest_client():
     """GitHubRestClientのモックを返すフィクスチャ"""
     mock = MagicMock(spec=GitHubRestClient)
+    # 既定では一覧取得に失敗させ、ログイン名ごとの確認 (フォールバック) を検証する
+    mock.list_assignees.side_effect = GitHubClientError("Listing unavailable")
     return mock
 
 
@@ -140,3 +143,102 @@ def test_validate_assignees_deduplication(mock_rest_client):
     # APIは1回だけ呼ばれる（重複は排除される）
     mock_rest_client.check_collaborator.assert_called_once_with(
         "owner", "repo", "user1")
+
+
+def test_validate_assignees_uses_snapshot(mock_rest_client):
+    """スナップショット読み込み後は API を呼ばずに判定されるか確認するテスト"""
+    validator = AssigneeValidator(mock_rest_client)
+    validator.load_snapshot(RepositorySnapshot(
+        owner="owner", name="repo", assignable_users=["User1", "user2"]))
+
+    valid, invalid = validator.validate_assignees(
+        "owner", "repo", ["@user1", "outsider"])
+
+    assert valid == ["user1"]  # ログイン名は大文字小文字を区別しない
+    assert invalid == ["outsider"]
+    mock_rest_client.check_collaborator.assert_not_called()
+
+    # 別リポジトリは従来どおり API で確認される
+    mock_rest_client.check_collaborator.return_value = True
+    validator.validate_assignees("owner", "other-repo", ["user1"])
+    mock_rest_client.check_collaborator.assert_called_once_with(
+        "owner", "other-repo", "user1")
+
+
+def test_validate_assignees_ignores_incomplete_snapshot(mock_rest_client):
+    """全件取得できていないスナップショットは判定に使用されないか確認するテスト"""
+    mock_rest_client.check_collaborator.return_value = True
+    validator = AssigneeValidator(mock_rest_client)
+    validator.load_snapshot(RepositorySnapshot(
+        owner="owner", name="repo", assignable_users=[], is_complete=False))
+
+    valid, invalid = validator.validate_assignees("owner", "repo", ["user1"])
+
+    assert valid == ["user1"]
+    mock_rest_client.check_collaborator.assert_called_once_with(
+        "owner", "repo", "user1")
+
+
+def test_validate_assignees_uses_single_listing_across_calls(mock_rest_client):
+    """割り当て可能ユーザー一覧を1回だけ取得し、以降の呼び出しではキャッシュを使うことを確認"""
+    mock_rest_client.list_assignees.side_effect = None
+    mock_rest_client.list_assignees.return_value = ["User1", "user2"]
+    validator = AssigneeValidator(mock_rest_client)
+
+    for _ in range(500):  # 500 Issue 分の検証
+        valid, invalid = validator.validate_assignees(
+            "owner", "repo", ["user1", "@USER2", "outsider"])
+
+    assert set(valid) == {"user1", "USER2"}
+    assert invalid == ["outsider"]
+    mock_rest_client.list_assignees.assert_called_once_with("owner", "repo")
+    mock_rest_client.check_collaborator.assert_not_called()
+
+
+def test_validate_assignees_cache_expires_after_ttl(mock_rest_client):
+    """TTL を過ぎたキャッシュは再取得されることを確認"""
+    now = [1000.0]
+    cache = AssignableUsersCache(clock=lambda: now[0])
+    mock_rest_client.list_assignees.side_effect = [["user1"], ["user1", "user2"]]
+    validator = AssigneeValidator(mock_rest_client, cache=cache, cache_ttl=60)
+
+    assert validator.validate_assignees("owner", "repo", ["user2"]) == ([], ["user2"])
+    now[0] += 30
+    assert validator.validate_assignees("owner", "repo", ["user2"]) == ([], ["user2"])
+    now[0] += 31
+    assert validator.validate_assignees("owner", "repo", ["user2"]) == (["user2"], [])
+    assert mock_rest_client.list_assignees.call_count == 2
+
+
+def test_validate_assignees_shared_cache_across_validators(mock_rest_client):
+    """共有キャッシュを渡した場合、別インスタンス (別の実行) でも再取得しないことを確認"""
+    mock_rest_client.list_assignees.side_effect = None
+    mock_rest_client.list_assignees.return_value = ["user1"]
+    cache = AssignableUsersCache()
+
+    AssigneeValidator(mock_rest_client, cache=cache).validate_assignees(
+        "owner", "repo", ["user1"])
+    valid, _ = AssigneeValidator(mock_rest_client, cache=cache).validate_assignees(
+        "Owner", "Repo", ["user1"])
+
+    assert valid == ["user1"]
+    mock_rest_client.list_assignees.assert_called_once()
+
+
+def test_validate_assignees_listing_error_falls_back(mock_rest_client, caplog):
+    """一覧取得に失敗した場合はログイン名ごとの確認にフォールバックすることを確認"""
+    mock_rest_client.check_collaborator.return_value = True
+    validator = AssigneeValidator(mock_rest_client)
+    with caplog.at_level(logging.WARNING):
+        valid, invalid = validator.validate_assignees(
+            "owner", "repo", ["user1"])
+
+    assert valid == ["user1"]
+    assert "Falling back to per-user collaborator checks" in caplog.text
+    mock_rest_client.check_collaborator.assert_called_once_with(
+        "owner", "repo", "user1")
+
+
+def test_init_with_negative_ttl(mock_rest_client):
+    with pytest.raises(ValueError, match="cache_ttl must not be negative"):
+        AssigneeValidator(mock_rest_client, cache_ttl=-1)
@@ -15,7 +15,7 @@ from core_logic.infrastructure.file_reader import read_markdown_file
 from core_logic.adapters.ai_parser import AIParser
 from core_logic.adapters.github_rest_client import GitHubRestClient
 from core_logic.use_cases.create_github_resources import CreateGitHubResourcesUseCase
-from core_logic.domain.models import ParsedRequirementData, IssueData, CreateGitHubResourcesResult
+from core_logic.domain.models import ParsedRequirementData, IssueData, CreateGitHubResourcesResult, ResourcePlan
 from core_logic.domain.exceptions import (
     AiParserError, GitHubClientError, GitHubValidationError, GitHubAuthenticationError
 )
@@ -87,6 +87,8 @@ def mock_dependencies(dummy_md_file):
     ai_settings_mock.prompt_template = "Test prompt template {markdown_text} {format_instructions}"
     ai_settings_mock.openai_model_name = "gpt-4o"
     ai_settings_mock.gemini_model_name = "gemini-1.5-flash"
+    ai_settings_mock.parse_cache_enabled = False
+    ai_settings_mock.rules_cache_enabled = False
     mock_settings.ai = ai_settings_mock
 
     # プロパティ関数の戻り値を設定
@@ -100,6 +102,18 @@ def mock_dependencies(dummy_md_file):
     logging_settings_mock.log_level = "INFO"
     mock_settings.logging = logging_settings_mock
 
+    # GitHub設定
+    github_settings_mock = MagicMock()
+    github_settings_mock.max_workers = 1
+    github_settings_mock.rate_limit_reserve = 50
+    github_settings_mock.retry_max_attempts = 3
+    github_settings_mock.retry_base_delay = 1.0
+    github_settings_mock.retry_max_delay = 30.0
+    github_settings_mock.retry_jitter = 0.5
+    github_settings_mock.retry_max_retry_after = 60.0
+    github_settings_mock.assignee_cache_ttl = 600.0
+    mock_settings.github = github_settings_mock
+
     # GitHubAppClientからGitHubRestClientに修正
     mock_gh_client_instance = MagicMock(spec=GitHubRestClient)
     # オーナー推測用のモック設定
@@ -235,7 +249,9 @@ def test_cli_success_core_flow(mock_dependencies, dummy_md_file: Path, caplog):
         parsed_data=mock_parsed_data,
         repo_name_input="owner/repo",
         project_name=None,  # projectオプションなし
-        dry_run=False      # dry-runオプションなし
+        dry_run=False,      # dry-runオプションなし
+        plan=None,
+        run_id=None
     )
     # Reporterが呼ばれたか
     mock_reporter.display_create_github_resources_result.assert_called_once()
@@ -260,7 +276,9 @@ def test_cli_success_with_project(mock_dependencies, dummy_md_file: Path):
         parsed_data=mock_parsed_data,
         repo_name_input="owner/repo",
         project_name=project_name,  # project名が渡されている
-        dry_run=False
+        dry_run=False,
+        plan=None,
+        run_id=None
     )
 
 
@@ -281,10 +299,39 @@ def test_cli_dry_run_mode(mock_dependencies, dummy_md_file: Path):
         parsed_data=mock_parsed_data,
         repo_name_input="owner/repo",
         project_name=None,
-        dry_run=True  # dry_runフラグがTrueであることを確認
+        dry_run=True,  # dry_runフラグがTrueであることを確認
+        plan=None,
+        run_id=None
     )
 
 
+@pytest.mark.usefixtures("apply_patches")
+def test_cli_save_and_apply_plan(mock_dependencies, dummy_md_file: Path, tmp_path: Path):
+    """--save-plan で保存した実行計画を --apply-plan で UseCase に渡す"""
+    mock_main_uc = mock_dependencies['main_uc']
+    plan = ResourcePlan(owner="owner", repo="repo", repository_exists=True,
+                        repository_url="https://github.com/owner/repo", labels_to_create=["bug"])
+    mock_main_uc.execute.return_value = CreateGitHubResourcesResult(
+        repository_url="https://github.com/owner/repo (Dry Run)", plan=plan)
+    plan_file = tmp_path / "plan.json"
+
+    result = runner.invoke(app, [
+        "--file", str(dummy_md_file), "--repo", "owner/repo",
+        "--dry-run", "--save-plan", str(plan_file),
+    ])
+    assert result.exit_code == 0, f"Stderr: {result.stderr}"
+    assert ResourcePlan.model_validate_json(plan_file.read_text()) == plan
+
+    mock_main_uc.execute.reset_mock()
+    result = runner.invoke(app, [
+        "--file", str(dummy_md_file), "--repo", "owner/repo",
+        "--apply-plan", str(plan_file),
+    ])
+    assert result.exit_code == 0, f"Stderr: {result.stderr}"
+    assert mock_main_uc.execute.call_args.kwargs["plan"] == plan
+    assert mock_main_uc.execute.call_args.kwargs["dry_run"] is False
+
+
 @pytest.mark.usefixtures("apply_patches")
 def test_cli_owner_inference(mock_dependencies, dummy_md_file: Path):
     """オーナー名推測 (AC-Owner-Infer): --repo repo-name-only 指定"""
@@ -307,7 +354,9 @@ def test_cli_owner_inference(mock_dependencies, dummy_md_file: Path):
         parsed_data=mock_parsed_data,
         repo_name_input=repo_name_only,  # repo名のみ
         project_name=None,
-        dry_run=False
+        dry_run=False,
+        plan=None,
+        run_id=None
     )
     # GitHubAppClient の get_authenticated が UseCase 内部で呼ばれるはずだが、
     # ここでは UseCase をモックしているため直接検証はできない。
@@ -572,6 +621,8 @@ def test_cli_github_pat_invalid(tmp_path, capsys):
                 prompt_template = "{markdown_text}"
                 openai_model_name = "gpt-4o"
                 gemini_model_name = "gemini-1.5-flash"
+                parse_cache_enabled = False
+                rules_cache_enabled = False
             self.ai = DummyAI()
             self.prompt_template = "{markdown_text}"
             self.final_openai_model_name = "gpt-4o"
@@ -580,6 +631,17 @@ def test_cli_github_pat_invalid(tmp_path, capsys):
             class DummyLogging:
                 log_level = "INFO"
             self.logging = DummyLogging()
+
+            class DummyGitHub:
+                max_workers = 1
+                rate_limit_reserve = 50
+                retry_max_attempts = 3
+                retry_base_delay = 1.0
+                retry_max_delay = 30.0
+                retry_jitter = 0.5
+                retry_max_retry_after = 60.0
+                assignee_cache_ttl = 600.0
+            self.github = DummyGitHub()
     # 本物のGitHubRestClientインスタンスを生成し、get_authenticated_userだけをモック
     real_client = GitHubRestClient(github_instance=GitHub("invalid_token"))
     real_client.get_authenticated_user = MagicMock(
@@ -623,7 +685,7 @@ def test_cli_ai_parser_low_confidence(monkeypatch, mock_dependencies, dummy_md_f
 
     # monkeypatchでmain.AIParserをこのモックに差し替え
     monkeypatch.setattr("core_logic.main.AIParser",
-                        lambda settings: mock_ai_parser)
+                        lambda settings, cache=None, rules_cache=None: mock_ai_parser)
 
     # CLI実行
     result = runner.invoke(app, [
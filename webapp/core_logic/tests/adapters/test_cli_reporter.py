@@ -3,7 +3,7 @@ import logging  # caplog を使うために必要
 
 # テスト対象とデータモデル、テスト用例外をインポート
 from adapters.cli_reporter import CliReporter
-from domain.models import CreateIssuesResult, CreateGitHubResourcesResult
+from domain.models import CreateIssuesResult, CreateGitHubResourcesResult, ResourcePlan, PlannedIssue, ApiCostEstimate, StepTiming
 from domain.exceptions import GitHubValidationError, GitHubClientError
 
 # --- Fixtures ---
@@ -565,3 +565,83 @@ def test_display_ai_rule_low_confidence_warning(reporter: CliReporter, caplog):
     assert "信頼度が低い" in caplog.text
     assert "警告" in caplog.text
     assert "中断" in caplog.text or "修正" in caplog.text
+
+
+def test_display_create_github_resources_result_retries(reporter: CliReporter, caplog):
+    """リトライが発生した操作がサマリーに表示されるテスト"""
+    overall_result = CreateGitHubResourcesResult(
+        repository_url="https://github.com/o/r",
+        retried_operations={"rest.create_label": 2,
+                            "graphql.get_repository_snapshot": 1}
+    )
+
+    with caplog.at_level(logging.INFO):
+        reporter.display_create_github_resources_result(overall_result)
+
+    assert "[Retries] 3 transient error(s) were retried:" in caplog.text
+    assert "  - graphql.get_repository_snapshot: 1" in caplog.text
+    assert "  - rest.create_label: 2" in caplog.text
+
+
+def test_display_create_github_resources_result_dry_run_plan(reporter: CliReporter, caplog):
+    """Dry Run の実行計画 (作成/スキップ・見積もりAPI呼び出し数) が表示されるテスト"""
+    plan = ResourcePlan(
+        owner="o", repo="r", repository_exists=True, repository_url="https://github.com/o/r",
+        labels_to_create=["feature"], existing_labels=["bug"],
+        milestones_to_create=["Sprint 1"],
+        issues=[PlannedIssue(title="New", action="create", invalid_assignees=["ghost"]),
+                PlannedIssue(title="Old", action="skip", reason="exists")],
+        project_name="Board", project_node_id="PVT_1",
+        estimated_cost=ApiCostEstimate(rest_requests=3, graphql_requests=1, content_creations=3,
+                                       rest_remaining=2, graphql_remaining=None, fits_rate_limit=False))
+    overall_result = CreateGitHubResourcesResult(
+        repository_url="https://github.com/o/r (Dry Run)", project_name="Board", plan=plan)
+
+    with caplog.at_level(logging.INFO):
+        reporter.display_create_github_resources_result(overall_result)
+
+    assert "[DRY RUN MODE]" in caplog.text
+    assert "[Labels] Would create: 1, Existing: 1" in caplog.text
+    assert "[Milestones] Would create: 1, Existing: 0" in caplog.text
+    assert "[Issues] Would create: 1, Would skip: 1" in caplog.text
+    assert "  + New" in caplog.text
+    assert "ghost" in caplog.text
+    assert "  - Old (exists)" in caplog.text
+    assert "[Project] Would add 1 items to project 'Board'" in caplog.text
+    assert "~3 REST request(s) (3 content creation(s)), ~1 GraphQL request(s)" in caplog.text
+    assert "exceeds the remaining rate limit" in caplog.text
+
+
+def test_display_api_metrics_summary(reporter: CliReporter, caplog):
+    from adapters.github_metrics import OperationSummary
+    rows = [OperationSummary(api="rest", operation="create_issue", calls=3, errors=1,
+                             total_seconds=1.5, p50_seconds=0.5, p95_seconds=1.0, retries=2),
+            OperationSummary(api="graphql", operation="get_repository_snapshot", calls=1,
+                             total_seconds=0.3, graphql_cost=1)]
+
+    with caplog.at_level(logging.INFO):
+        reporter.display_api_metrics_summary(rows, {"core": 4990, "graphql": 4999})
+
+    assert "--- GitHub API Calls ---" in caplog.text
+    assert "create_issue" in caplog.text and "get_repository_snapshot" in caplog.text
+    assert "Rate limit remaining: core 4990, graphql 4999" in caplog.text
+
+
+def test_display_api_metrics_summary_empty(reporter: CliReporter, caplog):
+    with caplog.at_level(logging.INFO):
+        reporter.display_api_metrics_summary([])
+    assert "GitHub API Calls" not in caplog.text
+
+
+def test_display_create_github_resources_result_step_timings(reporter: CliReporter, caplog):
+    overall_result = CreateGitHubResourcesResult(
+        repository_url="https://github.com/o/r",
+        step_timings=[StepTiming(step="labels", duration_seconds=0.5, api_calls=3, items=3, items_per_second=6.0),
+                      StepTiming(step="project", duration_seconds=0.25, api_calls=1)])
+
+    with caplog.at_level(logging.INFO):
+        reporter.display_create_github_resources_result(overall_result)
+
+    assert "[Timings] Total: 0.75s" in caplog.text
+    assert "  - labels: 0.50s, 3 API call(s), 3 item(s), 6.0 items/s" in caplog.text
+    assert "  - project: 0.25s, 1 API call(s), 0 item(s)\n" in caplog.text
@@ -0,0 +1,150 @@
+# tests/adapters/test_github_client_registry.py
+
+import gc
+
+import httpx
+import pytest
+
+from core_logic.adapters.github_client_registry import GitHubClientRegistry, KeepAliveTransport
+from core_logic.infrastructure.config import GitHubSettings
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_same_token_reuses_client_set():
+    registry = GitHubClientRegistry()
+    settings = GitHubSettings()
+
+    first = registry.get("token-a", settings)
+    second = registry.get("token-a", settings)
+
+    assert second is first
+    assert registry.get("token-b", settings) is not first
+    assert registry.stats() == {"hits": 1, "misses": 2,
+                                "evictions": 0, "entries": 2}
+    # REST/GraphQL クライアントは呼び出しごとに作成し、リトライ統計を分ける
+    assert first.rest_client() is not first.rest_client()
+    assert first.rest_client().gh is first.github
+    assert first.graphql_client().scheduler is first.scheduler
+
+
+def test_key_does_not_contain_token_and_depends_on_settings():
+    key = GitHubClientRegistry.make_key("secret-token", GitHubSettings())
+    assert "secret-token" not in key
+    assert key != GitHubClientRegistry.make_key(
+        "secret-token", GitHubSettings(retry_max_attempts=5))
+    assert key != GitHubClientRegistry.make_key(
+        "secret-token", GitHubSettings(retry_max_retry_after=5.0))
+
+
+def test_bounded_size_evicts_least_recently_used():
+    registry = GitHubClientRegistry(max_size=2)
+    settings = GitHubSettings()
+    a = registry.get("a", settings)
+    registry.get("b", settings)
+    registry.get("a", settings)  # a を最近使用したものにする
+    registry.get("c", settings)
+
+    assert registry.get("a", settings) is a
+    assert registry.stats()["evictions"] == 1
+    assert registry.stats()["entries"] == 2
+
+
+def test_idle_clients_are_evicted_and_closed(monkeypatch):
+    clock = FakeClock()
+    registry = GitHubClientRegistry(idle_timeout=60, clock=clock)
+    settings = GitHubSettings()
+    first = registry.get("a", settings)
+    closed = []
+    monkeypatch.setattr(first.transport, "shutdown", lambda: closed.append(True))
+
+    clock.now = 61
+    second = registry.get("a", settings)
+
+    assert second is not first
+    assert closed == [True]
+    assert registry.stats()["evictions"] == 1
+
+
+def test_clients_in_use_are_not_evicted_when_idle(monkeypatch):
+    """実行中のジョブがクライアントを使用している間は idle_timeout を過ぎても削除しないこと"""
+    clock = FakeClock()
+    registry = GitHubClientRegistry(idle_timeout=60, clock=clock)
+    settings = GitHubSettings()
+    first = registry.get("a", settings)
+    closed = []
+    monkeypatch.setattr(first.transport, "shutdown", lambda: closed.append(True))
+    rest_client = first.rest_client()
+
+    clock.now = 61
+    assert registry.get("b", settings) is not first
+    assert registry.stats()["entries"] == 2
+    assert closed == []
+
+    del rest_client
+    gc.collect()
+    clock.now = 200
+    registry.get("b", settings)
+    assert closed == [True]
+    assert registry.stats()["entries"] == 1
+
+
+def test_evicted_client_set_is_closed_after_last_client_is_released(monkeypatch):
+    """使用中のクライアントセットを削除した場合、最後のクライアントが破棄されるまで接続プールを閉じないこと"""
+    registry = GitHubClientRegistry(max_size=1)
+    settings = GitHubSettings()
+    first = registry.get("a", settings)
+    closed = []
+    monkeypatch.setattr(first.transport, "shutdown", lambda: closed.append(True))
+    rest_client = first.rest_client()
+    graphql_client = first.graphql_client()
+
+    registry.get("b", settings)  # 上限を超えたため a を削除する
+    assert registry.stats()["evictions"] == 1
+    assert closed == []
+
+    del rest_client
+    gc.collect()
+    assert closed == []
+    del graphql_client
+    gc.collect()
+    assert closed == [True]
+    assert first.closed
+
+
+def test_bounded_size_prefers_evicting_unused_client_sets():
+    """上限を超えた場合、使用中のものより使用中でないものを先に削除すること"""
+    registry = GitHubClientRegistry(max_size=2)
+    settings = GitHubSettings()
+    a = registry.get("a", settings)
+    rest_client = a.rest_client()
+    b = registry.get("b", settings)
+    registry.get("c", settings)
+
+    assert registry.get("a", settings) is a
+    assert b.closed
+    assert not a.closed
+    assert rest_client.gh is a.github
+
+
+def test_keep_alive_transport_survives_client_close():
+    """httpx.Client の終了では共有の接続プールを閉じないこと"""
+    calls = []
+
+    class CountingTransport(KeepAliveTransport):
+        def handle_request(self, request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"ok": True})
+
+    transport = CountingTransport()
+    for _ in range(2):
+        with httpx.Client(transport=transport, base_url="https://api.github.com") as client:
+            assert client.get("/rate_limit").json() == {"ok": True}
+    assert calls == ["/rate_limit", "/rate_limit"]
+    transport.shutdown()
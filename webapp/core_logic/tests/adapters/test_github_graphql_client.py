@@ -426,3 +426,179 @@ def test_add_item_to_project_v2_trims_input(graphql_client):
     args, _ = graphql_client.mock_gh.graphql.call_args
     assert args[1] == {"projectId": "PROJECT_NODE",
                        "contentId": "CONTENT_NODE"}
+
+
+# add_items_to_project_v2 テスト
+
+def create_mock_batch_data(item_ids):
+    """エイリアス付きミューテーションのレスポンスdataを作成 (Noneは失敗扱い)"""
+    return {
+        f"item{i}": ({"item": {"id": item_id}} if item_id else None)
+        for i, item_id in enumerate(item_ids)
+    }
+
+
+def test_add_items_to_project_v2_batches_requests(graphql_client):
+    """batch_size ごとに1リクエストへまとめて送信されることを確認"""
+    node_ids = [f"ISSUE_{i}" for i in range(60)]
+
+    def graphql_side_effect(mutation, variables):
+        count = len(variables) - 1
+        return {"data": create_mock_batch_data([f"ITEM_{variables[f'contentId{i}']}" for i in range(count)])}
+    graphql_client.mock_gh.graphql.side_effect = graphql_side_effect
+
+    added, failed = graphql_client.add_items_to_project_v2(
+        "PROJECT_ID", node_ids, batch_size=25)
+
+    assert graphql_client.mock_gh.graphql.call_count == 3
+    assert failed == {}
+    assert added == {node_id: f"ITEM_{node_id}" for node_id in node_ids}
+    first_mutation, first_variables = graphql_client.mock_gh.graphql.call_args_list[0][0]
+    assert "item24: addProjectV2ItemById" in first_mutation
+    assert "item25" not in first_mutation
+    assert first_variables["projectId"] == "PROJECT_ID"
+    assert first_variables["contentId0"] == "ISSUE_0"
+
+
+def test_add_items_to_project_v2_partial_errors(graphql_client):
+    """バッチ内の一部エラーが path のエイリアスから各アイテムに対応付けられることを確認"""
+    graphql_client.mock_gh.graphql.return_value = {
+        "data": create_mock_batch_data(["ITEM_A", None, "ITEM_C"]),
+        "errors": [{"path": ["item1"], "message": "Content not found"}]
+    }
+
+    added, failed = graphql_client.add_items_to_project_v2(
+        "PROJECT_ID", ["ISSUE_A", "ISSUE_B", "ISSUE_C"])
+
+    assert added == {"ISSUE_A": "ITEM_A", "ISSUE_C": "ITEM_C"}
+    assert failed == {"ISSUE_B": "Content not found"}
+    graphql_client.mock_gh.graphql.assert_called_once()
+
+
+def test_add_items_to_project_v2_graphql_failed_exception(graphql_client):
+    """githubkit が GraphQLFailed を送出した場合も成功分と失敗分を振り分けることを確認"""
+    from githubkit.exception import GraphQLFailed
+    error = MagicMock(path=["item0"], message="Could not resolve to a node")
+    graphql_client.mock_gh.graphql.side_effect = GraphQLFailed(
+        MagicMock(data=create_mock_batch_data([None, "ITEM_B"]), errors=[error]))
+
+    added, failed = graphql_client.add_items_to_project_v2(
+        "PROJECT_ID", ["ISSUE_A", "ISSUE_B"])
+
+    assert added == {"ISSUE_B": "ITEM_B"}
+    assert failed == {"ISSUE_A": "Could not resolve to a node"}
+
+
+def test_add_items_to_project_v2_batch_request_error(graphql_client):
+    """バッチ全体が失敗した場合、そのバッチのアイテムのみ失敗となり次のバッチは続行される"""
+    graphql_client.mock_gh.graphql.side_effect = [
+        RequestError("Network error"),
+        {"data": create_mock_batch_data(["ITEM_C"])}
+    ]
+
+    added, failed = graphql_client.add_items_to_project_v2(
+        "PROJECT_ID", ["ISSUE_A", "ISSUE_B", "ISSUE_C"], batch_size=2)
+
+    assert added == {"ISSUE_C": "ITEM_C"}
+    assert set(failed) == {"ISSUE_A", "ISSUE_B"}
+    assert "Network/Request error" in failed["ISSUE_A"]
+
+
+def test_add_items_to_project_v2_empty_project_id(graphql_client):
+    """プロジェクトIDが空の場合は ValueError"""
+    with pytest.raises(ValueError, match="Project Node ID cannot be empty"):
+        graphql_client.add_items_to_project_v2("  ", ["ISSUE_A"])
+    graphql_client.mock_gh.graphql.assert_not_called()
+
+
+# get_repository_snapshot テスト
+
+def create_mock_connection(nodes, has_next_page=False, end_cursor=None):
+    """スナップショット用のコネクションデータを作成"""
+    return {"nodes": nodes, "pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor}}
+
+
+def test_get_repository_snapshot_paginates_each_connection(graphql_client):
+    """未取得のコネクションだけを次ページで要求し、全件を結合したスナップショットを返すことを確認"""
+    page1 = {"data": {"repository": {
+        "id": "REPO_ID",
+        "labels": create_mock_connection([{"name": "bug"}], True, "L1"),
+        "milestones": create_mock_connection([{"title": "Sprint 1", "number": 1}]),
+        "assignableUsers": create_mock_connection([{"login": "alice"}]),
+        "issues": create_mock_connection([{"title": "Existing"}], True, "I1"),
+    }}}
+    page2 = {"data": {"repository": {
+        "id": "REPO_ID",
+        "labels": create_mock_connection([{"name": "feature"}]),
+        "issues": create_mock_connection([{"title": "Another"}]),
+    }}}
+    graphql_client.mock_gh.graphql.side_effect = [page1, page2]
+
+    snapshot = graphql_client.get_repository_snapshot("owner", "repo")
+
+    assert snapshot.repository_id == "REPO_ID"
+    assert snapshot.label_names == ["bug", "feature"]
+    assert snapshot.milestones == {"Sprint 1": 1}
+    assert snapshot.assignable_users == ["alice"]
+    assert snapshot.open_issue_titles == ["Existing", "Another"]
+    assert snapshot.is_complete is True
+    assert graphql_client.mock_gh.graphql.call_count == 2
+    second_variables = graphql_client.mock_gh.graphql.call_args_list[1][0][1]
+    assert second_variables["labelsCursor"] == "L1"
+    assert second_variables["issuesCursor"] == "I1"
+    assert second_variables["withLabels"] is True
+    assert second_variables["withIssues"] is True
+    assert second_variables["withMilestones"] is False
+    assert second_variables["withAssignableUsers"] is False
+
+
+def test_get_repository_snapshot_incomplete_when_max_pages_reached(graphql_client, caplog):
+    """ページング上限に達した場合は is_complete=False のスナップショットを返すことを確認"""
+    graphql_client.mock_gh.graphql.return_value = {"data": {"repository": {
+        "id": "REPO_ID",
+        "labels": create_mock_connection([{"name": "bug"}], True, "L1"),
+        "milestones": create_mock_connection([]),
+        "assignableUsers": create_mock_connection([]),
+        "issues": create_mock_connection([]),
+    }}}
+
+    with caplog.at_level(logging.WARNING):
+        snapshot = graphql_client.get_repository_snapshot(
+            "owner", "repo", max_pages=2)
+
+    assert snapshot.is_complete is False
+    assert graphql_client.mock_gh.graphql.call_count == 2
+    assert "Reached maximum page limit (2)" in caplog.text
+
+
+def test_get_repository_snapshot_not_found(graphql_client):
+    """リポジトリが存在しない (NOT_FOUND) 場合は None を返すことを確認"""
+    graphql_client.mock_gh.graphql.return_value = {
+        "data": {"repository": None},
+        "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to a Repository"}]
+    }
+
+    assert graphql_client.get_repository_snapshot("owner", "missing") is None
+
+
+def test_get_repository_snapshot_reports_rate_limit_to_scheduler(mock_github):
+    """スケジューラ指定時、レスポンスの rateLimit フィールドが通知されることを確認"""
+    from core_logic.adapters.github_request_scheduler import GitHubRequestScheduler
+    scheduler = MagicMock(spec=GitHubRequestScheduler)
+    client = GitHubGraphQLClient(mock_github, scheduler=scheduler)
+    rate_limit = {"cost": 1, "remaining": 4999,
+                  "resetAt": "2030-01-01T00:00:00Z"}
+    mock_github.graphql.return_value = {"data": {
+        "rateLimit": rate_limit,
+        "repository": {
+            "id": "REPO_ID",
+            "labels": create_mock_connection([]),
+            "milestones": create_mock_connection([]),
+            "assignableUsers": create_mock_connection([]),
+            "issues": create_mock_connection([]),
+        }}}
+
+    client.get_repository_snapshot("owner", "repo")
+
+    scheduler.update_from_graphql.assert_called_once_with(rate_limit)
+    assert "rateLimit { cost remaining resetAt }" in mock_github.graphql.call_args[0][0]
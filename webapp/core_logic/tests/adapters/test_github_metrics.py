@@ -0,0 +1,123 @@
+import pytest
+from unittest.mock import patch
+
+from core_logic.adapters.github_metrics import (
+    GitHubApiMetrics, Histogram, begin_call, end_call, observe_response, observe_graphql_rate_limit,
+    render_stats_family
+)
+from core_logic.adapters.github_utils import github_api_error_handler, github_api_retry, RetryPolicy
+from core_logic.domain.exceptions import GitHubClientError, GitHubResourceNotFoundError
+
+
+class _MeteredClient:
+    """メトリクス記録のテスト用クライアント"""
+    api_name = "rest"
+
+    def __init__(self, metrics, retry_policy=None):
+        self.metrics = metrics
+        self.retry_policy = retry_policy
+        self.responses = []
+        self.side_effects = []
+
+    @github_api_retry()
+    @github_api_error_handler()
+    def fetch(self, name):
+        for status_code, headers in self.responses:
+            observe_response(status_code, headers, "core")
+        if self.side_effects:
+            raise self.side_effects.pop(0)
+        return name
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("0.1", 1), ("1.0", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(3.05)
+    assert histogram.quantile(0.5) == 1.0
+    # +Inf に入った値は観測した最大値で推定する
+    assert histogram.quantile(0.95) == 2.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_decorator_records_status_rate_limit_and_http_requests():
+    metrics = GitHubApiMetrics()
+    client = _MeteredClient(metrics)
+    client.responses = [(200, {"X-RateLimit-Remaining": "4999", "X-RateLimit-Resource": "core"}),
+                        (200, {"X-RateLimit-Remaining": "4998"})]
+
+    assert client.fetch("x") == "x"
+
+    [row] = metrics.summary()
+    assert (row.api, row.operation, row.calls, row.errors) == (
+        "rest", "fetch", 1, 0)
+    assert row.http_requests == 2
+    assert row.status_counts == {"200": 1}
+    assert metrics.rate_limit_remaining() == {"core": 4998}
+
+
+def test_decorator_records_errors_and_retries():
+    metrics = GitHubApiMetrics()
+    client = _MeteredClient(metrics, retry_policy=RetryPolicy(
+        max_attempts=3, base_delay=0.0, jitter=0.0))
+    client.side_effects = [GitHubClientError("boom", status_code=502)]
+
+    with patch("core_logic.adapters.github_utils.time.sleep"):
+        assert client.fetch("x") == "x"
+    client.side_effects = [GitHubResourceNotFoundError("missing")]
+    with pytest.raises(GitHubResourceNotFoundError):
+        client.fetch("y")
+
+    [row] = metrics.summary()
+    assert row.calls == 3
+    assert row.errors == 2
+    assert row.retries == 1
+    assert row.status_counts == {"502": 1, "ok": 1, "404": 1}
+
+
+def test_observations_outside_a_call_are_ignored():
+    metrics = GitHubApiMetrics()
+    observe_response(200, {"X-RateLimit-Remaining": "1"}, "core")
+    observe_graphql_rate_limit({"cost": 1, "remaining": 10})
+
+    observation = begin_call()
+    observe_graphql_rate_limit({"cost": 2, "remaining": 4990})
+    observe_graphql_rate_limit({"cost": "bad"})
+    end_call(observation)
+    metrics.record_call("graphql", "get_repository_snapshot",
+                        0.2, "200", observation=observation)
+
+    assert observation.graphql_cost == 2
+    assert metrics.summary()[0].graphql_cost == 2
+    assert metrics.rate_limit_remaining() == {"graphql": 4990}
+
+
+def test_render_prometheus():
+    metrics = GitHubApiMetrics(buckets=(0.5,))
+    metrics.record_call("rest", "create_issue", 0.2, "201")
+    metrics.record_call("rest", "create_issue", 1.0, "502", error=True)
+    metrics.record_retries("rest", "create_issue", 1)
+
+    text = metrics.render_prometheus()
+
+    assert '# TYPE github_api_request_duration_seconds histogram' in text
+    assert 'github_api_request_duration_seconds_bucket{api="rest",operation="create_issue",le="0.5"} 1' in text
+    assert 'github_api_request_duration_seconds_bucket{api="rest",operation="create_issue",le="+Inf"} 2' in text
+    assert 'github_api_request_duration_seconds_count{api="rest",operation="create_issue"} 2' in text
+    assert 'github_api_calls_total{api="rest",operation="create_issue",status="502"} 1' in text
+    assert 'github_api_retries_total{api="rest",operation="create_issue"} 1' in text
+    assert text.endswith("\n")
+
+    metrics.reset()
+    assert metrics.summary() == []
+
+
+def test_render_stats_family_escapes_labels():
+    lines = render_stats_family("cache_stats", "Cache statistics.",
+                                [({"cache": 'a"b'}, {"hits": 2})])
+    assert lines == ["# HELP cache_stats Cache statistics.",
+                     "# TYPE cache_stats gauge",
+                     'cache_stats{cache="a\\"b",stat="hits"} 2']
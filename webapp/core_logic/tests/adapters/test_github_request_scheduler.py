@@ -0,0 +1,128 @@
+# tests/adapters/test_github_request_scheduler.py
+
+import pytest
+from unittest.mock import MagicMock
+import logging
+
+import httpx
+
+from core_logic.adapters.github_request_scheduler import (
+    GitHubRequestScheduler, create_github_instance
+)
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def fake_sleep():
+    return MagicMock()
+
+
+@pytest.fixture
+def scheduler(fake_sleep):
+    """時刻固定・sleepをモックしたスケジューラ"""
+    return GitHubRequestScheduler(reserve=10, clock=lambda: NOW, sleep=fake_sleep)
+
+
+def test_no_wait_without_state(scheduler, fake_sleep):
+    """レート制限情報がない場合は待機しない"""
+    assert scheduler.wait_for_slot("core") == 0
+    fake_sleep.assert_not_called()
+
+
+def test_no_wait_when_budget_is_sufficient(scheduler, fake_sleep):
+    """残量が reserve より多い場合は待機しない"""
+    scheduler.update_from_headers(
+        {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": str(int(NOW + 600))})
+    assert scheduler.wait_for_slot("core") == 0
+    fake_sleep.assert_not_called()
+
+
+def test_paces_requests_when_budget_is_low(scheduler, fake_sleep):
+    """残量が reserve 以下の場合、リセットまでの時間を残量で均等に分散して待機する"""
+    scheduler.update_from_headers({
+        "X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(int(NOW + 100)),
+        "X-RateLimit-Resource": "core", "X-RateLimit-Limit": "5000"})
+
+    assert scheduler.wait_for_slot("core") == pytest.approx(20.0)
+    fake_sleep.assert_called_once_with(pytest.approx(20.0))
+    assert scheduler.get_state("core").limit == 5000
+    # 他のリソースには影響しない
+    assert scheduler.compute_delay("graphql") == 0
+
+
+def test_waits_until_reset_when_exhausted(scheduler):
+    """残量0の場合はリセット時刻まで待機する"""
+    scheduler.update_from_headers(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(NOW + 300))})
+    assert scheduler.compute_delay("core") == pytest.approx(300.0)
+
+
+def test_wait_is_capped_by_max_wait(fake_sleep):
+    """待機時間は max_wait を超えない"""
+    scheduler = GitHubRequestScheduler(
+        reserve=10, max_wait=60, clock=lambda: NOW, sleep=fake_sleep)
+    scheduler.update_from_headers(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(NOW + 3000))})
+    assert scheduler.compute_delay("core") == 60
+
+
+def test_retry_after_pauses_all_resources(scheduler, caplog):
+    """Retry-After を受け取ると全リソースのリクエストが待機する"""
+    with caplog.at_level(logging.WARNING):
+        scheduler.update_from_headers({"Retry-After": "30"})
+    assert scheduler.compute_delay("core") == pytest.approx(30.0)
+    assert scheduler.compute_delay("graphql") == pytest.approx(30.0)
+    assert "Retry-After 30s" in caplog.text
+
+
+def test_update_from_graphql_rate_limit(scheduler):
+    """GraphQL の rateLimit フィールドから graphql リソースの状態を更新する"""
+    scheduler.update_from_graphql(
+        {"cost": 1, "remaining": 0, "resetAt": "2023-11-14T22:13:20Z"})
+    state = scheduler.get_state("graphql")
+    assert state.remaining == 0
+    assert state.reset_at == pytest.approx(NOW)
+
+    # 不正な値は無視される
+    scheduler.update_from_graphql({"remaining": "x", "resetAt": "invalid"})
+    assert scheduler.get_state("graphql").remaining == 0
+
+
+def test_resource_for_path():
+    assert GitHubRequestScheduler.resource_for_path("/graphql") == "graphql"
+    assert GitHubRequestScheduler.resource_for_path(
+        "/api/graphql") == "graphql"
+    assert GitHubRequestScheduler.resource_for_path(
+        "/search/issues") == "search"
+    assert GitHubRequestScheduler.resource_for_path(
+        "/repos/o/r/labels") == "core"
+
+
+def test_event_hooks_track_responses(scheduler, fake_sleep):
+    """httpx のイベントフック経由でヘッダーを追跡し、次のリクエスト前に待機する"""
+    hooks = scheduler.event_hooks()
+    request = httpx.Request("POST", "https://api.github.com/graphql")
+    response = httpx.Response(200, request=request, headers={
+        "X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(int(NOW + 10))})
+
+    for hook in hooks["response"]:
+        hook(response)
+    for hook in hooks["request"]:
+        hook(request)
+
+    assert scheduler.get_state("graphql").remaining == 2
+    fake_sleep.assert_called_once_with(pytest.approx(5.0))
+    assert scheduler.total_wait_seconds == pytest.approx(5.0)
+
+
+def test_create_github_instance_installs_hooks(scheduler):
+    """スケジューラ指定時は GitHub インスタンスにイベントフックが設定される"""
+    gh = create_github_instance("dummy-token", scheduler)
+    assert gh.config.event_hooks["request"] == [scheduler._on_request]
+    assert gh.config.event_hooks["response"] == [scheduler._on_response]
+
+
+def test_invalid_reserve():
+    with pytest.raises(ValueError, match="reserve must not be negative"):
+        GitHubRequestScheduler(reserve=-1)
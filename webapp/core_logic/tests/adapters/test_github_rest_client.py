@@ -6,6 +6,7 @@ import logging
 import json
 
 from core_logic.adapters.github_rest_client import GitHubRestClient
+from core_logic.adapters.github_utils import RetryPolicy
 from core_logic.domain.exceptions import (
     GitHubClientError, GitHubResourceNotFoundError, GitHubValidationError,
     GitHubAuthenticationError
@@ -402,6 +403,42 @@ def test_create_label_api_error(rest_client):
     assert f"creating label 'duplicate-label' in {TARGET_OWNER}/{TARGET_REPO}" in error_msg
 
 
+@patch("core_logic.adapters.github_utils.time.sleep")
+def test_create_label_retry_returns_label_created_by_failed_attempt(mock_sleep, rest_client):
+    """5xx 後のリトライ前に既存ラベルを確認し、作成済みであれば再作成しないことを確認"""
+    rest_client.retry_policy = RetryPolicy(max_attempts=3, jitter=0.0)
+    rest_client.mock_gh.rest.issues.create_label.side_effect = create_mock_request_failed(
+        status_code=502, content=b'{"message":"Bad Gateway"}')
+    existing_label = MagicMock()
+    existing_label.name = "flaky"
+    existing_label.errors = None  # GraphQLエラー検出を防止するため明示的にNoneに設定
+    rest_client.mock_gh.rest.issues.get_label.return_value = MagicMock(
+        parsed_data=existing_label, errors=None)
+
+    result = rest_client.create_label(TARGET_OWNER, TARGET_REPO, " flaky ")
+
+    assert result is existing_label
+    rest_client.mock_gh.rest.issues.create_label.assert_called_once()
+    rest_client.mock_gh.rest.issues.get_label.assert_called_once_with(
+        owner=TARGET_OWNER, repo=TARGET_REPO, name="flaky")
+    mock_sleep.assert_called_once_with(1.0)
+    assert rest_client.retry_stats.snapshot() == {"create_label": 1}
+
+
+@patch("core_logic.adapters.github_utils.time.sleep")
+def test_create_issue_is_not_retried(mock_sleep, rest_client):
+    """冪等でない Issue 作成はリトライしないことを確認"""
+    rest_client.retry_policy = RetryPolicy(max_attempts=3)
+    rest_client.mock_gh.rest.issues.create.side_effect = create_mock_request_failed(
+        status_code=502, content=b'{"message":"Bad Gateway"}')
+
+    with pytest.raises(GitHubClientError):
+        rest_client.create_issue(TARGET_OWNER, TARGET_REPO, "title")
+
+    rest_client.mock_gh.rest.issues.create.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
 # list_milestones テスト
 
 def test_list_milestones_success(rest_client):
@@ -431,7 +468,7 @@ def test_list_milestones_success(rest_client):
     assert result[0].title == "Sprint 1"
     assert result[1].number == 2
     rest_client.mock_gh.rest.issues.list_milestones.assert_called_once_with(
-        owner=TARGET_OWNER, repo=TARGET_REPO, state="open", per_page=100
+        owner=TARGET_OWNER, repo=TARGET_REPO, state="open", per_page=100, page=1
     )
 
 
@@ -449,10 +486,25 @@ def test_list_milestones_with_custom_params(rest_client):
 
     # 検証
     rest_client.mock_gh.rest.issues.list_milestones.assert_called_once_with(
-        owner=TARGET_OWNER, repo=TARGET_REPO, state="closed", per_page=50
+        owner=TARGET_OWNER, repo=TARGET_REPO, state="closed", per_page=50, page=1
     )
 
 
+def test_list_milestones_paginates(rest_client):
+    """100件を超えるマイルストーンも全ページ取得されることを確認"""
+    page1 = [MagicMock() for _ in range(100)]
+    page2 = [MagicMock()]
+    rest_client.mock_gh.rest.issues.list_milestones.side_effect = [
+        MagicMock(parsed_data=page1), MagicMock(parsed_data=page2)]
+
+    result = rest_client.list_milestones(TARGET_OWNER, TARGET_REPO, state="all")
+
+    assert result == page1 + page2
+    assert rest_client.mock_gh.rest.issues.list_milestones.call_count == 2
+    rest_client.mock_gh.rest.issues.list_milestones.assert_any_call(
+        owner=TARGET_OWNER, repo=TARGET_REPO, state="all", per_page=100, page=2)
+
+
 def test_list_milestones_empty_result(rest_client):
     """マイルストーンが空のリストを返す場合のテスト"""
     # 空リストのレスポンスを設定
@@ -651,6 +703,89 @@ def test_create_issue_api_error(rest_client):
     assert f"creating issue 'No Permission Issue' in {TARGET_OWNER}/{TARGET_REPO}" in error_msg
 
 
+# list_labels テスト
+
+def test_list_labels_paginates(rest_client):
+    """全ページのラベルを結合して返すことを確認"""
+    page1 = [MagicMock() for _ in range(100)]
+    page2 = [MagicMock()]
+    rest_client.mock_gh.rest.issues.list_labels_for_repo.side_effect = [
+        MagicMock(parsed_data=page1), MagicMock(parsed_data=page2)]
+
+    result = rest_client.list_labels(TARGET_OWNER, TARGET_REPO)
+
+    assert result == page1 + page2
+    assert rest_client.mock_gh.rest.issues.list_labels_for_repo.call_count == 2
+    rest_client.mock_gh.rest.issues.list_labels_for_repo.assert_any_call(
+        owner=TARGET_OWNER, repo=TARGET_REPO, per_page=100, page=1)
+    rest_client.mock_gh.rest.issues.list_labels_for_repo.assert_any_call(
+        owner=TARGET_OWNER, repo=TARGET_REPO, per_page=100, page=2)
+
+
+def test_list_labels_api_error(rest_client):
+    """ラベル一覧取得時のAPIエラーが適切に処理されることを確認"""
+    mock_error = create_mock_request_failed(
+        status_code=500,
+        content=b'{"message":"Server Error"}'
+    )
+    rest_client.mock_gh.rest.issues.list_labels_for_repo.side_effect = mock_error
+
+    with pytest.raises(GitHubClientError) as excinfo:
+        rest_client.list_labels(TARGET_OWNER, TARGET_REPO)
+
+    assert f"listing labels for {TARGET_OWNER}/{TARGET_REPO}" in str(
+        excinfo.value)
+
+
+# list_issues テスト
+
+def test_list_issues_paginates_and_excludes_pull_requests(rest_client):
+    """全ページを取得し、Pull Requestを除外してIssueのみ返すことを確認"""
+    page1 = []
+    for i in range(100):
+        issue = MagicMock()
+        issue.title = f"Issue {i}"
+        issue.pull_request = None
+        page1.append(issue)
+    pr = MagicMock()
+    pr.title = "Some PR"
+    pr.pull_request = MagicMock()  # PRには pull_request 属性が付く
+    last_issue = MagicMock()
+    last_issue.title = "Issue 100"
+    last_issue.pull_request = None
+
+    response1 = MagicMock(parsed_data=page1)
+    response2 = MagicMock(parsed_data=[pr, last_issue])
+    rest_client.mock_gh.rest.issues.list_for_repo.side_effect = [
+        response1, response2]
+
+    result = rest_client.list_issues(TARGET_OWNER, TARGET_REPO)
+
+    assert len(result) == 101
+    assert pr not in result
+    assert result[-1] is last_issue
+    assert rest_client.mock_gh.rest.issues.list_for_repo.call_count == 2
+    rest_client.mock_gh.rest.issues.list_for_repo.assert_any_call(
+        owner=TARGET_OWNER, repo=TARGET_REPO, state="open", per_page=100, page=1)
+    rest_client.mock_gh.rest.issues.list_for_repo.assert_any_call(
+        owner=TARGET_OWNER, repo=TARGET_REPO, state="open", per_page=100, page=2)
+
+
+def test_list_issues_api_error(rest_client):
+    """Issue一覧取得時のAPIエラーが適切に処理されることを確認"""
+    mock_error = create_mock_request_failed(
+        status_code=404,
+        content=b'{"message":"Not Found"}'
+    )
+    rest_client.mock_gh.rest.issues.list_for_repo.side_effect = mock_error
+
+    with pytest.raises(GitHubResourceNotFoundError) as excinfo:
+        rest_client.list_issues(TARGET_OWNER, TARGET_REPO)
+
+    assert f"listing issues for {TARGET_OWNER}/{TARGET_REPO}" in str(
+        excinfo.value)
+
+
 # search_issues_and_pull_requests テスト
 
 def test_search_issues_success(rest_client):
@@ -843,3 +978,37 @@ def test_get_repository_invalid_response(rest_client):
     error_msg = str(excinfo.value)
     assert f"Successfully fetched repository {TARGET_OWNER}/{TARGET_REPO}" in error_msg
     assert "but response data is missing" in error_msg
+
+
+# list_assignees テスト
+
+def test_list_assignees_paginates(rest_client):
+    """割り当て可能ユーザーを全ページ取得してログイン名のリストを返すことを確認"""
+    def make_user(login):
+        user = MagicMock()
+        user.login = login
+        return user
+
+    first_page = MagicMock(parsed_data=[make_user(f"user{i}") for i in range(100)])
+    second_page = MagicMock(parsed_data=[make_user("last-user")])
+    rest_client.mock_gh.rest.issues.list_assignees.side_effect = [
+        first_page, second_page]
+
+    logins = rest_client.list_assignees(TARGET_OWNER, TARGET_REPO)
+
+    assert len(logins) == 101
+    assert logins[-1] == "last-user"
+    rest_client.mock_gh.rest.issues.list_assignees.assert_any_call(
+        owner=TARGET_OWNER, repo=TARGET_REPO, per_page=100, page=2)
+    assert rest_client.mock_gh.rest.issues.list_assignees.call_count == 2
+
+
+def test_list_assignees_api_error(rest_client):
+    """一覧取得時のAPIエラーが適切に処理されることを確認"""
+    rest_client.mock_gh.rest.issues.list_assignees.side_effect = create_mock_request_failed(
+        status_code=403, content=b'{"message":"Forbidden"}')
+
+    with pytest.raises(GitHubAuthenticationError) as excinfo:
+        rest_client.list_assignees(TARGET_OWNER, TARGET_REPO)
+    assert f"listing assignable users for {TARGET_OWNER}/{TARGET_REPO}" in str(
+        excinfo.value)
@@ -1,18 +1,21 @@
 """GitHub API エラーハンドリングユーティリティのテスト"""
 
+import datetime
 import unittest
 import logging
 from typing import Optional, Dict, Any, List
 from unittest.mock import patch, MagicMock
 
 # テスト対象のモジュールをインポート
-from core_logic.adapters.github_utils import github_api_error_handler, _process_graphql_errors
+from core_logic.adapters.github_utils import (
+    github_api_error_handler, _process_graphql_errors, github_api_retry, RetryPolicy, RetryStats
+)
 from core_logic.domain.exceptions import (
     GitHubClientError, GitHubResourceNotFoundError, GitHubAuthenticationError, GitHubRateLimitError, GitHubValidationError
 )
 
 # githubkit の例外クラスをインポート
-from githubkit.exception import RequestFailed, RequestError, RequestTimeout
+from githubkit.exception import RequestFailed, RequestError, RequestTimeout, SecondaryRateLimitExceeded
 
 # GraphQLResponseのインポート
 try:
@@ -236,6 +239,52 @@ class TestGithubApiErrorHandler(unittest.TestCase):
         self.assertEqual(context.exception.original_exception,
                          request_failed_error)
 
+    def test_request_failed_403_secondary_rate_limit(self):
+        """Retry-After 付きの403エラー (セカンダリレート制限) は残量があってもGitHubRateLimitErrorに変換されることを確認"""
+        request_failed_error = self.create_request_failed(
+            status_code=403,
+            content=b'{"message": "You have exceeded a secondary rate limit"}',
+            headers={"X-RateLimit-Remaining": "4000", "retry-after": "30"}
+        )
+
+        @github_api_error_handler()
+        def test_function(self):
+            raise request_failed_error
+
+        with self.assertRaises(GitHubRateLimitError) as context:
+            test_function(self)
+        self.assertEqual(context.exception.status_code, 403)
+        self.assertEqual(context.exception.retry_after, 30.0)
+
+    def test_request_failed_429_rate_limit(self):
+        """429エラーがGitHubRateLimitErrorに変換されることを確認"""
+        request_failed_error = self.create_request_failed(
+            status_code=429, content=b'{"message": "Too Many Requests"}')
+
+        @github_api_error_handler()
+        def test_function(self):
+            raise request_failed_error
+
+        with self.assertRaises(GitHubRateLimitError) as context:
+            test_function(self)
+        self.assertEqual(context.exception.status_code, 429)
+        self.assertIsNone(context.exception.retry_after)
+
+    def test_githubkit_rate_limit_exceeded(self):
+        """githubkit の RateLimitExceeded は、githubkit が算出した待機秒数を持つGitHubRateLimitErrorに変換されることを確認"""
+        rate_limit_error = SecondaryRateLimitExceeded(
+            self.create_mock_response(status_code=403, headers={"X-RateLimit-Remaining": "4000"}),
+            datetime.timedelta(seconds=45))
+
+        @github_api_error_handler()
+        def test_function(self):
+            raise rate_limit_error
+
+        with self.assertRaises(GitHubRateLimitError) as context:
+            test_function(self)
+        self.assertEqual(context.exception.retry_after, 45.0)
+        self.assertIs(context.exception.original_exception, rate_limit_error)
+
     def test_request_failed_404(self):
         """404エラーがGitHubResourceNotFoundErrorに変換されることを確認"""
         # RequestFailed例外を作成
@@ -692,5 +741,154 @@ class TestGithubApiErrorHandler(unittest.TestCase):
             test_function(self)
 
 
+class _RetryTarget:
+    """github_api_retry のテスト用クライアント"""
+
+    def __init__(self, side_effect, retry_policy=None, existing=None):
+        self.call_mock = MagicMock(side_effect=side_effect)
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.existing = existing
+
+    def _find_existing(self, name):
+        return self.existing
+
+    @github_api_retry()
+    def fetch(self, name):
+        return self.call_mock(name)
+
+    @github_api_retry(duplicate_check=_find_existing)
+    def create(self, name):
+        return self.call_mock(name)
+
+    @github_api_retry(rate_limit_only=True)
+    def create_once(self, name):
+        return self.call_mock(name)
+
+
+@patch("core_logic.adapters.github_utils.time.sleep")
+class TestGithubApiRetry(unittest.TestCase):
+    """github_api_retry デコレータのテスト"""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.policy = RetryPolicy(
+            max_attempts=3, base_delay=1.0, max_delay=30.0, jitter=0.0)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_retries_transient_error_then_succeeds(self, mock_sleep):
+        """5xx エラーはバックオフしながらリトライされ、リトライ回数が記録される"""
+        target = _RetryTarget([GitHubClientError("boom", status_code=502),
+                               GitHubClientError("boom", status_code=503),
+                               "ok"], retry_policy=self.policy)
+
+        self.assertEqual(target.fetch("x"), "ok")
+        self.assertEqual(target.call_mock.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1.0, 2.0])
+        self.assertEqual(target.retry_stats.snapshot(), {"fetch": 2})
+
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        """最大試行回数に達した場合は最後の例外を送出する"""
+        error = GitHubRateLimitError("limited", status_code=403)
+        target = _RetryTarget([error] * 5, retry_policy=self.policy)
+
+        with self.assertRaises(GitHubRateLimitError):
+            target.fetch("x")
+        self.assertEqual(target.call_mock.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(target.retry_stats.snapshot(), {"fetch": 2})
+
+    def test_network_error_is_retried(self, mock_sleep):
+        """ステータスコードのないネットワークエラー・タイムアウトはリトライ対象"""
+        timeout = GitHubClientError(
+            "timeout", original_exception=RequestTimeout(MagicMock()))
+        target = _RetryTarget([timeout, "ok"], retry_policy=self.policy)
+
+        self.assertEqual(target.fetch("x"), "ok")
+        self.assertEqual(target.retry_stats.snapshot(), {"fetch": 1})
+
+    def test_non_retryable_errors_are_raised_immediately(self, mock_sleep):
+        """404 や 422 などはリトライせずに送出する"""
+        for error in (GitHubResourceNotFoundError("missing"),
+                      GitHubValidationError("invalid", status_code=422),
+                      GitHubAuthenticationError("denied", status_code=401)):
+            target = _RetryTarget([error], retry_policy=self.policy)
+            with self.assertRaises(type(error)):
+                target.fetch("x")
+            self.assertEqual(target.call_mock.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_no_retry_without_policy(self, mock_sleep):
+        """retry_policy が未設定の場合はリトライしない"""
+        target = _RetryTarget([GitHubClientError("boom", status_code=500)])
+
+        with self.assertRaises(GitHubClientError):
+            target.fetch("x")
+        self.assertEqual(target.call_mock.call_count, 1)
+        self.assertEqual(target.retry_stats.snapshot(), {})
+        mock_sleep.assert_not_called()
+
+    def test_duplicate_check_prevents_recreation(self, mock_sleep):
+        """前回の試行で作成済みだった場合は再作成せずに既存リソースを返す"""
+        target = _RetryTarget([GitHubClientError("boom", status_code=502), "created"],
+                              retry_policy=self.policy, existing="already-created")
+
+        self.assertEqual(target.create("x"), "already-created")
+        self.assertEqual(target.call_mock.call_count, 1)
+        self.assertEqual(target.retry_stats.snapshot(), {"create": 1})
+
+    def test_duplicate_check_not_found_retries_creation(self, mock_sleep):
+        """作成済みでなければ作成をリトライする"""
+        target = _RetryTarget([GitHubClientError("boom", status_code=502), "created"],
+                              retry_policy=self.policy)
+
+        self.assertEqual(target.create("x"), "created")
+        self.assertEqual(target.call_mock.call_count, 2)
+
+    def test_rate_limit_waits_for_retry_after(self, mock_sleep):
+        """レート制限は Retry-After の秒数以上待機してからリトライされる"""
+        target = _RetryTarget([GitHubRateLimitError("limited", status_code=403, retry_after=20.0), "ok"],
+                              retry_policy=self.policy)
+
+        self.assertEqual(target.fetch("x"), "ok")
+        mock_sleep.assert_called_once_with(20.0)
+        self.assertEqual(target.retry_stats.snapshot(), {"fetch": 1})
+
+    def test_rate_limit_beyond_max_retry_after_is_not_retried(self, mock_sleep):
+        """解除まで max_retry_after より長く待つ必要があるレート制限はリトライしない"""
+        target = _RetryTarget([GitHubRateLimitError("limited", status_code=403, retry_after=3600.0)],
+                              retry_policy=self.policy)
+
+        with self.assertRaises(GitHubRateLimitError):
+            target.fetch("x")
+        self.assertEqual(target.call_mock.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_rate_limit_only_retries_rejected_requests(self, mock_sleep):
+        """rate_limit_only の場合、レート制限はリトライし、その他の一時的なエラーはリトライしない"""
+        target = _RetryTarget([GitHubRateLimitError("limited", status_code=403, retry_after=5.0), "created"],
+                              retry_policy=self.policy)
+        self.assertEqual(target.create_once("x"), "created")
+        mock_sleep.assert_called_once_with(5.0)
+
+        target = _RetryTarget([GitHubClientError("boom", status_code=502), "created"],
+                              retry_policy=self.policy)
+        with self.assertRaises(GitHubClientError):
+            target.create_once("x")
+        self.assertEqual(target.call_mock.call_count, 1)
+
+    def test_compute_delay_with_jitter(self, mock_sleep):
+        """待機時間は指数的に増加し、ジッターの範囲内で揺らぎ、上限を超えない"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.5)
+        self.assertEqual(policy.compute_delay(1, rand=lambda: 0.0), 0.5)
+        self.assertEqual(policy.compute_delay(2, rand=lambda: 1.0), 3.0)
+        self.assertEqual(policy.compute_delay(10, rand=lambda: 0.5), 5.0)
+        # Retry-After が指定された場合は少なくともその秒数待機する (max_delay の上限は適用しない)
+        self.assertEqual(policy.compute_delay(1, rand=lambda: 0.5, retry_after=12.0), 12.0)
+        self.assertEqual(policy.compute_delay(3, rand=lambda: 0.5, retry_after=0.5), 4.0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,7 @@
-from core_logic.adapters.issue_file_parser_base import AbstractIssueFileParser, IntermediateParsingResult
+from core_logic.adapters.issue_file_parser_base import (
+    AbstractIssueFileParser, IntermediateParsingResult, TextChunkStream, decode_utf8_chunks, iter_byte_chunks
+)
+from core_logic.domain.exceptions import ParsingError
 import sys
 import os
 import pytest
@@ -24,3 +27,26 @@ def test_dummy_parser_returns_input_as_list():
     result = parser.parse(content)
     assert isinstance(result, list)
     assert result == [content]
+
+
+def test_default_iter_blocks_joins_chunks():
+    assert list(DummyParser().iter_blocks(["a", "b"])) == ["ab"]
+
+
+def test_decode_utf8_chunks_handles_split_multibyte_characters():
+    data = "日本語のIssue".encode("utf-8")
+    chunks = list(iter_byte_chunks(data, chunk_size=2))
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert "".join(decode_utf8_chunks(chunks)) == "日本語のIssue"
+
+
+def test_decode_utf8_chunks_invalid_bytes_raise_parsing_error():
+    with pytest.raises(ParsingError):
+        list(decode_utf8_chunks([b"ok", b"\xff\xfe"]))
+
+
+def test_text_chunk_stream_reads_across_chunks():
+    stream = TextChunkStream(iter(["ab", "cde", "f"]))
+    assert stream.read(4) == "abcd"
+    assert stream.read() == "ef"
+    assert stream.read(1) == ""
@@ -32,3 +32,24 @@ def test_parse_ignores_leading_and_trailing_delimiters():
     result = parser.parse(content)
     assert len(result) == 2
     assert all(block.strip().startswith("# Issue") for block in result)
+
+
+def test_iter_blocks_matches_parse_for_any_chunking():
+    content = "---\n# Issue 1\nDesc\n---\n\n---\n# Issue 2\n日本語\n--- \n# still 2\n---"
+    parser = MarkdownIssueParser()
+    for size in (1, 2, 5, 1024):
+        chunks = [content[i:i + size] for i in range(0, len(content), size)]
+        assert list(parser.iter_blocks(chunks)) == parser.parse(content)
+
+
+def test_iter_blocks_yields_each_block_as_soon_as_delimiter_is_read():
+    read = []
+
+    def chunks():
+        for chunk in ["# Issue 1\n", "---\n", "# Issue 2\n", "---\n", "# Issue 3"]:
+            read.append(chunk)
+            yield chunk
+    blocks = MarkdownIssueParser().iter_blocks(chunks())
+    assert next(blocks) == "# Issue 1"
+    assert len(read) == 2
+    assert list(blocks) == ["# Issue 2", "# Issue 3"]
@@ -0,0 +1,184 @@
+# tests/adapters/test_parse_result_cache.py
+
+import json
+
+import pytest
+
+from core_logic.adapters.parse_result_cache import (
+    ParseResultCache, create_parse_result_cache, create_inferred_rules_cache,
+    document_shape_fingerprint, normalize_parse_input
+)
+from core_logic.domain.models import ParsedRequirementData, IssueData, AISuggestedRules
+from core_logic.infrastructure.config import AiSettings
+
+
+def make_result(title: str) -> ParsedRequirementData:
+    return ParsedRequirementData(issues=[IssueData(title=title, description="desc")])
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_normalize_parse_input():
+    """改行コード・行末空白・前後の空行の違いを吸収すること"""
+    assert normalize_parse_input("a  \r\nb\r\n\n") == "a\nb"
+    assert normalize_parse_input("\n a\n") == " a"
+
+
+def test_make_key_depends_on_all_components():
+    base = ParseResultCache.make_key("input", "openai:gpt-4o", "prompt")
+    assert base == ParseResultCache.make_key(
+        "input \r\n", "openai:gpt-4o", "prompt")
+    assert base != ParseResultCache.make_key(
+        "other", "openai:gpt-4o", "prompt")
+    assert base != ParseResultCache.make_key(
+        "input", "gemini:gemini-1.5-flash", "prompt")
+    assert base != ParseResultCache.make_key(
+        "input", "openai:gpt-4o", "prompt v2")
+
+
+def test_get_and_put_in_memory():
+    cache = ParseResultCache()
+    assert cache.get("k") is None
+
+    cache.put("k", make_result("A"))
+    cached = cache.get("k")
+    assert cached.issues[0].title == "A"
+
+    # 返されたオブジェクトを変更してもキャッシュには影響しない
+    cached.issues[0].title = "changed"
+    assert cache.get("k").issues[0].title == "A"
+    assert cache.stats() == {"hits": 2, "misses": 1,
+                             "evictions": 0, "entries": 1}
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = ParseResultCache(ttl=60, clock=clock)
+    cache.put("k", make_result("A"))
+
+    clock.now += 60
+    assert cache.get("k") is not None
+    clock.now += 1
+    assert cache.get("k") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_size_eviction_is_least_recently_used():
+    cache = ParseResultCache(max_entries=2)
+    cache.put("a", make_result("A"))
+    cache.put("b", make_result("B"))
+    cache.get("a")  # a を最近使用したものにする
+    cache.put("c", make_result("C"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_persists_across_instances(tmp_path):
+    """ディレクトリを指定した場合、別インスタンス (再起動後) でも結果を再利用できること"""
+    ParseResultCache(directory=tmp_path).put("k", make_result("A"))
+
+    reloaded = ParseResultCache(directory=tmp_path)
+    assert reloaded.get("k").issues[0].title == "A"
+    assert [p.name for p in tmp_path.iterdir()] == ["k.json"]
+
+
+def test_reload_discards_expired_and_corrupt_files(tmp_path):
+    clock = FakeClock()
+    ParseResultCache(directory=tmp_path, ttl=60,
+                     clock=clock).put("old", make_result("A"))
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+    (tmp_path / "invalid.json").write_text(
+        json.dumps({"created_at": clock.now, "result": {"issues": "x"}}), encoding="utf-8")
+
+    clock.now += 120
+    reloaded = ParseResultCache(directory=tmp_path, ttl=60, clock=clock)
+
+    assert reloaded.stats()["entries"] == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_eviction_removes_files(tmp_path):
+    cache = ParseResultCache(directory=tmp_path, max_entries=1)
+    cache.put("a", make_result("A"))
+    cache.put("b", make_result("B"))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.json"]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="max_entries must be at least 1"):
+        ParseResultCache(max_entries=0)
+    with pytest.raises(ValueError, match="ttl must not be negative"):
+        ParseResultCache(ttl=-1)
+
+
+def test_create_parse_result_cache_from_settings(tmp_path):
+    assert create_parse_result_cache(
+        AiSettings(parse_cache_enabled=False)) is None
+
+    cache = create_parse_result_cache(AiSettings(
+        parse_cache_dir=str(tmp_path / "cache"), parse_cache_max_entries=5, parse_cache_ttl=10))
+    assert cache.directory == tmp_path / "cache"
+    assert cache.max_entries == 5
+    assert cache.ttl == 10
+
+
+def test_parse_result_cache_persists_to_user_cache_dir_by_default(tmp_path, monkeypatch):
+    """parse_cache_dir 未指定でもディレクトリに保存し、CLIの次回実行で再利用されること"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = create_parse_result_cache(AiSettings())
+    assert cache.directory == tmp_path / "github-auto-setup" / "parse_results"
+    assert create_inferred_rules_cache(AiSettings()).directory == cache.directory / "rules"
+
+    data = make_result("A")
+    cache.put("k", data)
+    assert create_parse_result_cache(AiSettings()).get("k") == data
+
+    assert create_parse_result_cache(
+        AiSettings(parse_cache_persist=False)).directory is None
+
+
+def test_parse_result_cache_falls_back_to_memory_when_dir_is_unusable(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    cache = create_parse_result_cache(AiSettings(parse_cache_dir=str(blocker / "cache")))
+    assert cache is not None
+    assert cache.directory is None
+
+
+def test_document_shape_fingerprint_ignores_content():
+    """見出し・キー構成が同じ文書は内容や件数が異なっても同じフィンガープリントになること"""
+    one = "# Backlog\n---\n**Title:** A\n**Description:** x\n- task"
+    two = "# Other\n---\n**Title:** B\n**Description:** y\n---\n**Title:** C\n**Description:** z"
+    assert document_shape_fingerprint(one) == document_shape_fingerprint(two)
+    assert document_shape_fingerprint(one) != document_shape_fingerprint(
+        "# Backlog\n---\n**件名:** A")
+    assert document_shape_fingerprint(one) != document_shape_fingerprint(
+        "## Backlog\n---\n**Title:** A\n**Description:** x")
+    # YAML/JSON のキーも構造として扱う
+    assert document_shape_fingerprint("- title: A\n  labels: x") == \
+        document_shape_fingerprint("- title: B\n  labels: y\n- title: C")
+    assert document_shape_fingerprint('[{"title": "A"}]') != \
+        document_shape_fingerprint('[{"name": "A"}]')
+
+
+def test_inferred_rules_cache_persists_rules(tmp_path):
+    settings = AiSettings(parse_cache_dir=str(tmp_path / "cache"))
+    rules = AISuggestedRules(separator_rule={"separator_pattern": "---"},
+                             key_mapping_rule={"Title": "title"}, confidence=1.0)
+    cache = create_inferred_rules_cache(settings)
+    cache.put("k", rules)
+
+    reloaded = create_inferred_rules_cache(settings)
+    assert reloaded.get("k") == rules
+    assert create_inferred_rules_cache(
+        AiSettings(rules_cache_enabled=False)) is None
@@ -0,0 +1,127 @@
+import json
+import time
+
+import pytest
+import yaml
+from unittest import mock
+
+from core_logic.adapters.ai_parser import AIParser
+from core_logic.adapters.replay_llm import ReplayChatModel, load_replay_responses
+from core_logic.domain.exceptions import AiParserError
+from core_logic.domain.models import ParsedRequirementData
+from core_logic.infrastructure.config import AiSettings, ReplayModelSettings, Settings
+from core_logic.services.parse_issue_file_service import ParseIssueFileService
+
+RECORDED = {"issues": [{"title": "Recorded 1", "description": "d1"},
+                       {"title": "Recorded 2", "description": "d2", "labels": ["bug"]}]}
+
+
+@pytest.fixture
+def replay_settings():
+    settings = mock.MagicMock(spec=Settings)
+    settings.ai_model = "replay"
+    settings.prompt_template = "Parse this:\n{markdown_text}"
+    settings.ai = AiSettings(
+        prompt_template="Parse this:\n{markdown_text}",
+        separator_rule_prompt_template="Separator rule for {markdown_text}",
+        key_mapping_rule_prompt_template="Key mapping rule for {markdown_text}")
+    return settings
+
+
+def test_load_replay_responses_accepts_supported_shapes(tmp_path):
+    single = tmp_path / "single.json"
+    single.write_text(json.dumps(RECORDED), encoding="utf-8")
+    many = tmp_path / "many.yml"
+    many.write_text(yaml.safe_dump([RECORDED, {"issues": []}]), encoding="utf-8")
+    issues_only = tmp_path / "issues.yaml"
+    issues_only.write_text(yaml.safe_dump(RECORDED["issues"]), encoding="utf-8")
+
+    assert [len(r.issues) for r in load_replay_responses(single)] == [2]
+    assert [len(r.issues) for r in load_replay_responses(many)] == [2, 0]
+    assert [i.title for i in load_replay_responses(issues_only)[0].issues] == ["Recorded 1", "Recorded 2"]
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text('"text"', encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_replay_responses(invalid)
+
+
+def test_structured_output_replays_recorded_responses_in_order():
+    model = ReplayChatModel(responses=[ParsedRequirementData.model_validate(RECORDED),
+                                       ParsedRequirementData(issues=[])],
+                            prompt_tokens=100, completion_tokens=20)
+    runnable = model.with_structured_output(ParsedRequirementData)
+
+    first = runnable.invoke("input")
+    second = runnable.invoke("input")
+    third = runnable.invoke("input")
+
+    assert [i.title for i in first.issues] == ["Recorded 1", "Recorded 2"]
+    assert second.issues == []
+    assert [i.title for i in third.issues] == ["Recorded 1", "Recorded 2"]
+    # 繰り返し返しても temp_id は重複しない
+    assert first.issues[0].temp_id != third.issues[0].temp_id
+    assert model.stats() == {"calls": 3, "prompt_tokens": 300, "completion_tokens": 60}
+
+
+def test_structured_output_synthesizes_issues_from_title_lines():
+    model = ReplayChatModel()
+    runnable = model.with_structured_output(ParsedRequirementData)
+
+    result = runnable.invoke("# Setup CI\nbody\n---\n**Title:** Add docs\n- title: From YAML")
+
+    assert [i.title for i in result.issues] == ["Setup CI", "Add docs", "From YAML"]
+    assert len(ReplayChatModel(synthetic_issues=5).with_structured_output(
+        ParsedRequirementData).invoke("no titles").issues) == 5
+    with pytest.raises(NotImplementedError):
+        model.with_structured_output(dict)
+
+
+def test_latency_is_applied_per_call():
+    model = ReplayChatModel(latency=0.05, synthetic_issues=1)
+    started = time.perf_counter()
+    model.with_structured_output(ParsedRequirementData).invoke("text")
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_invoke_returns_rules_json_with_usage_metadata():
+    model = ReplayChatModel(completion_tokens=7)
+
+    message = model.invoke("Infer the separator rule")
+
+    assert json.loads(message.content) == {
+        "separator_pattern": "---", "key_mapping": {"title": "title", "description": "description"}}
+    assert message.usage_metadata["output_tokens"] == 7
+    assert message.usage_metadata["input_tokens"] > 0
+
+
+def test_ai_parser_with_replay_model_parses_streams_and_infers_rules(replay_settings):
+    parser = AIParser(replay_settings)
+
+    result = parser.parse("# First\n---\n# Second")
+    streamed = list(parser.parse_stream("# First\n---\n# Second"))
+    rules = parser.infer_rules("# First")
+
+    assert isinstance(parser.llm, ReplayChatModel)
+    assert [i.title for i in result.issues] == ["First", "Second"]
+    assert [i.title for i in streamed] == ["First", "Second"]
+    assert rules.separator_rule == {"separator_pattern": "---"}
+    assert rules.key_mapping_rule == {"title": "title", "description": "description"}
+    assert rules.errors == []
+    assert parser._model_identifier() == "replay:synthetic"
+
+
+def test_parse_issue_file_service_with_recorded_responses(replay_settings, tmp_path):
+    path = tmp_path / "recorded.json"
+    path.write_text(json.dumps(RECORDED), encoding="utf-8")
+    replay_settings.ai.replay = ReplayModelSettings(responses_path=str(path))
+    service = ParseIssueFileService(AIParser(replay_settings))
+
+    result = service.parse("requirements.md", b"# Anything\nbody")
+
+    assert [i.title for i in result.issues] == ["Recorded 1", "Recorded 2"]
+
+
+def test_ai_parser_reports_missing_responses_file(replay_settings, tmp_path):
+    replay_settings.ai.replay = ReplayModelSettings(responses_path=str(tmp_path / "missing.json"))
+    with pytest.raises(AiParserError, match="Configuration error for 'replay'"):
+        AIParser(replay_settings)
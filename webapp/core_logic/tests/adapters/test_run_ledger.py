@@ -0,0 +1,85 @@
+import pytest
+
+from core_logic.adapters.run_ledger import (
+    RunLedger, create_run_ledger, issue_fingerprint, KIND_ISSUE, KIND_LABEL, KIND_MILESTONE
+)
+from core_logic.domain.models import IssueData
+from core_logic.infrastructure.config import GitHubSettings
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_issue_fingerprint_ignores_temp_id():
+    """temp_id は解析ごとに変わるため、フィンガープリントには含めない"""
+    first = IssueData(title="Issue", description="Body", labels=["bug"])
+    second = IssueData(title="Issue", description="Body", labels=["bug"])
+    assert first.temp_id != second.temp_id
+    assert issue_fingerprint(first) == issue_fingerprint(second)
+
+
+def test_issue_fingerprint_changes_with_content():
+    base = IssueData(title="Issue", description="Body")
+    assert issue_fingerprint(base) != issue_fingerprint(
+        IssueData(title="Issue", description="Other body"))
+    assert issue_fingerprint(base) != issue_fingerprint(
+        IssueData(title="Issue", description="Body", milestone="Sprint 1"))
+
+
+def test_record_and_read_entries_per_run():
+    """記録は実行IDと種類ごとに分かれる"""
+    ledger = RunLedger()
+    run = ledger.run("run-1")
+    run.record(KIND_LABEL, "bug")
+    run.record(KIND_MILESTONE, "Sprint 1", 3)
+    run.record(KIND_ISSUE, "abc", {"url": "https://github.com/o/r/issues/1", "node_id": "I_1"})
+
+    assert run.get(KIND_MILESTONE, "Sprint 1") == 3
+    assert run.get(KIND_LABEL, "missing") is None
+    assert run.entries(KIND_LABEL) == {"bug": True}
+    assert run.entries(KIND_ISSUE)["abc"]["node_id"] == "I_1"
+    assert ledger.run("run-2").entries(KIND_LABEL) == {}
+
+
+def test_entries_persist_across_instances(tmp_path):
+    """ファイルに保存した記録は別のインスタンス (再起動後のプロセス) から読み込める"""
+    path = tmp_path / "ledger" / "runs.sqlite3"
+    ledger = RunLedger(path)
+    ledger.run("run-1").record(KIND_MILESTONE, "Sprint 1", 7)
+    ledger.close()
+
+    reopened = RunLedger(path)
+    assert reopened.run("run-1").get(KIND_MILESTONE, "Sprint 1") == 7
+    reopened.close()
+
+
+def test_delete_run_and_prune():
+    clock = FakeClock()
+    ledger = RunLedger(clock=clock)
+    ledger.run("old").record(KIND_LABEL, "bug")
+    clock.now += 100
+    ledger.run("recent").record(KIND_LABEL, "bug")
+    ledger.run("recent").record(KIND_LABEL, "feature")
+
+    assert ledger.prune(older_than=50) == 1
+    assert ledger.run("old").entries(KIND_LABEL) == {}
+    assert ledger.delete_run("recent") == 2
+    assert ledger.run("recent").entries(KIND_LABEL) == {}
+
+
+def test_run_requires_id():
+    with pytest.raises(ValueError):
+        RunLedger().run("")
+
+
+def test_create_run_ledger_from_settings(tmp_path):
+    assert create_run_ledger(GitHubSettings()) is None
+    ledger = create_run_ledger(GitHubSettings(
+        run_ledger_path=str(tmp_path / "runs.sqlite3")))
+    assert isinstance(ledger, RunLedger)
+    ledger.close()
@@ -92,3 +92,57 @@ def test_json_issues_key_value_not_a_list_logs_warning_and_returns_empty(caplog)
         result = parser.parse(content)
     assert result == []
     assert "Key 'data_points' found in JSON but its value is not a list (type: dict). Returning empty list." in caplog.text
+
+
+def split_into_chunks(content, size):
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+@pytest.mark.parametrize("content", [
+    "- title: A\n  tasks: [x, y]\n- title: 日本語\n",
+    "meta: {owner: a}\nissues:\n  - &base {title: A}\n  - *base\nfooter: 1\n",
+    "issues: not a list\n",
+    "",
+])
+def test_yaml_iter_blocks_matches_parse_for_any_chunking(content):
+    parser = YamlIssueParser()
+    for size in (1, 3, 1024):
+        assert list(parser.iter_blocks(split_into_chunks(content, size))) == parser.parse(content)
+
+
+@pytest.mark.parametrize("content", [
+    '[{"title": "A", "n": 12345}, {"title": "日本語"}]',
+    '{"meta": {"x": [1, 2]}, "issues": [{"title": "A"}], "count": 1}',
+    '{"issues": 5}',
+    '{}',
+    '',
+])
+def test_json_iter_blocks_matches_parse_for_any_chunking(content):
+    parser = JsonIssueParser()
+    for size in (1, 3, 1024):
+        assert list(parser.iter_blocks(split_into_chunks(content, size))) == parser.parse(content)
+
+
+def test_json_iter_blocks_yields_before_reading_whole_file():
+    """配列の要素は、後続のチャンクを読み込む前に返される"""
+    read = []
+
+    def chunks():
+        for chunk in ['[{"title": "A"},', ' {"title": "B"}', ']']:
+            read.append(chunk)
+            yield chunk
+    blocks = JsonIssueParser().iter_blocks(chunks())
+    assert next(blocks) == {"title": "A"}
+    assert len(read) == 1
+    assert list(blocks) == [{"title": "B"}]
+
+
+@pytest.mark.parametrize("parser, content", [
+    (JsonIssueParser(), '[{"title": "A"}, {"title": '),
+    (JsonIssueParser(), '[1] [2]'),
+    (YamlIssueParser(), "- title: A\n- title: [B\n"),
+    (YamlIssueParser(), "- 1\n---\n- 2\n"),
+])
+def test_iter_blocks_invalid_content_raises_parsing_error(parser, content):
+    with pytest.raises(ParsingError):
+        list(parser.iter_blocks(split_into_chunks(content, 4)))
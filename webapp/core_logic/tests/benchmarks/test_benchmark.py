@@ -0,0 +1,131 @@
+import json
+
+import pytest
+import yaml
+
+from core_logic.adapters.github_client_registry import KeepAliveTransport
+from core_logic.adapters.github_graphql_client import GitHubGraphQLClient
+from core_logic.adapters.github_request_scheduler import GitHubRequestScheduler, create_github_instance
+from core_logic.adapters.github_rest_client import GitHubRestClient
+from core_logic.benchmarks.fake_github_server import FakeGitHubConfig, FakeGitHubServer
+from core_logic.benchmarks.run_benchmark import (
+    BenchmarkConfig, BenchmarkResult, format_result, percentile, run_benchmark
+)
+from core_logic.benchmarks.synthetic_requirements import generate_requirements, write_requirements_file
+from core_logic.domain.exceptions import GitHubClientError
+
+
+@pytest.fixture
+def fake_server():
+    with FakeGitHubServer(FakeGitHubConfig()) as server:
+        yield server
+
+
+@pytest.fixture
+def clients(fake_server):
+    transport = KeepAliveTransport()
+    github = create_github_instance("test-token", GitHubRequestScheduler(), auto_retry=False,
+                                    transport=transport, base_url=fake_server.url)
+    yield GitHubRestClient(github), GitHubGraphQLClient(github)
+    transport.shutdown()
+
+
+def test_fake_server_serves_rest_and_graphql_clients(fake_server, clients):
+    rest_client, graphql_client = clients
+
+    repo = rest_client.create_repository("bench-repo")
+    assert repo.full_name == "bench-user/bench-repo"
+    assert rest_client.create_label("bench-user", "bench-repo", "bug").name == "bug"
+    with pytest.raises(GitHubClientError):
+        rest_client.create_label("bench-user", "bench-repo", "bug")
+    milestone_id = rest_client.create_milestone("bench-user", "bench-repo", "v1").number
+    issue = rest_client.create_issue(
+        owner="bench-user", repo="bench-repo", title="Hello", labels=["bug"], milestone=milestone_id)
+
+    snapshot = graphql_client.get_repository_snapshot("bench-user", "bench-repo")
+    assert snapshot.label_names == ["bug"]
+    assert snapshot.milestones == {"v1": milestone_id}
+    assert snapshot.open_issue_titles == ["Hello"]
+    project_id = graphql_client.find_project_v2_node_id("bench-user", "Benchmark Board")
+    assert project_id is not None
+    assert graphql_client.add_item_to_project_v2(project_id, issue.node_id) is not None
+
+    with pytest.raises(GitHubClientError):
+        rest_client.create_repository("bench-repo")
+    assert fake_server.stats()["requests_by_route"]["POST create_label"] == 2
+
+
+def test_fake_server_rejects_requests_over_rate_limit():
+    with FakeGitHubServer(FakeGitHubConfig(rate_limit=1)) as server:
+        github = create_github_instance("test-token", auto_retry=False, base_url=server.url)
+        client = GitHubRestClient(github)
+        client.get_authenticated_user()
+        with pytest.raises(GitHubClientError):
+            client.get_authenticated_user()
+        assert server.stats()["rate_limited"] == 1
+
+
+def test_generate_requirements_is_deterministic():
+    data = generate_requirements(20, labels=5, milestones=3, assignees=["alice"], seed=7)
+
+    assert len(data.issues) == 20
+    again = generate_requirements(20, labels=5, milestones=3, assignees=["alice"], seed=7)
+    assert [issue.model_dump(exclude={"temp_id"}) for issue in data.issues] == [
+        issue.model_dump(exclude={"temp_id"}) for issue in again.issues]
+    assert {label for issue in data.issues for label in issue.labels} == {
+        f"label-{i:03d}" for i in range(1, 6)}
+    assert {issue.milestone for issue in data.issues} == {
+        "Milestone 001", "Milestone 002", "Milestone 003"}
+    assert all(issue.assignees == ["@alice"] for issue in data.issues)
+    assert generate_requirements(3).issues[0].labels is None
+    with pytest.raises(ValueError):
+        generate_requirements(-1)
+
+
+def test_write_requirements_file(tmp_path):
+    data = generate_requirements(2, labels=1, milestones=1)
+
+    yaml_issues = yaml.safe_load(write_requirements_file(data, tmp_path / "req.yml").read_text(encoding="utf-8"))
+    json_issues = json.loads(write_requirements_file(data, tmp_path / "req.json").read_text(encoding="utf-8"))
+
+    assert yaml_issues == json_issues
+    assert yaml_issues[0]["title"] == "Synthetic issue 00001"
+    with pytest.raises(ValueError):
+        write_requirements_file(data, tmp_path / "req.txt")
+
+
+def test_percentile():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.95) == 4.0
+
+
+def test_run_benchmark_reports_throughput_and_api_calls():
+    config = BenchmarkConfig(runs=2, issues=5, labels=3, milestones=2, assignees=1)
+
+    result = run_benchmark(config)
+
+    assert result.runs == 2
+    assert result.failed_runs == 0
+    assert result.failed_issues == 0
+    assert result.runs_per_second > 0
+    assert result.p95_run_seconds >= result.p50_run_seconds > 0
+    assert list(result.step_seconds) == [
+        "repository", "labels", "milestones", "project", "issues", "project_items"]
+    assert result.api_calls_per_run > 0
+    assert result.http_requests_per_run >= result.api_calls_per_run
+    assert result.requests_by_route["POST create_issue"] == 10
+    assert {row.operation for row in result.operations} >= {"create_repository", "create_issue"}
+    # JSON で保存した結果をベースラインとして比較できる
+    baseline = BenchmarkResult.model_validate_json(result.model_dump_json())
+    assert "vs baseline" in "\n".join(format_result(result, baseline))
+
+
+def test_run_benchmark_with_injected_failures_counts_retries():
+    config = BenchmarkConfig(runs=2, issues=10, labels=5, milestones=2, retry_base_delay=0.0,
+                             server=FakeGitHubConfig(failure_rate=0.2, seed=3))
+
+    result = run_benchmark(config)
+
+    assert result.injected_failures > 0
+    assert result.retries > 0
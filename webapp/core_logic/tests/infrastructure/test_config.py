@@ -8,7 +8,7 @@ from unittest import mock
 from pydantic import SecretStr
 
 from core_logic.infrastructure.config import (
-    load_settings, Settings, YamlConfigSettingsSource
+    load_settings, get_settings, clear_settings_cache, Settings, YamlConfigSettingsSource
 )
 
 
@@ -158,6 +158,28 @@ def test_final_values_env_override(temp_yaml_file):
             f"Settings final_gemini_model_name: {settings.final_gemini_model_name}")
 
 
+def test_github_settings_loaded_from_yaml(temp_yaml_file):
+    """YAMLのgithubセクションから並行数・レート制限・リトライ設定が読み込まれ、未指定時はデフォルト値になること"""
+    with open(temp_yaml_file, 'w') as f:
+        yaml.dump({"github": {"max_workers": 8, "rate_limit_reserve": 100,
+                              "retry_max_attempts": 5, "retry_base_delay": 0.5}}, f)
+
+    with mock.patch.dict(os.environ, {"GITHUB_PAT": "test_pat"}):
+        settings = load_settings(config_file=temp_yaml_file)
+        assert settings.github.max_workers == 8
+        assert settings.github.rate_limit_reserve == 100
+        assert settings.github.retry_max_attempts == 5
+        assert settings.github.retry_base_delay == 0.5
+
+        default_settings = load_settings(
+            config_file=Path("/non/existent/file.yaml"))
+        assert default_settings.github.max_workers == 1
+        assert default_settings.github.rate_limit_reserve == 50
+        assert default_settings.github.retry_max_attempts == 3
+        assert default_settings.github.retry_jitter == 0.5
+        assert default_settings.github.assignee_cache_ttl == 600.0
+
+
 def test_log_level_validation(temp_yaml_file, caplog):
     """無効なログレベルの場合、デフォルトのINFOが返されること"""
     # YAMLファイルを書き込む
@@ -211,3 +233,24 @@ def test_load_settings_github_pat_empty():
         with pytest.raises(ValueError) as exc_info:
             load_settings(config_file=Path("/non/existent/file.yaml"))
         assert "GITHUB_PAT cannot be empty." in str(exc_info.value)
+
+
+def test_get_settings_caches_until_file_or_env_changes(temp_yaml_file):
+    """get_settings は設定ファイル・環境変数が変わらない限り読み込み結果を再利用すること"""
+    clear_settings_cache()
+    with mock.patch.dict(os.environ, {"GITHUB_PAT": "test_pat"}), \
+            mock.patch("core_logic.infrastructure.config.load_settings", wraps=load_settings) as spy:
+        first = get_settings(config_file=temp_yaml_file)
+        assert get_settings(config_file=temp_yaml_file) is first
+        assert spy.call_count == 1
+
+        with open(temp_yaml_file, 'w') as f:
+            yaml.dump({"github": {"max_workers": 6}}, f)
+        os.utime(temp_yaml_file, ns=(0, 10**18))
+        reloaded = get_settings(config_file=temp_yaml_file)
+        assert reloaded.github.max_workers == 6
+
+        os.environ["GITHUB_PAT"] = "other_pat"
+        assert get_settings(config_file=temp_yaml_file).github_pat.get_secret_value() == "other_pat"
+        assert spy.call_count == 3
+    clear_settings_cache()
@@ -0,0 +1,280 @@
+"""
+ParseIssueFileService 単体テスト
+"""
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+from core_logic.adapters.ai_parser import AIParser
+from core_logic.domain.exceptions import AiParserError, ParsingError
+from core_logic.domain.models import IssueData, ParsedRequirementData, ParseReport
+from core_logic.services.parse_issue_file_service import (
+    ParseIssueFileService, estimate_tokens
+)
+
+MARKDOWN = "\n".join(
+    f"---\n**Title:** Issue {i}\n**Description:** body {i}" for i in range(6)).encode("utf-8")
+
+
+@pytest.fixture
+def mock_ai_parser():
+    """入力テキストに含まれる 'Issue N' ごとに IssueData を返す AIParser のモック"""
+    parser = MagicMock(spec=AIParser)
+
+    def parse(text):
+        titles = [f"Issue {i}" for i in range(6) if f"Issue {i}" in text]
+        return ParsedRequirementData(issues=[IssueData(title=t, description="d") for t in titles])
+    parser.parse.side_effect = parse
+    return parser
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("日本語") == 3
+    assert estimate_tokens("") == 0
+
+
+def test_parse_without_chunking_makes_single_call(mock_ai_parser):
+    """既定ではファイル全体を1回で解析する"""
+    service = ParseIssueFileService(mock_ai_parser)
+
+    result = service.parse("backlog.md", MARKDOWN)
+
+    assert [i.title for i in result.issues] == [f"Issue {i}" for i in range(6)]
+    mock_ai_parser.parse.assert_called_once()
+    assert "\n---\n" in mock_ai_parser.parse.call_args.args[0]
+
+
+def test_parse_chunked_keeps_order_and_respects_budget(mock_ai_parser):
+    """トークン上限ごとにチャンク化し、結果をチャンク順に結合する"""
+    service = ParseIssueFileService(
+        mock_ai_parser, chunk_token_budget=25, max_parallel_chunks=3)
+
+    report = service.parse_with_report("backlog.md", MARKDOWN)
+
+    assert [i.title for i in report.data.issues] == [
+        f"Issue {i}" for i in range(6)]
+    assert report.chunk_count == mock_ai_parser.parse.call_count > 1
+    assert report.failed_chunks == []
+    for call in mock_ai_parser.parse.call_args_list:
+        assert estimate_tokens(call.args[0]) <= 25
+
+
+def test_parse_chunked_runs_concurrently(mock_ai_parser):
+    """チャンクは max_parallel_chunks まで並行に解析される"""
+    barrier = threading.Barrier(2, timeout=5)
+    original = mock_ai_parser.parse.side_effect
+
+    def parse(text):
+        barrier.wait()  # 2チャンクが同時に実行されないとタイムアウトする
+        return original(text)
+    mock_ai_parser.parse.side_effect = parse
+    service = ParseIssueFileService(
+        mock_ai_parser, chunk_token_budget=60, max_parallel_chunks=2)
+
+    report = service.parse_with_report("backlog.md", MARKDOWN)
+
+    assert report.chunk_count == 2
+    assert len(report.data.issues) == 6
+
+
+def test_parse_chunked_reports_failed_chunks(mock_ai_parser):
+    """失敗したチャンクは報告され、他のチャンクの結果は返される"""
+    original = mock_ai_parser.parse.side_effect
+
+    def parse(text):
+        if "Issue 0" in text:
+            raise AiParserError("output token limit exceeded")
+        return original(text)
+    mock_ai_parser.parse.side_effect = parse
+    service = ParseIssueFileService(mock_ai_parser, chunk_token_budget=25)
+
+    report = service.parse_with_report("backlog.md", MARKDOWN)
+
+    assert len(report.failed_chunks) == 1
+    failure = report.failed_chunks[0]
+    assert (failure.chunk_index, failure.first_block) == (0, 0)
+    assert "output token limit exceeded" in failure.error
+    titles = [i.title for i in report.data.issues]
+    assert "Issue 0" not in titles and "Issue 5" in titles
+
+
+def test_parse_chunked_all_chunks_fail(mock_ai_parser):
+    mock_ai_parser.parse.side_effect = AiParserError("down")
+    service = ParseIssueFileService(mock_ai_parser, chunk_token_budget=25)
+
+    with pytest.raises(AiParserError, match="chunk\\(s\\) failed to parse: down"):
+        service.parse("backlog.md", MARKDOWN)
+
+
+def test_parse_chunked_yaml_blocks_are_serialized_per_chunk(mock_ai_parser):
+    """YAMLのブロックはチャンクごとにYAMLのリストとして渡される"""
+    content = yaml.dump([{"title": f"Issue {i}", "description": "d"} for i in range(4)]).encode("utf-8")
+    service = ParseIssueFileService(
+        mock_ai_parser, chunk_token_budget=10, rule_based_fast_path=False)
+
+    report = service.parse_with_report("backlog.yaml", content)
+
+    assert [i.title for i in report.data.issues] == [
+        f"Issue {i}" for i in range(4)]
+    for call in mock_ai_parser.parse.call_args_list:
+        assert isinstance(yaml.safe_load(call.args[0]), list)
+
+
+def test_structured_fast_path_skips_ai(mock_ai_parser):
+    """キーがIssueのフィールドと一致するYAML/JSONはAIを呼ばずにマッピングする"""
+    blocks = [{"title": "Issue 0", "description": "d", "tasks": "a\nb", "labels": "bug, ui"},
+              {"title": "Issue 1", "body": "本文", "assignees": ["alice"]}]
+    service = ParseIssueFileService(mock_ai_parser)
+
+    for name, content in [("backlog.yaml", yaml.dump(blocks, allow_unicode=True)),
+                          ("backlog.json", json.dumps(blocks, ensure_ascii=False))]:
+        report = service.parse_with_report(name, content.encode("utf-8"))
+        issues = report.data.issues
+        assert [i.title for i in issues] == ["Issue 0", "Issue 1"]
+        assert issues[0].tasks == ["a", "b"]
+        assert issues[0].labels == ["bug", "ui"]
+        assert issues[1].description == "本文"
+        assert issues[1].assignees == ["alice"]
+        assert report.rule_based_count == 2
+    mock_ai_parser.parse.assert_not_called()
+
+
+def test_structured_fast_path_falls_back_for_unknown_blocks(mock_ai_parser):
+    """マッピングできないブロックのみAIで解析し、ファイル内の順序を保つ"""
+    blocks = [{"title": "Issue 0", "description": "d"},
+              {"件名": "Issue 1", "内容": "d"},
+              {"件名": "Issue 2"},
+              {"title": "Issue 3", "description": "d"},
+              {"description": "タイトルなし Issue 4"}]
+    service = ParseIssueFileService(mock_ai_parser)
+
+    report = service.parse_with_report(
+        "backlog.yaml", yaml.dump(blocks, allow_unicode=True).encode("utf-8"))
+
+    assert [i.title for i in report.data.issues] == [
+        f"Issue {i}" for i in range(5)]
+    assert report.rule_based_count == 2
+    # 連続するフォールバックブロックはまとめて1回で解析する
+    assert mock_ai_parser.parse.call_count == 2
+    assert "Issue 1" in mock_ai_parser.parse.call_args_list[0].args[0]
+    assert "Issue 2" in mock_ai_parser.parse.call_args_list[0].args[0]
+
+
+def test_structured_fast_path_uses_key_mapping(mock_ai_parser):
+    blocks = [{"件名": "Issue 0", "説明": "d", "ラベル": "a,b"}]
+    service = ParseIssueFileService(mock_ai_parser, key_mapping={
+        "title": "件名", "description": "説明", "labels": "ラベル"})
+
+    result = service.parse(
+        "backlog.json", json.dumps(blocks, ensure_ascii=False).encode("utf-8"))
+
+    assert result.issues[0].title == "Issue 0"
+    assert result.issues[0].labels == ["a", "b"]
+    mock_ai_parser.parse.assert_not_called()
+
+
+def test_structured_fast_path_keeps_partial_results_on_ai_failure(mock_ai_parser):
+    blocks = [{"title": "Issue 0", "description": "d"}, {"件名": "Issue 1"}]
+    mock_ai_parser.parse.side_effect = AiParserError("down")
+    service = ParseIssueFileService(mock_ai_parser)
+
+    report = service.parse_with_report(
+        "backlog.yaml", yaml.dump(blocks, allow_unicode=True).encode("utf-8"))
+
+    assert [i.title for i in report.data.issues] == ["Issue 0"]
+    assert report.failed_chunks[0].first_block == 1
+
+    with pytest.raises(AiParserError, match="down"):
+        service.parse("backlog.yaml", yaml.dump(
+            blocks[1:], allow_unicode=True).encode("utf-8"))
+
+
+def test_parse_stream_yields_issues_in_file_order(mock_ai_parser):
+    """ルールベースでマッピングしたIssueはAI解析を待たずに返し、ファイル内の順序を保つ"""
+    blocks = [{"title": "Issue 0", "description": "d"},
+              {"件名": "Issue 1"},
+              {"title": "Issue 2", "description": "d"}]
+    mock_ai_parser.parse_stream.side_effect = lambda text: iter(
+        mock_ai_parser.parse(text).issues)
+    service = ParseIssueFileService(mock_ai_parser)
+    report = ParseReport(data=ParsedRequirementData(issues=[]))
+
+    stream = service.parse_stream(
+        "backlog.yaml", yaml.dump(blocks, allow_unicode=True).encode("utf-8"), report=report)
+    assert next(stream).title == "Issue 0"
+    mock_ai_parser.parse_stream.assert_not_called()
+    assert [i.title for i in stream] == ["Issue 1", "Issue 2"]
+
+    assert [i.title for i in report.data.issues] == [
+        f"Issue {i}" for i in range(3)]
+    assert (report.chunk_count, report.rule_based_count) == (1, 2)
+
+
+def test_parse_stream_chunked_records_failures(mock_ai_parser):
+    parse = mock_ai_parser.parse.side_effect
+
+    def flaky_parse(text):
+        if "Issue 0" in text:
+            raise AiParserError("boom")
+        return parse(text)
+    mock_ai_parser.parse.side_effect = flaky_parse
+    service = ParseIssueFileService(
+        mock_ai_parser, chunk_token_budget=20, max_parallel_chunks=3)
+    report = ParseReport(data=ParsedRequirementData(issues=[]))
+
+    titles = [i.title for i in service.parse_stream(
+        "backlog.md", MARKDOWN, report=report)]
+
+    assert titles == [f"Issue {i}" for i in range(1, 6)]
+    assert report.failed_chunks[0].first_block == 0
+    assert report.chunk_count > 1
+
+
+def test_parse_accepts_byte_chunks(mock_ai_parser):
+    """UploadedFile.chunks() のようなバイト列のチャンクも受け付け、マルチバイト文字の分断を扱える"""
+    content = yaml.dump([{"title": f"Issue {i}", "description": "日本語"} for i in range(3)],
+                        allow_unicode=True).encode("utf-8")
+    chunks = (content[i:i + 5] for i in range(0, len(content), 5))
+
+    result = ParseIssueFileService(mock_ai_parser).parse("backlog.yaml", chunks)
+
+    assert [i.title for i in result.issues] == [f"Issue {i}" for i in range(3)]
+    assert result.issues[0].description == "日本語"
+
+
+def test_parse_stream_chunked_reads_input_lazily(mock_ai_parser):
+    """チャンク解析では、ファイル全体を読み込む前に先頭のチャンクを解析して返す"""
+    read = []
+
+    def chunks():
+        for block in MARKDOWN.split(b"\n---\n"):
+            read.append(block)
+            yield block + b"\n---\n"
+    service = ParseIssueFileService(mock_ai_parser, chunk_token_budget=10)
+
+    stream = service.parse_stream("backlog.md", chunks())
+
+    assert next(stream).title == "Issue 0"
+    assert len(read) < 6
+    assert [i.title for i in stream] == [f"Issue {i}" for i in range(1, 6)]
+
+
+def test_parse_invalid_utf8_raises_parsing_error(mock_ai_parser):
+    with pytest.raises(ParsingError, match="UTF-8"):
+        ParseIssueFileService(mock_ai_parser).parse("backlog.md", b"\xff\xfe")
+
+
+def test_parse_unsupported_extension(mock_ai_parser):
+    with pytest.raises(ParsingError):
+        ParseIssueFileService(mock_ai_parser).parse("notes.txt", b"x")
+
+
+def test_invalid_arguments(mock_ai_parser):
+    with pytest.raises(ValueError):
+        ParseIssueFileService(mock_ai_parser, chunk_token_budget=0)
+    with pytest.raises(ValueError):
+        ParseIssueFileService(mock_ai_parser, max_parallel_chunks=0)
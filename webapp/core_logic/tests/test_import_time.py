@@ -0,0 +1,84 @@
+"""
+起動時間の回帰テスト。
+新しいプロセスで python -X importtime を実行し、CLI (core_logic.main) の import 時間が予算内であること、
+LangChain・プロバイダーの SDK が初回使用時まで読み込まれないことを確認します。
+予算は環境変数 IMPORT_TIME_BUDGET_MS で変更できます (遅いCI環境向け)。
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+WEBAPP_DIR = Path(__file__).resolve().parents[2]
+# langchain_openai などを import 時に読み込むと 2 秒以上かかるため、それを検出できる値にする
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", "1500"))
+HEAVY_MODULES = ("langchain_core", "langchain_openai",
+                 "langchain_google_genai", "openai", "google.genai")
+
+
+def run_python(code: str, *args: str, ai_model: str = "openai") -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(WEBAPP_DIR.parent), str(WEBAPP_DIR), str(WEBAPP_DIR / "core_logic")])
+    env.setdefault("GITHUB_PAT", "dummy-token")
+    env.setdefault("OPENAI_API_KEY", "dummy-key")
+    env.setdefault("GEMINI_API_KEY", "dummy-key")
+    env["AI_MODEL"] = ai_model
+    return subprocess.run([sys.executable, *args, "-c", code], cwd=WEBAPP_DIR, env=env,
+                          capture_output=True, text=True, timeout=120, check=True)
+
+
+def cumulative_import_ms(importtime_output: str, module: str) -> float:
+    """-X importtime の出力から、指定したモジュールの累積 import 時間 (ミリ秒) を返します。"""
+    for line in importtime_output.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module and not parts[2].startswith("  "):
+            return int(parts[1]) / 1000
+    raise AssertionError(f"'{module}' not found in -X importtime output.")
+
+
+def loaded_heavy_modules(code: str, ai_model: str = "openai") -> list:
+    result = run_python(
+        f"{code}\nimport json, sys\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))",
+        ai_model=ai_model)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cumulative_import_ms_parses_top_level_entry():
+    output = ("import time: self [us] | cumulative | imported package\n"
+              "import time:       100 |        200 |   core_logic.main\n"
+              "import time:       300 |     450000 | core_logic.main\n")
+    assert cumulative_import_ms(output, "core_logic.main") == 450.0
+
+
+def test_cli_import_time_is_within_budget():
+    # 最初の1回はバイトコードのコンパイルを含むため、2回目を計測する
+    run_python("import core_logic.main")
+    result = run_python("import core_logic.main", "-X", "importtime")
+
+    elapsed_ms = cumulative_import_ms(result.stderr, "core_logic.main")
+
+    assert elapsed_ms <= IMPORT_TIME_BUDGET_MS, (
+        f"Importing core_logic.main took {elapsed_ms:.0f}ms (budget: {IMPORT_TIME_BUDGET_MS:.0f}ms). "
+        f"Check for new top-level imports of heavy modules.")
+
+
+def test_cli_does_not_import_llm_providers():
+    assert loaded_heavy_modules("import core_logic.main") == []
+
+
+@pytest.mark.parametrize("ai_model, expected, unexpected", [
+    ("openai", "langchain_openai", "langchain_google_genai"),
+    ("gemini", "langchain_google_genai", "langchain_openai"),
+])
+def test_ai_parser_imports_only_selected_provider(ai_model, expected, unexpected):
+    loaded = loaded_heavy_modules(
+        "from core_logic.infrastructure.config import Settings\n"
+        "from core_logic.adapters.ai_parser import AIParser\n"
+        "AIParser(Settings())", ai_model=ai_model)
+
+    assert expected in loaded
+    assert unexpected not in loaded
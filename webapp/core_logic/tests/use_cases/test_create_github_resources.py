@@ -9,9 +9,12 @@ from core_logic.use_cases.create_github_resources import CreateGitHubResourcesUs
 # GitHubAppClient から変更
 from core_logic.adapters.github_rest_client import GitHubRestClient
 from core_logic.adapters.github_graphql_client import GitHubGraphQLClient  # 追加
+from core_logic.adapters.github_utils import RetryStats, ApiCallCounter
+from core_logic.adapters.assignee_validator import AssigneeValidator
+from core_logic.adapters.run_ledger import RunLedger, KIND_ISSUE
 from core_logic.use_cases.create_repository import CreateRepositoryUseCase
 from core_logic.use_cases.create_issues import CreateIssuesUseCase
-from core_logic.domain.models import ParsedRequirementData, IssueData, CreateIssuesResult
+from core_logic.domain.models import ParsedRequirementData, IssueData, CreateIssuesResult, RepositorySnapshot, ResourcePlan
 from core_logic.domain.exceptions import (
     GitHubClientError, GitHubValidationError, GitHubAuthenticationError, GitHubResourceNotFoundError
 )
@@ -29,7 +32,8 @@ def mock_rest_client() -> MagicMock:
     mock.get_authenticated_user = MagicMock(return_value=mock_user_data)
 
     # ラベル、マイルストーン用のメソッドモックを追加
-    mock.get_label = MagicMock(return_value=None)  # デフォルトではラベルは存在しない
+    mock.list_labels = MagicMock(return_value=[])  # デフォルトではラベルは存在しない
+    mock.get_label = MagicMock(return_value=None)  # 一覧取得失敗時のフォールバック用
     mock.create_label = MagicMock(return_value=True)  # デフォルトは成功(新規作成)
     mock.list_milestones = MagicMock(return_value=[])  # デフォルトでは存在しない
     # create_milestone が MagicMock オブジェクトを返すように設定
@@ -48,8 +52,11 @@ def mock_graphql_client() -> MagicMock:
     # プロジェクト連携用のメソッドモックを追加
     mock.find_project_v2_node_id = MagicMock(
         return_value="PROJECT_NODE_ID")  # デフォルトは成功
-    mock.add_item_to_project_v2 = MagicMock(
-        return_value="PROJECT_ITEM_ID")  # デフォルトは成功
+    # デフォルトではスナップショットを取得できず、REST APIでの確認にフォールバックする
+    mock.get_repository_snapshot = MagicMock(return_value=None)
+    # デフォルトでは渡された全アイテムの追加に成功する
+    mock.add_items_to_project_v2 = MagicMock(
+        side_effect=lambda project_id, node_ids: ({node_id: f"ITEM_{node_id}" for node_id in node_ids}, {}))
 
     return mock
 
@@ -179,13 +186,12 @@ def test_execute_success_full_repo_name(create_resources_use_case: CreateGitHubR
     mock_create_repo_uc.execute.assert_called_once_with(
         EXPECTED_REPO)  # repo名のみ渡す
 
+    # ラベルは一覧APIで一括取得し、個別の存在確認は行わない
+    mock_rest_client.list_labels.assert_called_once_with(
+        EXPECTED_OWNER, EXPECTED_REPO)
+    mock_rest_client.get_label.assert_not_called()
+
     # ラベル作成呼び出し (順不同でOK)
-    mock_rest_client.get_label.assert_has_calls([
-        call(EXPECTED_OWNER, EXPECTED_REPO, "bug"),
-        call(EXPECTED_OWNER, EXPECTED_REPO, "feature"),
-        call(EXPECTED_OWNER, EXPECTED_REPO, "urgent"),
-    ], any_order=True)
-    assert mock_rest_client.get_label.call_count == 3
 
     mock_rest_client.create_label.assert_has_calls([
         call(EXPECTED_OWNER, EXPECTED_REPO, "bug"),
@@ -206,14 +212,12 @@ def test_execute_success_full_repo_name(create_resources_use_case: CreateGitHubR
 
     # Issue作成Use Case呼び出し - マイルストーンIDマップを渡すように変更
     mock_create_issues_uc.execute.assert_called_once_with(
-        DUMMY_PARSED_DATA_WITH_DETAILS, EXPECTED_OWNER, EXPECTED_REPO, {"Sprint 1": 123})
+        DUMMY_PARSED_DATA_WITH_DETAILS, EXPECTED_OWNER, EXPECTED_REPO, {"Sprint 1": 123},
+        repository_snapshot=None, ledger=None)
 
-    # プロジェクト追加呼び出し
-    mock_graphql_client.add_item_to_project_v2.assert_has_calls([
-        call("PROJECT_NODE_ID", "NODE_ID_1"),
-        call("PROJECT_NODE_ID", "NODE_ID_2"),
-    ])
-    assert mock_graphql_client.add_item_to_project_v2.call_count == 2
+    # プロジェクト追加呼び出し (バッチAPIで1回)
+    mock_graphql_client.add_items_to_project_v2.assert_called_once_with(
+        "PROJECT_NODE_ID", ["NODE_ID_1", "NODE_ID_2"])
 
     # ログの検証 - 実際のログ出力に合わせて期待値を修正
     assert "Starting GitHub resource creation workflow..." in caplog.text
@@ -239,14 +243,36 @@ def test_execute_success_full_repo_name(create_resources_use_case: CreateGitHubR
     assert f"Step 7: Creating issues in '{DUMMY_REPO_NAME_FULL}'..." in caplog.text
     assert "Step 7 finished." in caplog.text
     assert f"Step 8: Adding 2 created issues to project '{DUMMY_PROJECT_NAME}'..." in caplog.text
-    # 変更されたログメッセージのフォーマットに合わせる
-    assert "Processing item 1/2: adding item (Issue Node ID: NODE_ID_1)" in caplog.text
-    assert "Processing item 2/2: adding item (Issue Node ID: NODE_ID_2)" in caplog.text
     # プロジェクト統合のログメッセージを更新
     assert "Step 8 finished. Project Integration: Added: 2/2, Failed: 0/2." in caplog.text
     assert "GitHub resource creation workflow completed successfully." in caplog.text
 
 
+def test_execute_reports_progress(create_resources_use_case: CreateGitHubResourcesUseCase, mock_create_repo_uc, mock_create_issues_uc):
+    """progress_callback に各ステップの開始と完了が途中結果とともに通知される"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_create_issues_uc.execute.return_value = DUMMY_ISSUE_RESULT
+    progress = []
+
+    def on_progress(step, partial):
+        progress.append((step, partial.repository_url))
+        if step == "ensure_labels":
+            raise RuntimeError("callback failure must not stop the workflow")
+
+    result = create_resources_use_case.execute(
+        parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
+        repo_name_input=DUMMY_REPO_NAME_FULL,
+        project_name=DUMMY_PROJECT_NAME,
+        progress_callback=on_progress)
+
+    assert [step for step, _ in progress] == [
+        "resolve_repository", "ensure_repository", "ensure_labels", "ensure_milestones",
+        "find_project", "create_issues", "add_to_project", "completed"]
+    # リポジトリ確認後の通知には途中結果としてURLが含まれる
+    assert progress[2][1] == DUMMY_REPO_URL
+    assert result.fatal_error is None
+
+
 def test_execute_success_repo_name_only(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc):
     """正常系: repo名のみ指定され、ownerをAPIで取得して成功"""
     # Arrange: モックの設定
@@ -273,7 +299,9 @@ def test_execute_success_repo_name_only(create_resources_use_case: CreateGitHubR
         DUMMY_PARSED_DATA_WITH_DETAILS,
         EXPECTED_AUTH_USER,
         DUMMY_REPO_NAME_ONLY,
-        {"Sprint 1": 123}  # マイルストーンIDマップを追加
+        {"Sprint 1": 123},  # マイルストーンIDマップを追加
+        repository_snapshot=None,
+        ledger=None
     )
 
     # ラベル作成呼び出し
@@ -285,7 +313,11 @@ def test_execute_success_repo_name_only(create_resources_use_case: CreateGitHubR
 
 
 def test_execute_dry_run(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc, caplog):
-    """Dry run モードの場合、GitHub操作とIssue作成UseCaseが呼ばれない"""
+    """Dry run モードの場合、読み取り専用のAPIで実行計画を作成し、GitHubへの書き込みとIssue作成UseCaseは呼ばれない"""
+    mock_graphql_client.get_repository_snapshot.return_value = RepositorySnapshot(
+        owner="test-owner", name="test-repo", repository_id="REPO_ID",
+        repository_url=DUMMY_REPO_URL, label_names=["bug"], milestones={},
+        assignable_users=["userA"], open_issue_titles=["Issue 2"])
     with caplog.at_level(logging.INFO):  # WARNINGも含む
         result = create_resources_use_case.execute(
             parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
@@ -299,31 +331,39 @@ def test_execute_dry_run(create_resources_use_case: CreateGitHubResourcesUseCase
     assert "(Dry Run)" in result.repository_url  # URLに "(Dry Run)" が含まれる
     assert result.project_name == DUMMY_PROJECT_NAME
 
-    # Dry Run結果の検証 - created_labels は空になる（実際の動作に合わせて）
+    # Dry Run ではリソースを作成しないため、作成結果は空になる
     assert result.created_labels == []
-    # milestone_ids も空になっていることを確認
     assert len(result.processed_milestones) == 0
     assert result.failed_labels == []
     assert result.failed_milestones == []
-
-    # Issue結果は実際の実装に合わせてNoneになっていることを確認（修正）
     assert result.issue_result is None
-
-    # プロジェクト関連の結果
-    assert result.project_node_id is None
     assert result.project_items_added_count == 0
     assert result.project_items_failed == []
 
-    # 依存コンポーネントの検証: GitHub操作は行われない
+    # 実行計画の検証
+    plan = result.plan
+    assert plan is not None
+    assert plan.repository_exists is True
+    assert plan.labels_to_create == ["feature", "urgent"]
+    assert plan.existing_labels == ["bug"]
+    assert plan.milestones_to_create == ["Sprint 1"]
+    assert [issue.title for issue in plan.issues_to_create] == [
+        "Issue 1", "Issue 3"]
+    assert [(issue.title, issue.reason)
+            for issue in plan.issues_to_skip] == [("Issue 2", "exists")]
+    assert plan.project_node_id == "PROJECT_NODE_ID"
+    assert result.project_node_id == "PROJECT_NODE_ID"
+    # ラベル2件 + マイルストーン1件 + Issue2件の作成、プロジェクトへの追加1回
+    assert plan.estimated_cost.content_creations == 5
+    assert plan.estimated_cost.graphql_requests == 1
+
+    # 依存コンポーネントの検証: GitHubへの書き込みは行われない
     mock_rest_client.get_authenticated_user.assert_not_called()
     mock_create_repo_uc.execute.assert_not_called()
     mock_create_issues_uc.execute.assert_not_called()
-    mock_rest_client.get_label.assert_not_called()
     mock_rest_client.create_label.assert_not_called()
-    mock_rest_client.list_milestones.assert_not_called()
     mock_rest_client.create_milestone.assert_not_called()
-    mock_graphql_client.find_project_v2_node_id.assert_not_called()
-    mock_graphql_client.add_item_to_project_v2.assert_not_called()
+    mock_graphql_client.add_items_to_project_v2.assert_not_called()
 
     # ログの検証
     assert "Dry run mode enabled. Skipping GitHub operations." in caplog.text
@@ -363,6 +403,99 @@ def test_execute_label_creation_fails(create_resources_use_case, mock_rest_clien
     mock_graphql_client.find_project_v2_node_id.assert_called()
 
 
+def create_existing_label(name: str) -> MagicMock:
+    """list_labels が返す既存ラベルのモックを作成するヘルパー"""
+    label = MagicMock()
+    label.name = name
+    return label
+
+
+def test_execute_labels_created_only_when_missing(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_create_repo_uc, caplog):
+    """既存ラベル一覧との差分 (大文字小文字無視) で不足分のみ作成されることを確認"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_rest_client.list_labels.return_value = [
+        create_existing_label("Bug"), create_existing_label("documentation")]
+
+    with caplog.at_level(logging.INFO):
+        result = create_resources_use_case.execute(
+            parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
+            repo_name_input=DUMMY_REPO_NAME_FULL
+        )
+
+    assert result.created_labels == ["bug", "feature", "urgent"]
+    assert result.failed_labels == []
+    mock_rest_client.list_labels.assert_called_once_with(
+        EXPECTED_OWNER, EXPECTED_REPO)
+    mock_rest_client.get_label.assert_not_called()
+    mock_rest_client.create_label.assert_has_calls([
+        call(EXPECTED_OWNER, EXPECTED_REPO, "feature"),
+        call(EXPECTED_OWNER, EXPECTED_REPO, "urgent"),
+    ])
+    assert mock_rest_client.create_label.call_count == 2
+    assert "Label 'bug' already exists." in caplog.text
+    assert "Step 4 finished. New labels: 2, Existing/Skipped: 1, Failed: 0." in caplog.text
+
+
+def test_execute_list_labels_fails_falls_back_to_get_label(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_create_repo_uc, caplog):
+    """ラベル一覧取得に失敗した場合、ラベルごとの get_label による確認にフォールバックする"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_rest_client.list_labels.side_effect = GitHubClientError(
+        "List labels failed")
+    mock_rest_client.get_label.side_effect = lambda owner, repo, name: (
+        MagicMock() if name == "bug" else None)
+
+    with caplog.at_level(logging.INFO):
+        result = create_resources_use_case.execute(
+            parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
+            repo_name_input=DUMMY_REPO_NAME_FULL
+        )
+
+    assert result.created_labels == ["bug", "feature", "urgent"]
+    assert mock_rest_client.get_label.call_count == 3
+    assert mock_rest_client.create_label.call_count == 2
+    assert "Falling back to per-label lookup." in caplog.text
+
+
+def test_execute_labels_created_concurrently(mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc):
+    """max_workers > 1 の場合も、不足ラベルのみ作成され結果はソート順に格納される"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+
+    def create_label_side_effect(owner, repo, name):
+        if name == "feature":
+            raise GitHubClientError("Label creation failed")
+        return True
+    mock_rest_client.create_label.side_effect = create_label_side_effect
+
+    use_case = CreateGitHubResourcesUseCase(
+        rest_client=mock_rest_client,
+        graphql_client=mock_graphql_client,
+        create_repo_uc=mock_create_repo_uc,
+        create_issues_uc=mock_create_issues_uc,
+        max_workers=3
+    )
+    result = use_case.execute(
+        parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
+        repo_name_input=DUMMY_REPO_NAME_FULL
+    )
+
+    assert result.created_labels == ["bug", "urgent"]
+    assert result.failed_labels == [
+        ("feature", "Unexpected error: Label creation failed")]
+    assert mock_rest_client.create_label.call_count == 3
+
+
+def test_init_invalid_max_workers(mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc):
+    """max_workers に1未満を指定した場合は ValueError"""
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        CreateGitHubResourcesUseCase(
+            rest_client=mock_rest_client,
+            graphql_client=mock_graphql_client,
+            create_repo_uc=mock_create_repo_uc,
+            create_issues_uc=mock_create_issues_uc,
+            max_workers=0
+        )
+
+
 def test_execute_milestone_creation_fails(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc, caplog):
     """マイルストーン作成で失敗した場合、記録され、処理は続行する"""
     mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
@@ -402,6 +535,178 @@ def test_execute_milestone_creation_fails(create_resources_use_case: CreateGitHu
     assert "Failed milestones: ['Sprint 1']" in caplog.text
 
 
+def test_execute_milestones_listed_once(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_create_repo_uc, mock_create_issues_uc):
+    """マイルストーン一覧は1回だけ取得され、既存分は再作成されない"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    existing_ms = MagicMock()
+    existing_ms.title = "MilestoneA"
+    existing_ms.number = 7
+    mock_rest_client.list_milestones.return_value = [existing_ms]
+
+    result = create_resources_use_case.execute(
+        parsed_data=PARSED_DATA_MULTI_MILESTONE,
+        repo_name_input=DUMMY_REPO_NAME_FULL
+    )
+
+    mock_rest_client.list_milestones.assert_called_once_with(
+        EXPECTED_OWNER, EXPECTED_REPO, state="all")
+    mock_rest_client.create_milestone.assert_called_once_with(
+        EXPECTED_OWNER, EXPECTED_REPO, "MilestoneB")
+    assert result.processed_milestones == [("MilestoneA", 7), ("MilestoneB", 123)]
+    mock_create_issues_uc.execute.assert_called_once_with(
+        PARSED_DATA_MULTI_MILESTONE, EXPECTED_OWNER, EXPECTED_REPO,
+        {"MilestoneA": 7, "MilestoneB": 123}, repository_snapshot=None, ledger=None)
+
+
+def test_execute_milestone_listing_fails(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_create_repo_uc, mock_create_issues_uc):
+    """マイルストーン一覧の取得に失敗した場合、重複を避けるため作成せず失敗として記録する"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_rest_client.list_milestones.side_effect = GitHubClientError(
+        "List milestones failed")
+
+    result = create_resources_use_case.execute(
+        parsed_data=PARSED_DATA_MULTI_MILESTONE,
+        repo_name_input=DUMMY_REPO_NAME_FULL
+    )
+
+    mock_rest_client.list_milestones.assert_called_once()
+    mock_rest_client.create_milestone.assert_not_called()
+    assert result.processed_milestones == []
+    assert result.failed_milestones == [
+        ("MilestoneA", "Unexpected error: List milestones failed"),
+        ("MilestoneB", "Unexpected error: List milestones failed"),
+    ]
+    mock_create_issues_uc.execute.assert_called_once()
+
+
+def test_execute_uses_repository_snapshot(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc):
+    """スナップショットを取得できた場合、ラベル・マイルストーンの一覧APIを呼ばずに差分判定する"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    snapshot = RepositorySnapshot(
+        owner=EXPECTED_OWNER, name=EXPECTED_REPO, repository_id="REPO_NODE_ID",
+        label_names=["Bug"], milestones={"MilestoneA": 7})
+    mock_graphql_client.get_repository_snapshot.return_value = snapshot
+
+    result = create_resources_use_case.execute(
+        parsed_data=PARSED_DATA_MULTI_MILESTONE,
+        repo_name_input=DUMMY_REPO_NAME_FULL
+    )
+
+    mock_graphql_client.get_repository_snapshot.assert_called_once_with(
+        EXPECTED_OWNER, EXPECTED_REPO)
+    mock_rest_client.list_labels.assert_not_called()
+    mock_rest_client.list_milestones.assert_not_called()
+    mock_rest_client.create_label.assert_has_calls([
+        call(EXPECTED_OWNER, EXPECTED_REPO, "documentation"),
+        call(EXPECTED_OWNER, EXPECTED_REPO, "feature"),
+    ])
+    assert mock_rest_client.create_label.call_count == 2
+    mock_rest_client.create_milestone.assert_called_once_with(
+        EXPECTED_OWNER, EXPECTED_REPO, "MilestoneB")
+    assert result.processed_milestones == [("MilestoneA", 7), ("MilestoneB", 123)]
+    mock_create_issues_uc.execute.assert_called_once_with(
+        PARSED_DATA_MULTI_MILESTONE, EXPECTED_OWNER, EXPECTED_REPO,
+        {"MilestoneA": 7, "MilestoneB": 123}, repository_snapshot=snapshot, ledger=None)
+
+
+def test_execute_incomplete_snapshot_falls_back_to_rest(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc):
+    """全件取得できなかったスナップショットは使用せず、REST APIで確認する"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_graphql_client.get_repository_snapshot.return_value = RepositorySnapshot(
+        owner=EXPECTED_OWNER, name=EXPECTED_REPO, is_complete=False)
+
+    create_resources_use_case.execute(
+        parsed_data=PARSED_DATA_MULTI_MILESTONE,
+        repo_name_input=DUMMY_REPO_NAME_FULL
+    )
+
+    mock_rest_client.list_labels.assert_called_once()
+    mock_rest_client.list_milestones.assert_called_once()
+    assert mock_create_issues_uc.execute.call_args.kwargs["repository_snapshot"] is None
+
+
+def test_execute_reports_retried_operations(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc):
+    """クライアントに記録されたリトライ回数が結果に集計される"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_rest_client.retry_stats = RetryStats()
+    mock_rest_client.retry_stats.record("create_label", 3)
+    mock_graphql_client.retry_stats = RetryStats()
+    mock_graphql_client.retry_stats.record("get_repository_snapshot", 2)
+
+    result = create_resources_use_case.execute(
+        parsed_data=PARSED_DATA_MULTI_MILESTONE,
+        repo_name_input=DUMMY_REPO_NAME_FULL
+    )
+
+    assert result.retried_operations == {
+        "rest.create_label": 2, "graphql.get_repository_snapshot": 1}
+
+
+def test_execute_reports_retried_operations_when_halted(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc):
+    """ワークフローが中断した場合も、それまでのリトライ回数が結果に集計される"""
+    mock_rest_client.retry_stats = RetryStats()
+    mock_rest_client.retry_stats.record("create_repository", 3)
+    mock_create_repo_uc.execute.side_effect = GitHubClientError("repository failed")
+    progress = []
+
+    with pytest.raises(GitHubClientError):
+        create_resources_use_case.execute(
+            parsed_data=PARSED_DATA_MULTI_MILESTONE,
+            repo_name_input=DUMMY_REPO_NAME_FULL,
+            progress_callback=lambda step, result: progress.append(result)
+        )
+
+    assert progress[-1].fatal_error
+    assert progress[-1].retried_operations == {"rest.create_repository": 2}
+
+
+def test_execute_records_step_timings(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc):
+    """ステップごとの所要時間・API呼び出し回数・処理件数が実行順に記録される"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_rest_client.call_counter = ApiCallCounter()
+    mock_graphql_client.call_counter = ApiCallCounter()
+
+    def create_label(*args, **kwargs):
+        mock_rest_client.call_counter.increment()
+        return True
+    mock_rest_client.create_label.side_effect = create_label
+
+    result = create_resources_use_case.execute(
+        parsed_data=PARSED_DATA_MULTI_MILESTONE,
+        repo_name_input=DUMMY_REPO_NAME_FULL,
+        project_name=DUMMY_PROJECT_NAME
+    )
+
+    timings = {timing.step: timing for timing in result.step_timings}
+    assert [timing.step for timing in result.step_timings] == [
+        "repository", "labels", "milestones", "project", "issues", "project_items"]
+    assert timings["labels"].api_calls == 3
+    assert timings["labels"].items == 3
+    assert timings["milestones"].api_calls == 0
+    assert timings["milestones"].items == 2
+    assert timings["issues"].items == 3
+    assert timings["project_items"].items == 1
+    assert all(timing.duration_seconds >= 0 for timing in result.step_timings)
+
+
+def test_execute_records_timing_of_failed_step(create_resources_use_case: CreateGitHubResourcesUseCase, mock_create_repo_uc, mock_create_issues_uc):
+    """途中で中断した場合も、中断したステップまでの所要時間が記録される"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_create_issues_uc.execute.side_effect = GitHubClientError("boom")
+    results = []
+
+    with pytest.raises(GitHubClientError):
+        create_resources_use_case.execute(
+            parsed_data=PARSED_DATA_MULTI_MILESTONE,
+            repo_name_input=DUMMY_REPO_NAME_FULL,
+            progress_callback=lambda step, result: results.append(result)
+        )
+
+    assert [timing.step for timing in results[-1].step_timings] == [
+        "repository", "labels", "milestones", "project", "issues"]
+    assert results[-1].step_timings[-1].items == 0
+
+
 def test_execute_project_not_found(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc, caplog):
     """プロジェクトが見つからない場合、記録され、アイテム追加はスキップされる"""
     mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
@@ -421,7 +726,7 @@ def test_execute_project_not_found(create_resources_use_case: CreateGitHubResour
     assert result.project_items_added_count == 0
 
     # アイテム追加が呼ばれていないことを確認
-    mock_graphql_client.add_item_to_project_v2.assert_not_called()
+    mock_graphql_client.add_items_to_project_v2.assert_not_called()
     # 他の処理は実行される
     assert result.repository_url is not None
     assert len(result.created_labels) > 0
@@ -448,10 +753,10 @@ def test_execute_add_item_fails(create_resources_use_case: CreateGitHubResources
     )
     mock_create_issues_uc.execute.return_value = mock_issue_result
 
-    # 2番目のアイテム追加だけ失敗させる
-    mock_add_error = GitHubResourceNotFoundError("Item not found")
-    mock_graphql_client.add_item_to_project_v2.side_effect = [
-        "ITEM_ID_1", mock_add_error]
+    # 2番目のアイテム追加だけ失敗させる (バッチ内の部分的エラー)
+    mock_graphql_client.add_items_to_project_v2.side_effect = None
+    mock_graphql_client.add_items_to_project_v2.return_value = (
+        {"NODE_ID_1": "ITEM_ID_1"}, {"NODE_ID_2": "Item not found"})
 
     with caplog.at_level(logging.INFO):  # ERROR, WARNING も含む
         result = create_resources_use_case.execute(
@@ -464,21 +769,38 @@ def test_execute_add_item_fails(create_resources_use_case: CreateGitHubResources
     assert result.fatal_error is None
     assert result.project_items_added_count == 1  # 1件は成功
     assert result.project_items_failed == [
-        ("NODE_ID_2", f"Unexpected error: {str(mock_add_error)}")]
-    assert mock_graphql_client.add_item_to_project_v2.call_count == 2
+        ("NODE_ID_2", "Unexpected error: Item not found")]
+    mock_graphql_client.add_items_to_project_v2.assert_called_once_with(
+        "PROJECT_NODE_ID", ["NODE_ID_1", "NODE_ID_2"])
 
-    # ログの検証 - 実際の出力に合わせて修正
+    # ログの検証
     assert f"Step 8: Adding 2 created issues to project '{DUMMY_PROJECT_NAME}'..." in caplog.text
-    # 実際のログ出力に合わせて修正
-    assert "Processing item 1/2: adding item (Issue Node ID: NODE_ID_1)" in caplog.text
-    assert "Processing item 2/2: adding item (Issue Node ID: NODE_ID_2)" in caplog.text
-    # ERRORログメッセージの形式を修正
-    assert f"Unexpected error during adding item (Issue Node ID: NODE_ID_2) to project '{DUMMY_PROJECT_NAME}' (Project Node ID: PROJECT_NODE_ID): {str(mock_add_error)}" in caplog.text
-    # ステップ完了のメッセージを修正
+    assert f"Unexpected error during adding item (Issue Node ID: NODE_ID_2) to project '{DUMMY_PROJECT_NAME}' (Project Node ID: PROJECT_NODE_ID) (url/2): Item not found" in caplog.text
     assert "Step 8 finished. Project Integration: Added: 1/2, Failed: 1/2." in caplog.text
     assert "Failed items: ['NODE_ID_2']" in caplog.text
 
 
+def test_execute_add_items_batch_raises(create_resources_use_case: CreateGitHubResourcesUseCase, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc):
+    """バッチ追加自体が例外を送出した場合、全アイテムが失敗として記録され処理は継続する"""
+    mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
+    mock_create_issues_uc.execute.return_value = DUMMY_ISSUE_RESULT
+    mock_graphql_client.add_items_to_project_v2.side_effect = GitHubClientError(
+        "Batch failed")
+
+    result = create_resources_use_case.execute(
+        parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
+        repo_name_input=DUMMY_REPO_NAME_FULL,
+        project_name=DUMMY_PROJECT_NAME
+    )
+
+    assert result.fatal_error is None
+    assert result.project_items_added_count == 0
+    assert result.project_items_failed == [
+        ("NODE_ID_1", "Unexpected error: Batch failed"),
+        ("NODE_ID_2", "Unexpected error: Batch failed"),
+    ]
+
+
 def test_execute_no_project_specified(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc):
     """プロジェクト名が指定されなかった場合、プロジェクト関連処理はスキップされる"""
     mock_create_repo_uc.execute.return_value = DUMMY_REPO_URL
@@ -498,7 +820,7 @@ def test_execute_no_project_specified(create_resources_use_case: CreateGitHubRes
 
     # プロジェクト関連のAPIが呼ばれないことを確認
     mock_graphql_client.find_project_v2_node_id.assert_not_called()
-    mock_graphql_client.add_item_to_project_v2.assert_not_called()
+    mock_graphql_client.add_items_to_project_v2.assert_not_called()
     # 他の処理は実行される
     assert result.repository_url is not None
     assert len(result.created_labels) > 0
@@ -651,3 +973,120 @@ def test_execute_create_issues_unexpected_error(create_resources_use_case: Creat
     mock_graphql_client.find_project_v2_node_id.assert_called_once()
     # Issue作成UseCaseも呼ばれる (ここでエラー発生)
     mock_create_issues_uc.execute.assert_called_once()
+
+
+def test_execute_dry_run_plan_failure_is_not_fatal(create_resources_use_case: CreateGitHubResourcesUseCase, mock_graphql_client, caplog):
+    """実行計画の作成に失敗しても Dry run は完了し、plan は None になる"""
+    mock_graphql_client.get_repository_snapshot.side_effect = GitHubClientError(
+        "boom")
+    create_resources_use_case.rest_client.get_repository.side_effect = GitHubAuthenticationError(
+        "bad credentials")
+    with caplog.at_level(logging.WARNING):
+        result = create_resources_use_case.execute(
+            parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
+            repo_name_input=DUMMY_REPO_NAME_FULL, dry_run=True)
+
+    assert result.plan is None
+    assert "(Dry Run)" in result.repository_url
+    assert "Could not compute a plan" in caplog.text
+
+
+def test_execute_applies_plan_without_reloading_state(create_resources_use_case: CreateGitHubResourcesUseCase, mock_rest_client, mock_graphql_client, mock_create_repo_uc, mock_create_issues_uc):
+    """計画を渡した場合、リポジトリ・スナップショット・プロジェクトを再取得せずに計画の状態で適用する"""
+    snapshot = RepositorySnapshot(
+        owner="test-owner", name="test-repo", repository_id="REPO_ID",
+        repository_url=DUMMY_REPO_URL, label_names=["bug", "feature", "urgent"],
+        milestones={"Sprint 1": 7}, assignable_users=["userA"], open_issue_titles=[])
+    mock_graphql_client.get_repository_snapshot.return_value = snapshot
+    plan = create_resources_use_case.plan(
+        DUMMY_PARSED_DATA_WITH_DETAILS, DUMMY_REPO_NAME_FULL, DUMMY_PROJECT_NAME)
+    mock_graphql_client.get_repository_snapshot.reset_mock()
+    mock_graphql_client.find_project_v2_node_id.reset_mock()
+
+    result = create_resources_use_case.execute(
+        parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
+        repo_name_input=DUMMY_REPO_NAME_FULL, plan=plan)
+
+    assert result.repository_url == DUMMY_REPO_URL
+    assert result.plan is plan
+    assert result.project_node_id == "PROJECT_NODE_ID"
+    mock_rest_client.get_authenticated_user.assert_not_called()
+    mock_create_repo_uc.execute.assert_not_called()
+    mock_graphql_client.get_repository_snapshot.assert_not_called()
+    mock_graphql_client.find_project_v2_node_id.assert_not_called()
+    mock_rest_client.create_label.assert_not_called()
+    mock_rest_client.create_milestone.assert_not_called()
+    assert mock_create_issues_uc.execute.call_args.kwargs["repository_snapshot"] is snapshot
+    mock_graphql_client.add_items_to_project_v2.assert_called_once()
+
+
+def test_execute_rejects_plan_for_other_repository(create_resources_use_case: CreateGitHubResourcesUseCase):
+    """計画の対象と異なるリポジトリを指定した場合はエラーになる"""
+    plan = ResourcePlan(owner="test-owner", repo="test-repo", repository_exists=True)
+    with pytest.raises(GitHubClientError, match="Plan was computed for"):
+        create_resources_use_case.execute(
+            parsed_data=DUMMY_PARSED_DATA_WITH_DETAILS,
+            repo_name_input="other-owner/other-repo", plan=plan)
+
+
+def test_execute_resumes_run_from_ledger(mock_rest_client, mock_graphql_client, mock_create_repo_uc):
+    """同じ実行IDで再実行すると、完了済みの処理はスキップされ、失敗したIssueだけが作成される"""
+    ledger = RunLedger()
+    assignee_validator = MagicMock(spec=AssigneeValidator)
+    assignee_validator.validate_assignees.side_effect = lambda owner, repo, logins: (
+        list(logins), [])
+    use_case = CreateGitHubResourcesUseCase(
+        rest_client=mock_rest_client, graphql_client=mock_graphql_client,
+        create_repo_uc=mock_create_repo_uc,
+        create_issues_uc=CreateIssuesUseCase(
+            rest_client=mock_rest_client, assignee_validator=assignee_validator),
+        ledger=ledger)
+    mock_rest_client.list_issues.return_value = []
+    created_titles, failures = [], []
+
+    def create_issue(owner, repo, title, **kwargs):
+        if title == "Issue 2" and not failures:
+            failures.append(title)
+            raise GitHubClientError("secondary rate limit")
+        created_titles.append(title)
+        number = len(created_titles)
+        return MagicMock(html_url=f"https://github.com/test-owner/test-repo/issues/{number}",
+                         node_id=f"I_{title}", number=number)
+    mock_rest_client.create_issue.side_effect = create_issue
+
+    # 1回目: Issue 2 の作成に失敗する
+    first = use_case.execute(DUMMY_PARSED_DATA_WITH_DETAILS, DUMMY_REPO_NAME_FULL,
+                             project_name=DUMMY_PROJECT_NAME, run_id="run-1")
+    assert first.issue_result.failed_issue_titles == ["Issue 2"]
+    assert len(ledger.run("run-1").entries(KIND_ISSUE)) == 2
+
+    # 2回目: 完了済みのリポジトリ・ラベル・マイルストーン・プロジェクト・Issueは再処理しない
+    for mock in (mock_rest_client, mock_graphql_client, mock_create_repo_uc):
+        mock.reset_mock()
+    second = use_case.execute(DUMMY_PARSED_DATA_WITH_DETAILS, DUMMY_REPO_NAME_FULL,
+                              project_name=DUMMY_PROJECT_NAME, run_id="run-1")
+    assert [call.kwargs["title"] for call in mock_rest_client.create_issue.call_args_list] == [
+        "Issue 2"]
+    assert len(second.issue_result.created_issue_details) == 3
+    assert second.created_labels == ["bug", "feature", "urgent"]
+    assert second.processed_milestones == [("Sprint 1", 123)]
+    assert second.project_items_added_count == 3
+    mock_create_repo_uc.execute.assert_not_called()
+    mock_rest_client.create_label.assert_not_called()
+    mock_rest_client.create_milestone.assert_not_called()
+    mock_graphql_client.find_project_v2_node_id.assert_not_called()
+    # プロジェクトには新たに作成したIssueだけを追加する
+    mock_graphql_client.add_items_to_project_v2.assert_called_once_with(
+        "PROJECT_NODE_ID", ["I_Issue 2"])
+
+    # 3回目: 全て完了済みのためAPIを1回も呼ばない
+    for mock in (mock_rest_client, mock_graphql_client, mock_create_repo_uc):
+        mock.reset_mock()
+    third = use_case.execute(DUMMY_PARSED_DATA_WITH_DETAILS, DUMMY_REPO_NAME_FULL,
+                             project_name=DUMMY_PROJECT_NAME, run_id="run-1")
+    assert mock_rest_client.method_calls == []
+    assert mock_graphql_client.method_calls == []
+    assert mock_create_repo_uc.method_calls == []
+    assert third.repository_url == "https://github.com/test-owner/test-repo"
+    assert len(third.issue_result.created_issue_details) == 3
+    assert third.project_items_added_count == 3
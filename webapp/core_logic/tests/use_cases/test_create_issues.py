@@ -2,10 +2,11 @@ import pytest
 from unittest.mock import MagicMock, call, patch  # patch を追加
 import logging  # caplog を使うためにインポート
 import copy  # deep copy用に追加
+import time
 
 # テスト対象 UseCase, データモデル, 依存 Client, 例外をインポート
 from core_logic.use_cases.create_issues import CreateIssuesUseCase
-from core_logic.domain.models import ParsedRequirementData, IssueData, CreateIssuesResult
+from core_logic.domain.models import ParsedRequirementData, IssueData, CreateIssuesResult, RepositorySnapshot
 from core_logic.adapters.github_rest_client import GitHubRestClient
 from core_logic.adapters.assignee_validator import AssigneeValidator
 from core_logic.domain.exceptions import GitHubClientError, GitHubValidationError
@@ -18,6 +19,7 @@ def mock_github_client() -> MagicMock:
     """GitHubRestClient のモックインスタンスを作成するフィクスチャ"""
     mock = MagicMock(spec=GitHubRestClient)
     # 実際のメソッド名に合わせてモックメソッドを追加
+    mock.list_issues = MagicMock(return_value=[])  # 既存Issueなし
     mock.search_issues_and_pull_requests = MagicMock()
     mock.create_issue = MagicMock()
     return mock
@@ -104,16 +106,18 @@ def create_mock_issue(url, node_id):
     mock_issue.node_id = node_id
     return mock_issue
 
+
+def create_existing_issue(title):
+    """list_issues の戻り値用に既存Issueのモックを作成するヘルパー関数"""
+    mock_issue = MagicMock()
+    mock_issue.title = title
+    return mock_issue
+
 # --- Test Cases ---
 
 
 def test_execute_all_new_issues(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, caplog):
     """全てのIssueが新規の場合、全て作成され、進捗ログが出力されることをテスト"""
-    # モックの検索結果を整数値で直接モック化
-    mock_search_result = MagicMock()
-    mock_search_result.total_count = 0  # 整数値をセット
-    mock_github_client.search_issues_and_pull_requests.return_value = mock_search_result
-
     # create_issue がオブジェクトを返すように設定
     mock_issue1 = create_mock_issue("url/1", "node_id_1")
     mock_issue3 = create_mock_issue("url/3", "node_id_3")
@@ -129,15 +133,10 @@ def test_execute_all_new_issues(create_issues_use_case: CreateIssuesUseCase, moc
     assert result.skipped_issue_titles == []
     assert result.failed_issue_titles == []
     assert result.errors == []
-    # search_issues と create_issue が期待通り呼ばれたか
-    assert mock_github_client.search_issues_and_pull_requests.call_count == 2
-    # callsのアサーションを修正
-    expected_query1 = f'repo:{TEST_OWNER}/{TEST_REPO} is:issue is:open in:title "{ISSUE1_DATA.title}"'
-    expected_query3 = f'repo:{TEST_OWNER}/{TEST_REPO} is:issue is:open in:title "{ISSUE3_DATA.title}"'
-    mock_github_client.search_issues_and_pull_requests.assert_any_call(
-        q=expected_query1, per_page=1)
-    mock_github_client.search_issues_and_pull_requests.assert_any_call(
-        q=expected_query3, per_page=1)
+    # 既存Issueの一覧取得は1回のみで、検索APIは呼ばれない
+    mock_github_client.list_issues.assert_called_once_with(
+        TEST_OWNER, TEST_REPO, state="open")
+    mock_github_client.search_issues_and_pull_requests.assert_not_called()
 
     assert mock_github_client.create_issue.call_count == 2
     mock_github_client.create_issue.assert_has_calls([
@@ -157,10 +156,9 @@ def test_execute_all_new_issues(create_issues_use_case: CreateIssuesUseCase, moc
 
 def test_execute_all_existing_issues(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, caplog):
     """全てのIssueが既存の場合、全てスキップされ、進捗ログが出力されることをテスト"""
-    # モック設定: 存在確認は常にTrue
-    mock_search_result = MagicMock()
-    mock_search_result.total_count = 1  # 1件以上あれば既存と判断される
-    mock_github_client.search_issues_and_pull_requests.return_value = mock_search_result
+    # モック設定: 既存Issue一覧に同じタイトルが含まれる
+    mock_github_client.list_issues.return_value = [
+        create_existing_issue(ISSUE2_DATA.title)]
 
     with caplog.at_level(logging.INFO):
         result = create_issues_use_case.execute(
@@ -171,9 +169,9 @@ def test_execute_all_existing_issues(create_issues_use_case: CreateIssuesUseCase
     assert result.failed_issue_titles == []
     assert result.errors == []
     # APIメソッドの呼び出し検証
-    expected_query = f'repo:{TEST_OWNER}/{TEST_REPO} is:issue is:open in:title "{ISSUE2_DATA.title}"'
-    mock_github_client.search_issues_and_pull_requests.assert_called_once_with(
-        q=expected_query, per_page=1)
+    mock_github_client.list_issues.assert_called_once_with(
+        TEST_OWNER, TEST_REPO, state="open")
+    mock_github_client.search_issues_and_pull_requests.assert_not_called()
     mock_github_client.create_issue.assert_not_called()  # 作成は呼ばれない
     # ログの検証
     assert f"Executing CreateIssuesUseCase for {TEST_OWNER}/{TEST_REPO} with 1 potential issues." in caplog.text
@@ -184,15 +182,11 @@ def test_execute_all_existing_issues(create_issues_use_case: CreateIssuesUseCase
 
 def test_execute_mixed_issues(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, caplog):
     """新規と既存が混在する場合のテスト"""
-    # モック設定: ISSUE2_DATA のみ find で True を返す
-    def find_side_effect(q, per_page):
-        mock_result = MagicMock()
-        if ISSUE2_DATA.title in q:
-            mock_result.total_count = 1  # 既存のIssue
-        else:
-            mock_result.total_count = 0  # 新規のIssue
-        return mock_result
-    mock_github_client.search_issues_and_pull_requests.side_effect = find_side_effect
+    # モック設定: ISSUE2_DATA のみ既存Issue一覧に含まれる
+    mock_github_client.list_issues.return_value = [
+        create_existing_issue(ISSUE2_DATA.title),
+        create_existing_issue("Unrelated Issue"),
+    ]
 
     # create は2回呼ばれる想定
     mock_issue1 = create_mock_issue("url/1", "node_id_1")
@@ -208,7 +202,8 @@ def test_execute_mixed_issues(create_issues_use_case: CreateIssuesUseCase, mock_
     assert result.skipped_issue_titles == [ISSUE2_DATA.title]
     assert result.failed_issue_titles == []
     assert result.errors == []
-    assert mock_github_client.search_issues_and_pull_requests.call_count == 3
+    assert mock_github_client.list_issues.call_count == 1
+    mock_github_client.search_issues_and_pull_requests.assert_not_called()
     assert mock_github_client.create_issue.call_count == 2
     # ログの検証 (一部抜粋)
     assert f"Processing issue 1/3: '{ISSUE1_DATA.title}'" in caplog.text
@@ -222,6 +217,9 @@ def test_execute_mixed_issues(create_issues_use_case: CreateIssuesUseCase, mock_
 
 def test_execute_find_issue_api_error(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, caplog):
     """存在確認中にAPIエラーが発生しても処理が継続され、ログが出力されるかテスト"""
+    # 既存Issue一覧の取得に失敗した場合は検索APIにフォールバックする
+    mock_github_client.list_issues.side_effect = GitHubClientError(
+        "List API Error")
     mock_error = GitHubClientError("Find API Error")
 
     # 2番目と3番目のsearch_issuesの結果を設定
@@ -260,6 +258,7 @@ def test_execute_find_issue_api_error(create_issues_use_case: CreateIssuesUseCas
         owner=TEST_OWNER, repo=TEST_REPO, title=ISSUE2_DATA.title, body=ISSUE2_DATA.description, labels=None, milestone=None, assignees=[]
     )
     # ログの検証
+    assert "Falling back to per-issue search" in caplog.text
     assert f"Processing issue 1/3: '{ISSUE1_DATA.title}'" in caplog.text
     # エラーログ
     assert f"Failed to process issue '{ISSUE1_DATA.title}': GitHubClientError - Find API Error" in caplog.text
@@ -274,12 +273,7 @@ def test_execute_create_issue_api_error(create_issues_use_case: CreateIssuesUseC
     """Issue作成中にAPIエラーが発生しても処理が継続され、ログが出力されるかテスト"""
     mock_error = GitHubValidationError("Create API Error", status_code=422)
 
-    # search_issues の結果を設定
-    mock_search_result = MagicMock()
-    mock_search_result.total_count = 0  # 見つからない
-    mock_github_client.search_issues_and_pull_requests.return_value = mock_search_result
-
-    # モック設定: find は全て空リスト、create の2番目 (ISSUE4) でエラー
+    # モック設定: 既存Issueなし、create の2番目 (ISSUE4) でエラー
     mock_issue1 = create_mock_issue("url/1", "node1")
     mock_issue3 = create_mock_issue("url/3", "node3")
     mock_github_client.create_issue.side_effect = [
@@ -297,7 +291,7 @@ def test_execute_create_issue_api_error(create_issues_use_case: CreateIssuesUseC
     assert "Create API Error" in result.errors[0]
     # エラータイプも正しく記録されていることを検証
     assert "GitHubValidationError" in result.errors[0]
-    assert mock_github_client.search_issues_and_pull_requests.call_count == 3
+    mock_github_client.search_issues_and_pull_requests.assert_not_called()
     assert mock_github_client.create_issue.call_count == 3  # 3回呼ばれるが2回目はエラー
     # ログの検証
     assert f"Processing issue 1/3: '{ISSUE1_DATA.title}'" in caplog.text  # 成功
@@ -319,6 +313,7 @@ def test_execute_empty_issue_list(create_issues_use_case: CreateIssuesUseCase, m
     assert result.skipped_issue_titles == []
     assert result.failed_issue_titles == []
     assert result.errors == []
+    mock_github_client.list_issues.assert_not_called()
     mock_github_client.search_issues_and_pull_requests.assert_not_called()
     mock_github_client.create_issue.assert_not_called()
     assert f"Executing CreateIssuesUseCase for {TEST_OWNER}/{TEST_REPO} with 0 potential issues." in caplog.text
@@ -328,9 +323,6 @@ def test_execute_empty_issue_list(create_issues_use_case: CreateIssuesUseCase, m
 def test_execute_with_empty_title(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, caplog):
     """空タイトルのIssueが正しく処理されるかテスト（直接カスタムIssueDataを使用）"""
     # モック設定
-    mock_search_result = MagicMock()
-    mock_search_result.total_count = 0  # 見つからない
-    mock_github_client.search_issues_and_pull_requests.return_value = mock_search_result
     mock_issue1 = create_mock_issue("url/1", "node_id_1")
     mock_issue3 = create_mock_issue("url/3", "node_id_3")
     mock_github_client.create_issue.side_effect = [mock_issue1, mock_issue3]
@@ -358,8 +350,8 @@ def test_execute_with_empty_title(create_issues_use_case: CreateIssuesUseCase, m
     # エラーメッセージに「empty title」が含まれる
     assert "empty title" in result.errors[0].lower()
 
-    # find_issue_by_title と create_issue の呼び出し回数の検証
-    assert mock_github_client.search_issues_and_pull_requests.call_count == 2  # 空タイトルのチェックはスキップ
+    # 一覧取得と create_issue の呼び出し回数の検証
+    assert mock_github_client.list_issues.call_count == 1
     assert mock_github_client.create_issue.call_count == 2  # 空タイトル以外のみ作成
 
     # ログの検証
@@ -369,11 +361,6 @@ def test_execute_with_empty_title(create_issues_use_case: CreateIssuesUseCase, m
 
 def test_execute_with_assignees_validation(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, mock_assignee_validator: MagicMock, caplog):
     """担当者の検証機能が正しく動作するかテスト"""
-    # モック設定: search_issues は常に空リストを返す
-    mock_search_result = MagicMock()
-    mock_search_result.total_count = 0  # 見つからない
-    mock_github_client.search_issues_and_pull_requests.return_value = mock_search_result
-
     # create_issue の戻り値を設定
     mock_issue_valid = create_mock_issue("url/valid", "node_valid")
     mock_issue_invalid = create_mock_issue("url/invalid", "node_invalid")
@@ -443,7 +430,9 @@ def test_execute_with_assignees_validation(create_issues_use_case: CreateIssuesU
 
 def test_execute_with_unexpected_error(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, caplog):
     """予期せぬエラーが発生した場合のエラーハンドリングをテスト"""
-    # モックの設定
+    # モックの設定: 一覧取得に失敗させ、検索APIへのフォールバック経路を通す
+    mock_github_client.list_issues.side_effect = GitHubClientError(
+        "List API Error")
     mock_search_result1 = MagicMock()
     mock_search_result1.total_count = 0  # 見つからない
 
@@ -479,11 +468,6 @@ def test_execute_with_unexpected_error(create_issues_use_case: CreateIssuesUseCa
 
 def test_create_issue_returns_none_values(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, caplog):
     """create_issue が None の値を返した場合のエラー処理をテスト"""
-    # モックの設定
-    mock_search_result = MagicMock()
-    mock_search_result.total_count = 0  # 見つからない
-    mock_github_client.search_issues_and_pull_requests.return_value = mock_search_result
-
     # 1回目は正常、2回目はURL=None、3回目は両方Noneを返す
     mock_issue1 = create_mock_issue("url/1", "node_id_1")
     mock_issue2 = create_mock_issue(None, "node_id_2")  # URLがNone
@@ -524,9 +508,6 @@ def test_execute_with_milestone_mapping(create_issues_use_case: CreateIssuesUseC
     parsed_data = ParsedRequirementData(issues=[issue_with_milestone])
 
     # モック設定
-    mock_search_result = MagicMock()
-    mock_search_result.total_count = 0  # 見つからない
-    mock_github_client.search_issues_and_pull_requests.return_value = mock_search_result
     mock_issue = create_mock_issue("url/milestone", "node_id_milestone")
     mock_github_client.create_issue.return_value = mock_issue
 
@@ -558,9 +539,6 @@ def test_execute_with_missing_milestone_id(create_issues_use_case: CreateIssuesU
     parsed_data = ParsedRequirementData(issues=[issue_with_milestone])
 
     # モック設定
-    mock_search_result = MagicMock()
-    mock_search_result.total_count = 0  # 見つからない
-    mock_github_client.search_issues_and_pull_requests.return_value = mock_search_result
     mock_issue = create_mock_issue("url/milestone", "node_id_milestone")
     mock_github_client.create_issue.return_value = mock_issue
 
@@ -585,3 +563,105 @@ def test_execute_with_missing_milestone_id(create_issues_use_case: CreateIssuesU
 
     # 警告ログの検証
     assert "No milestone ID found for milestone 'Unknown Sprint'" in caplog.text
+
+
+def test_execute_skips_duplicates_within_same_file(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock):
+    """同一ファイル内で重複するタイトルは、最初の作成後にスキップされることをテスト"""
+    duplicate_issue = IssueData(title="  new issue 1 ", description="Dup")
+    parsed_data = ParsedRequirementData(issues=[ISSUE1_DATA, duplicate_issue])
+    mock_github_client.create_issue.return_value = create_mock_issue(
+        "url/1", "node_id_1")
+
+    result = create_issues_use_case.execute(
+        parsed_data, TEST_OWNER, TEST_REPO)
+
+    assert result.created_issue_details == [("url/1", "node_id_1")]
+    assert result.skipped_issue_titles == [duplicate_issue.title]
+    assert mock_github_client.create_issue.call_count == 1
+    mock_github_client.search_issues_and_pull_requests.assert_not_called()
+
+
+def test_execute_title_index_ignores_case_and_whitespace(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock):
+    """既存タイトルとの比較は大文字小文字・前後空白を無視することをテスト"""
+    mock_github_client.list_issues.return_value = [
+        create_existing_issue(" EXISTING issue 2")]
+
+    result = create_issues_use_case.execute(
+        PARSED_DATA_ALL_EXISTING, TEST_OWNER, TEST_REPO)
+
+    assert result.skipped_issue_titles == [ISSUE2_DATA.title]
+    mock_github_client.create_issue.assert_not_called()
+
+
+# --- 並行実行モードのテスト ---
+
+
+def test_init_rejects_invalid_max_workers(mock_github_client: MagicMock, mock_assignee_validator: MagicMock):
+    """max_workers に1未満を指定するとエラーになることをテスト"""
+    with pytest.raises(ValueError, match="max_workers"):
+        CreateIssuesUseCase(rest_client=mock_github_client,
+                            assignee_validator=mock_assignee_validator, max_workers=0)
+
+
+def test_execute_concurrent_keeps_input_order_and_isolates_errors(mock_github_client: MagicMock, mock_assignee_validator: MagicMock):
+    """並行実行時も結果が入力順に並び、Issue単位でエラーが分離されることをテスト"""
+    use_case = CreateIssuesUseCase(
+        rest_client=mock_github_client, assignee_validator=mock_assignee_validator, max_workers=4)
+    issues = [IssueData(title=f"Issue {i}", description=f"Body {i}")
+              for i in range(8)]
+
+    def create_side_effect(owner, repo, title, **kwargs):
+        index = int(title.split()[-1])
+        # 先頭のIssueほど遅く完了させ、完了順と入力順を入れ替える
+        time.sleep((8 - index) * 0.005)
+        if index == 5:
+            raise GitHubClientError("Create failed")
+        return create_mock_issue(f"url/{index}", f"node_{index}")
+    mock_github_client.create_issue.side_effect = create_side_effect
+
+    result = use_case.execute(ParsedRequirementData(
+        issues=issues), TEST_OWNER, TEST_REPO)
+
+    assert result.created_issue_details == [
+        (f"url/{i}", f"node_{i}") for i in range(8) if i != 5]
+    assert result.failed_issue_titles == ["Issue 5"]
+    assert len(result.errors) == 1
+    assert "Create failed" in result.errors[0]
+    assert mock_github_client.list_issues.call_count == 1
+
+
+def test_execute_concurrent_detects_duplicates_within_same_file(mock_github_client: MagicMock, mock_assignee_validator: MagicMock):
+    """並行実行時も同一ファイル内の重複タイトルは1件だけ作成されることをテスト"""
+    use_case = CreateIssuesUseCase(
+        rest_client=mock_github_client, assignee_validator=mock_assignee_validator, max_workers=4)
+    parsed_data = ParsedRequirementData(issues=[
+        ISSUE1_DATA, ISSUE3_DATA,
+        IssueData(title="New Issue 1", description="Duplicate"),
+    ])
+    mock_github_client.create_issue.side_effect = lambda owner, repo, title, **kwargs: create_mock_issue(
+        f"url/{title}", f"node/{title}")
+
+    result = use_case.execute(parsed_data, TEST_OWNER, TEST_REPO)
+
+    assert result.created_issue_details == [
+        ("url/New Issue 1", "node/New Issue 1"), ("url/New Issue 3", "node/New Issue 3")]
+    assert result.skipped_issue_titles == ["New Issue 1"]
+    assert mock_github_client.create_issue.call_count == 2
+
+
+def test_execute_uses_repository_snapshot(create_issues_use_case: CreateIssuesUseCase, mock_github_client: MagicMock, mock_assignee_validator: MagicMock):
+    """スナップショットが渡された場合、既存Issue一覧を取得せずにそのタイトルで重複判定する"""
+    snapshot = RepositorySnapshot(
+        owner=TEST_OWNER, name=TEST_REPO, open_issue_titles=[ISSUE1_DATA.title.upper()])
+    mock_github_client.create_issue.return_value = create_mock_issue(
+        "url/2", "node_id_2")
+    data = ParsedRequirementData(issues=[ISSUE1_DATA, ISSUE2_DATA])
+
+    result = create_issues_use_case.execute(
+        data, TEST_OWNER, TEST_REPO, repository_snapshot=snapshot)
+
+    mock_github_client.list_issues.assert_not_called()
+    mock_github_client.search_issues_and_pull_requests.assert_not_called()
+    mock_assignee_validator.load_snapshot.assert_called_once_with(snapshot)
+    assert result.skipped_issue_titles == [ISSUE1_DATA.title]
+    assert result.created_issue_details == [("url/2", "node_id_2")]
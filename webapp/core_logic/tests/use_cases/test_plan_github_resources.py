@@ -0,0 +1,146 @@
+import pytest
+from unittest.mock import MagicMock
+
+from core_logic.use_cases.plan_github_resources import PlanGitHubResourcesUseCase
+from core_logic.adapters.github_rest_client import GitHubRestClient
+from core_logic.adapters.github_graphql_client import GitHubGraphQLClient
+from core_logic.adapters.github_request_scheduler import GitHubRequestScheduler, RateLimitState
+from core_logic.domain.models import ParsedRequirementData, IssueData, RepositorySnapshot
+from core_logic.domain.exceptions import GitHubClientError, GitHubResourceNotFoundError
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def mock_rest_client() -> MagicMock:
+    return MagicMock(spec=GitHubRestClient)
+
+
+@pytest.fixture
+def mock_graphql_client() -> MagicMock:
+    mock = MagicMock(spec=GitHubGraphQLClient)
+    mock.get_repository_snapshot = MagicMock(return_value=SNAPSHOT)
+    mock.find_project_v2_node_id = MagicMock(return_value="PROJECT_NODE_ID")
+    mock.scheduler = None
+    return mock
+
+
+@pytest.fixture
+def plan_use_case(mock_rest_client, mock_graphql_client) -> PlanGitHubResourcesUseCase:
+    return PlanGitHubResourcesUseCase(rest_client=mock_rest_client, graphql_client=mock_graphql_client)
+
+
+# --- Test Data ---
+SNAPSHOT = RepositorySnapshot(
+    owner="owner", name="repo", repository_id="REPO_ID",
+    repository_url="https://github.com/owner/repo",
+    label_names=["Bug"], milestones={"Sprint 1": 3},
+    assignable_users=["alice"], open_issue_titles=["Existing issue"])
+PARSED_DATA = ParsedRequirementData(issues=[
+    IssueData(title="New issue", description="d", labels=["bug", "feature"],
+              milestone="Sprint 1", assignees=["@alice", "ghost"]),
+    IssueData(title="existing issue ", description="d", milestone="Sprint 2"),
+    IssueData(title="New Issue", description="d"),
+])
+
+
+# --- Tests ---
+
+def test_plan_existing_repository(plan_use_case, mock_rest_client, mock_graphql_client):
+    """スナップショットとの差分から作成/スキップを判定し、書き込みAPIは呼ばない"""
+    plan = plan_use_case.execute(PARSED_DATA, "owner", "repo", "Board")
+
+    assert plan.repository_exists is True
+    assert plan.repository_url == "https://github.com/owner/repo"
+    # ラベルは大文字小文字を区別せずに既存判定する
+    assert plan.labels_to_create == ["feature"]
+    assert plan.existing_labels == ["bug"]
+    assert plan.milestones_to_create == ["Sprint 2"]
+    assert plan.existing_milestones == {"Sprint 1": 3}
+    assert [(i.title, i.action, i.reason) for i in plan.issues] == [
+        ("New issue", "create", None),
+        ("existing issue ", "skip", "exists"),
+        ("New Issue", "skip", "duplicate_in_file"),
+    ]
+    assert plan.issues_to_create[0].invalid_assignees == ["ghost"]
+    assert plan.project_node_id == "PROJECT_NODE_ID"
+    assert plan.snapshot == SNAPSHOT
+    assert plan.estimated_cost.content_creations == 3  # ラベル1 + マイルストーン1 + Issue1
+    assert plan.estimated_cost.graphql_requests == 1
+    assert plan.estimated_cost.fits_rate_limit is None
+
+    mock_graphql_client.find_project_v2_node_id.assert_called_once_with(
+        "owner", "Board")
+    mock_rest_client.get_repository.assert_not_called()
+    mock_rest_client.create_label.assert_not_called()
+    mock_rest_client.create_milestone.assert_not_called()
+    mock_rest_client.create_issue.assert_not_called()
+
+
+def test_plan_new_repository(plan_use_case, mock_rest_client, mock_graphql_client):
+    """リポジトリが存在しない場合は全リソースを作成する計画になる"""
+    mock_graphql_client.get_repository_snapshot.return_value = None
+    mock_rest_client.get_repository.side_effect = GitHubResourceNotFoundError(
+        "not found")
+
+    plan = plan_use_case.execute(PARSED_DATA, "owner", "repo")
+
+    assert plan.repository_exists is False
+    assert plan.repository_url is None
+    assert plan.snapshot is None
+    assert plan.labels_to_create == ["bug", "feature"]
+    assert plan.milestones_to_create == ["Sprint 1", "Sprint 2"]
+    assert [i.title for i in plan.issues_to_create] == [
+        "New issue", "existing issue "]
+    # 担当者を検証できないため除外候補はない
+    assert plan.issues_to_create[0].invalid_assignees == []
+    assert plan.project_node_id is None
+    # リポジトリ1 + ラベル2 + マイルストーン2 + Issue2、作成後のスナップショット1回
+    assert plan.estimated_cost.content_creations == 7
+    assert plan.estimated_cost.graphql_requests == 1
+    mock_graphql_client.find_project_v2_node_id.assert_not_called()
+    mock_rest_client.list_labels.assert_not_called()
+
+
+def test_plan_falls_back_to_rest(plan_use_case, mock_rest_client, mock_graphql_client):
+    """スナップショットを取得できない場合は REST API で同じ状態を取得する"""
+    mock_graphql_client.get_repository_snapshot.side_effect = GitHubClientError(
+        "boom")
+    mock_rest_client.get_repository.return_value = MagicMock(
+        node_id="REPO_ID", html_url="https://github.com/owner/repo")
+    mock_rest_client.list_labels.return_value = [MagicMock(name="label")]
+    mock_rest_client.list_labels.return_value[0].name = "bug"
+    mock_rest_client.list_milestones.return_value = [
+        MagicMock(title="Sprint 1", number=3)]
+    mock_rest_client.list_assignees.return_value = ["alice"]
+    mock_rest_client.list_issues.return_value = [
+        MagicMock(title="Existing issue")]
+
+    plan = plan_use_case.execute(PARSED_DATA, "owner", "repo")
+
+    assert plan.repository_exists is True
+    assert plan.labels_to_create == ["feature"]
+    assert plan.existing_milestones == {"Sprint 1": 3}
+    assert plan.issues[1].action == "skip"
+    assert plan.snapshot.assignable_users == ["alice"]
+    mock_rest_client.list_milestones.assert_called_once_with(
+        "owner", "repo", state="all")
+    mock_rest_client.list_issues.assert_called_once_with(
+        "owner", "repo", state="open")
+
+
+def test_plan_compares_cost_with_rate_limit(plan_use_case, mock_graphql_client):
+    """スケジューラが把握しているレート制限の残量と見積もりを比較する"""
+    scheduler = MagicMock(spec=GitHubRequestScheduler)
+    scheduler.get_state.side_effect = lambda resource: {
+        "core": RateLimitState(remaining=2, reset_at=0),
+        "graphql": None,
+    }[resource]
+    mock_graphql_client.scheduler = scheduler
+
+    plan = plan_use_case.execute(PARSED_DATA, "owner", "repo")
+
+    assert plan.estimated_cost.rest_requests == 3
+    assert plan.estimated_cost.rest_remaining == 2
+    assert plan.estimated_cost.graphql_remaining is None
+    assert plan.estimated_cost.fits_rate_limit is False
@@ -1,14 +1,24 @@
 from core_logic.domain.exceptions import (
     GitHubClientError, GitHubAuthenticationError, GitHubValidationError, GitHubResourceNotFoundError
 )
-from core_logic.domain.models import ParsedRequirementData, CreateIssuesResult, CreateGitHubResourcesResult
+from core_logic.domain.models import (
+    ParsedRequirementData, CreateIssuesResult, CreateGitHubResourcesResult, RepositorySnapshot, ResourcePlan, StepTiming
+)
 from core_logic.use_cases.create_issues import CreateIssuesUseCase
 from core_logic.use_cases.create_repository import CreateRepositoryUseCase
+from core_logic.use_cases.plan_github_resources import PlanGitHubResourcesUseCase
 from core_logic.adapters.label_milestone_normalizer import LabelMilestoneNormalizerSvc
 from core_logic.adapters.github_graphql_client import GitHubGraphQLClient  # 追加
 from core_logic.adapters.github_rest_client import GitHubRestClient  # 修正
+from core_logic.adapters.github_utils import ApiCallCounter
+from core_logic.adapters.run_ledger import (
+    RunLedger, LedgerRun, KIND_REPOSITORY, KIND_LABEL, KIND_MILESTONE, KIND_PROJECT, KIND_PROJECT_ITEM,
+    KIND_ISSUE, issue_fingerprint
+)
 import logging
-from typing import Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
 import sys
 import os
 from unittest.mock import MagicMock
@@ -20,6 +30,41 @@ from unittest.mock import MagicMock
 
 logger = logging.getLogger(__name__)
 
+# 進捗通知のコールバック: (ステップ名, その時点までの実行結果) を受け取る
+ProgressCallback = Callable[[str, CreateGitHubResourcesResult], None]
+
+
+class _StepTimer:
+    """ワークフローのステップごとの所要時間とAPI呼び出し回数を計測し、result.step_timings に追記します。"""
+
+    def __init__(self, result: CreateGitHubResourcesResult, call_count: Callable[[], int],
+                 clock: Callable[[], float] = time.perf_counter):
+        self._result = result
+        self._call_count = call_count
+        self._clock = clock
+        self._step: Optional[str] = None
+        self._started = 0.0
+        self._calls_at_start = 0
+
+    def start(self, step: str) -> None:
+        self.finish()
+        self._step = step
+        self._started = self._clock()
+        self._calls_at_start = self._call_count()
+
+    def finish(self, items: int = 0) -> None:
+        """計測中のステップを終了します (計測中でなければ何もしません)。"""
+        if self._step is None:
+            return
+        duration = self._clock() - self._started
+        self._result.step_timings.append(StepTiming(
+            step=self._step, duration_seconds=duration,
+            api_calls=self._call_count() - self._calls_at_start, items=items,
+            items_per_second=items / duration if items and duration > 0 else None))
+        logger.debug(
+            f"Step '{self._step}' took {duration:.3f}s ({items} item(s)).")
+        self._step = None
+
 
 class CreateGitHubResourcesUseCase:
     """
@@ -34,8 +79,18 @@ class CreateGitHubResourcesUseCase:
                  graphql_client: GitHubGraphQLClient,
                  create_repo_uc: CreateRepositoryUseCase,
                  create_issues_uc: CreateIssuesUseCase,
-                 defaults_loader=None):
-        """UseCaseを初期化し、依存コンポーネントを注入します。"""
+                 defaults_loader=None,
+                 max_workers: int = 1,
+                 plan_uc: Optional[PlanGitHubResourcesUseCase] = None,
+                 ledger: Optional[RunLedger] = None):
+        """
+        UseCaseを初期化し、依存コンポーネントを注入します。
+
+        Args:
+            max_workers: 不足ラベル作成の最大並行数。1の場合は逐次処理します。
+            plan_uc: ドライランで実行計画を作成するUseCase。省略時は同じクライアントで作成します。
+            ledger: 作成済みリソースを実行IDごとに記録する台帳。execute に run_id を指定した場合に使用します。
+        """
         # 型チェック（テスト用MagicMock/NonCallableMagicMockも許容）
         allowed_mocks = ('MagicMock', 'NonCallableMagicMock')
         if not (isinstance(rest_client, GitHubRestClient) or type(rest_client).__name__ in allowed_mocks):
@@ -55,6 +110,12 @@ class CreateGitHubResourcesUseCase:
         self.create_repo_uc = create_repo_uc
         self.create_issues_uc = create_issues_uc
         self.defaults_loader = defaults_loader  # 追加
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.plan_uc = plan_uc or PlanGitHubResourcesUseCase(
+            rest_client=rest_client, graphql_client=graphql_client)
+        self.ledger = ledger
         logger.debug("CreateGitHubResourcesUseCase initialized.")
 
     def _get_owner_repo(self, repo_name_input: str) -> Tuple[str, str]:
@@ -92,11 +153,190 @@ class CreateGitHubResourcesUseCase:
                 raise GitHubAuthenticationError(
                     f"Unexpected error getting authenticated user: {e} [cause: {type(e).__name__}: {e} ]", original_exception=e) from e
 
+    def _ensure_repository(self, repo_owner: str, repo_name: str, repo_full_name: str) -> Optional[str]:
+        """リポジトリを作成し、既に存在する場合は既存リポジトリのURLを返します。"""
+        repo_url: Optional[str] = None
+        try:
+            # UseCase を呼び出してリポジトリ作成を試みる
+            repo_url = self.create_repo_uc.execute(repo_name)
+            logger.info(
+                f"Repository '{repo_full_name}' created successfully: {repo_url}")
+        except GitHubValidationError as e:
+            # ★ Issueで提案された修正箇所: 既存リポジトリエラーのハンドリング ★
+            if e.status_code == 422 and "already exists" in str(e).lower():
+                logger.warning(
+                    f"Repository '{repo_full_name}' already exists. Proceeding with existing repository.")
+                # 既存リポジトリの情報を取得して URL を設定
+                try:
+                    # 追加した get_repository メソッドを呼び出す
+                    existing_repo = self.rest_client.get_repository(
+                        repo_owner, repo_name)
+                    if existing_repo and existing_repo.html_url:
+                        repo_url = existing_repo.html_url
+                        logger.info(
+                            f"Using existing repository URL: {repo_url}")
+                    else:
+                        # get_repository が成功してもURLが取れない稀なケース
+                        logger.error(
+                            f"Could not retrieve URL for existing repository '{repo_full_name}'. Halting workflow.")
+                        raise GitHubClientError(
+                            f"Failed to get URL for existing repo {repo_full_name}") from e
+                except (GitHubResourceNotFoundError, GitHubAuthenticationError, GitHubClientError) as get_err:
+                    # 既存リポジトリ情報の取得に失敗した場合（アクセス権がない等）は致命的エラー
+                    logger.error(
+                        f"Failed to access existing repository '{repo_full_name}': {get_err}. Halting workflow.")
+                    raise  # ワークフローを停止させるため再送出
+            else:
+                # "already exists" 以外の ValidationError は致命的エラー
+                logger.error(
+                    f"Repository creation failed with unexpected validation error: {e}")
+                raise  # ワークフローを停止させるため再送出
+        # create_repo_uc.execute や rest_client.get_repository で捕捉されなかった他の例外もここで捕捉し、
+        # 致命的エラーとして扱う (例: GitHubAuthenticationError など)
+        except (GitHubAuthenticationError, GitHubClientError) as e:
+            logger.error(
+                f"Error during repository setup for '{repo_full_name}': {e}. Halting workflow.")
+            raise
+        return repo_url
+
+    def _load_repository_snapshot(self, owner: str, repo: str) -> Optional[RepositorySnapshot]:
+        """
+        GraphQL でリポジトリスナップショットを一括取得します。
+        取得に失敗した場合や全件取得できなかった場合は None を返し、各ステップは REST API による確認にフォールバックします。
+        """
+        try:
+            snapshot = self.graphql_client.get_repository_snapshot(owner, repo)
+        except Exception as e:
+            logger.warning(
+                f"Failed to load repository snapshot for {owner}/{repo}: {e}. Falling back to REST lookups.")
+            return None
+        if snapshot is None:
+            logger.warning(
+                f"Repository snapshot for {owner}/{repo} is unavailable. Falling back to REST lookups.")
+            return None
+        if not snapshot.is_complete:
+            logger.warning(
+                f"Repository snapshot for {owner}/{repo} is incomplete. Falling back to REST lookups.")
+            return None
+        return snapshot
+
+    def _list_existing_label_names(self, owner: str, repo: str) -> Optional[set[str]]:
+        """
+        リポジトリの既存ラベルを一覧APIで取得し、正規化済み (大文字小文字無視) の名前セットを返します。
+        一覧取得に失敗した場合は None を返し、呼び出し元はラベルごとの存在確認にフォールバックします。
+        """
+        try:
+            existing_labels = self.rest_client.list_labels(owner, repo)
+        except GitHubClientError as e:
+            logger.warning(
+                f"Failed to list labels for {owner}/{repo}: {e}. Falling back to per-label lookup.")
+            return None
+        names = {label.name.strip().casefold()
+                 for label in existing_labels if getattr(label, "name", None)}
+        logger.info(
+            f"Loaded {len(names)} existing labels from {owner}/{repo}.")
+        return names
+
+    def _create_missing_label(self, owner: str, repo: str, repo_full_name: str, label_name: str) -> Optional[str]:
+        """不足しているラベルを1件作成します。成功時は None、失敗時は結果に記録するエラーメッセージを返します。"""
+        logger.info(f"Label '{label_name}' not found, creating...")
+        try:
+            self.rest_client.create_label(owner, repo, label_name)
+            return None
+        except Exception as e:
+            context = f"ensuring label '{label_name}' in {repo_full_name}"
+            logger.exception(f"Unexpected error during {context}: {e}")
+            return f"Unexpected error: {e}"
+
+    def _build_milestone_number_map(self, owner: str, repo: str) -> dict[str, Optional[int]]:
+        """
+        リポジトリの全マイルストーン (open/closed) を取得し、タイトル→番号のマップを返します。
+        同名のマイルストーンが複数ある場合は最初に見つかったものを採用します。
+        """
+        existing_milestones = self.rest_client.list_milestones(
+            owner, repo, state="all")
+        number_map: dict[str, Optional[int]] = {}
+        for ms in existing_milestones:
+            number_map.setdefault(ms.title, ms.number)
+        logger.info(
+            f"Loaded {len(number_map)} existing milestones from {owner}/{repo}.")
+        return number_map
+
+    def _collect_retry_counts(self) -> dict[str, int]:
+        """REST/GraphQL クライアントに記録されたリトライ回数を 'rest.xxx' / 'graphql.xxx' の形式で集計します。"""
+        retried: dict[str, int] = {}
+        for prefix, client in (("rest", self.rest_client), ("graphql", self.graphql_client)):
+            retry_stats = getattr(client, "retry_stats", None)
+            if retry_stats is None:
+                continue
+            for operation, count in retry_stats.snapshot().items():
+                retried[f"{prefix}.{operation}"] = count
+        return retried
+
+    def _api_call_count(self) -> int:
+        """REST/GraphQL クライアントがこれまでに実行したAPI呼び出し回数の合計を返します。"""
+        total = 0
+        for client in (self.rest_client, self.graphql_client):
+            call_counter = getattr(client, "call_counter", None)
+            if isinstance(call_counter, ApiCallCounter):
+                total += call_counter.value
+        return total
+
+    @staticmethod
+    def _has_pending_work(parsed_data: ParsedRequirementData, run: LedgerRun) -> bool:
+        """台帳に記録されていない (この実行でまだ完了していない) ラベル・マイルストーン・Issueがあるかを返します。"""
+        recorded_labels = run.entries(KIND_LABEL)
+        recorded_milestones = run.entries(KIND_MILESTONE)
+        recorded_issues = run.entries(KIND_ISSUE)
+        for issue in parsed_data.issues:
+            if any(label and label.strip() and label not in recorded_labels for label in issue.labels or []):
+                return True
+            if issue.milestone and issue.milestone.strip() and issue.milestone.strip() not in recorded_milestones:
+                return True
+            if issue.title and issue_fingerprint(issue) not in recorded_issues:
+                return True
+        return False
+
+    @staticmethod
+    def _notify_progress(progress_callback: Optional[ProgressCallback], step: str,
+                         result: CreateGitHubResourcesResult) -> None:
+        """進捗をコールバックに通知します。コールバックの失敗はワークフローに影響させません。"""
+        if progress_callback is None:
+            return
+        try:
+            progress_callback(step, result)
+        except Exception as e:
+            logger.warning(f"Progress callback failed at step '{step}': {e}")
+
+    def plan(self, parsed_data: ParsedRequirementData, repo_name_input: str,
+             project_name: Optional[str] = None) -> ResourcePlan:
+        """リポジトリの現在状態を読み取り専用のAPIで取得し、作成/スキップの実行計画を返します (GitHubは変更しません)。"""
+        repo_owner, repo_name = self._get_owner_repo(repo_name_input)
+        return self.plan_uc.execute(parsed_data, repo_owner, repo_name, project_name)
+
+    def _resolve_plan_target(self, plan: ResourcePlan, repo_name_input: str) -> Tuple[str, str]:
+        """適用する計画の対象リポジトリを返します。入力されたリポジトリ名と一致しない場合は ValueError を送出します。"""
+        if repo_name_input not in (plan.repo, f"{plan.owner}/{plan.repo}"):
+            raise ValueError(
+                f"Plan was computed for '{plan.owner}/{plan.repo}', not '{repo_name_input}'.")
+        return plan.owner, plan.repo
+
     def execute(self, parsed_data: ParsedRequirementData, repo_name_input: str,
-                project_name: Optional[str] = None, dry_run: bool = False) -> CreateGitHubResourcesResult:
+                project_name: Optional[str] = None, dry_run: bool = False,
+                progress_callback: Optional[ProgressCallback] = None,
+                plan: Optional[ResourcePlan] = None,
+                run_id: Optional[str] = None) -> CreateGitHubResourcesResult:
         """
         GitHub リソース作成のワークフローを実行します。
         既存リポジトリの場合も処理を続行します。
+        progress_callback を指定した場合、各ステップの開始時と完了時に (ステップ名, 途中結果) を通知します。
+
+        dry_run=True の場合はGitHubを変更せず、実行計画 (ResourcePlan) を作成して result.plan に格納します。
+        plan を指定した場合は、計画作成時に取得したリポジトリの状態 (存在有無・ラベル・マイルストーン・既存Issue・
+        担当者・プロジェクト) を再取得せずに使用して適用します。
+
+        台帳 (ledger) を設定した状態で run_id を指定した場合、作成・確認したリソースを台帳に記録します。
+        同じ run_id で再実行すると、記録済みの処理はAPIを呼ばずにスキップし、作成済みのIssueは再作成しません。
         """
         logger.info(
             f"Starting GitHub resource creation workflow... (Dry Run: {dry_run})")
@@ -104,76 +344,96 @@ class CreateGitHubResourcesUseCase:
         result = CreateGitHubResourcesResult(project_name=project_name)
         repo_owner, repo_name, repo_full_name = "", "", ""
         repo_url: Optional[str] = None  # repo_urlを try ブロック外で初期化
+        run: Optional[LedgerRun] = None
+        if self.ledger is not None and run_id and not dry_run:
+            run = self.ledger.run(run_id)
+        timer = _StepTimer(result, self._api_call_count)
 
         try:
             # --- ステップ 1: リポジトリ名解析 ---
+            self._notify_progress(progress_callback, "resolve_repository", result)
             logger.info("Step 1: Resolving repository owner and name...")
-            repo_owner, repo_name = self._get_owner_repo(repo_name_input)
+            recorded_repo = run.get(
+                KIND_REPOSITORY, repo_name_input) if run else None
+            if plan is not None:
+                repo_owner, repo_name = self._resolve_plan_target(
+                    plan, repo_name_input)
+                project_name = plan.project_name
+                result.project_name = project_name
+            elif recorded_repo:
+                repo_owner, repo_name = recorded_repo["owner"], recorded_repo["repo"]
+                logger.info(
+                    f"Resuming run '{run_id}' for {repo_owner}/{repo_name}.")
+            else:
+                repo_owner, repo_name = self._get_owner_repo(repo_name_input)
             repo_full_name = f"{repo_owner}/{repo_name}"
             logger.info(
                 f"Step 1 finished. Target repository: {repo_full_name}")
 
             # --- ステップ 2: Dry Run モード ---
             if dry_run:
-                # (Dry Run のロジックは変更なし)
                 logger.warning(
                     "Dry run mode enabled. Skipping GitHub operations.")
                 result.repository_url = f"https://github.com/{repo_full_name} (Dry Run)"
-                # ... (Dry Run 用のダミーデータ設定) ...
+                # 読み取り専用のAPIで現在状態を取得し、作成/スキップの計画を作成する
+                if plan is None:
+                    try:
+                        plan = self.plan_uc.execute(
+                            parsed_data, repo_owner, repo_name, project_name)
+                    except Exception as e:
+                        logger.warning(
+                            f"Could not compute a plan for {repo_full_name}: {e}")
+                result.plan = plan
+                if plan is not None:
+                    result.project_node_id = plan.project_node_id
                 logger.warning("Dry run finished.")
+                self._notify_progress(progress_callback, "completed", result)
                 return result
 
             # --- ステップ 3: リポジトリ作成/確認 ---
+            self._notify_progress(progress_callback, "ensure_repository", result)
+            timer.start("repository")
             logger.info(
                 f"Step 3: Ensuring repository '{repo_full_name}' exists...")
-            try:
-                # UseCase を呼び出してリポジトリ作成を試みる
-                repo_url = self.create_repo_uc.execute(repo_name)
+            if recorded_repo:
+                repo_url = recorded_repo["url"]
                 logger.info(
-                    f"Repository '{repo_full_name}' created successfully: {repo_url}")
-            except GitHubValidationError as e:
-                # ★ Issueで提案された修正箇所: 既存リポジトリエラーのハンドリング ★
-                if e.status_code == 422 and "already exists" in str(e).lower():
-                    logger.warning(
-                        f"Repository '{repo_full_name}' already exists. Proceeding with existing repository.")
-                    # 既存リポジトリの情報を取得して URL を設定
-                    try:
-                        # 追加した get_repository メソッドを呼び出す
-                        existing_repo = self.rest_client.get_repository(
-                            repo_owner, repo_name)
-                        if existing_repo and existing_repo.html_url:
-                            repo_url = existing_repo.html_url
-                            logger.info(
-                                f"Using existing repository URL: {repo_url}")
-                        else:
-                            # get_repository が成功してもURLが取れない稀なケース
-                            logger.error(
-                                f"Could not retrieve URL for existing repository '{repo_full_name}'. Halting workflow.")
-                            raise GitHubClientError(
-                                f"Failed to get URL for existing repo {repo_full_name}") from e
-                    except (GitHubResourceNotFoundError, GitHubAuthenticationError, GitHubClientError) as get_err:
-                        # 既存リポジトリ情報の取得に失敗した場合（アクセス権がない等）は致命的エラー
-                        logger.error(
-                            f"Failed to access existing repository '{repo_full_name}': {get_err}. Halting workflow.")
-                        raise  # ワークフローを停止させるため再送出
-                else:
-                    # "already exists" 以外の ValidationError は致命的エラー
-                    logger.error(
-                        f"Repository creation failed with unexpected validation error: {e}")
-                    raise  # ワークフローを停止させるため再送出
-            # create_repo_uc.execute や rest_client.get_repository で捕捉されなかった他の例外もここで捕捉し、
-            # 致命的エラーとして扱う (例: GitHubAuthenticationError など)
-            except (GitHubAuthenticationError, GitHubClientError) as e:
-                logger.error(
-                    f"Error during repository setup for '{repo_full_name}': {e}. Halting workflow.")
-                raise
+                    f"Repository '{repo_full_name}' was already ensured in this run.")
+            elif plan is not None and plan.repository_exists:
+                # 計画作成時に存在を確認済みのため、作成・再確認は行わない
+                repo_url = plan.repository_url
+                logger.info(
+                    f"Repository '{repo_full_name}' exists according to the plan.")
+            else:
+                repo_url = self._ensure_repository(
+                    repo_owner, repo_name, repo_full_name)
+            if run and not recorded_repo:
+                run.record(KIND_REPOSITORY, repo_name_input, {
+                    "owner": repo_owner, "repo": repo_name, "url": repo_url})
 
             # 取得した URL を結果に格納
             result.repository_url = repo_url
             logger.info(f"Step 3 finished. Repository URL to use: {repo_url}")
             # --- ★ 修正箇所ここまで ★ ---
 
+            # 既存のラベル・マイルストーン・担当者・Issueを1回のGraphQLクエリでまとめて取得する
+            # (計画を適用する場合は計画作成時に取得した状態を使用する)
+            if plan is not None and plan.repository_exists and plan.snapshot is not None:
+                repository_snapshot = plan.snapshot
+                result.plan = plan
+            elif run and not self._has_pending_work(parsed_data, run):
+                # 全てのリソースが台帳に記録済みの場合は状態を取得しない
+                logger.info(
+                    f"All labels, milestones and issues were already processed in run '{run_id}'.")
+                repository_snapshot = None
+            else:
+                repository_snapshot = self._load_repository_snapshot(
+                    repo_owner, repo_name)
+            timer.finish(items=1)
+
             # --- ステップ 4: ラベル作成/確認 ---
+            self._notify_progress(progress_callback, "ensure_labels", result)
+            timer.start("labels")
             logger.info(
                 f"Step 4: Ensuring required labels exist in {repo_full_name}...")
             unique_labels_in_file = set()
@@ -189,37 +449,86 @@ class CreateGitHubResourcesUseCase:
             result.failed_labels = []
             sorted_labels = sorted(list(unique_labels_in_file))
             total_labels = len(sorted_labels)
+            recorded_labels = run.entries(KIND_LABEL) if run else {}
 
             if total_labels > 0:
                 logger.debug(
                     f"Found {total_labels} unique labels in file: {sorted_labels}")
+                # 既存ラベルは一覧APIで一括取得し、差分判定はローカルで行う
+                if all(label_name in recorded_labels for label_name in sorted_labels):
+                    existing_label_names = set()
+                elif repository_snapshot is not None:
+                    existing_label_names = {
+                        name.strip().casefold() for name in repository_snapshot.label_names}
+                else:
+                    existing_label_names = self._list_existing_label_names(
+                        repo_owner, repo_name)
+                label_errors: dict[str, str] = {}
+                labels_to_create: list[str] = []
                 for i, label_name in enumerate(sorted_labels):
-                    context = f"ensuring label '{label_name}' in {repo_full_name}"
                     logger.info(
                         f"Processing label {i+1}/{total_labels}: '{label_name}'")
+                    if label_name in recorded_labels:
+                        logger.info(
+                            f"Label '{label_name}' was already ensured in this run.")
+                        skipped_labels_count += 1
+                        continue
                     try:
-                        # ラベル取得/作成は GitHubRestClient を使用
-                        existing_label = self.rest_client.get_label(
-                            repo_owner, repo_name, label_name)
-                        if existing_label:
-                            logger.info(
-                                f"Label '{label_name}' already exists.")
-                            skipped_labels_count += 1
+                        if existing_label_names is not None:
+                            label_exists = label_name.strip().casefold() in existing_label_names
                         else:
-                            logger.info(
-                                f"Label '{label_name}' not found, creating...")
-                            self.rest_client.create_label(
-                                repo_owner, repo_name, label_name)
-                            created_labels_count += 1
-                        result.created_labels.append(label_name)
+                            # 一覧取得に失敗した場合は従来どおり個別に存在確認する
+                            label_exists = self.rest_client.get_label(
+                                repo_owner, repo_name, label_name) is not None
                     except Exception as e:
-                        error_msg = f"Unexpected error during {context}: {e}"
-                        logger.exception(error_msg)
+                        context = f"ensuring label '{label_name}' in {repo_full_name}"
+                        logger.exception(
+                            f"Unexpected error during {context}: {e}")
+                        label_errors[label_name] = f"Unexpected error: {e}"
+                        continue
+                    if label_exists:
+                        logger.info(f"Label '{label_name}' already exists.")
+                        skipped_labels_count += 1
+                        if run:
+                            run.record(KIND_LABEL, label_name)
+                    else:
+                        labels_to_create.append(label_name)
+
+                # 不足しているラベルのみ作成する (max_workers > 1 の場合は並行実行)
+                def create_missing(label_name: str) -> Optional[str]:
+                    return self._create_missing_label(
+                        repo_owner, repo_name, repo_full_name, label_name)
+
+                workers = min(self.max_workers, len(labels_to_create))
+                if workers > 1:
+                    logger.info(
+                        f"Creating {len(labels_to_create)} missing labels with {workers} workers.")
+                    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="create-label") as executor:
+                        creation_errors = list(
+                            executor.map(create_missing, labels_to_create))
+                else:
+                    creation_errors = [create_missing(label_name)
+                                       for label_name in labels_to_create]
+
+                for label_name, error in zip(labels_to_create, creation_errors):
+                    if error is None:
+                        created_labels_count += 1
+                        if run:
+                            run.record(KIND_LABEL, label_name)
+                    else:
+                        label_errors[label_name] = error
+
+                # 結果はファイル内ラベルのソート順で格納する
+                for label_name in sorted_labels:
+                    if label_name in label_errors:
                         result.failed_labels.append(
-                            (label_name, f"Unexpected error: {e}"))
+                            (label_name, label_errors[label_name]))
+                    else:
+                        result.created_labels.append(label_name)
             else:
                 logger.info("No valid labels found in parsed data to ensure.")
 
+            timer.finish(items=total_labels)
             log_label_summary = (f"Step 4 finished. New labels: {created_labels_count}, "
                                  f"Existing/Skipped: {skipped_labels_count}, Failed: {len(result.failed_labels)}.")
             if result.failed_labels:
@@ -229,6 +538,8 @@ class CreateGitHubResourcesUseCase:
                 logger.info(log_label_summary)
 
             # --- ステップ 5: マイルストーン作成/確認 ---
+            self._notify_progress(progress_callback, "ensure_milestones", result)
+            timer.start("milestones")
             logger.info(
                 f"Step 5: Ensuring required milestones exist in {repo_full_name}...")
             unique_milestones_in_file = set()
@@ -245,26 +556,45 @@ class CreateGitHubResourcesUseCase:
             if total_milestones > 0:
                 logger.info(
                     f"Found {total_milestones} unique milestones to process")
+                # 既存マイルストーンは全ページを1回だけ取得し、タイトル→番号のマップとして保持する
+                existing_milestone_numbers: Optional[dict[str, Optional[int]]] = None
+                milestone_list_error: Optional[Exception] = None
+                recorded_milestones = run.entries(KIND_MILESTONE) if run else {}
+                try:
+                    if all(name in recorded_milestones for name in unique_milestones_in_file):
+                        existing_milestone_numbers = {}
+                    elif repository_snapshot is not None:
+                        existing_milestone_numbers = dict(
+                            repository_snapshot.milestones)
+                    else:
+                        existing_milestone_numbers = self._build_milestone_number_map(
+                            repo_owner, repo_name)
+                except Exception as e:
+                    logger.exception(
+                        f"Failed to list milestones for {repo_full_name}: {e}")
+                    milestone_list_error = e
+
                 for i, milestone_name in enumerate(sorted(unique_milestones_in_file)):
                     context = f"ensuring milestone '{milestone_name}' in {repo_full_name}"
                     logger.info(
                         f"Processing milestone {i+1}/{total_milestones}: '{milestone_name}'")
                     try:
-                        # マイルストーン取得/作成は GitHubRestClient を使用
-                        # list_milestones で存在確認してから create_milestone を呼ぶ
-                        existing_milestones = self.rest_client.list_milestones(
-                            repo_owner, repo_name, state="all")
-                        found_milestone = None
-                        for ms in existing_milestones:
-                            if ms.title == milestone_name:
-                                found_milestone = ms
-                                break
-
-                        if found_milestone:
-                            if found_milestone.number is None:
+                        if milestone_name in recorded_milestones:
+                            milestone_id = recorded_milestones[milestone_name]
+                            logger.info(
+                                f"Milestone '{milestone_name}' was already ensured in this run with ID: {milestone_id}.")
+                            milestone_id_map[milestone_name] = milestone_id
+                            result.processed_milestones.append(
+                                (milestone_name, milestone_id))
+                            continue
+                        if existing_milestone_numbers is None:
+                            # 一覧取得に失敗した場合は重複作成を避けるため作成しない
+                            raise milestone_list_error
+                        if milestone_name in existing_milestone_numbers:
+                            milestone_id = existing_milestone_numbers[milestone_name]
+                            if milestone_id is None:
                                 raise GitHubClientError(
                                     f"Found milestone '{milestone_name}' but it has no ID.")
-                            milestone_id = found_milestone.number
                             logger.info(
                                 f"Milestone '{milestone_name}' already exists with ID: {milestone_id}.")
                         else:
@@ -276,12 +606,16 @@ class CreateGitHubResourcesUseCase:
                                 raise GitHubClientError(
                                     f"Milestone '{milestone_name}' creation failed.")
                             milestone_id = new_milestone.number
+                            existing_milestone_numbers[milestone_name] = milestone_id
                             logger.info(
                                 f"Milestone '{milestone_name}' created successfully with ID: {milestone_id}.")
 
                         milestone_id_map[milestone_name] = milestone_id
                         result.processed_milestones.append(
                             (milestone_name, milestone_id))
+                        if run:
+                            run.record(KIND_MILESTONE,
+                                       milestone_name, milestone_id)
                     except Exception as e:
                         error_msg = f"Unexpected error during {context}: {e}"
                         logger.exception(error_msg)
@@ -290,6 +624,7 @@ class CreateGitHubResourcesUseCase:
             else:
                 logger.info("No milestones found in parsed data.")
 
+            timer.finish(items=total_milestones)
             log_milestone_summary = (f"Step 5 finished. Processed milestones: {len(result.processed_milestones)}/{total_milestones}, "
                                      f"Failed: {len(result.failed_milestones)}.")
             if result.failed_milestones:
@@ -299,8 +634,20 @@ class CreateGitHubResourcesUseCase:
                 logger.info(log_milestone_summary)
 
             # --- ステップ 6: プロジェクト検索 ---
+            self._notify_progress(progress_callback, "find_project", result)
+            timer.start("project")
             project_node_id = None
-            if project_name:
+            if plan is not None:
+                project_node_id = plan.project_node_id
+                result.project_node_id = project_node_id
+                logger.info(
+                    f"Step 6: Using project from the plan: {project_node_id or 'not found'}.")
+            elif project_name and run and run.get(KIND_PROJECT, project_name):
+                project_node_id = run.get(KIND_PROJECT, project_name)
+                result.project_node_id = project_node_id
+                logger.info(
+                    f"Step 6: Using Project V2 '{project_name}' found earlier in this run: {project_node_id}.")
+            elif project_name:
                 context = f"finding Project V2 '{project_name}' for owner '{repo_owner}'"
                 logger.info(f"Step 6: {context}...")
                 try:
@@ -309,6 +656,9 @@ class CreateGitHubResourcesUseCase:
                         repo_owner, project_name)
                     if project_node_id:
                         result.project_node_id = project_node_id
+                        if run:
+                            run.record(KIND_PROJECT, project_name,
+                                       project_node_id)
                         logger.info(
                             f"Found Project V2 '{project_name}' with Node ID: {project_node_id}")
                     else:
@@ -324,42 +674,70 @@ class CreateGitHubResourcesUseCase:
             else:
                 logger.info("Step 6: No project name specified, skipping.")
 
+            timer.finish(items=1 if project_name else 0)
+
             # --- ステップ 7: Issue 作成 ---
+            self._notify_progress(progress_callback, "create_issues", result)
+            timer.start("issues")
             logger.info(f"Step 7: Creating issues in '{repo_full_name}'...")
             # Issue作成UseCase呼び出し (依存関係は修正済みと仮定)
             issue_result: CreateIssuesResult = self.create_issues_uc.execute(
-                parsed_data, repo_owner, repo_name, milestone_id_map
+                parsed_data, repo_owner, repo_name, milestone_id_map,
+                repository_snapshot=repository_snapshot, ledger=run
             )
             result.issue_result = issue_result
+            timer.finish(items=len(parsed_data.issues))
             logger.info("Step 7 finished.")
 
             # --- ステップ 8: Issueをプロジェクトに追加 ---
+            self._notify_progress(progress_callback, "add_to_project", result)
+            timer.start("project_items")
             if project_node_id and issue_result and issue_result.created_issue_details:
                 total_issues_to_add = len(issue_result.created_issue_details)
                 logger.info(
                     f"Step 8: Adding {total_issues_to_add} created issues to project '{project_name}'...")
                 result.project_items_failed = []
 
-                for i, (issue_url, issue_node_id) in enumerate(issue_result.created_issue_details):
-                    context = f"adding item (Issue Node ID: {issue_node_id}) to project '{project_name}' (Project Node ID: {project_node_id})"
-                    logger.info(
-                        f"Processing item {i+1}/{total_issues_to_add}: {context}")
+                # この実行で追加済みのアイテムは再追加しない
+                recorded_items = {key.split(":", 1)[1]: item_id for key, item_id in (
+                    run.entries(KIND_PROJECT_ITEM).items() if run else ())
+                    if key.startswith(f"{project_node_id}:")}
+                issue_node_ids = [
+                    node_id for _, node_id in issue_result.created_issue_details
+                    if node_id not in recorded_items]
+                added_items: dict = {}
+                failed_items: dict = {}
+                if issue_node_ids:
                     try:
-                        # プロジェクトへのアイテム追加は GitHubGraphQLClient を使用
-                        item_id = self.graphql_client.add_item_to_project_v2(
-                            project_node_id, issue_node_id)
-                        if item_id:
-                            result.project_items_added_count += 1
-                        else:
-                            error_msg = f"Failed to {context}: Did not receive valid item ID."
-                            logger.error(error_msg)
-                            result.project_items_failed.append(
-                                (issue_node_id, "Unexpected error: Did not receive valid item ID"))
+                        # プロジェクトへのアイテム追加は GitHubGraphQLClient のバッチAPIでまとめて行う
+                        added_items, failed_items = self.graphql_client.add_items_to_project_v2(
+                            project_node_id, issue_node_ids)
                     except Exception as e:
-                        error_msg = f"Unexpected error during {context}: {e}"
-                        logger.exception(error_msg)
+                        logger.exception(
+                            f"Unexpected error during adding items to project '{project_name}' (Project Node ID: {project_node_id}): {e}")
+                        added_items = {}
+                        failed_items = {node_id: str(e)
+                                        for node_id in issue_node_ids}
+                if run:
+                    for node_id, item_id in added_items.items():
+                        if item_id:
+                            run.record(KIND_PROJECT_ITEM,
+                                       f"{project_node_id}:{node_id}", item_id)
+                added_items = {**recorded_items, **added_items}
+
+                for i, (issue_url, issue_node_id) in enumerate(issue_result.created_issue_details):
+                    context = f"adding item (Issue Node ID: {issue_node_id}) to project '{project_name}' (Project Node ID: {project_node_id})"
+                    if added_items.get(issue_node_id):
+                        logger.debug(
+                            f"Item {i+1}/{total_issues_to_add}: {context} succeeded.")
+                        result.project_items_added_count += 1
+                    else:
+                        error = failed_items.get(
+                            issue_node_id, "Did not receive valid item ID")
+                        logger.error(
+                            f"Unexpected error during {context} ({issue_url}): {error}")
                         result.project_items_failed.append(
-                            (issue_node_id, f"Unexpected error: {e}"))
+                            (issue_node_id, f"Unexpected error: {error}"))
 
                 log_proj_summary = (f"Step 8 finished. Project Integration: Added: {result.project_items_added_count}/{total_issues_to_add}, "
                                     f"Failed: {len(result.project_items_failed)}/{total_issues_to_add}.")
@@ -377,10 +755,16 @@ class CreateGitHubResourcesUseCase:
             else:
                 logger.info("Step 8: No project integration specified.")
 
+            timer.finish(items=len(issue_result.created_issue_details)
+                         if project_node_id and issue_result else 0)
+
             logger.info(
                 "GitHub resource creation workflow completed successfully.")
+            self._notify_progress(progress_callback, "completed", result)
 
         except (ValueError, GitHubValidationError, GitHubAuthenticationError, GitHubResourceNotFoundError, GitHubClientError) as e:
+            # 中断したステップも所要時間を残す
+            timer.finish()
             logger.error(
                 f"Workflow halted due to error: {type(e).__name__} - {e}")
             result.fatal_error = f"Workflow halted due to error: {type(e).__name__} - {e}"
@@ -392,9 +776,16 @@ class CreateGitHubResourcesUseCase:
                 f"Workflow halted due to error: {type(e).__name__} - {e} [cause: {type(e).__name__}: {e} ]", original_exception=e) from e
         except Exception as e:
             # 未知例外も同様にラップ
+            timer.finish()
             error_message = f"An unexpected critical error occurred during resource creation workflow: {e} [cause: {type(e).__name__}: {e} ]"
             logger.exception(error_message)
             result.fatal_error = error_message
             raise GitHubClientError(error_message, original_exception=e) from e
+        finally:
+            # 中断した場合も、それまでに再試行した操作を結果に残す
+            result.retried_operations = self._collect_retry_counts()
+            if result.retried_operations:
+                logger.info(
+                    f"Transient errors were retried: {result.retried_operations}")
 
         return result
@@ -1,11 +1,13 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 # 依存関係を修正
 from core_logic.adapters.github_rest_client import GitHubRestClient
 from core_logic.adapters.assignee_validator import AssigneeValidator
 from core_logic.adapters.label_milestone_normalizer import LabelMilestoneNormalizerSvc
-from core_logic.domain.models import ParsedRequirementData, IssueData, CreateIssuesResult
+from core_logic.domain.models import ParsedRequirementData, IssueData, CreateIssuesResult, RepositorySnapshot
 from core_logic.domain.exceptions import GitHubClientError
 from core_logic.adapters.github_graphql_client import GitHubGraphQLClient
+from core_logic.adapters.run_ledger import LedgerRun, KIND_ISSUE, issue_fingerprint
 from core_logic.use_cases.create_repository import CreateRepositoryUseCase
 
 logger = logging.getLogger(__name__)
@@ -14,16 +16,19 @@ logger = logging.getLogger(__name__)
 class CreateIssuesUseCase:
     """
     解析されたデータに基づいてGitHub Issueを作成するユースケース（重複スキップ機能付き）。
+    max_workers に2以上を指定すると、スレッドプールで複数のIssueを並行して作成します。
     """
     # コンストラクタで GitHubRestClient と AssigneeValidator を受け取る
 
-    def __init__(self, rest_client: GitHubRestClient, assignee_validator: AssigneeValidator):
+    def __init__(self, rest_client: GitHubRestClient, assignee_validator: AssigneeValidator,
+                 max_workers: int = 1):
         """
         UseCaseを初期化します。
 
         Args:
             rest_client: GitHub APIと対話するためのクライアントインスタンス。
             assignee_validator: 担当者の検証を行うバリデータインスタンス。
+            max_workers: Issue作成の最大並行数。1の場合は従来どおり逐次処理します。
         """
         if not isinstance(rest_client, GitHubRestClient):
             raise TypeError(
@@ -31,20 +36,235 @@ class CreateIssuesUseCase:
         if not isinstance(assignee_validator, AssigneeValidator):
             raise TypeError(
                 "assignee_validator must be an instance of AssigneeValidator")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.rest_client = rest_client
         self.assignee_validator = assignee_validator  # AssigneeValidator を保持
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _normalize_title(title: str) -> str:
+        """重複判定用にタイトルを正規化します (前後空白除去・大文字小文字無視)。"""
+        return title.strip().casefold()
+
+    def _build_title_index(self, owner: str, repo: str,
+                           repository_snapshot: RepositorySnapshot | None = None) -> tuple[set[str], bool]:
+        """
+        対象リポジトリのOpen Issueを一括取得し、正規化済みタイトルのセットを構築します。
+        全件取得済みのスナップショットが渡された場合は、APIを呼ばずにそのタイトルを使用します。
+
+        Returns:
+            (タイトルインデックス, 検索APIへのフォールバック要否) のタプル。
+            一覧取得に失敗した場合は空のセットとTrueを返します。
+        """
+        if repository_snapshot is not None and repository_snapshot.is_complete:
+            title_index = {
+                self._normalize_title(title) for title in repository_snapshot.open_issue_titles}
+            logger.info(
+                f"Using {len(title_index)} existing open issue title(s) from repository snapshot for {owner}/{repo}.")
+            return title_index, False
+        try:
+            existing_issues = self.rest_client.list_issues(
+                owner, repo, state="open")
+        except GitHubClientError as e:
+            logger.warning(
+                f"Failed to preload existing issue titles for {owner}/{repo}: {e}. Falling back to per-issue search.")
+            return set(), True
+        title_index = {
+            self._normalize_title(issue.title)
+            for issue in existing_issues if issue.title
+        }
+        logger.info(
+            f"Loaded {len(title_index)} existing open issue title(s) for {owner}/{repo}.")
+        return title_index, False
+
+    @staticmethod
+    def _build_issue_body(issue_data: IssueData) -> str:
+        """Issue本文を構築します（description、tasks、relational_definition、relational_issues、acceptanceを結合）。"""
+        body_parts = []
+
+        # 説明文を追加
+        if issue_data.description:
+            body_parts.append(issue_data.description)
+
+        # タスクリストを追加
+        tasks = [t for t in (issue_data.tasks or []) if t]
+        if tasks:
+            body_parts.append("\n## タスク\n")
+            body_parts.extend(f"- [ ] {task}" for task in tasks)
+
+        # 関連要件を追加
+        reqs = [r for r in (
+            issue_data.relational_definition or []) if r]
+        if reqs:
+            body_parts.append("\n## 関連要件\n")
+            body_parts.extend(f"- {req}" for req in reqs)
+
+        # 関連Issueを追加
+        issues = [i for i in (
+            issue_data.relational_issues or []) if i]
+        if issues:
+            body_parts.append("\n## 関連Issue\n")
+            body_parts.extend(
+                f"- {issue_ref}" for issue_ref in issues)
+
+        # 受け入れ基準を追加
+        accs = [a for a in (issue_data.acceptance or []) if a]
+        if accs:
+            body_parts.append("\n## 受け入れ基準\n")
+            body_parts.extend(
+                f"- [ ] {criteria}" for criteria in accs)
+
+        # 全体をNewlineで結合
+        return "\n".join(body_parts)
+
+    def _process_issue(self, issue_data: IssueData, owner: str, repo: str,
+                       milestone_id_map: dict[str, int], title_index: set[str],
+                       use_search_fallback: bool, ledger: LedgerRun | None = None,
+                       recorded_issues: dict[str, dict] | None = None) -> CreateIssuesResult:
+        """
+        単一のIssueについて存在確認と作成を行い、そのIssueだけの結果を返します。
+        例外は全てここで捕捉し、結果に記録します（Issue単位のエラー分離）。
+        台帳 (ledger) が指定された場合、同じ実行で作成済みのIssueはAPIを呼ばずに作成済みとして扱い、
+        新たに作成したIssueは作成直後に台帳に記録します。
+        """
+        issue_title = issue_data.title
+        issue_result = CreateIssuesResult()
+        try:
+            fingerprint = issue_fingerprint(issue_data) if ledger else None
+            # 同じ内容のIssueがファイル内に複数ある場合、台帳の記録は最初の1件にのみ対応させる
+            recorded = recorded_issues.pop(fingerprint, None) \
+                if recorded_issues is not None else None
+            if recorded:
+                logger.info(
+                    f"Issue '{issue_title}' was already created in this run ({recorded.get('url')}). Skipping.")
+                issue_result.created_issue_details.append(
+                    (recorded["url"], recorded["node_id"]))
+                title_index.add(self._normalize_title(issue_title))
+                return issue_result
+
+            # 存在確認はタイトルインデックスを使用 (同一ファイル内の重複も検出される)
+            logger.debug(
+                f"Checking if issue '{issue_title}' already exists...")
+            title_key = self._normalize_title(issue_title)
+            exists = title_key in title_index
+            if not exists and use_search_fallback:
+                # 注意: 検索APIはレート制限が厳しい場合がある
+                query = f'repo:{owner}/{repo} is:issue is:open in:title "{issue_title}"'
+                search_results = self.rest_client.search_issues_and_pull_requests(
+                    q=query, per_page=1)
+                exists = search_results.total_count > 0 if search_results else False
+
+            if exists:
+                # 2a. 存在する場合: スキップ
+                logger.info(
+                    f"Issue '{issue_title}' already exists. Skipping creation.")
+                issue_result.skipped_issue_titles.append(issue_title)
+                return issue_result
+
+            # 2b. 存在しない場合: 作成
+            logger.info(
+                f"Issue '{issue_title}' does not exist. Attempting creation...")
+
+            # マイルストーン名からIDへの変換
+            milestone_id = None
+            if issue_data.milestone and issue_data.milestone.strip():
+                milestone_name = issue_data.milestone.strip()
+                milestone_id = milestone_id_map.get(milestone_name)
+                if milestone_id:
+                    logger.debug(
+                        f"Using milestone ID {milestone_id} for milestone '{milestone_name}'")
+                else:
+                    logger.warning(
+                        f"No milestone ID found for milestone '{milestone_name}', using name only")
+
+            constructed_body = self._build_issue_body(issue_data)
+
+            # 担当者が指定されている場合、検証処理を行う
+            valid_assignees = []
+            invalid_assignees_for_issue = []
+            if issue_data.assignees:
+                logger.info(
+                    f"Validating {len(issue_data.assignees)} assignee(s) for issue '{issue_title}'")
+                # AssigneeValidator を使用
+                valid_assignees, invalid_assignees_for_issue = self.assignee_validator.validate_assignees(
+                    owner, repo, issue_data.assignees
+                )
+                if invalid_assignees_for_issue:
+                    logger.warning(
+                        f"Found {len(invalid_assignees_for_issue)} invalid assignee(s) for issue '{issue_title}': {invalid_assignees_for_issue}")
+                    issue_result.validation_failed_assignees.append(
+                        (issue_title, invalid_assignees_for_issue))
+
+            # Issue作成は GitHubRestClient を使用
+            created_issue = self.rest_client.create_issue(
+                owner=owner,
+                repo=repo,
+                title=issue_title,
+                body=constructed_body,
+                labels=issue_data.labels,
+                milestone=milestone_id,
+                assignees=valid_assignees  # 検証済みのみ
+            )
+            # create_issue は Issue オブジェクトを返すので、URLとNode IDを抽出
+            if created_issue and created_issue.html_url and created_issue.node_id:
+                issue_result.created_issue_details.append(
+                    (created_issue.html_url, created_issue.node_id))
+                title_index.add(title_key)
+                if ledger:
+                    ledger.record(KIND_ISSUE, fingerprint, {
+                        "title": issue_title, "url": created_issue.html_url,
+                        "node_id": created_issue.node_id,
+                        "number": getattr(created_issue, "number", None)})
+            else:
+                error_msg = f"Failed to get URL or Node ID after attempting to create issue '{issue_title}'."
+                logger.error(error_msg)
+                issue_result.failed_issue_titles.append(issue_title)
+                issue_result.errors.append(error_msg)
+
+        # エラーハンドリング: 例外が発生しても他のIssueの処理は止めずに記録する
+        except GitHubClientError as e:
+            error_msg = f"Failed to process issue '{issue_title}': {type(e).__name__} - {e}"
+            # トレースバックは冗長になる可能性があるのでFalseに
+            logger.error(error_msg, exc_info=False)
+            issue_result.failed_issue_titles.append(issue_title)
+            issue_result.errors.append(error_msg)
+        except Exception as e:  # 予期せぬその他のエラー
+            error_msg = f"Unexpected error processing issue '{issue_title}': {type(e).__name__} - {e}"
+            logger.exception(error_msg)  # 予期せぬエラーなのでトレースバックも記録
+            issue_result.failed_issue_titles.append(issue_title)
+            issue_result.errors.append(error_msg)
+        return issue_result
+
+    @staticmethod
+    def _merge_result(result: CreateIssuesResult, issue_result: CreateIssuesResult) -> None:
+        """単一Issueの結果を全体の結果に追記します。"""
+        result.created_issue_details.extend(
+            issue_result.created_issue_details)
+        result.skipped_issue_titles.extend(issue_result.skipped_issue_titles)
+        result.failed_issue_titles.extend(issue_result.failed_issue_titles)
+        result.errors.extend(issue_result.errors)
+        result.validation_failed_assignees.extend(
+            issue_result.validation_failed_assignees)
 
     def execute(self, parsed_data: ParsedRequirementData, owner: str, repo: str,
-                milestone_id_map: dict[str, int] = None) -> CreateIssuesResult:
+                milestone_id_map: dict[str, int] = None,
+                repository_snapshot: RepositorySnapshot | None = None,
+                ledger: LedgerRun | None = None) -> CreateIssuesResult:
         """
         解析データ内の各Issueについて、存在確認を行い、存在しなければ作成します。
         エラーが発生しても、他のIssueの処理は続行します。
+        並行実行時も、結果の各リストは入力データのIssue順に並びます。
 
         Args:
             parsed_data: AIによって解析された ParsedRequirementData オブジェクト。
             owner: 対象リポジトリのオーナー名。
             repo: 対象リポジトリ名。
             milestone_id_map: マイルストーン名からIDへのマッピング辞書（オプション）。
+            repository_snapshot: 事前に取得したリポジトリスナップショット（オプション）。
+                既存Issueタイトルと担当者の検証に使用し、API呼び出しを省略します。
+            ledger: 実行IDに対応する台帳（オプション）。同じ実行で作成済みのIssueは再作成せず、
+                全てのIssueが作成済みの場合は既存Issueの取得も行いません。
 
         Returns:
             CreateIssuesResult オブジェクト（作成成功URL、スキップタイトル、失敗タイトル、エラーリスト、検証失敗担当者情報）。
@@ -62,143 +282,68 @@ class CreateIssuesUseCase:
         if milestone_id_map is None:
             milestone_id_map = {}
 
-        # enumerate を使ってインデックスを取得し、進捗を表示
-        for i, issue_data in enumerate(parsed_data.issues):
-            issue_title = issue_data.title
-            logger.info(
-                # 進捗ログ
-                f"Processing issue {i+1}/{total_issues}: '{issue_title if issue_title else '(Empty Title)'}'")
+        recorded_issues: dict[str, dict] | None = None
+        if ledger:
+            recorded_issues = ledger.entries(KIND_ISSUE)
+            if recorded_issues:
+                logger.info(
+                    f"Found {len(recorded_issues)} issue(s) already created in this run.")
 
-            if not issue_title:  # タイトルがないデータはスキップ (またはエラー)
+        # 既存Issueタイトルのインデックスを一度だけ構築し、重複チェックはメモリ上で行う
+        # 取得に失敗した場合は従来どおりIssueごとの検索APIにフォールバックする
+        # (全てのIssueが台帳に記録済みの場合は取得しない)
+        if recorded_issues and all(issue_fingerprint(issue) in recorded_issues
+                                   for issue in parsed_data.issues if issue.title):
+            title_index, use_search_fallback = set(), False
+        else:
+            title_index, use_search_fallback = self._build_title_index(
+                owner, repo, repository_snapshot)
+        if repository_snapshot is not None:
+            self.assignee_validator.load_snapshot(repository_snapshot)
+
+        # Issueごとの結果を入力順のスロットに格納し、最後に順番どおり結合する
+        issue_results: list[CreateIssuesResult | None] = [None] * total_issues
+        # 同じタイトルのIssueは1つのグループにまとめ、同一ワーカー内で入力順に処理する
+        # (並行実行時もファイル内の重複を確実に検出するため)
+        title_groups: dict[str, list[int]] = {}
+        for i, issue_data in enumerate(parsed_data.issues):
+            if not issue_data.title:  # タイトルがないデータはスキップ (またはエラー)
+                logger.info(
+                    f"Processing issue {i+1}/{total_issues}: '(Empty Title)'")
                 logger.warning("Skipping issue data with empty title.")
-                result.failed_issue_titles.append("(Empty Title)")
-                result.errors.append("Skipped issue due to empty title.")
+                issue_results[i] = CreateIssuesResult(
+                    failed_issue_titles=["(Empty Title)"],
+                    errors=["Skipped issue due to empty title."])
                 continue
+            title_groups.setdefault(
+                self._normalize_title(issue_data.title), []).append(i)
 
-            try:
-                # 存在確認は GitHubRestClient を使用
-                logger.debug(
-                    f"Checking if issue '{issue_title}' already exists...")
-                # find_issue_by_title は GitHubRestClient には無いので、search_issues_and_pull_requests を使うか、
-                # または GitHubRestClient に find_issue_by_title を実装する必要がある。
-                # ここでは仮に search_issues_and_pull_requests を使う例とする。
-                # 注意: 検索APIはレート制限が厳しい場合がある
-                query = f'repo:{owner}/{repo} is:issue is:open in:title "{issue_title}"'
-                search_results = self.rest_client.search_issues_and_pull_requests(
-                    q=query, per_page=1)
-                exists = search_results.total_count > 0 if search_results else False
+        def process_group(indices: list[int]) -> None:
+            for i in indices:
+                issue_data = parsed_data.issues[i]
+                # enumerate のインデックスで進捗を表示
+                logger.info(
+                    f"Processing issue {i+1}/{total_issues}: '{issue_data.title}'")
+                issue_results[i] = self._process_issue(
+                    issue_data, owner, repo, milestone_id_map, title_index, use_search_fallback,
+                    ledger=ledger, recorded_issues=recorded_issues)
 
-                if exists:
-                    # 2a. 存在する場合: スキップ
-                    logger.info(
-                        f"Issue '{issue_title}' already exists. Skipping creation.")
-                    result.skipped_issue_titles.append(issue_title)
-                else:
-                    # 2b. 存在しない場合: 作成
-                    # INFOレベルに変更
-                    logger.info(
-                        f"Issue '{issue_title}' does not exist. Attempting creation...")
-
-                    # マイルストーン名からIDへの変換
-                    milestone_id = None
-                    if issue_data.milestone and issue_data.milestone.strip():
-                        milestone_name = issue_data.milestone.strip()
-                        milestone_id = milestone_id_map.get(milestone_name)
-                        if milestone_id:
-                            logger.debug(
-                                f"Using milestone ID {milestone_id} for milestone '{milestone_name}'")
-                        else:
-                            logger.warning(
-                                f"No milestone ID found for milestone '{milestone_name}', using name only")
-
-                    # Issue本文の構築（description、tasks、relational_definition、relational_issues、acceptanceを結合）
-                    body_parts = []
-
-                    # 説明文を追加
-                    if issue_data.description:
-                        body_parts.append(issue_data.description)
-
-                    # タスクリストを追加
-                    tasks = [t for t in (issue_data.tasks or []) if t]
-                    if tasks:
-                        body_parts.append("\n## タスク\n")
-                        body_parts.extend(f"- [ ] {task}" for task in tasks)
-
-                    # 関連要件を追加
-                    reqs = [r for r in (
-                        issue_data.relational_definition or []) if r]
-                    if reqs:
-                        body_parts.append("\n## 関連要件\n")
-                        body_parts.extend(f"- {req}" for req in reqs)
-
-                    # 関連Issueを追加
-                    issues = [i for i in (
-                        issue_data.relational_issues or []) if i]
-                    if issues:
-                        body_parts.append("\n## 関連Issue\n")
-                        body_parts.extend(
-                            f"- {issue_ref}" for issue_ref in issues)
-
-                    # 受け入れ基準を追加
-                    accs = [a for a in (issue_data.acceptance or []) if a]
-                    if accs:
-                        body_parts.append("\n## 受け入れ基準\n")
-                        body_parts.extend(
-                            f"- [ ] {criteria}" for criteria in accs)
-
-                    # 全体をNewlineで結合
-                    constructed_body = "\n".join(body_parts)
-
-                    # 担当者が指定されている場合、検証処理を行う
-                    valid_assignees = []
-                    invalid_assignees_for_issue = []
-                    if issue_data.assignees:
-                        logger.info(
-                            f"Validating {len(issue_data.assignees)} assignee(s) for issue '{issue_title}'")
-                        # AssigneeValidator を使用
-                        valid_assignees, invalid_assignees_for_issue = self.assignee_validator.validate_assignees(
-                            owner, repo, issue_data.assignees
-                        )
-                        if invalid_assignees_for_issue:
-                            logger.warning(
-                                f"Found {len(invalid_assignees_for_issue)} invalid assignee(s) for issue '{issue_title}': {invalid_assignees_for_issue}")
-                            result.validation_failed_assignees.append(
-                                (issue_title, invalid_assignees_for_issue))
-
-                    # Issue作成は GitHubRestClient を使用
-                    created_issue = self.rest_client.create_issue(
-                        owner=owner,
-                        repo=repo,
-                        title=issue_title,
-                        body=constructed_body,
-                        labels=issue_data.labels,
-                        milestone=milestone_id,
-                        assignees=valid_assignees  # 検証済みのみ
-                    )
-                    # create_issue は Issue オブジェクトを返すので、URLとNode IDを抽出
-                    if created_issue and created_issue.html_url and created_issue.node_id:
-                        result.created_issue_details.append(
-                            (created_issue.html_url, created_issue.node_id))
-                    else:
-                        error_msg = f"Failed to get URL or Node ID after attempting to create issue '{issue_title}'."
-                        logger.error(error_msg)
-                        result.failed_issue_titles.append(issue_title)
-                        result.errors.append(error_msg)
-
-            # エラーハンドリング: 例外が発生してもループは止めずに記録する
-            except GitHubClientError as e:
-                error_msg = f"Failed to process issue '{issue_title}': {type(e).__name__} - {e}"
-                # トレースバックは冗長になる可能性があるのでFalseに
-                logger.error(error_msg, exc_info=False)
-                result.failed_issue_titles.append(issue_title)
-                result.errors.append(error_msg)
-            except Exception as e:  # 予期せぬその他のエラー
-                error_msg = f"Unexpected error processing issue '{issue_title}': {type(e).__name__} - {e}"
-                logger.exception(error_msg)  # 予期せぬエラーなのでトレースバックも記録
-                result.failed_issue_titles.append(issue_title)
-                result.errors.append(error_msg)
-
-        # ループ完了後に最終結果をログ出力
+        workers = min(self.max_workers, len(title_groups))
+        if workers > 1:
+            logger.info(
+                f"Creating issues concurrently with {workers} worker(s).")
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="create-issue") as executor:
+                # list() で全タスクの完了を待つ (ワーカー内の例外もここで再送出される)
+                list(executor.map(process_group, title_groups.values()))
+        else:
+            for indices in title_groups.values():
+                process_group(indices)
+
+        for issue_result in issue_results:
+            if issue_result is not None:
+                self._merge_result(result, issue_result)
+
+        # 全Issue処理後に最終結果をログ出力
         log_summary = (
             f"CreateIssuesUseCase finished for {owner}/{repo}. "
             f"Created: {len(result.created_issue_details)}, "
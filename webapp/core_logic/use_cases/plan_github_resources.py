@@ -0,0 +1,185 @@
+from core_logic.domain.exceptions import GitHubResourceNotFoundError
+from core_logic.domain.models import (
+    ParsedRequirementData, RepositorySnapshot, ResourcePlan, PlannedIssue, ApiCostEstimate
+)
+from core_logic.adapters.github_graphql_client import GitHubGraphQLClient, PROJECT_ITEMS_BATCH_SIZE
+from core_logic.adapters.github_rest_client import GitHubRestClient
+import logging
+import math
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PlanGitHubResourcesUseCase:
+    """
+    リポジトリの現在状態 (存在有無・ラベル・マイルストーン・Open Issueタイトル・割り当て可能ユーザー・プロジェクト) を
+    読み取り専用のAPIでまとめて取得し、解析結果との差分から作成/スキップの実行計画を作成するUseCase。
+    GitHub上のリソースは一切変更しません。
+    """
+
+    def __init__(self, rest_client: GitHubRestClient, graphql_client: GitHubGraphQLClient):
+        self.rest_client = rest_client
+        self.graphql_client = graphql_client
+
+    # --- 現在状態の取得 ---
+    def _load_snapshot(self, owner: str, repo: str) -> Optional[RepositorySnapshot]:
+        """
+        GraphQL の一括クエリでリポジトリの状態を取得します。取得できない場合は REST API で同じ情報を集めます。
+        リポジトリが存在しない場合は None を返します。
+        """
+        try:
+            snapshot = self.graphql_client.get_repository_snapshot(owner, repo)
+            if snapshot is not None and snapshot.is_complete:
+                return snapshot
+            if snapshot is not None:
+                logger.warning(
+                    f"Repository snapshot for {owner}/{repo} is incomplete. Loading state via REST.")
+        except Exception as e:
+            logger.warning(
+                f"Failed to load repository snapshot for {owner}/{repo}: {e}. Loading state via REST.")
+
+        try:
+            repository = self.rest_client.get_repository(owner, repo)
+        except GitHubResourceNotFoundError:
+            logger.info(f"Repository {owner}/{repo} does not exist yet.")
+            return None
+        milestones: dict[str, int] = {}
+        for ms in self.rest_client.list_milestones(owner, repo, state="all"):
+            if ms.title and ms.number is not None:
+                milestones.setdefault(ms.title, ms.number)
+        return RepositorySnapshot(
+            owner=owner,
+            name=repo,
+            repository_id=getattr(repository, "node_id", None),
+            repository_url=getattr(repository, "html_url", None),
+            label_names=[label.name for label in self.rest_client.list_labels(owner, repo)
+                         if getattr(label, "name", None)],
+            milestones=milestones,
+            assignable_users=self.rest_client.list_assignees(owner, repo),
+            open_issue_titles=[issue.title for issue in self.rest_client.list_issues(owner, repo, state="open")
+                               if issue.title],
+        )
+
+    def _find_project(self, owner: str, project_name: str) -> Optional[str]:
+        try:
+            project_node_id = self.graphql_client.find_project_v2_node_id(
+                owner, project_name)
+        except Exception as e:
+            logger.warning(
+                f"Could not find Project V2 '{project_name}' for owner '{owner}': {e}")
+            return None
+        if not project_node_id:
+            logger.warning(f"Project V2 '{project_name}' not found.")
+        return project_node_id
+
+    # --- 差分の計算 ---
+    @staticmethod
+    def _plan_issues(parsed_data: ParsedRequirementData,
+                     snapshot: Optional[RepositorySnapshot]) -> list[PlannedIssue]:
+        """CreateIssuesUseCase と同じ規則 (正規化したタイトルで既存・ファイル内の重複を判定) で各Issueの扱いを決めます。"""
+        known_titles = {title.strip().casefold()
+                        for title in snapshot.open_issue_titles} if snapshot else set()
+        assignable = {login.casefold()
+                      for login in snapshot.assignable_users} if snapshot else None
+        planned: list[PlannedIssue] = []
+        planned_titles: set[str] = set()
+        for issue in parsed_data.issues:
+            if not issue.title:
+                planned.append(PlannedIssue(title="(Empty Title)", temp_id=issue.temp_id,
+                                            action="invalid", reason="empty_title"))
+                continue
+            title_key = issue.title.strip().casefold()
+            if title_key in known_titles:
+                planned.append(PlannedIssue(title=issue.title, temp_id=issue.temp_id,
+                                            action="skip", reason="exists"))
+                continue
+            if title_key in planned_titles:
+                planned.append(PlannedIssue(title=issue.title, temp_id=issue.temp_id,
+                                            action="skip", reason="duplicate_in_file"))
+                continue
+            planned_titles.add(title_key)
+            invalid_assignees: list[str] = []
+            if issue.assignees and assignable is not None:
+                logins = {login.strip().lstrip('@')
+                          for login in issue.assignees if login and login.strip()}
+                invalid_assignees = sorted(
+                    login for login in logins if login.casefold() not in assignable)
+            planned.append(PlannedIssue(title=issue.title, temp_id=issue.temp_id, action="create",
+                                        invalid_assignees=invalid_assignees))
+        return planned
+
+    def _estimate_cost(self, plan: ResourcePlan) -> ApiCostEstimate:
+        """計画の適用に必要なAPI呼び出し数を見積もり、取得済みのレート制限の残量と比較します。"""
+        issues_to_create = len(plan.issues_to_create)
+        content_creations = (0 if plan.repository_exists else 1) + len(plan.labels_to_create) \
+            + len(plan.milestones_to_create) + issues_to_create
+        rest_requests = content_creations
+        graphql_requests = math.ceil(issues_to_create / PROJECT_ITEMS_BATCH_SIZE) \
+            if plan.project_node_id else 0
+        if not plan.repository_exists:
+            # 新規リポジトリは作成後の状態 (既定のラベルなど) をスナップショットで1回確認する
+            graphql_requests += 1
+
+        rest_remaining = graphql_remaining = None
+        scheduler = getattr(self.graphql_client, "scheduler", None)
+        if scheduler is not None:
+            core_state = scheduler.get_state("core")
+            graphql_state = scheduler.get_state("graphql")
+            rest_remaining = core_state.remaining if core_state else None
+            graphql_remaining = graphql_state.remaining if graphql_state else None
+        fits_rate_limit = None
+        if rest_remaining is not None or graphql_remaining is not None:
+            fits_rate_limit = (rest_remaining is None or rest_requests <= rest_remaining) and \
+                (graphql_remaining is None or graphql_requests <= graphql_remaining)
+        return ApiCostEstimate(
+            rest_requests=rest_requests, graphql_requests=graphql_requests,
+            content_creations=content_creations, rest_remaining=rest_remaining,
+            graphql_remaining=graphql_remaining, fits_rate_limit=fits_rate_limit)
+
+    def execute(self, parsed_data: ParsedRequirementData, owner: str, repo: str,
+                project_name: Optional[str] = None) -> ResourcePlan:
+        """
+        リポジトリの現在状態を読み取り、解析結果を適用した場合に作成/スキップされるリソースの計画を返します。
+
+        Raises:
+            GitHubClientError: 現在状態を取得できなかった場合 (認証エラーなど)。
+        """
+        logger.info(f"Planning GitHub resources for {owner}/{repo}...")
+        snapshot = self._load_snapshot(owner, repo)
+
+        labels_in_file = sorted({label for issue in parsed_data.issues for label in issue.labels or []
+                                 if label and label.strip()})
+        existing_label_keys = {name.strip().casefold()
+                               for name in snapshot.label_names} if snapshot else set()
+        milestones_in_file = sorted({issue.milestone.strip() for issue in parsed_data.issues
+                                     if issue.milestone and issue.milestone.strip()})
+        existing_milestones = snapshot.milestones if snapshot else {}
+
+        plan = ResourcePlan(
+            owner=owner,
+            repo=repo,
+            repository_exists=snapshot is not None,
+            repository_url=(snapshot.repository_url or f"https://github.com/{owner}/{repo}")
+            if snapshot else None,
+            labels_to_create=[label for label in labels_in_file
+                              if label.strip().casefold() not in existing_label_keys],
+            existing_labels=[label for label in labels_in_file
+                             if label.strip().casefold() in existing_label_keys],
+            milestones_to_create=[name for name in milestones_in_file
+                                  if name not in existing_milestones],
+            existing_milestones={name: existing_milestones[name] for name in milestones_in_file
+                                 if name in existing_milestones},
+            issues=self._plan_issues(parsed_data, snapshot),
+            project_name=project_name,
+            project_node_id=self._find_project(
+                owner, project_name) if project_name else None,
+            snapshot=snapshot,
+        )
+        plan.estimated_cost = self._estimate_cost(plan)
+        logger.info(
+            f"Plan for {owner}/{repo}: repository {'exists' if plan.repository_exists else 'will be created'}, "
+            f"labels +{len(plan.labels_to_create)}, milestones +{len(plan.milestones_to_create)}, "
+            f"issues +{len(plan.issues_to_create)} (skip {len(plan.issues_to_skip)}), "
+            f"estimated {plan.estimated_cost.rest_requests} REST / {plan.estimated_cost.graphql_requests} GraphQL request(s).")
+        return plan
@@ -89,6 +89,42 @@ DATABASES = {
     }
 }
 
+# Cache
+# REDIS_URL を設定した場合は Redis を、それ以外はプロセス内メモリを使用する
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# 解析結果セッションの保存先 (app/session_store.py)
+# BACKEND: memory (プロセス内LRU) / cache (CACHES、Redis など) / database (ParsedDataCache テーブル)
+# LOCAL_CACHE: database/cache の前段にプロセス内LRUを置き、同一プロセスでの読み込みをメモリで完結させる
+PARSED_SESSION_STORE = {
+    'BACKEND': os.environ.get('PARSED_SESSION_STORE_BACKEND', 'database'),
+    'TTL': float(os.environ.get('PARSED_SESSION_TTL', '600')),
+    'COMPRESS': os.environ.get('PARSED_SESSION_COMPRESS', 'True') == 'True',
+    'MAX_ENTRIES': int(os.environ.get('PARSED_SESSION_MAX_ENTRIES', '1024')),
+    'SWEEP_INTERVAL': float(os.environ.get('PARSED_SESSION_SWEEP_INTERVAL', '300')),
+    'CACHE_ALIAS': 'default',
+    'LOCAL_CACHE': os.environ.get('PARSED_SESSION_LOCAL_CACHE', 'True') == 'True',
+}
+
+# Issueファイルのアップロード上限 (バイト)
+# アップロードはチャンク単位で読み込む (FILE_UPLOAD_MAX_MEMORY_SIZE を超えるファイルは一時ファイルに保存される)。
+# ただし分割解析 (ai.parse_chunk_token_budget) が無効の場合はファイル全体を1回のAI解析に渡すため、
+# 既定の 10MB より大きくするのは分割解析を有効にした場合のみにしてください。
+ISSUE_FILE_MAX_UPLOAD_SIZE = int(os.environ.get(
+    'ISSUE_FILE_MAX_UPLOAD_SIZE_MB', '10')) * 1024 * 1024
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -14,3 +14,11 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'webapp_project.settings')
 
 application = get_wsgi_application()
+
+# ワーカーの起動時に、中断されたリソース作成ジョブを再実行し、定期的な回復処理を開始する
+from app.github_resources import job_runner  # noqa: E402
+# 期限切れの解析結果セッションを定期的に削除する
+from app.session_store import get_parsed_session_store  # noqa: E402
+
+job_runner.start()
+get_parsed_session_store().start_sweeper()